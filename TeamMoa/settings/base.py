@@ -61,12 +61,14 @@ INSTALLED_APPS = [
     'schedules.apps.SchedulesConfig',
     'members.apps.MembersConfig',
     'mindmaps.apps.MindmapsConfig',
+    'taskqueue.apps.TaskqueueConfig',
 ]
 
 MIDDLEWARE = [
+    'common.middleware.PerformanceInstrumentationMiddleware',  # 요청별 성능 계측 (Server-Timing)
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',  # Static 파일 서빙용
+    'common.middleware.AsyncWhiteNoiseMiddleware',  # Static 파일 서빙용 (sync/async 겸용 WhiteNoise)
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -213,6 +215,32 @@ CHANNEL_LAYERS = {
 
 MEDIA_URL= '/media/'
 MEDIA_ROOT= os.path.join(BASE_DIR,'media/')
+
+# 캐시 - 적중/미스가 요청 계측(Server-Timing)에 기록되는 백엔드 사용
+# 로컬 메모리 캐시는 프로세스마다 따로라 개발/테스트용 (운영은 prod.py에서 Redis)
+CACHES = {
+    'default': {
+        'BACKEND': 'common.cache.InstrumentedLocMemCache',
+    },
+}
+
+# 요청 성능 계측 (common.middleware.PerformanceInstrumentationMiddleware)
+PERF_INSTRUMENTATION_ENABLED = env.bool('PERF_INSTRUMENTATION_ENABLED', default=True)
+PERF_SERVER_TIMING_HEADER = env.bool('PERF_SERVER_TIMING_HEADER', default=True)
+PERF_SLOW_REQUEST_MS = env.int('PERF_SLOW_REQUEST_MS', default=500)
+PERF_SLOW_SAMPLE_RATE = env.float('PERF_SLOW_SAMPLE_RATE', default=1.0)
+PERF_TOP_QUERIES = env.int('PERF_TOP_QUERIES', default=5)
+
+# 백그라운드 작업 큐 (taskqueue, 워커: python manage.py run_tasks)
+# True면 큐에 넣지 않고 그 자리에서 실행 (워커 없이 띄우는 개발 환경/테스트용)
+TASKS_EAGER = env.bool('TASKS_EAGER', default=False)
+
+# Prometheus 메트릭 (/metrics)
+# 다중 워커 환경에서는 공유 디렉토리를 지정해야 전체 프로세스 값이 합산됨
+METRICS_MULTIPROC_DIR = env('METRICS_MULTIPROC_DIR', default=None)
+# 토큰이 없으면 인증 없이 공개 (개발 환경용, 프로덕션은 prod.py에서 필수)
+METRICS_AUTH_TOKEN = env('METRICS_AUTH_TOKEN', default=None)
+
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
 
@@ -284,10 +312,16 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # JSON 인코딩/디코딩은 orjson (common.fastjson)
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'api.renderers.TeamMoaJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.parsers.TeamMoaJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'api.pagination.TeamMoaPageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
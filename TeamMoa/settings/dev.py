@@ -2,3 +2,6 @@ from .base import *  # Import only the needed names from base.py
 
 ALLOWED_HOSTS = ['*']
 DEBUG = True
+
+# 개발 환경은 워커 없이 작업을 바로 실행
+TASKS_EAGER = env.bool('TASKS_EAGER', default=True)
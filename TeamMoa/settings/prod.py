@@ -9,6 +9,11 @@ ALLOWED_HOSTS = env.list('ALLOWED_HOSTS', default=[])
 if not ALLOWED_HOSTS:
     raise ValueError("ALLOWED_HOSTS must be set in production environment")
 
+# SECURITY: Require a scrape token for /metrics in production
+METRICS_AUTH_TOKEN = env('METRICS_AUTH_TOKEN', default=None)
+if not METRICS_AUTH_TOKEN:
+    raise ValueError("METRICS_AUTH_TOKEN must be set in production environment")
+
 # Security Settings
 SECURE_SSL_REDIRECT = env.bool('SECURE_SSL_REDIRECT', default=True)
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')  # Trust Nginx proxy
@@ -36,9 +41,10 @@ redis_port = env.int('REDIS_PORT', default=6379)
 redis_password = env('REDIS_PASSWORD', default=None)
 
 if redis_password:
-    redis_url = f"redis://:{redis_password}@{redis_host}:{redis_port}/0"
+    redis_base_url = f"redis://:{redis_password}@{redis_host}:{redis_port}"
 else:
-    redis_url = f"redis://{redis_host}:{redis_port}/0"
+    redis_base_url = f"redis://{redis_host}:{redis_port}"
+redis_url = f"{redis_base_url}/0"
 
 CHANNEL_LAYERS = {
     'default': {
@@ -49,6 +55,15 @@ CHANNEL_LAYERS = {
     },
 }
 
+# 캐시 - gunicorn 워커들이 같은 캐시를 보도록 Redis 사용 (DB 1, 채널 레이어와 분리)
+# 스냅샷/그래프/초대 코드 캐시의 커밋 후 삭제가 모든 워커에 바로 반영됨
+CACHES = {
+    'default': {
+        'BACKEND': 'common.cache.InstrumentedRedisCache',
+        'LOCATION': env('CACHE_REDIS_URL', default=f"{redis_base_url}/1"),
+    },
+}
+
 # Logging Configuration
 LOGGING = {
     'version': 1,
@@ -58,6 +73,10 @@ LOGGING = {
             'format': '{levelname} {asctime} {module} {message}',
             'style': '{',
         },
+        'performance': {
+            'format': '{asctime} {levelname} {name} {message}',
+            'style': '{',
+        },
     },
     'handlers': {
         'file': {
@@ -73,6 +92,15 @@ LOGGING = {
             'class': 'logging.StreamHandler',
             'formatter': 'verbose',
         },
+        # 요청 성능 계측 로그 (common.middleware)
+        'performance': {
+            'level': 'INFO',
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': os.path.join(BASE_DIR, 'logs', 'performance.log'),
+            'maxBytes': 1024 * 1024 * 10,  # 10MB
+            'backupCount': 5,
+            'formatter': 'performance',
+        },
     },
     'root': {
         'handlers': ['console', 'file'],
@@ -89,9 +117,28 @@ LOGGING = {
             'level': 'ERROR',
             'propagate': False,
         },
+        # 모든 요청의 계측 필드 (key=value 형식)
+        'teammoa.performance': {
+            'handlers': ['performance'],
+            'level': env('PERF_LOG_LEVEL', default='INFO'),
+            'propagate': False,
+        },
+        # 느린 요청 샘플 (상위 쿼리 포함) - 일반 로그에도 남김
+        'teammoa.performance.slow': {
+            'handlers': ['performance', 'file'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
     },
 }
 
+# Server-Timing 헤더는 쿼리 수/구간 시간을 외부에 드러내므로 운영에서는 기본 끔 (로그에는 계속 기록)
+PERF_SERVER_TIMING_HEADER = env.bool('PERF_SERVER_TIMING_HEADER', default=False)
+
+# 느린 요청 샘플링 (운영 기본값)
+PERF_SLOW_REQUEST_MS = env.int('PERF_SLOW_REQUEST_MS', default=1000)
+PERF_SLOW_SAMPLE_RATE = env.float('PERF_SLOW_SAMPLE_RATE', default=0.2)
+
 # Database connection pooling (optional but recommended)
 DATABASES['default']['CONN_MAX_AGE'] = env.int('DB_CONN_MAX_AGE', default=600)
 
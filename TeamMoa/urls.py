@@ -32,6 +32,17 @@ def health_check(request):
     })
 
 
+@require_GET
+def metrics(request):
+    """Prometheus scrape endpoint (METRICS_AUTH_TOKEN 설정 시 Bearer 토큰 필요)"""
+    from common.metrics import REGISTRY
+
+    token = getattr(settings, 'METRICS_AUTH_TOKEN', None)
+    if token and request.headers.get('Authorization') != f'Bearer {token}':
+        return HttpResponse(status=401)
+    return HttpResponse(REGISTRY.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
 @require_GET
 def favicon(request):
     """Serve favicon.ico from static files"""
@@ -45,6 +56,7 @@ def favicon(request):
 
 urlpatterns = [
     path('health/', health_check, name='health_check'),
+    path('metrics', metrics, name='metrics'),
     path('favicon.ico', favicon, name='favicon'),
     path('admin/', admin.site.urls),
     path('', RedirectView.as_view(url='/teams/', permanent=False)),
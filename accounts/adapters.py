@@ -2,6 +2,8 @@ from allauth.socialaccount.adapter import DefaultSocialAccountAdapter
 from allauth.account.adapter import DefaultAccountAdapter
 from django.contrib.auth import get_user_model
 from django.contrib import messages
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 
 User = get_user_model()
 
@@ -13,6 +15,9 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
     - 동일 이메일 계정 자동 연결
     """
 
+    # username 경쟁으로 저장이 실패했을 때 최대 시도 횟수
+    USERNAME_SAVE_ATTEMPTS = 3
+
     def populate_user(self, request, sociallogin, data):
         """
         OAuth 프로필 정보로 User 인스턴스 채우기
@@ -68,7 +73,7 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
         이메일에서 고유한 username 생성
         - @ 앞부분 사용
         - 특수문자 제거 (_, -, . 제외)
-        - 중복 시 숫자 추가
+        - 중복 시 비어 있는 가장 작은 숫자 추가 (조회 1회)
         """
         # @ 앞부분 추출
         base_username = email.split('@')[0]
@@ -83,14 +88,43 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
         # 최대 150자 제한
         base_username = base_username[:147]  # _숫자를 위해 여유 공간
 
-        # 고유성 보장 (이미 존재하면 숫자 추가)
-        username = base_username
+        # 고유성 보장: base와 base_* 를 한 번에 조회해 비어 있는 첫 접미사 선택
+        # (MySQL username 비교는 대소문자를 구분하지 않으므로 소문자로 비교)
+        prefix = f"{base_username}_".lower()
+        taken = {
+            username.lower()
+            for username in User.objects.filter(
+                Q(username__iexact=base_username) | Q(username__istartswith=prefix)
+            ).values_list('username', flat=True)
+        }
+        if base_username.lower() not in taken:
+            return base_username
+
+        suffixes = {
+            int(username[len(prefix):])
+            for username in taken
+            if username.startswith(prefix) and username[len(prefix):].isdigit()
+        }
         counter = 1
-        while User.objects.filter(username=username).exists():
-            username = f"{base_username}_{counter}"
+        while counter in suffixes:
             counter += 1
+        return f"{base_username}_{counter}"
 
-        return username
+    def save_user(self, request, sociallogin, form=None):
+        """
+        소셜 가입 사용자 저장
+        동시 가입으로 같은 username을 먼저 차지당하면 새 username으로 다시 저장합니다.
+        """
+        user = sociallogin.user
+        for attempt in range(1, self.USERNAME_SAVE_ATTEMPTS + 1):
+            try:
+                with transaction.atomic():
+                    return super().save_user(request, sociallogin, form)
+            except IntegrityError:
+                username_taken = User.objects.filter(username__iexact=user.username).exists()
+                if form is not None or not user.email or not username_taken or attempt == self.USERNAME_SAVE_ATTEMPTS:
+                    raise
+                user.username = self.generate_unique_username(user.email)
 
     def pre_social_login(self, request, sociallogin):
         """
@@ -10,6 +10,10 @@
     python manage.py delete_unverified_users --dry-run  # 실제 삭제 없이 확인만
     python manage.py delete_unverified_users --verbose  # 상세 정보 출력
     python manage.py delete_unverified_users --dry-run --verbose  # 상세 정보 + 삭제 안함
+    python manage.py delete_unverified_users --batch-size 200  # 200명씩 나눠 삭제
+
+대상은 id 순으로 batch-size명씩 조회/삭제하므로 메모리 사용량이 대상 수와 무관하고,
+배치마다 커밋되어 한 번에 오래 잠그지 않습니다.
 """
 from django.core.management.base import BaseCommand
 from django.utils import timezone
@@ -37,11 +41,18 @@ class Command(BaseCommand):
             action='store_true',
             help='사용자의 상세 정보를 출력합니다.',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 조회/삭제할 사용자 수 (기본값: 500)',
+        )
 
     def handle(self, *args, **options):
         days = options['days']
         dry_run = options['dry_run']
         verbose = options['verbose']
+        batch_size = options['batch_size']
 
         # 삭제 기준 시점 계산
         cutoff_date = timezone.now() - timedelta(days=days)
@@ -51,7 +62,7 @@ class Command(BaseCommand):
             is_active=False,
             is_deleted=False,
             date_joined__lt=cutoff_date
-        )
+        ).order_by('id')
 
         count = unverified_users.count()
 
@@ -65,7 +76,7 @@ class Command(BaseCommand):
         self.stdout.write(f'\n삭제 대상 미인증 계정: {count}개')
         self.stdout.write('=' * 80)
 
-        for user in unverified_users:
+        for user in unverified_users.iterator(chunk_size=batch_size):
             days_passed = (timezone.now() - user.date_joined).days
 
             if verbose:
@@ -104,8 +115,21 @@ class Command(BaseCommand):
             )
             return
 
-        # 실제 삭제 실행
-        deleted_count, _ = unverified_users.delete()
+        # 실제 삭제 실행 (id 순 배치, 배치마다 커밋)
+        deleted_count = 0
+        last_id = 0
+        while True:
+            user_ids = list(
+                unverified_users.filter(id__gt=last_id).values_list('id', flat=True)[:batch_size]
+            )
+            if not user_ids:
+                break
+
+            # 조회 후 인증을 마친 계정은 지우지 않도록 조건을 다시 걸어 삭제
+            _, deleted_by_model = unverified_users.filter(pk__in=user_ids).delete()
+            deleted_count += deleted_by_model.get(User._meta.label, 0)
+            last_id = user_ids[-1]
+            self.stdout.write(f'  삭제 진행: {deleted_count}/{count}')
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -1,14 +1,13 @@
 from django.contrib.sites.shortcuts import get_current_site
-from django.template.loader import render_to_string
-from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
-from django.utils.encoding import force_bytes, force_str
-from django.core.mail import EmailMessage
+from django.utils.http import urlsafe_base64_decode
+from django.utils.encoding import force_str
 from django.contrib import auth
 from django.utils import timezone
 from datetime import timedelta
 from smtplib import SMTPRecipientsRefused
 from .tokens import account_activation_token
 from .models import User
+from .tasks import send_activation_email
 from django.db import transaction
 
 
@@ -18,34 +17,16 @@ class AuthService:
     @transaction.atomic
     def register_user(self, form, current_site):
         """
-        사용자를 등록하고 활성화 이메일을 발송합니다.
-        이메일 발송 실패 시 사용자 생성도 취소됩니다.
+        사용자를 등록하고 활성화 이메일 발송을 예약합니다.
+        메일은 커밋 후 작업 큐 워커가 보내므로 SMTP 왕복이 트랜잭션과 응답 시간에 포함되지 않습니다.
         """
-        # pk는 commit되어야 db에 저장되고 부여받는 값
-        # 따라서 email로 pk를 전송하려면, db에 user가 저장되어야 한다.
-        # 그러나 email이 유효하지 않아, 전송이 실패하면 db에 저장된 user는 더미가 되어버린다.
-        # 따라서 transcation.atomic을 통해 원자성을 확보
-        with transaction.atomic():
-            # 1. 유저를 db에 임시 저장, pk부여
-            user = form.save()
-
-            # 2. 이메일을 전송
-            self.send_activation_email(user, current_site)
-
-        # 3. with 블록이 예외 없이 성공적으로 끝나면, DB에 저장된 user가 최종 확정(commit)
+        user = form.save()
+        self.send_activation_email(user, current_site)
         return user
 
     def send_activation_email(self, user, current_site):
-        """인증 메일 전송 (재사용 가능한 함수)"""
-        message = render_to_string('accounts/user_activate_email.html', {
-            'user': user,
-            'domain': current_site.domain,
-            'uid': urlsafe_base64_encode(force_bytes(user.pk)),
-            'token': account_activation_token.make_token(user),
-        })
-        mail_subject = "[TeamMoa] 회원가입 인증 메일입니다."
-        email_message = EmailMessage(mail_subject, message, to=[user.email])
-        email_message.send()
+        """인증 메일 전송 예약 (재사용 가능한 함수, 현재 트랜잭션 커밋 후 큐에 들어감)"""
+        send_activation_email.delay_on_commit(user_id=user.pk, domain=current_site.domain)
 
     def store_return_url(self, request):
         """
@@ -165,6 +146,18 @@ class AuthService:
         last_sent_key = f'activation_email_sent_{user_id}'
         request.session[last_sent_key] = timezone.now().isoformat()
 
+    @transaction.atomic
+    def update_profile(self, form):
+        """
+        프로필 수정 폼(또는 Serializer)을 저장하고 소속 팀에 변경을 알립니다.
+        닉네임은 팀 데이터 응답에 포함되므로 팀 데이터 버전을 올려야 ETag가 바뀝니다.
+        """
+        from teams.services import TeamService
+
+        user = form.save()
+        TeamService().record_member_profile_update(user)
+        return user
+
     @transaction.atomic
     def deactivate_user(self, user, password=None):
         """
@@ -188,7 +181,6 @@ class AuthService:
         Raises:
             ValueError: 비밀번호 불일치 등
         """
-        from teams.models import TeamUser
         from teams.services import TeamService
         from allauth.socialaccount.models import SocialAccount
         from allauth.account.models import EmailAddress
@@ -216,7 +208,7 @@ class AuthService:
         user.save()
 
         # 4. 멤버십 해제 (TODO의 assignee는 SET_NULL로 자동 처리됨)
-        TeamUser.objects.filter(user=user).delete()
+        team_service.leave_all_teams_on_user_deactivation(user)
 
         # 5. 소셜 계정 연결 해제
         SocialAccount.objects.filter(user=user).delete()
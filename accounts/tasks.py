@@ -0,0 +1,30 @@
+"""
+Accounts 백그라운드 작업
+"""
+from django.core.mail import EmailMessage
+from django.template.loader import render_to_string
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+from taskqueue.queue import task
+
+from .models import User
+from .tokens import account_activation_token
+
+
+@task(max_attempts=5)
+def send_activation_email(user_id, domain):
+    """인증 메일 SMTP 전송 (이미 인증했거나 삭제된 계정이면 건너뜀)"""
+    user = User.objects.filter(pk=user_id, is_active=False).first()
+    if user is None:
+        return
+
+    message = render_to_string('accounts/user_activate_email.html', {
+        'user': user,
+        'domain': domain,
+        'uid': urlsafe_base64_encode(force_bytes(user.pk)),
+        'token': account_activation_token.make_token(user),
+    })
+    mail_subject = "[TeamMoa] 회원가입 인증 메일입니다."
+    email_message = EmailMessage(mail_subject, message, to=[user.email])
+    email_message.send()
@@ -0,0 +1,63 @@
+"""
+Accounts 소셜 로그인 어댑터 테스트 (5개)
+
+역할: 이메일 기반 username 자동 생성과 동시 가입 충돌 처리 검증
+"""
+import pytest
+from allauth.socialaccount.models import SocialAccount, SocialLogin
+from django.contrib.sessions.backends.db import SessionStore
+
+from accounts.adapters import CustomSocialAccountAdapter
+from accounts.models import User
+from accounts.tests.conftest import create_active_user
+
+
+@pytest.fixture
+def adapter():
+    return CustomSocialAccountAdapter()
+
+
+class TestGenerateUniqueUsername:
+    """generate_unique_username 테스트 (4개)"""
+
+    def test_returns_base_when_free(self, adapter, db):
+        """중복이 없으면 이메일 앞부분 그대로 (특수문자 제거)"""
+        assert adapter.generate_unique_username('ki+m.lee@example.com') == 'kim.lee'
+
+    def test_picks_smallest_free_suffix_with_single_query(self, adapter, db, django_assert_num_queries):
+        """base, base_1, base_3이 있으면 base_2 (조회 1회)"""
+        for index, username in enumerate(['kim', 'kim_1', 'kim_3', 'kimberly', 'kim_lee']):
+            create_active_user(username=username, email=f'user{index}@example.com')
+
+        with django_assert_num_queries(1):
+            username = adapter.generate_unique_username('kim@example.com')
+
+        assert username == 'kim_2'
+
+    def test_collision_is_case_insensitive(self, adapter, db):
+        """대소문자만 다른 username도 중복으로 본다 (MySQL 비교 규칙)"""
+        create_active_user(username='Kim', email='upper@example.com')
+
+        assert adapter.generate_unique_username('kim@example.com') == 'kim_1'
+
+    def test_short_prefix_falls_back_to_user(self, adapter, db):
+        """3자 미만이면 user 기반"""
+        assert adapter.generate_unique_username('ab@example.com') == 'user'
+
+
+class TestSaveUser:
+    """save_user 테스트 (1개)"""
+
+    def test_retries_with_new_username_when_taken_concurrently(self, adapter, db, rf):
+        """username을 고른 뒤 다른 가입이 먼저 저장하면 다음 접미사로 다시 저장"""
+        user = User(username=adapter.generate_unique_username('race@example.com'),
+                    email='race@example.com', nickname='race', profile='')
+        create_active_user(username='race', email='other@example.com')  # 동시 가입이 먼저 저장
+        sociallogin = SocialLogin(user=user, account=SocialAccount(provider='google', uid='race-uid'))
+        request = rf.get('/')
+        request.session = SessionStore()
+
+        saved = adapter.save_user(request, sociallogin)
+
+        assert saved.username == 'race_1'
+        assert SocialAccount.objects.filter(user=saved, uid='race-uid').exists()
@@ -1,5 +1,5 @@
 """
-Accounts 앱 서비스 레이어 테스트 (18개)
+Accounts 앱 서비스 레이어 테스트 (19개)
 
 역할: HTTP와 무관한 순수 비즈니스 로직 검증
 """
@@ -18,8 +18,8 @@ from accounts.tests.conftest import create_inactive_user, create_active_user, TE
 class TestRegistrationAndEmail:
     """회원가입 및 이메일 테스트 (5개)"""
 
-    def test_register_user_creates_inactive_user(self, auth_service, test_site, db):
-        """회원가입 시 비활성 계정 생성"""
+    def test_register_user_creates_inactive_user(self, auth_service, test_site, db, django_capture_on_commit_callbacks):
+        """회원가입 시 비활성 계정 생성, 인증 메일은 커밋 후 발송"""
         from accounts.forms import SignupForm
 
         form_data = {
@@ -32,18 +32,24 @@ class TestRegistrationAndEmail:
         form = SignupForm(data=form_data)
         assert form.is_valid()
 
-        user = auth_service.register_user(form, test_site)
+        mail.outbox = []
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            user = auth_service.register_user(form, test_site)
+            assert len(mail.outbox) == 0  # 커밋 전에는 발송하지 않음
 
+        assert len(callbacks) == 1
+        assert len(mail.outbox) == 1
         assert user.username == 'newuser'
         assert user.is_active is False  # 이메일 인증 전이므로 비활성
         assert User.objects.filter(username='newuser').exists()
 
-    def test_send_activation_email_includes_token(self, auth_service, test_site, db):
-        """이메일에 uid/token 포함 확인"""
+    def test_send_activation_email_includes_token(self, auth_service, test_site, db, django_capture_on_commit_callbacks):
+        """이메일에 uid/token 포함 확인 (커밋 후 작업 큐에서 발송)"""
         user = create_inactive_user(username='emailtest', email='emailtest@example.com')
 
         mail.outbox = []  # 초기화
-        auth_service.send_activation_email(user, test_site)
+        with django_capture_on_commit_callbacks(execute=True):
+            auth_service.send_activation_email(user, test_site)
 
         assert len(mail.outbox) == 1
         assert mail.outbox[0].to == [user.email]
@@ -89,7 +95,7 @@ class TestRegistrationAndEmail:
 class TestResendActivationAndRateLimiting:
     """인증 재발송 및 Rate Limiting 테스트 (4개)"""
 
-    def test_resend_activation_email_success(self, auth_service, test_site, db, rf):
+    def test_resend_activation_email_success(self, auth_service, test_site, db, rf, django_capture_on_commit_callbacks):
         """재발송 성공"""
         user = create_inactive_user(username='resend_test', email='resend@example.com')
 
@@ -98,7 +104,8 @@ class TestResendActivationAndRateLimiting:
         request.session = {}
 
         mail.outbox = []
-        result_user = auth_service.resend_activation_email(request, user.email, test_site)
+        with django_capture_on_commit_callbacks(execute=True):
+            result_user = auth_service.resend_activation_email(request, user.email, test_site)
 
         assert result_user == user
         assert len(mail.outbox) == 1
@@ -118,7 +125,7 @@ class TestResendActivationAndRateLimiting:
         with pytest.raises(ValueError, match='5분마다 한 번씩만'):
             auth_service.resend_activation_email(request, user.email, test_site)
 
-    def test_resend_activation_allowed_after_5_minutes(self, auth_service, test_site, db, rf):
+    def test_resend_activation_allowed_after_5_minutes(self, auth_service, test_site, db, rf, django_capture_on_commit_callbacks):
         """5분 경과 후 재발송 허용"""
         user = create_inactive_user(username='timepass_test', email='timepass@example.com')
 
@@ -127,7 +134,8 @@ class TestResendActivationAndRateLimiting:
 
         # 첫 요청
         mail.outbox = []
-        auth_service.resend_activation_email(request, user.email, test_site)
+        with django_capture_on_commit_callbacks(execute=True):
+            auth_service.resend_activation_email(request, user.email, test_site)
         assert len(mail.outbox) == 1
 
         # 5분 경과 시뮬레이션 (세션 시간 조작)
@@ -136,7 +144,8 @@ class TestResendActivationAndRateLimiting:
         ).isoformat()
 
         # 재요청 성공
-        auth_service.resend_activation_email(request, user.email, test_site)
+        with django_capture_on_commit_callbacks(execute=True):
+            auth_service.resend_activation_email(request, user.email, test_site)
         assert len(mail.outbox) == 2  # 이메일 2개 발송됨
 
     def test_resend_activation_rejects_active_user(self, auth_service, test_site, db, rf):
@@ -202,7 +211,7 @@ class TestSessionManagement:
 
 
 class TestUserDeactivation:
-    """회원 탈퇴 테스트 (4개)"""
+    """회원 탈퇴 테스트 (5개)"""
 
     def test_deactivate_user_anonymizes_personal_info(self, auth_service, db):
         """탈퇴 시 개인정보 익명화"""
@@ -246,12 +255,13 @@ class TestUserDeactivation:
         assert deactivated_user.deleted_at is not None
 
     def test_deactivate_user_removes_all_team_memberships(self, auth_service, db):
-        """탈퇴 시 모든 팀 멤버십 제거"""
+        """탈퇴 시 모든 팀 멤버십 제거 및 팀 인원수 감소"""
         from teams.models import Team, TeamUser
 
         user = create_active_user(username='multi_team_user', email='multi@example.com', password=TEST_PASSWORD)
 
         # 3개 팀에 멤버로 가입
+        teams = []
         for i in range(3):
             host = create_active_user(username=f'host_{i}', email=f'host{i}@example.com')
             team = Team.objects.create(
@@ -265,6 +275,7 @@ class TestUserDeactivation:
             )
             TeamUser.objects.create(team=team, user=host)
             TeamUser.objects.create(team=team, user=user)
+            teams.append(team)
 
         # 탈퇴 전 멤버십 확인
         assert TeamUser.objects.filter(user=user).count() == 3
@@ -274,3 +285,31 @@ class TestUserDeactivation:
 
         # 모든 멤버십이 제거되었는지 확인
         assert TeamUser.objects.filter(user=user).count() == 0
+        # 팀 인원수도 함께 줄어 빈 자리로 다시 가입할 수 있음
+        assert [Team.objects.get(pk=team.pk).currentuser for team in teams] == [1, 1, 1]
+
+    def test_deactivate_host_transfers_or_deletes_owned_teams(self, auth_service, db):
+        """탈퇴한 호스트의 팀은 가장 먼저 가입한 멤버에게 승계, 혼자인 팀은 삭제"""
+        from teams.models import Team, TeamUser
+
+        host = create_active_user(username='leaving_host', email='leaving@example.com', password=TEST_PASSWORD)
+        first = create_active_user(username='first_member', email='first@example.com')
+        second = create_active_user(username='second_member', email='second@example.com')
+
+        teams = []
+        for i in range(3):
+            team = Team.objects.create(
+                title=f'Owned {i}', host=host, maxuser=10, currentuser=1,
+                invitecode=f'own{i}', teampasswd='password', introduction='Test'
+            )
+            TeamUser.objects.create(team=team, user=host)
+            teams.append(team)
+        for team in teams[:2]:
+            TeamUser.objects.create(team=team, user=first if team is teams[0] else second)
+            TeamUser.objects.create(team=team, user=second if team is teams[0] else first)
+
+        auth_service.deactivate_user(host, TEST_PASSWORD)
+
+        assert Team.objects.get(pk=teams[0].pk).host == first
+        assert Team.objects.get(pk=teams[1].pk).host == second
+        assert not Team.objects.filter(pk=teams[2].pk).exists()
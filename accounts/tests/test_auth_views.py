@@ -33,7 +33,7 @@ class TestSignupFlow:
         assert 'form' in response.context
         assert 'username' in response.content.decode()
 
-    def test_signup_view_redirects_on_success(self, client, db):
+    def test_signup_view_redirects_on_success(self, client, db, django_capture_on_commit_callbacks):
         """POST 성공 → signup_success로 리다이렉트"""
         url = reverse('accounts:signup')
         form_data = {
@@ -45,7 +45,8 @@ class TestSignupFlow:
         }
 
         mail.outbox = []
-        response = client.post(url, data=form_data)
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(url, data=form_data)
 
         assert response.status_code == 302
         assert reverse('accounts:signup_success') in response.url
@@ -0,0 +1,55 @@
+"""
+delete_unverified_users Management Command 테스트
+
+테스트 구성:
+- TestDeleteUnverifiedUsersCommand: 배치 삭제/진행 출력, dry-run
+"""
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from accounts.models import User
+from accounts.tests.conftest import create_active_user, create_inactive_user
+
+
+@pytest.fixture
+def stale_users(db):
+    """기준일이 지난 미인증 계정 5개 + 남아야 하는 계정 2개"""
+    old = timezone.now() - timedelta(days=10)
+    for i in range(5):
+        create_inactive_user(username=f'stale{i}', email=f'stale{i}@example.com')
+    User.objects.filter(username__startswith='stale').update(date_joined=old)
+
+    create_inactive_user(username='recent', email='recent@example.com')
+    active = create_active_user(username='verified', email='verified@example.com')
+    User.objects.filter(pk=active.pk).update(date_joined=old)
+
+
+@pytest.mark.integration
+class TestDeleteUnverifiedUsersCommand:
+    """delete_unverified_users 커맨드 테스트"""
+
+    def test_deletes_in_batches_with_progress(self, stale_users):
+        """batch-size 단위로 삭제하며 진행 상황을 출력하고, 대상이 아닌 계정은 남긴다"""
+        stdout = StringIO()
+
+        call_command('delete_unverified_users', batch_size=2, stdout=stdout)
+
+        output = stdout.getvalue()
+        assert '삭제 진행: 2/5' in output
+        assert '삭제 진행: 4/5' in output
+        assert '5개의 미인증 계정을 삭제했습니다' in output
+        assert not User.objects.filter(username__startswith='stale').exists()
+        assert set(User.objects.values_list('username', flat=True)) == {'recent', 'verified'}
+
+    def test_dry_run_keeps_users(self, stale_users):
+        """--dry-run은 대상만 출력하고 삭제하지 않는다"""
+        stdout = StringIO()
+
+        call_command('delete_unverified_users', dry_run=True, stdout=stdout)
+
+        assert '삭제 대상 미인증 계정: 5개' in stdout.getvalue()
+        assert User.objects.filter(username__startswith='stale').count() == 5
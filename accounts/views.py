@@ -202,7 +202,7 @@ class UserUpdateView(LoginRequiredMixin, FormView):
         return super().get(request, *args, **kwargs)
     
     def form_valid(self, form):
-        form.save()
+        self.auth_service.update_profile(form)
         messages.success(self.request, '회원정보가 성공적으로 수정되었습니다.')
         return_url = self.auth_service.get_return_url(self.request, MAIN_PAGE)
         return redirect(return_url)
@@ -94,7 +94,7 @@ class UserViewSet(viewsets.GenericViewSet):
         )
 
         if serializer.is_valid():
-            serializer.save()
+            AuthService().update_profile(serializer)
             # 업데이트된 정보를 프로필 시리얼라이저로 반환
             response_serializer = UserProfileSerializer(user)
             return Response(response_serializer.data)
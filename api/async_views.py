@@ -0,0 +1,178 @@
+"""
+읽기 전용 async API 뷰
+
+조회가 잦은 엔드포인트를 Django async ORM으로 구현한 버전입니다.
+ASGI(uvicorn 워커, Daphne)에서 실행하면 DB/캐시 대기 중에 워커가 다른 요청을 처리할 수 있습니다.
+응답 형식은 대응하는 DRF ViewSet과 같습니다.
+
+- GET /api/v1/async/teams/                                          ↔ TeamViewSet.list
+- GET /api/v1/async/teams/{team_pk}/todos/board/                    ↔ TodoService.get_team_todos_with_stats
+- GET /api/v1/async/teams/{team_pk}/mindmaps/{pk}/                  ↔ MindmapViewSet.retrieve
+- GET /api/v1/async/teams/{team_pk}/schedules/team-availability/    ↔ ScheduleViewSet.get_team_availability
+- GET /api/v1/async/teams/{team_pk}/changes/                        팀 변경 피드 long-poll (async 전용)
+
+DRF APIView는 async 핸들러를 지원하지 않으므로 인증/팀 멤버십 확인과
+에러 응답 형식(api.exceptions.custom_exception_handler)은 async_api_view에서 처리합니다.
+"""
+from functools import wraps
+
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+
+from common import fastjson
+from members.serializers import TeamMemberSerializer, TodoSerializer
+from members.services import TodoService
+from mindmaps.models import Mindmap
+from mindmaps.serializers import MindmapSerializer, NodeConnectionSerializer, NodeSerializer
+from mindmaps.services import MindmapService
+from schedules.serializers import TeamAvailabilitySerializer, TeamScheduleQuerySerializer
+from schedules.services import ScheduleService
+from teams.models import TeamUser
+from teams.serializers import TeamChangeQuerySerializer, TeamListSerializer
+from teams.services import TeamChangeService, TeamService
+
+ERROR_MESSAGES = {
+    400: '잘못된 요청입니다.',
+    403: '접근 권한이 없습니다.',
+    404: '요청한 리소스를 찾을 수 없습니다.',
+}
+
+
+def json_response(payload, status=200):
+    return HttpResponse(fastjson.dumps(payload), status=status, content_type='application/json')
+
+
+def error_response(status, details=None):
+    """custom_exception_handler와 같은 형식의 에러 응답"""
+    return json_response({
+        'error': True,
+        'message': ERROR_MESSAGES[status],
+        'details': details if details is not None else {},
+        'status_code': status,
+    }, status=status)
+
+
+def async_api_view(view_func):
+    """
+    async API 뷰 공통 처리
+
+    - GET만 허용
+    - 로그인 확인 (SessionAuthentication과 같이 미인증 시 403)
+    - URL에 team_pk가 있으면 팀 멤버십 확인 (IsTeamMember)
+    """
+    @require_GET
+    @wraps(view_func)
+    async def wrapper(request, *args, **kwargs):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return error_response(403, {'detail': '자격 인증데이터(authentication credentials)가 제공되지 않았습니다.'})
+
+        team_pk = kwargs.get('team_pk')
+        if team_pk is not None and not await TeamUser.objects.filter(team_id=team_pk, user=user).aexists():
+            return error_response(403, {'detail': '이 작업을 수행할 권한(permission)이 없습니다.'})
+
+        request.user = user
+        return await view_func(request, *args, **kwargs)
+
+    return wrapper
+
+
+@async_api_view
+async def team_list(request):
+    """사용자가 속한 팀 목록 조회"""
+    teams = await TeamService().aget_user_teams(request.user)
+    return json_response({
+        'success': True,
+        'data': TeamListSerializer(teams, many=True).data
+    })
+
+
+@async_api_view
+async def todo_board(request, team_pk):
+    """멤버별 TODO + 미할당/완료 보드 조회"""
+    board = await TodoService().aget_team_todos_with_stats(team_pk)
+
+    members = []
+    for member_data in board['members_data']:
+        member = TeamMemberSerializer(member_data['member']).data
+        member.update({
+            'todo_count': member_data['todo_count'],
+            'completed_count': member_data['completed_count'],
+            'in_progress_count': member_data['in_progress_count'],
+            'todos': TodoSerializer(member_data['todos'], many=True).data,
+        })
+        members.append(member)
+
+    return json_response({
+        'success': True,
+        'data': {
+            'members': members,
+            'todos_unassigned': TodoSerializer(board['todos_unassigned'], many=True).data,
+            'todos_done': TodoSerializer(board['todos_done'], many=True).data,
+        }
+    })
+
+
+@async_api_view
+async def mindmap_detail(request, team_pk, pk):
+    """마인드맵 상세 조회 (노드 및 연결선 포함)"""
+    try:
+        mindmap_data = await MindmapService().aget_mindmap_with_nodes(team_pk, pk)
+    except Mindmap.DoesNotExist:
+        return error_response(404, {'detail': '찾을 수 없습니다.'})
+
+    return json_response({
+        'success': True,
+        'mindmap': MindmapSerializer(mindmap_data['mindmap']).data,
+        'nodes': NodeSerializer(mindmap_data['nodes'], many=True).data,
+        'lines': NodeConnectionSerializer(mindmap_data['lines'], many=True).data
+    })
+
+
+@async_api_view
+async def team_availability(request, team_pk):
+    """
+    팀 가용성 조회
+
+    GET /api/v1/async/teams/{team_pk}/schedules/team-availability/?start_date=2025-10-06&end_date=2025-10-12
+    """
+    query_serializer = TeamScheduleQuerySerializer(data=request.GET)
+    if not query_serializer.is_valid():
+        return error_response(400, query_serializer.errors)
+
+    availability_data = await ScheduleService().aget_team_availability(
+        team_pk,
+        query_serializer.validated_data['start_date'],
+        query_serializer.validated_data['end_date'],
+    )
+
+    return json_response({
+        'success': True,
+        'data': TeamAvailabilitySerializer(availability_data, many=True).data
+    })
+
+
+@async_api_view
+async def team_changes(request, team_pk):
+    """
+    팀 변경 피드 long-poll
+
+    GET /api/v1/async/teams/{team_pk}/changes/?since=120&timeout=25
+
+    - since 없이 요청하면 기다리지 않고 현재 seq만 반환 (목록을 처음 받은 직후 호출)
+    - since 이후 변경이 있으면 바로, 없으면 최대 timeout초 기다렸다가 반환
+    - 다음 요청은 응답의 seq를 since로 사용, reset이면 목록 전체를 다시 조회
+    대기 중에 워커를 점유하지 않도록 ASGI 워커(GUNICORN_WORKER_MODE=asgi)에서 사용합니다.
+    """
+    query_serializer = TeamChangeQuerySerializer(data=request.GET)
+    if not query_serializer.is_valid():
+        return error_response(400, query_serializer.errors)
+
+    since = query_serializer.validated_data.get('since')
+    service = TeamChangeService()
+    if since is None:
+        feed = await service.aget_changes(team_pk)
+    else:
+        feed = await service.wait_for_changes(team_pk, since, query_serializer.validated_data['timeout'])
+
+    return json_response({'success': True, **feed})
@@ -0,0 +1,113 @@
+"""
+API ViewSet 공용 Mixin
+"""
+import hashlib
+from datetime import date
+
+from django.utils.http import parse_etags
+from rest_framework import status as http_status
+from rest_framework.response import Response
+
+from teams.models import TeamChange, TeamDataVersion
+
+
+class _NotModified(Exception):
+    """If-None-Match가 현재 ETag와 같음 (핸들러 실행 생략)"""
+
+
+class ConditionalGetMixin:
+    """
+    읽기 액션에 ETag 조건부 GET(304 Not Modified)을 적용하는 ViewSet Mixin
+
+    ETag = hash(요청 경로+쿼리, 사용자, 오늘 날짜, 팀 데이터 버전, 응답 형식)
+    팀 데이터를 바꾸는 서비스 메서드가 TeamDataVersion을 올리므로, 권한 확인 뒤 버전 조회 1회로
+    클라이언트 사본이 최신인지 판단하고 최신이면 조회/직렬화 없이 304를 돌려줍니다.
+    (날짜는 마일스톤 상태처럼 오늘 기준으로 계산되는 값 때문에 포함)
+
+    - conditional_actions: 조건부 GET을 적용할 액션
+    - get_version_team_id(): 버전을 볼 팀 ID (기본값: URL의 team_pk)
+    - get_data_version(): None이면 해당 요청은 조건부 처리하지 않음
+    - 기본 ModelViewSet 쓰기(perform_create/update/destroy)도 버전을 올리고,
+      change_entity가 있으면 팀 변경 피드(TeamChange)에 남깁니다.
+    """
+    conditional_actions = ('list', 'retrieve')
+    change_entity = None
+
+    def get_version_team_id(self):
+        """데이터 버전을 볼 팀 ID"""
+        return self.kwargs.get('team_pk')
+
+    def get_data_version(self):
+        """응답 데이터 버전 문자열 (ETag 재료)"""
+        return str(TeamDataVersion.current(self.get_version_team_id()))
+
+    def get_change_entity_id(self, instance):
+        """변경 피드에 남길 entity_id"""
+        return instance.pk
+
+    def record_change(self, op, entity_id):
+        """ViewSet에서 서비스 레이어를 거치지 않고 저장한 경우 호출 (change_entity가 없으면 버전만 올림)"""
+        team_id = self.get_version_team_id()
+        if self.change_entity is None:
+            TeamDataVersion.bump(team_id)
+        else:
+            TeamChange.record(team_id, self.change_entity, entity_id, op)
+
+    def initial(self, request, *args, **kwargs):
+        # 인증/권한 확인이 끝난 뒤에만 버전을 보고 304 여부를 판단
+        super().initial(request, *args, **kwargs)
+        self._etag = None
+        if request.method not in ('GET', 'HEAD') or self.action not in self.conditional_actions:
+            return
+
+        version = self.get_data_version()
+        if version is None:
+            return
+        self._etag = self._make_etag(request, version)
+        if self._etag_matches(request.META.get('HTTP_IF_NONE_MATCH')):
+            raise _NotModified()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, _NotModified):
+            return Response(status=http_status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, '_etag', None) and response.status_code in (200, 304):
+            response['ETag'] = self._etag
+            # 브라우저가 저장은 하되 매번 재검증하도록 (공유 캐시 저장 금지)
+            response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        self.record_change(TeamChange.OP_CREATED, self.get_change_entity_id(serializer.instance))
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        self.record_change(TeamChange.OP_UPDATED, self.get_change_entity_id(serializer.instance))
+
+    def perform_destroy(self, instance):
+        entity_id = self.get_change_entity_id(instance)
+        super().perform_destroy(instance)
+        self.record_change(TeamChange.OP_DELETED, entity_id)
+
+    def _make_etag(self, request, version):
+        key = '|'.join((
+            request.get_full_path(),
+            str(request.user.pk),
+            date.today().isoformat(),
+            version,
+            request.accepted_media_type or '',
+        ))
+        return 'W/"%s"' % hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+    def _etag_matches(self, if_none_match):
+        """If-None-Match 약한 비교 (RFC 9110 13.1.2)"""
+        if not if_none_match:
+            return False
+        etags = parse_etags(if_none_match)
+        if '*' in etags:
+            return True
+        return self._etag.removeprefix('W/') in {etag.removeprefix('W/') for etag in etags}
@@ -1,4 +1,4 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 
 
@@ -45,4 +45,18 @@ class LargeResultsSetPagination(PageNumberPagination):
     """
     page_size = 50
     page_size_query_param = 'page_size'
-    max_page_size = 200
\ No newline at end of file
+    max_page_size = 200
+
+
+class CommentCursorPagination(CursorPagination):
+    """
+    댓글 스레드용 커서 페이지네이션 (최신순)
+
+    댓글이 수백 개인 노드도 page_size개씩만 읽고, 페이지를 넘기는 사이 새 댓글이 달려도
+    OFFSET과 달리 중복/누락이 없습니다.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-id'
+
@@ -0,0 +1,25 @@
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from common import fastjson
+
+
+class TeamMoaJSONParser(JSONParser):
+    """
+    TeamMoa API 기본 JSON 파서 (orjson)
+
+    UTF-8 본문은 디코딩 없이 bytes 그대로 파싱합니다.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            body = stream.read()
+            if encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+                body = body.decode(encoding)
+            return fastjson.loads(body)
+        except ValueError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
@@ -0,0 +1,21 @@
+from rest_framework.renderers import JSONRenderer
+
+from common import fastjson
+
+
+class TeamMoaJSONRenderer(JSONRenderer):
+    """
+    TeamMoa API 기본 JSON 렌더러 (orjson)
+
+    응답 형식은 JSONRenderer와 같고(compact, 한글 그대로), 인코딩만 common.fastjson으로 합니다.
+    들여쓰기를 요청한 경우(Accept: application/json; indent=4)에만 기본 구현을 사용합니다.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return fastjson.dumps(data)
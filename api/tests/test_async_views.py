@@ -0,0 +1,143 @@
+"""
+async API 뷰 테스트
+
+AsyncClient로 ASGI 핸들러 경로(async 미들웨어 체인)를 그대로 통과시켜 검증합니다.
+
+테스트 구성:
+- TestAsyncApiViews: 응답 형식(sync ViewSet과 동일), 인증/멤버십, 파라미터 검증, 팀 변경 피드 long-poll
+"""
+from datetime import date
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+
+from members.models import Todo
+from mindmaps.models import Mindmap, Node, NodeConnection
+from schedules.models import PersonalDaySchedule
+from teams.models import TeamChange, TeamUser
+
+
+def get(path, user=None, **params):
+    """AsyncClient GET 요청 (pytest-asyncio 없이 실행)"""
+    async def request():
+        client = AsyncClient()
+        if user is not None:
+            await client.aforce_login(user)
+        return await client.get(path, params)
+    return async_to_sync(request)()
+
+
+@pytest.mark.api
+class TestAsyncApiViews:
+    """async 읽기 전용 API 테스트"""
+
+    def test_team_list_matches_sync_viewset(self, user, team, authenticated_api_client):
+        """팀 목록 응답이 sync TeamViewSet.list와 같다"""
+        response = get('/api/v1/async/teams/', user)
+
+        assert response.status_code == 200
+        assert response.json() == authenticated_api_client.get('/api/v1/teams/').json()
+
+    def test_todo_board(self, user, team):
+        """멤버별 TODO와 미할당/완료 보드를 반환한다"""
+        host_membership = TeamUser.objects.get(team=team, user=user)
+        Todo.objects.create(team=team, content='할당됨', assignee=host_membership)
+        Todo.objects.create(team=team, content='미할당')
+        Todo.objects.create(team=team, content='완료', is_completed=True)
+
+        response = get(f'/api/v1/async/teams/{team.id}/todos/board/', user)
+
+        data = response.json()['data']
+        assert data['members'][0]['is_host'] is True
+        assert [t['content'] for t in data['members'][0]['todos']] == ['할당됨']
+        assert data['members'][0]['todos'][0]['assignee_name'] == user.nickname
+        assert [t['content'] for t in data['todos_unassigned']] == ['미할당']
+        assert [t['content'] for t in data['todos_done']] == ['완료']
+
+    def test_mindmap_detail_matches_sync_viewset(self, user, team, authenticated_api_client):
+        """마인드맵 상세 응답이 sync MindmapViewSet.retrieve와 같다"""
+        mindmap = Mindmap.objects.create(team=team, title='맵')
+        first = Node.objects.create(mindmap=mindmap, posX=1, posY=2, title='A', content='a')
+        second = Node.objects.create(mindmap=mindmap, posX=3, posY=4, title='B', content='b')
+        NodeConnection.objects.create(mindmap=mindmap, from_node=first, to_node=second)
+        path = f'/teams/{team.id}/mindmaps/{mindmap.id}/'
+
+        response = get(f'/api/v1/async{path}', user)
+
+        assert response.status_code == 200
+        assert response.json() == authenticated_api_client.get(f'/api/v1{path}').json()
+
+    def test_team_availability(self, user, team):
+        """기간 내 시간대별 가능 인원 수를 집계한다"""
+        PersonalDaySchedule.objects.create(
+            owner=TeamUser.objects.get(team=team, user=user),
+            date=date(2025, 10, 6),
+            available_hours=[9, 10],
+        )
+
+        response = get(
+            f'/api/v1/async/teams/{team.id}/schedules/team-availability/', user,
+            start_date='2025-10-06', end_date='2025-10-07',
+        )
+
+        data = response.json()['data']
+        assert len(data) == 2
+        assert data[0]['availability']['9'] == 1
+        assert data[1]['availability']['9'] == 0
+
+    def test_team_availability_invalid_params(self, user, team):
+        """시작일이 종료일보다 늦으면 400"""
+        response = get(
+            f'/api/v1/async/teams/{team.id}/schedules/team-availability/', user,
+            start_date='2025-10-07', end_date='2025-10-06',
+        )
+
+        assert response.status_code == 400
+        assert response.json()['error'] is True
+
+    def test_requires_authentication(self, team):
+        """미인증 요청은 403"""
+        response = get('/api/v1/async/teams/')
+
+        assert response.status_code == 403
+
+    def test_requires_team_membership(self, another_user, team):
+        """팀 멤버가 아니면 403"""
+        response = get(f'/api/v1/async/teams/{team.id}/todos/board/', another_user)
+
+        assert response.status_code == 403
+
+    def test_mindmap_of_other_team_not_found(self, user, team):
+        """다른 팀 마인드맵 ID는 404"""
+        response = get(f'/api/v1/async/teams/{team.id}/mindmaps/999999/', user)
+
+        assert response.status_code == 404
+
+    def test_queries_instrumented_on_async_path(self, user, team):
+        """async ORM 쿼리도 요청 계측(Server-Timing)에 집계된다"""
+        response = get('/api/v1/async/teams/', user)
+
+        assert 'desc="0 queries"' not in response['Server-Timing']
+
+    def test_team_changes_returns_pending_changes(self, user, team):
+        """since 이후 변경이 있으면 기다리지 않고 반환, since 없으면 현재 seq만"""
+        TeamChange.record(team.id, TeamChange.ENTITY_TODO, 7, TeamChange.OP_CREATED)
+        path = f'/api/v1/async/teams/{team.id}/changes/'
+
+        assert get(path, user).json() == {
+            'success': True, 'seq': 1, 'changes': [], 'has_more': False, 'reset': False
+        }
+        data = get(path, user, since=0).json()
+        assert data['seq'] == 1
+        assert [(c['entity'], c['id'], c['op']) for c in data['changes']] == [('todo', 7, 'created')]
+
+    def test_team_changes_times_out_without_changes(self, user, team, another_user):
+        """변경이 없으면 timeout 뒤 빈 목록, 팀 멤버가 아니면 403"""
+        path = f'/api/v1/async/teams/{team.id}/changes/'
+
+        data = get(path, user, since=0, timeout=0).json()
+        assert data['changes'] == []
+        assert data['reset'] is False
+        assert get(path, user, since=0, timeout=99).status_code == 400
+        assert get(path, another_user, since=0, timeout=0).status_code == 403
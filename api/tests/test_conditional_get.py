@@ -0,0 +1,152 @@
+"""
+ETag 조건부 GET 테스트
+
+테스트 구성:
+- TestConditionalGet: ETag 발급, If-None-Match → 304(핸들러 생략), 데이터 변경 시 ETag 변경,
+  마인드맵 편집은 마인드맵 ETag만 변경
+- TestTeamConditionalGet: 팀 목록/상세의 버전 기준 (소속 팀, 비멤버, 멤버 닉네임 변경/탈퇴)
+"""
+from datetime import date
+
+import pytest
+
+from mindmaps.models import Mindmap, Node
+from mindmaps.services import MindmapService
+from teams.models import TeamDataVersion
+from accounts.services import AuthService
+from teams.services import MilestoneService, TeamService
+
+
+@pytest.mark.api
+class TestConditionalGet:
+    """ConditionalGetMixin 테스트"""
+
+    def test_returns_etag_and_not_modified(self, authenticated_api_client, team, django_assert_max_num_queries):
+        """첫 응답에 ETag, 같은 ETag로 다시 요청하면 목록 조회 없이 본문 없는 304"""
+        MilestoneService().create_milestone(team, '기획', '', date(2025, 1, 6), date(2025, 1, 31), 'high')
+        url = f'/api/v1/teams/{team.id}/milestones/'
+
+        response = authenticated_api_client.get(url)
+        etag = response['ETag']
+        assert response.status_code == 200
+        assert etag.startswith('W/"')
+        assert response['Cache-Control'] == 'private, no-cache'
+
+        # 권한 확인 + 버전 조회만
+        with django_assert_max_num_queries(2):
+            response = authenticated_api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response.content == b''
+        assert response['ETag'] == etag
+
+    def test_service_write_changes_etag(self, authenticated_api_client, team):
+        """서비스 레이어 쓰기가 팀 버전을 올려 이전 ETag로는 200"""
+        url = f'/api/v1/teams/{team.id}/milestones/'
+        etag = authenticated_api_client.get(url)['ETag']
+
+        MilestoneService().create_milestone(team, '출시', '', date(2025, 2, 3), date(2025, 2, 28), 'medium')
+        response = authenticated_api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response['ETag'] != etag
+        assert len(response.json()) == 1
+
+    def test_viewset_write_changes_etag(self, authenticated_api_client, team):
+        """서비스를 거치지 않는 ViewSet 저장(노드 PATCH)도 버전을 올린다"""
+        mindmap = Mindmap.objects.create(team=team, title='아이디어')
+        node = Node.objects.create(mindmap=mindmap, posX=0, posY=0, title='노드', content='내용')
+        url = f'/api/v1/teams/{team.id}/mindmaps/{mindmap.id}/nodes/{node.id}/'
+        etag = authenticated_api_client.get(url)['ETag']
+
+        authenticated_api_client.patch(url, {'posX': 100}, format='json')
+
+        assert authenticated_api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_etag_differs_per_query_and_ignores_unsafe_methods(self, authenticated_api_client, team):
+        """쿼리 문자열이 다르면 다른 ETag, POST는 If-None-Match와 관계없이 처리"""
+        url = f'/api/v1/teams/{team.id}/mindmaps/'
+        etag = authenticated_api_client.get(url)['ETag']
+
+        assert authenticated_api_client.get(url + '?page=2')['ETag'] != etag
+        response = authenticated_api_client.post(url, {'title': '새 마인드맵'}, format='json',
+                                                 HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 201
+        assert 'ETag' not in response
+
+    def test_mindmap_edits_keep_team_etags(self, authenticated_api_client, team, user):
+        """마인드맵 편집/댓글/추천은 마인드맵 ETag만 바꾸고 팀의 다른 API는 계속 304"""
+        mindmap = Mindmap.objects.create(team=team, title='아이디어')
+        node = Node.objects.create(mindmap=mindmap, posX=0, posY=0, title='노드', content='내용')
+        team_urls = [f'/api/v1/teams/{team.id}/', f'/api/v1/teams/{team.id}/milestones/']
+        mindmap_urls = [
+            f'/api/v1/teams/{team.id}/mindmaps/',
+            f'/api/v1/teams/{team.id}/mindmaps/{mindmap.id}/',
+            f'/api/v1/teams/{team.id}/mindmaps/{mindmap.id}/nodes/{node.id}/',
+        ]
+        etags = {url: authenticated_api_client.get(url)['ETag'] for url in team_urls + mindmap_urls}
+        team_version = TeamDataVersion.current(team.id)
+
+        service = MindmapService()
+        for edit in (
+            lambda: service.apply_operations(mindmap.id, [{'type': 'node_move', 'node_id': node.id, 'x': 5, 'y': 5}], user),
+            lambda: service.create_comment(node.id, '댓글', user),
+            lambda: service.toggle_node_recommendation(node.id, user.id),
+        ):
+            edit()
+            for url in mindmap_urls:
+                response = authenticated_api_client.get(url, HTTP_IF_NONE_MATCH=etags[url])
+                assert response.status_code == 200
+                etags[url] = response['ETag']
+
+        assert TeamDataVersion.current(team.id) == team_version
+        for url in team_urls:
+            assert authenticated_api_client.get(url, HTTP_IF_NONE_MATCH=etags[url]).status_code == 304
+
+
+@pytest.mark.api
+class TestTeamConditionalGet:
+    """TeamViewSet 버전 기준 테스트"""
+
+    def test_team_list_changes_when_member_joins(self, authenticated_api_client, team, another_user):
+        """소속 팀의 멤버가 바뀌면 팀 목록 ETag도 바뀐다"""
+        etag = authenticated_api_client.get('/api/v1/teams/')['ETag']
+        assert authenticated_api_client.get('/api/v1/teams/', HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        TeamService().join_team(another_user, team.id, 'teampass123')
+
+        response = authenticated_api_client.get('/api/v1/teams/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.json()['data'][0]['currentuser'] == 2
+        assert TeamDataVersion.current(team.id) == 1
+
+    def test_non_member_gets_no_etag(self, api_client, team, another_user):
+        """소속되지 않은 팀 상세는 ETag 없이 404 (If-None-Match로 버전을 알아낼 수 없음)"""
+        api_client.force_authenticate(user=another_user)
+
+        response = api_client.get(f'/api/v1/teams/{team.id}/', HTTP_IF_NONE_MATCH='*')
+
+        assert response.status_code == 404
+        assert 'ETag' not in response
+
+    def test_member_profile_change_and_deactivation_change_etag(self, api_client, user, team, another_user):
+        """팀원의 닉네임 수정과 회원 탈퇴도 팀 ETag를 바꾼다"""
+        TeamService().join_team(another_user, team.id, 'teampass123')
+        url = f'/api/v1/teams/{team.id}/'
+        api_client.force_authenticate(user=user)
+        etag = api_client.get(url)['ETag']
+
+        api_client.force_authenticate(user=another_user)
+        assert api_client.patch('/api/v1/users/update_profile/', {'nickname': '새닉네임'},
+                                format='json').status_code == 200
+
+        api_client.force_authenticate(user=user)
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        etag = response['ETag']
+
+        AuthService().deactivate_user(another_user, 'testpass123!')
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.json()['data']['currentuser'] == 1
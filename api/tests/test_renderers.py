@@ -0,0 +1,81 @@
+"""
+orjson 기반 JSON 렌더러 / 파서 테스트
+
+테스트 구성:
+- TestTeamMoaJSONRenderer: 기본 JSONRenderer와 같은 출력, 타입 변환, indent 요청
+- TestTeamMoaJSONParser: 파싱, 잘못된 JSON
+- TestApiJsonSettings: REST_FRAMEWORK 기본 렌더러/파서로 API 왕복
+"""
+import io
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from api.parsers import TeamMoaJSONParser
+from api.renderers import TeamMoaJSONRenderer
+
+
+@pytest.mark.unit
+class TestTeamMoaJSONRenderer:
+    """TeamMoaJSONRenderer 테스트"""
+
+    def test_matches_default_renderer_output(self):
+        """compact 형식, 한글 그대로 - 기본 JSONRenderer와 같은 bytes"""
+        data = {'success': True, 'messages': [{'message': '저장되었습니다.', 'level': 'success'}],
+                'data': {'id': 1, 'ratio': 0.5, 'tags': ['회의', None]}}
+
+        assert TeamMoaJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_converts_non_json_types(self):
+        """date/UUID는 ISO 문자열, Decimal은 숫자, lazy 문자열은 str"""
+        key = uuid.UUID('12345678-1234-5678-1234-567812345678')
+        data = {'day': date(2025, 1, 6), 'at': datetime(2025, 1, 6, 9, 30), 'key': key,
+                'price': Decimal('1.50'), 'label': gettext_lazy('완료')}
+
+        assert json.loads(TeamMoaJSONRenderer().render(data)) == {
+            'day': '2025-01-06', 'at': '2025-01-06T09:30:00', 'key': str(key), 'price': 1.5, 'label': '완료'
+        }
+
+    def test_indent_request_uses_default_renderer(self):
+        """Accept 헤더로 indent를 요청하면 들여쓰기 출력"""
+        rendered = TeamMoaJSONRenderer().render({'a': 1}, 'application/json; indent=2')
+
+        assert rendered == b'{\n  "a": 1\n}'
+
+
+@pytest.mark.unit
+class TestTeamMoaJSONParser:
+    """TeamMoaJSONParser 테스트"""
+
+    def test_parses_utf8_body(self):
+        body = '{"title": "회의록", "ids": [1, 2]}'.encode('utf-8')
+
+        assert TeamMoaJSONParser().parse(io.BytesIO(body)) == {'title': '회의록', 'ids': [1, 2]}
+
+    def test_invalid_json_raises_parse_error(self):
+        with pytest.raises(ParseError):
+            TeamMoaJSONParser().parse(io.BytesIO(b'{"title": '))
+
+
+@pytest.mark.api
+class TestApiJsonSettings:
+    """REST_FRAMEWORK 기본 렌더러/파서 적용 확인"""
+
+    def test_api_round_trip(self, authenticated_api_client, team):
+        """JSON 본문 요청이 파싱되고 응답이 orjson 렌더러로 만들어진다"""
+        response = authenticated_api_client.post(
+            f'/api/v1/teams/{team.id}/milestones/',
+            data=json.dumps({'title': '출시', 'startdate': '2025-01-06', 'enddate': '2025-01-31',
+                             'priority': 'high'}),
+            content_type='application/json',
+        )
+
+        assert response.status_code == 201
+        assert isinstance(response.accepted_renderer, TeamMoaJSONRenderer)
+        assert response.json()['milestone']['title'] == '출시'
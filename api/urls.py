@@ -8,6 +8,7 @@ from members.viewsets import TodoViewSet, TeamMemberViewSet
 from teams.viewsets import TeamViewSet, MilestoneViewSet
 from schedules.viewsets import ScheduleViewSet
 from mindmaps.viewsets import MindmapViewSet, NodeViewSet, NodeConnectionViewSet
+from . import async_views
 
 # API 라우터 설정
 router = DefaultRouter()
@@ -96,16 +97,40 @@ urlpatterns = [
         'get': 'list',
         'post': 'create'
     }), name='team-mindmaps-list'),
+    path('v1/teams/<int:team_pk>/mindmaps/import/', MindmapViewSet.as_view({
+        'post': 'import_mindmap'
+    }), name='team-mindmaps-import'),
     path('v1/teams/<int:team_pk>/mindmaps/<int:pk>/', MindmapViewSet.as_view({
         'get': 'retrieve',
         'delete': 'destroy'
     }), name='team-mindmaps-detail'),
+    path('v1/teams/<int:team_pk>/mindmaps/<int:pk>/graph/components/', MindmapViewSet.as_view({
+        'get': 'graph_components'
+    }), name='team-mindmaps-graph-components'),
+    path('v1/teams/<int:team_pk>/mindmaps/<int:pk>/graph/ranking/', MindmapViewSet.as_view({
+        'get': 'graph_ranking'
+    }), name='team-mindmaps-graph-ranking'),
+    path('v1/teams/<int:team_pk>/mindmaps/<int:pk>/graph/shortest-path/', MindmapViewSet.as_view({
+        'get': 'graph_shortest_path'
+    }), name='team-mindmaps-graph-shortest-path'),
+    path('v1/teams/<int:team_pk>/mindmaps/<int:pk>/graph/orphans/', MindmapViewSet.as_view({
+        'get': 'graph_orphans'
+    }), name='team-mindmaps-graph-orphans'),
+    path('v1/teams/<int:team_pk>/mindmaps/<int:pk>/layout/', MindmapViewSet.as_view({
+        'post': 'layout'
+    }), name='team-mindmaps-layout'),
+    path('v1/teams/<int:team_pk>/mindmaps/<int:pk>/export/', MindmapViewSet.as_view({
+        'get': 'export_mindmap'
+    }), name='team-mindmaps-export'),
 
     # 노드 엔드포인트
     path('v1/teams/<int:team_pk>/mindmaps/<int:mindmap_pk>/nodes/', NodeViewSet.as_view({
         'get': 'list',
         'post': 'create'
     }), name='mindmap-nodes-list'),
+    path('v1/teams/<int:team_pk>/mindmaps/<int:mindmap_pk>/nodes/viewport/', NodeViewSet.as_view({
+        'get': 'viewport'
+    }), name='mindmap-nodes-viewport'),
     path('v1/teams/<int:team_pk>/mindmaps/<int:mindmap_pk>/nodes/<int:pk>/', NodeViewSet.as_view({
         'get': 'retrieve',
         'patch': 'partial_update',
@@ -124,10 +149,21 @@ urlpatterns = [
         'get': 'list',
         'post': 'create'
     }), name='mindmap-connections-list'),
+    path('v1/teams/<int:team_pk>/mindmaps/<int:mindmap_pk>/connections/bulk/', NodeConnectionViewSet.as_view({
+        'post': 'bulk_connect'
+    }), name='mindmap-connections-bulk'),
     path('v1/teams/<int:team_pk>/mindmaps/<int:mindmap_pk>/connections/<int:pk>/', NodeConnectionViewSet.as_view({
         'delete': 'destroy'
     }), name='mindmap-connections-detail'),
 
+    # 읽기 전용 async 엔드포인트 (ASGI 배포용)
+    path('v1/async/teams/', async_views.team_list, name='async-team-list'),
+    path('v1/async/teams/<int:team_pk>/todos/board/', async_views.todo_board, name='async-todo-board'),
+    path('v1/async/teams/<int:team_pk>/mindmaps/<int:pk>/', async_views.mindmap_detail, name='async-mindmap-detail'),
+    path('v1/async/teams/<int:team_pk>/schedules/team-availability/', async_views.team_availability,
+         name='async-team-availability'),
+    path('v1/async/teams/<int:team_pk>/changes/', async_views.team_changes, name='async-team-changes'),
+
     # API 문서화
     path('schema/', SpectacularAPIView.as_view(), name='schema'),
     path('docs/', SpectacularSwaggerView.as_view(url_name='api:schema'), name='swagger-ui'),
@@ -0,0 +1,130 @@
+"""
+sync / async 엔드포인트 동시성 비교
+
+같은 서버(같은 워커 수)에 sync DRF 엔드포인트와 api/async_views.py의 async 엔드포인트를
+같은 동시 요청 수로 호출해 처리량과 응답 시간 백분위를 비교합니다.
+데이터와 계정은 seed_loadtest manifest를 사용합니다.
+
+사용법:
+    python manage.py seed_loadtest --reset --output loadtest_manifest.json
+    GUNICORN_WORKER_MODE=asgi GUNICORN_WORKERS=2 gunicorn -c deploy/gunicorn_config.py
+    python benchmarks/compare_sync_async.py --host http://127.0.0.1:8000 \\
+        --manifest loadtest_manifest.json --concurrency 50 --requests 500 --output results/sync_vs_async.json
+
+TODO 보드는 같은 응답을 내는 sync JSON 엔드포인트가 없어 비교 대상에서 제외합니다.
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def endpoint_pairs(team):
+    """(이름, sync 경로, async 경로, 쿼리 파라미터) 목록"""
+    team_id = team['team_id']
+    availability_params = {'start_date': team['week_start'], 'end_date': team['week_end']}
+    return [
+        ('team_list', '/api/v1/teams/', '/api/v1/async/teams/', {}),
+        (
+            'mindmap_detail',
+            f'/api/v1/teams/{team_id}/mindmaps/{team["mindmap_id"]}/',
+            f'/api/v1/async/teams/{team_id}/mindmaps/{team["mindmap_id"]}/',
+            {},
+        ),
+        (
+            'team_availability',
+            f'/api/v1/teams/{team_id}/schedules/team-availability/',
+            f'/api/v1/async/teams/{team_id}/schedules/team-availability/',
+            availability_params,
+        ),
+    ]
+
+
+def login(host, username, password):
+    session = requests.Session()
+    response = session.post(f'{host}/api/v1/users/login/', data={'username': username, 'password': password})
+    response.raise_for_status()
+    return session
+
+
+def run(sessions, url, params, total_requests, concurrency):
+    """동시 요청을 보내고 (지연 시간 목록(ms), 실패 수, 경과 시간(s)) 반환"""
+    def call(index):
+        session = sessions[index % len(sessions)]
+        start = time.perf_counter()
+        try:
+            ok = session.get(url, params=params, timeout=60).status_code == 200
+        except requests.RequestException:
+            ok = False
+        return (time.perf_counter() - start) * 1000, ok
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(call, range(total_requests)))
+    elapsed = time.perf_counter() - started_at
+
+    latencies = [latency for latency, _ in results]
+    failures = sum(1 for _, ok in results if not ok)
+    return latencies, failures, elapsed
+
+
+def summarize(latencies, failures, elapsed):
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        'requests': len(latencies),
+        'failures': failures,
+        'rps': round(len(latencies) / elapsed, 2),
+        'mean_ms': round(statistics.mean(latencies), 2),
+        **{f'p{p}_ms': round(quantiles[p - 1], 2) for p in PERCENTILES},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='http://127.0.0.1:8000')
+    parser.add_argument('--manifest', default='loadtest_manifest.json')
+    parser.add_argument('--concurrency', type=int, default=50, help='동시 요청 수')
+    parser.add_argument('--requests', type=int, default=500, help='엔드포인트별 요청 수')
+    parser.add_argument('--sessions', type=int, default=10, help='로그인 세션 수')
+    parser.add_argument('--output', default=None, help='결과 JSON 경로')
+    args = parser.parse_args(argv)
+
+    manifest = json.loads(Path(args.manifest).read_text(encoding='utf-8'))
+    team = manifest['teams'][0]
+    usernames = random.Random(0).sample(team['usernames'], min(args.sessions, len(team['usernames'])))
+    sessions = [login(args.host, username, manifest['password']) for username in usernames]
+
+    report = {
+        'host': args.host,
+        'concurrency': args.concurrency,
+        'requests_per_endpoint': args.requests,
+        'endpoints': {},
+    }
+    print(f'{"endpoint":<20} {"mode":<6} {"rps":>8} {"mean":>8} {"p50":>8} {"p95":>8} {"p99":>8} {"fail":>5}')
+    for name, sync_path, async_path, params in endpoint_pairs(team):
+        report['endpoints'][name] = {}
+        for mode, path in (('sync', sync_path), ('async', async_path)):
+            summary = summarize(*run(sessions, f'{args.host}{path}', params, args.requests, args.concurrency))
+            report['endpoints'][name][mode] = summary
+            print(
+                f'{name:<20} {mode:<6} {summary["rps"]:>8.1f} {summary["mean_ms"]:>8.1f} '
+                f'{summary["p50_ms"]:>8.1f} {summary["p95_ms"]:>8.1f} {summary["p99_ms"]:>8.1f} '
+                f'{summary["failures"]:>5}'
+            )
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+서비스 레이어 벤치마크 fixtures / 옵션
+
+일반 테스트 실행(pytest)에서는 수집되지 않으며 디렉토리를 지정해 실행합니다.
+
+    # 기본 (small 규모, SQLite)
+    pytest benchmarks
+
+    # 규모 지정 + 결과 저장
+    pytest benchmarks --bench-scale=medium --bench-save=.benchmarks/baseline.json
+
+    # baseline 비교 (median 20% 이상 느려지거나 쿼리 수가 늘면 실패)
+    pytest benchmarks --bench-compare=.benchmarks/baseline.json --bench-max-regression=0.2
+"""
+import pytest
+
+from benchmarks import factories
+from benchmarks.runner import BenchmarkRunner, compare, load_baseline, save_results
+
+_results = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('benchmarks', '서비스 레이어 벤치마크')
+    group.addoption(
+        '--bench-scale', default='small', choices=sorted(factories.SCALES),
+        help='데이터 규모 (small / medium / large)',
+    )
+    group.addoption('--bench-rounds', type=int, default=5, help='측정 라운드 수')
+    group.addoption('--bench-save', default=None, help='결과 JSON 저장 경로')
+    group.addoption('--bench-compare', default=None, help='비교할 baseline JSON 경로')
+    group.addoption(
+        '--bench-max-regression', type=float, default=0.2,
+        help='허용 median 증가율 (기본 0.2 = 20%%)',
+    )
+
+
+def pytest_collection_modifyitems(items):
+    for item in items:
+        item.add_marker(pytest.mark.benchmark)
+
+
+@pytest.fixture(scope='session')
+def bench_scale(request):
+    """현재 규모의 데이터 크기 설정 (factories.SCALES)"""
+    return factories.SCALES[request.config.getoption('--bench-scale')]
+
+
+@pytest.fixture
+def benchmark(request, db):
+    """pytest-benchmark 형식의 측정 fixture"""
+    return BenchmarkRunner(
+        request.node.name,
+        _results,
+        rounds=request.config.getoption('--bench-rounds'),
+    )
+
+
+@pytest.fixture(scope='module')
+def bench_team(django_db_setup, django_db_blocker, bench_scale, request):
+    """
+    모듈 단위 대용량 팀 데이터 (멤버 + 마일스톤)
+
+    테스트마다 다시 만들기엔 비싸므로 모듈 시작 시 한 번 적재하고 모듈 종료 시 삭제합니다.
+    """
+    prefix = request.module.__name__.rsplit('.', 1)[-1].replace('test_bench_', '')
+    with django_db_blocker.unblock():
+        team, team_users = factories.create_team_with_members(bench_scale['members'], prefix=prefix)
+        milestones = factories.create_milestones(team)
+
+    yield {'team': team, 'team_users': team_users, 'milestones': milestones}
+
+    with django_db_blocker.unblock():
+        team.delete()
+        factories.User.objects.filter(username__startswith=f'{prefix}user').delete()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not _results:
+        return
+
+    config = session.config
+    scale = config.getoption('--bench-scale')
+
+    save_path = config.getoption('--bench-save')
+    if save_path:
+        save_results(save_path, _results, scale)
+
+    compare_path = config.getoption('--bench-compare')
+    if compare_path:
+        baseline = load_baseline(compare_path)
+        rows, regressions = compare(_results, baseline, config.getoption('--bench-max-regression'))
+        config._bench_comparison = (rows, regressions, baseline.get('scale'))
+        if regressions:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _results:
+        return
+
+    write = terminalreporter.write_line
+    terminalreporter.section(f'benchmarks (scale={config.getoption("--bench-scale")})')
+    write(f'{"name":<48} {"min(ms)":>10} {"median(ms)":>11} {"mean(ms)":>10} {"stddev":>8} {"queries":>8}')
+    for name, result in sorted(_results.items()):
+        write(
+            f'{name:<48} {result.min * 1000:>10.2f} {result.median * 1000:>11.2f} '
+            f'{result.mean * 1000:>10.2f} {result.stddev * 1000:>8.2f} {result.queries:>8}'
+        )
+
+    comparison = getattr(config, '_bench_comparison', None)
+    if comparison is None:
+        return
+
+    rows, regressions, baseline_scale = comparison
+    terminalreporter.section(f'baseline comparison (baseline scale={baseline_scale})')
+    write(f'{"name":<48} {"before(ms)":>11} {"after(ms)":>10} {"queries":>12} {"change":>11}')
+    for name, before, after, before_queries, after_queries, change in rows:
+        before_text = f'{before * 1000:.2f}' if before is not None else '-'
+        queries_text = f'{before_queries if before_queries is not None else "-"}->{after_queries}'
+        write(f'{name:<48} {before_text:>11} {after * 1000:>10.2f} {queries_text:>12} {change:>11}')
+    if regressions:
+        write(f'{len(regressions)} benchmark(s) regressed: {", ".join(regressions)}', red=True)
@@ -0,0 +1,223 @@
+"""
+벤치마크용 대용량 데이터 생성기
+
+모든 생성기는 bulk_create로 한 번에 적재하며, 모델 save() 훅
+(Team.full_clean, Todo 마일스톤 진행률 갱신 등)을 거치지 않습니다.
+측정 대상은 조회 경로이므로 데이터는 결정적(random seed 고정)으로 생성합니다.
+"""
+import random
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+
+from members.models import Todo
+from mindmaps.models import Mindmap, Node, NodeConnection
+from schedules.models import PersonalDaySchedule
+from shares.models import Post
+from teams.models import Milestone, Team, TeamUser
+
+User = get_user_model()
+
+BATCH_SIZE = 1000
+
+# 규모별 데이터 크기 (--bench-scale)
+SCALES = {
+    'small': {
+        'members': 10,
+        'todos': 1_000,
+        'schedule_days': 30,
+        'posts': 1_000,
+        'nodes': 200,
+        'username_collisions': 1_000,
+        'milestones': 500,
+    },
+    'medium': {
+        'members': 100,
+        'todos': 10_000,
+        'schedule_days': 100,
+        'posts': 10_000,
+        'nodes': 1_000,
+        'username_collisions': 5_000,
+        'milestones': 2_000,
+    },
+    'large': {
+        'members': 1_000,
+        'todos': 10_000,
+        'schedule_days': 100,  # 1,000명 x 100일 = 100,000 rows
+        'posts': 50_000,
+        'nodes': 5_000,
+        'username_collisions': 20_000,
+        'milestones': 10_000,
+    },
+}
+
+SCHEDULE_START = date(2025, 1, 6)  # 월요일
+
+WORDS = [
+    '회의', '기획', '디자인', '개발', '배포', '테스트', '리뷰', '문서',
+    '서버', '프론트', '백엔드', '마일스톤', '일정', '버그', '개선', '발표',
+]
+
+
+def _sentence(rng, length):
+    return ' '.join(rng.choice(WORDS) for _ in range(length))
+
+
+def create_username_collisions(base_username, count):
+    """
+    base_username, base_username_1 ... base_username_{count - 1} 사용자 생성
+    (소셜 가입 username 중복 처리 벤치마크용, 인기 있는 이메일 앞부분을 흉내)
+    """
+    usernames = [base_username] + [f'{base_username}_{i}' for i in range(1, count)]
+    User.objects.bulk_create(
+        [
+            User(username=username, email=f'{username}@example.com', nickname=username[:10], is_active=True)
+            for username in usernames
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+
+def create_team_with_members(member_count, prefix='bench'):
+    """
+    호스트 포함 member_count명의 팀 생성
+
+    Returns:
+        tuple: (Team, [TeamUser])
+    """
+    password = make_password('benchpass123!')  # 해싱은 한 번만
+    users = User.objects.bulk_create(
+        [
+            User(
+                username=f'{prefix}user{i}',
+                email=f'{prefix}user{i}@example.com',
+                nickname=f'{prefix}{i}',
+                password=password,
+                is_active=True,
+            )
+            for i in range(member_count)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    # SQLite/MySQL은 bulk_create 후 pk를 돌려주지 않을 수 있으므로 다시 조회
+    users = list(User.objects.filter(username__startswith=f'{prefix}user').order_by('id'))
+
+    team = Team.objects.create(
+        title=f'{prefix} 팀',
+        maxuser=member_count,
+        currentuser=member_count,
+        host=users[0],
+        invitecode=f'{prefix.upper()[:8]}CODE',
+        teampasswd='benchpass',
+        introduction='벤치마크용 팀',
+    )
+    TeamUser.objects.bulk_create(
+        [TeamUser(team=team, user=u) for u in users],
+        batch_size=BATCH_SIZE,
+    )
+    team_users = list(TeamUser.objects.filter(team=team).order_by('id'))
+    return team, team_users
+
+
+def create_milestones(team, count=10):
+    """팀 마일스톤 생성 (TODO 연결용 / 목록 직렬화 측정용)"""
+    priorities = ['critical', 'high', 'medium', 'low', 'minimal']
+    Milestone.objects.bulk_create([
+        Milestone(
+            team=team,
+            title=f'마일스톤 {i}',
+            startdate=SCHEDULE_START,
+            enddate=SCHEDULE_START + timedelta(days=30 * (i + 1)),
+            priority=priorities[i % len(priorities)],
+        )
+        for i in range(count)
+    ], batch_size=BATCH_SIZE)
+    return list(Milestone.objects.filter(team=team).order_by('id'))
+
+
+def create_todos(team, team_users, count, milestones=(), seed=0):
+    """
+    TODO 생성 (약 20%는 미할당, 약 40%는 완료)
+    """
+    rng = random.Random(seed)
+    todos = []
+    for i in range(count):
+        assignee = None if rng.random() < 0.2 else rng.choice(team_users)
+        todos.append(Todo(
+            team=team,
+            assignee=assignee,
+            milestone=rng.choice(milestones) if milestones and rng.random() < 0.5 else None,
+            content=_sentence(rng, 6),
+            is_completed=rng.random() < 0.4,
+            order=i,
+        ))
+    Todo.objects.bulk_create(todos, batch_size=BATCH_SIZE)
+
+
+def create_schedules(team_users, days, start=SCHEDULE_START, seed=0):
+    """
+    멤버별 days일치 개인 스케줄 생성 (rows = 멤버 수 x days)
+    """
+    rng = random.Random(seed)
+    schedules = []
+    for team_user in team_users:
+        for offset in range(days):
+            schedules.append(PersonalDaySchedule(
+                owner=team_user,
+                date=start + timedelta(days=offset),
+                available_hours=sorted(rng.sample(range(24), rng.randint(0, 12))),
+            ))
+            if len(schedules) >= BATCH_SIZE:
+                PersonalDaySchedule.objects.bulk_create(schedules)
+                schedules = []
+    PersonalDaySchedule.objects.bulk_create(schedules)
+
+
+def create_posts(team, team_users, count, seed=0):
+    """게시물 생성 (첨부파일 없음)"""
+    rng = random.Random(seed)
+    Post.objects.bulk_create(
+        [
+            Post(
+                team=team,
+                teamuser=rng.choice(team_users),
+                title=_sentence(rng, 3)[:64],
+                article=_sentence(rng, 40),
+            )
+            for _ in range(count)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+
+def create_mindmap(team, node_count, seed=0):
+    """
+    node_count개 노드와 (트리 + 추가 교차 연결) 연결선을 가진 마인드맵 생성
+    """
+    rng = random.Random(seed)
+    mindmap = Mindmap.objects.create(team=team, title='벤치마크 마인드맵')
+    Node.objects.bulk_create(
+        [
+            Node(
+                mindmap=mindmap,
+                posX=rng.randint(0, 5000),
+                posY=rng.randint(0, 5000),
+                title=_sentence(rng, 2)[:64],
+                content=_sentence(rng, 10),
+            )
+            for _ in range(node_count)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    node_ids = list(Node.objects.filter(mindmap=mindmap).order_by('id').values_list('id', flat=True))
+
+    connections = [
+        NodeConnection(mindmap=mindmap, from_node_id=node_ids[rng.randrange(i)], to_node_id=node_ids[i])
+        for i in range(1, len(node_ids))
+    ]
+    for _ in range(len(node_ids) // 10):
+        from_id, to_id = rng.sample(node_ids, 2)
+        connections.append(NodeConnection(mindmap=mindmap, from_node_id=from_id, to_node_id=to_id))
+    NodeConnection.objects.bulk_create(connections, batch_size=BATCH_SIZE)
+    return mindmap
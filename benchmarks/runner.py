@@ -0,0 +1,132 @@
+"""
+벤치마크 실행/기록/비교 유틸리티
+
+pytest-benchmark와 같은 형태로 `benchmark(func, *args, **kwargs)`를 호출하면
+라운드별 소요 시간과 호출당 DB 쿼리 수를 기록합니다.
+결과는 JSON으로 저장하고, 저장된 baseline과 비교할 수 있습니다.
+"""
+import json
+import statistics
+import time
+from pathlib import Path
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class BenchmarkResult:
+    """벤치마크 하나의 측정 결과"""
+
+    def __init__(self, name, timings, queries):
+        self.name = name
+        self.timings = timings
+        self.queries = queries
+
+    @property
+    def min(self):
+        return min(self.timings)
+
+    @property
+    def median(self):
+        return statistics.median(self.timings)
+
+    @property
+    def mean(self):
+        return statistics.mean(self.timings)
+
+    @property
+    def stddev(self):
+        return statistics.stdev(self.timings) if len(self.timings) > 1 else 0.0
+
+    def as_dict(self):
+        return {
+            'rounds': len(self.timings),
+            'min': self.min,
+            'median': self.median,
+            'mean': self.mean,
+            'stddev': self.stddev,
+            'queries': self.queries,
+        }
+
+
+class BenchmarkRunner:
+    """
+    `benchmark` fixture 구현
+
+    사용 예:
+        def test_team_todos(benchmark, todo_team):
+            benchmark(lambda: list(service.get_team_todos_with_stats(todo_team)['members_data']))
+
+    측정 대상이 QuerySet을 반환하면 평가되지 않으므로 호출 안에서 list() 등으로 평가해야 합니다.
+    """
+
+    def __init__(self, name, results, rounds=5, warmup=1):
+        self.name = name
+        self.results = results
+        self.rounds = rounds
+        self.warmup = warmup
+
+    def __call__(self, func, *args, **kwargs):
+        for _ in range(self.warmup):
+            func(*args, **kwargs)
+
+        # 쿼리 수는 별도 1회 실행으로 측정 (캡처 오버헤드가 시간에 섞이지 않도록)
+        with CaptureQueriesContext(connection) as captured:
+            result = func(*args, **kwargs)
+
+        timings = []
+        for _ in range(self.rounds):
+            start = time.perf_counter()
+            func(*args, **kwargs)
+            timings.append(time.perf_counter() - start)
+
+        self.results[self.name] = BenchmarkResult(self.name, timings, len(captured))
+        return result
+
+
+def save_results(path, results, scale):
+    """측정 결과를 JSON으로 저장"""
+    data = {
+        'scale': scale,
+        'benchmarks': {name: result.as_dict() for name, result in sorted(results.items())},
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+
+
+def load_baseline(path):
+    """저장된 baseline JSON 로드"""
+    return json.loads(Path(path).read_text(encoding='utf-8'))
+
+
+def compare(results, baseline, max_regression):
+    """
+    baseline 대비 median 시간/쿼리 수 비교
+
+    Args:
+        results: {name: BenchmarkResult}
+        baseline: load_baseline() 결과
+        max_regression: 허용 median 증가율 (0.2 = 20%)
+
+    Returns:
+        tuple: (비교 행 목록, 회귀 벤치마크 이름 목록)
+    """
+    rows = []
+    regressions = []
+    previous = baseline.get('benchmarks', {})
+    for name, result in sorted(results.items()):
+        before = previous.get(name)
+        if before is None:
+            rows.append((name, None, result.median, None, result.queries, 'new'))
+            continue
+
+        change = (result.median - before['median']) / before['median'] if before['median'] else 0.0
+        regressed = change > max_regression or result.queries > before['queries']
+        if regressed:
+            regressions.append(name)
+        rows.append((
+            name, before['median'], result.median, before['queries'], result.queries,
+            f'{change:+.1%}' + (' !' if regressed else ''),
+        ))
+    return rows, regressions
@@ -0,0 +1,31 @@
+"""
+소셜 로그인 어댑터 벤치마크
+
+- generate_unique_username: 같은 이메일 앞부분으로 이미 수천 명이 가입한 상태에서 새 username 생성
+"""
+import pytest
+
+from accounts.adapters import CustomSocialAccountAdapter
+from benchmarks import factories
+
+BASE_USERNAME = 'benchkim'
+
+
+@pytest.fixture(scope='module')
+def username_collisions(django_db_setup, django_db_blocker, bench_scale):
+    with django_db_blocker.unblock():
+        factories.create_username_collisions(BASE_USERNAME, bench_scale['username_collisions'])
+
+    yield bench_scale['username_collisions']
+
+    with django_db_blocker.unblock():
+        factories.User.objects.filter(username__startswith=BASE_USERNAME).delete()
+
+
+def test_generate_unique_username_with_collisions(benchmark, username_collisions):
+    username = benchmark(
+        CustomSocialAccountAdapter().generate_unique_username, f'{BASE_USERNAME}@example.com'
+    )
+
+    assert username == f'{BASE_USERNAME}_{username_collisions}'
+    assert benchmark.results[benchmark.name].queries == 1
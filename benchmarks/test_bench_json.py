@@ -0,0 +1,54 @@
+"""
+JSON 인코딩 벤치마크
+
+- API 응답 렌더링: 마일스톤 목록 응답을 기본 JSONRenderer vs TeamMoaJSONRenderer(orjson)
+- WebSocket 프레임: 마인드맵 연산 브로드캐스트 프레임을 json.dumps vs fastjson.dumps_str
+"""
+import json
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from api.renderers import TeamMoaJSONRenderer
+from benchmarks import factories
+from common import fastjson
+from teams.services import MilestoneService
+
+
+@pytest.fixture(scope='module')
+def milestone_payload(bench_team, bench_scale, django_db_blocker):
+    """api_response 형식의 마일스톤 목록 응답 본문"""
+    with django_db_blocker.unblock():
+        factories.create_milestones(bench_team['team'], bench_scale['milestones'])
+        rows = MilestoneService().get_team_milestone_rows(bench_team['team'])
+    return {'success': True, 'messages': [{'message': '조회되었습니다.', 'level': 'success'}], 'data': rows}
+
+
+@pytest.fixture(scope='module')
+def operation_frames(bench_scale):
+    """operations_applied 프레임 (연산 배치 20개씩)"""
+    operations = [
+        {'seq': seq, 'lamport': seq, 'op_type': 'node_move', 'user_id': seq % 10,
+         'payload': {'node_id': seq, 'posX': seq * 3, 'posY': seq * 7, 'title': f'노드 {seq}'}}
+        for seq in range(bench_scale['nodes'])
+    ]
+    return [
+        {'type': 'operations_applied', 'operations': operations[i:i + 20]}
+        for i in range(0, len(operations), 20)
+    ]
+
+
+@pytest.mark.parametrize('renderer_class', [JSONRenderer, TeamMoaJSONRenderer], ids=['drf', 'orjson'])
+def test_render_milestone_list(benchmark, milestone_payload, renderer_class):
+    renderer = renderer_class()
+
+    body = benchmark(renderer.render, milestone_payload)
+
+    assert json.loads(body) == json.loads(JSONRenderer().render(milestone_payload))
+
+
+@pytest.mark.parametrize('encode', [json.dumps, fastjson.dumps_str], ids=['stdlib', 'orjson'])
+def test_encode_operation_frames(benchmark, operation_frames, encode):
+    frames = benchmark(lambda: [encode(frame) for frame in operation_frames])
+
+    assert len(frames) == len(operation_frames)
@@ -0,0 +1,35 @@
+"""
+TodoService 벤치마크
+
+- get_team_todos_with_stats: 멤버별 TODO/통계 + 미할당/완료 보드
+"""
+import pytest
+
+from benchmarks import factories
+from members.services import TodoService
+
+
+@pytest.fixture(scope='module')
+def todo_team(bench_team, bench_scale, django_db_blocker):
+    with django_db_blocker.unblock():
+        factories.create_todos(
+            bench_team['team'], bench_team['team_users'], bench_scale['todos'],
+            milestones=bench_team['milestones'],
+        )
+    return bench_team['team']
+
+
+def _load_todo_board(service, team):
+    """뷰가 실제로 평가하는 범위까지 QuerySet 평가"""
+    result = service.get_team_todos_with_stats(team)
+    for member_data in result['members_data']:
+        list(member_data['todos'])
+    list(result['todos_unassigned'])
+    list(result['todos_done'])
+    return result
+
+
+def test_get_team_todos_with_stats(benchmark, todo_team):
+    result = benchmark(_load_todo_board, TodoService(), todo_team)
+
+    assert result['members_data']
@@ -0,0 +1,28 @@
+"""
+MindmapService 벤치마크
+
+- get_mindmap_with_nodes: 대형 마인드맵 노드/연결선 조회
+"""
+import pytest
+
+from benchmarks import factories
+from mindmaps.services import MindmapService
+
+
+@pytest.fixture(scope='module')
+def large_mindmap(bench_team, bench_scale, django_db_blocker):
+    with django_db_blocker.unblock():
+        return factories.create_mindmap(bench_team['team'], bench_scale['nodes'])
+
+
+def _load_mindmap(service, mindmap_id):
+    result = service.get_mindmap_with_nodes(mindmap_id)
+    list(result['nodes'])
+    list(result['lines'])
+    return result
+
+
+def test_get_mindmap_with_nodes(benchmark, large_mindmap):
+    result = benchmark(_load_mindmap, MindmapService(), large_mindmap.id)
+
+    assert len(result['nodes']) > 0
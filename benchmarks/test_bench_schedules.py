@@ -0,0 +1,28 @@
+"""
+ScheduleService 벤치마크
+
+- get_team_availability: 주간 / 월간 팀 가용성 집계
+"""
+from datetime import timedelta
+
+import pytest
+
+from benchmarks import factories
+from schedules.services import ScheduleService
+
+
+@pytest.fixture(scope='module')
+def schedule_team(bench_team, bench_scale, django_db_blocker):
+    with django_db_blocker.unblock():
+        factories.create_schedules(bench_team['team_users'], bench_scale['schedule_days'])
+    return bench_team['team']
+
+
+@pytest.mark.parametrize('days', [7, 28])
+def test_get_team_availability(benchmark, schedule_team, days):
+    start = factories.SCHEDULE_START
+    end = start + timedelta(days=days - 1)
+
+    result = benchmark(ScheduleService().get_team_availability, schedule_team, start, end)
+
+    assert len(result) == days
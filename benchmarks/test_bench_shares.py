@@ -0,0 +1,31 @@
+"""
+ShareService 벤치마크
+
+- search_posts: 검색 타입별 게시물 검색 + 페이지네이션
+"""
+import pytest
+
+from benchmarks import factories
+from shares.services import ShareService
+
+
+@pytest.fixture(scope='module')
+def post_team(bench_team, bench_scale, django_db_blocker):
+    with django_db_blocker.unblock():
+        factories.create_posts(bench_team['team'], bench_team['team_users'], bench_scale['posts'])
+    return bench_team['team']
+
+
+def _search(service, team, query, search_type):
+    result = service.search_posts(team.id, query, search_type=search_type)
+    list(result['posts'])
+    return result
+
+
+@pytest.mark.parametrize('search_type', ['all', 'title', 'content', 'writer'])
+def test_search_posts(benchmark, post_team, search_type):
+    query = 'shares1' if search_type == 'writer' else '배포'
+
+    result = benchmark(_search, ShareService(), post_team, query, search_type)
+
+    assert result['posts'].paginator.count > 0
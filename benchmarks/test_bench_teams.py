@@ -0,0 +1,38 @@
+"""
+팀 / 마일스톤 목록 직렬화 벤치마크
+
+- 마일스톤 목록 API 응답 생성: MilestoneSerializer(many=True) vs values() 기반 dict
+  (같은 팀에 마일스톤이 수천 개 쌓인 경우, 행당 비용 = median / 마일스톤 수)
+"""
+import pytest
+
+from benchmarks import factories
+from teams.serializers import MilestoneSerializer
+from teams.services import MilestoneService
+
+ORDER_BY = ['startdate', 'enddate', 'priority']
+
+
+@pytest.fixture(scope='module')
+def milestone_team(bench_team, bench_scale, django_db_blocker):
+    with django_db_blocker.unblock():
+        factories.create_milestones(bench_team['team'], bench_scale['milestones'])
+    return bench_team['team']
+
+
+def _serialize_with_serializer(team):
+    milestones = MilestoneService().get_team_milestones(team, order_by=ORDER_BY)
+    return MilestoneSerializer(milestones, many=True).data
+
+
+def test_milestone_list_serializer(benchmark, milestone_team, bench_scale):
+    data = benchmark(_serialize_with_serializer, milestone_team)
+
+    assert len(data) >= bench_scale['milestones']
+
+
+def test_milestone_list_rows(benchmark, milestone_team, bench_scale):
+    rows = benchmark(MilestoneService().get_team_milestone_rows, milestone_team, order_by=ORDER_BY)
+
+    assert len(rows) >= bench_scale['milestones']
+    assert benchmark.results[benchmark.name].queries == 1
@@ -0,0 +1,43 @@
+"""
+캐시 적중/미스를 요청 계측에 기록하는 캐시 백엔드
+
+CACHES 설정의 BACKEND로 지정하면 get/get_many 결과가
+common.instrumentation의 현재 요청 계측에 반영됩니다.
+"""
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+
+from .instrumentation import record_cache_access
+
+_MISSING = object()
+
+
+class InstrumentedCacheMixin:
+    """get 호출 시 캐시 적중 여부를 기록하는 Mixin
+
+    BaseCache.get_many()는 내부적으로 get()을 호출하므로 별도 처리가 필요 없습니다.
+    get_many()를 직접 구현하는 백엔드만 따로 기록합니다.
+    """
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version=version)
+        if value is _MISSING:
+            record_cache_access(hit=False)
+            return default
+        record_cache_access(hit=True)
+        return value
+
+
+class InstrumentedLocMemCache(InstrumentedCacheMixin, LocMemCache):
+    """로컬 메모리 캐시 (개발/테스트)"""
+
+
+class InstrumentedRedisCache(InstrumentedCacheMixin, RedisCache):
+    """Redis 캐시 (운영)"""
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        found = super().get_many(keys, version=version)
+        for key in keys:
+            record_cache_access(hit=key in found)
+        return found
@@ -0,0 +1,48 @@
+"""
+대용량 일괄 삭제 유틸리티
+
+QuerySet.delete()는 Collector가 연쇄 삭제 대상(CASCADE / SET_NULL)을 모두
+메모리에 올린 뒤 삭제하므로, 노드·TODO·게시물이 수만 건 쌓인 팀을 해체하면
+요청 시간이 gunicorn 워커 타임아웃(30초)을 넘깁니다.
+
+raw_delete_in_chunks는 호출부가 의존 순서(자식 → 부모)를 보장한다는 전제로
+Collector와 시그널 없이 pk 청크 단위 DELETE만 실행합니다.
+첨부파일처럼 DB 밖의 정리는 호출부가 작업 큐(taskqueue)로 넘깁니다.
+
+사용 예:
+    from common.deletion import raw_delete_in_chunks
+
+    raw_delete_in_chunks(Comment.objects.filter(node__mindmap_id=mindmap_id))
+"""
+DELETE_CHUNK_SIZE = 2000
+
+
+def raw_delete_in_chunks(queryset, chunk_size=DELETE_CHUNK_SIZE, progress=None):
+    """
+    queryset에 해당하는 행을 pk 청크 단위로 삭제합니다.
+
+    Collector를 거치지 않으므로 연쇄 삭제, SET_NULL, delete 시그널, Model.delete()가
+    실행되지 않습니다. 이 테이블을 참조하는 행은 호출 전에 먼저 삭제해야 합니다.
+
+    Args:
+        queryset (QuerySet): 삭제 대상
+        chunk_size (int): DELETE 한 번에 지울 최대 행 수
+        progress (callable | None): 청크마다 progress(label, 누적 삭제 수) 호출
+
+    Returns:
+        int: 삭제된 행 수
+    """
+    model = queryset.model
+    label = model._meta.label
+    deleted = 0
+    pks = queryset.order_by('pk').values_list('pk', flat=True)
+    while True:
+        chunk = list(pks[:chunk_size])
+        if not chunk:
+            break
+        deleted += model._base_manager.filter(pk__in=chunk)._raw_delete(queryset.db)
+        if progress is not None:
+            progress(label, deleted)
+        if len(chunk) < chunk_size:
+            break
+    return deleted
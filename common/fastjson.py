@@ -0,0 +1,67 @@
+"""
+orjson 기반 JSON 직렬화 유틸리티
+
+API 응답(api.renderers / api.parsers), 마인드맵 WebSocket 프레임, 스냅샷/NDJSON 내보내기가
+모두 이 모듈을 거칩니다. 표준 json보다 인코딩이 수 배 빠르고 결과를 UTF-8 bytes로 바로 돌려주므로
+응답 본문/스냅샷 압축 전에 다시 encode할 필요가 없습니다.
+
+- date / datetime / time / UUID / dataclass / numpy 값은 orjson이 직접 처리합니다.
+  (datetime은 마이크로초까지 그대로 출력, 문자열로 변환된 serializer 필드 값은 영향 없음)
+- Decimal, lazy 번역 문자열, timedelta, QuerySet 등은 DRF JSONEncoder와 같은 규칙으로 변환합니다.
+- 출력은 공백 없는 compact 형식이고 한글을 이스케이프하지 않습니다 (ensure_ascii=False와 동일).
+
+사용 예:
+    from common import fastjson
+
+    body = fastjson.dumps({'ok': True})           # bytes
+    await self.send(text_data=fastjson.dumps_str(payload))
+    data = fastjson.loads(text_data)
+"""
+import datetime
+import decimal
+
+import orjson
+from django.db.models.query import QuerySet
+from django.utils.functional import Promise
+
+JSONDecodeError = orjson.JSONDecodeError
+
+OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj):
+    """orjson이 직접 처리하지 못하는 타입 변환 (DRF JSONEncoder 규칙)"""
+    if isinstance(obj, Promise):
+        return str(obj)
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, QuerySet):
+        return tuple(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if hasattr(obj, '__getitem__') and hasattr(obj, 'keys'):
+        return dict(obj)
+    if hasattr(obj, '__iter__'):
+        return list(obj)
+    raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
+
+
+def dumps(obj):
+    """obj를 compact JSON(UTF-8 bytes)으로 직렬화"""
+    return orjson.dumps(obj, default=_default, option=OPTIONS)
+
+
+def dumps_str(obj):
+    """obj를 compact JSON 문자열로 직렬화 (WebSocket text 프레임용)"""
+    return dumps(obj).decode('utf-8')
+
+
+def loads(data):
+    """JSON(str / bytes)을 파싱. 잘못된 JSON이면 JSONDecodeError (ValueError 하위 클래스)"""
+    return orjson.loads(data)
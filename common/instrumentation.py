@@ -0,0 +1,151 @@
+"""
+요청 단위 성능 계측 유틸리티
+
+하나의 HTTP 요청 동안 발생한 DB 쿼리, 캐시 조회, 구간별 소요 시간을 수집합니다.
+수집 결과는 PerformanceInstrumentationMiddleware가 Server-Timing 헤더와
+구조화 로그로 내보냅니다.
+
+사용 예:
+    from common.instrumentation import span
+
+    with span('serialize'):
+        data = TodoSerializer(todos, many=True).data
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.backends.signals import connection_created
+
+_current_metrics = ContextVar('teammoa_request_metrics', default=None)
+
+
+class RequestMetrics:
+    """요청 하나의 계측 값을 담는 컨테이너"""
+
+    def __init__(self, top_queries=5):
+        self.started_at = time.perf_counter()
+        self.query_count = 0
+        self.query_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.spans = {}
+        self._top_queries_limit = top_queries
+        self._top_queries = []
+
+    def record_query(self, sql, duration):
+        """실행된 쿼리 기록 (가장 느린 N개만 보관)"""
+        self.query_count += 1
+        self.query_time += duration
+
+        if self._top_queries_limit <= 0:
+            return
+
+        self._top_queries.append((duration, sql))
+        if len(self._top_queries) > self._top_queries_limit:
+            self._top_queries.sort(key=lambda item: item[0], reverse=True)
+            self._top_queries.pop()
+
+    def record_cache(self, hit):
+        """캐시 조회 결과 기록"""
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+    def add_span(self, name, duration):
+        """이름 있는 구간 시간 누적 (초 단위)"""
+        self.spans[name] = self.spans.get(name, 0.0) + duration
+
+    @property
+    def total_time(self):
+        return time.perf_counter() - self.started_at
+
+    @property
+    def top_queries(self):
+        """소요 시간 내림차순 상위 쿼리 목록"""
+        return [
+            {'sql': sql, 'ms': round(duration * 1000, 2)}
+            for duration, sql in sorted(self._top_queries, key=lambda item: item[0], reverse=True)
+        ]
+
+
+class QueryRecorder:
+    """
+    connection.execute_wrappers에 상시 등록되는 쿼리 기록기
+
+    현재 컨텍스트의 RequestMetrics에 기록하므로, async view의 ORM 호출처럼
+    sync_to_async 스레드에서 실행된 쿼리도 같은 요청에 집계됩니다.
+    계측 중이 아니면 아무것도 기록하지 않습니다.
+    예외가 발생한 쿼리도 소요 시간은 기록합니다.
+    """
+
+    def __call__(self, execute, sql, params, many, context):
+        metrics = _current_metrics.get()
+        if metrics is None:
+            return execute(sql, params, many, context)
+
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            metrics.record_query(sql, time.perf_counter() - start)
+
+
+query_recorder = QueryRecorder()
+
+
+def install_query_recorder(connection, **kwargs):
+    """
+    DB 연결에 query_recorder 등록 (중복 등록하지 않음)
+
+    connection_created 시그널 수신기로도 사용합니다. connection.execute_wrapper()는
+    마지막 래퍼를 pop()하므로 목록 맨 앞에 넣어 다른 래퍼와 섞이지 않게 합니다.
+    """
+    if query_recorder not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, query_recorder)
+
+
+connection_created.connect(install_query_recorder, dispatch_uid='teammoa_query_recorder')
+
+
+def start_request_metrics(top_queries=5):
+    """현재 컨텍스트에 새 RequestMetrics를 등록하고 (metrics, token) 반환"""
+    metrics = RequestMetrics(top_queries=top_queries)
+    token = _current_metrics.set(metrics)
+    return metrics, token
+
+
+def finish_request_metrics(token):
+    """start_request_metrics()로 등록한 컨텍스트 해제"""
+    _current_metrics.reset(token)
+
+
+def get_current_metrics():
+    """현재 요청의 RequestMetrics (계측 중이 아니면 None)"""
+    return _current_metrics.get()
+
+
+def record_cache_access(hit):
+    """캐시 조회 결과를 현재 요청 계측에 반영"""
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.record_cache(hit)
+
+
+@contextmanager
+def span(name):
+    """
+    코드 구간 소요 시간을 현재 요청 계측에 누적합니다.
+    계측 중이 아닐 때는 아무 동작도 하지 않습니다.
+    """
+    metrics = _current_metrics.get()
+    if metrics is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.add_span(name, time.perf_counter() - start)
@@ -0,0 +1,427 @@
+"""
+Prometheus 텍스트 포맷 메트릭 레지스트리
+
+외부 의존성 없이 Counter / Gauge / Histogram을 제공하고,
+/metrics 엔드포인트에서 Prometheus exposition 포맷으로 내보냅니다.
+
+멀티프로세스 (gunicorn workers, 다중 Daphne):
+    settings.METRICS_MULTIPROC_DIR 이 지정되면 각 프로세스가 주기적으로
+    자신의 스냅샷을 `<dir>/<pid>-<시작 ID>.json` 에 기록하고, /metrics 는 디렉토리의
+    모든 스냅샷을 합산합니다.
+    - Counter / Histogram: 종료된 프로세스 스냅샷은 `<dir>/dead.json` 누적값에 합친 뒤 삭제
+      (재시작된 워커가 같은 pid를 받아도 이전 값을 덮어쓰지 않아 합계가 줄지 않음)
+    - Gauge: 살아있는 프로세스 값만 합산
+    프로세스 생존 여부는 os.kill(pid, 0)으로 확인하므로 디렉토리에 쓰는 모든 프로세스가
+    같은 pid 네임스페이스(같은 컨테이너)에 있어야 합니다. 다른 컨테이너(예: 작업 워커)와
+    디렉토리를 공유하면 살아있는 프로세스를 종료된 것으로 보고 값을 이중 집계합니다.
+    (docker-compose에서는 web 컨테이너 전용 tmpfs로 마운트)
+
+사용 예:
+    from common.metrics import REGISTRY
+
+    requests_total = REGISTRY.counter(
+        'teammoa_http_requests_total', 'HTTP 요청 수', ['method', 'route', 'status']
+    )
+    requests_total.inc(method='GET', route='api:team-list', status='200')
+"""
+import atexit
+import glob
+import json
+import math
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경 (멀티프로세스 모드 미사용)
+    fcntl = None
+
+from django.conf import settings
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 종료된 프로세스의 Counter / Histogram 누적값
+DEAD_TOTALS_FILE = 'dead.json'
+LOCK_FILE = '.lock'
+
+
+class Metric:
+    """메트릭 공통 기반 클래스"""
+
+    type_name = None
+
+    def __init__(self, registry, name, documentation, labelnames=()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f'{self.name}: 레이블 {sorted(self.labelnames)} 가 필요합니다. (받은 값: {sorted(labels)})'
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def snapshot(self):
+        """직렬화 가능한 [(레이블 값 목록, 값)] 목록"""
+        with self.registry.lock:
+            return [[list(key), value] for key, value in self._values.items()]
+
+
+class Counter(Metric):
+    """단조 증가 카운터"""
+
+    type_name = 'counter'
+
+    def inc(self, amount=1, **labels):
+        if amount < 0:
+            raise ValueError('Counter는 감소할 수 없습니다.')
+        key = self._key(labels)
+        with self.registry.lock:
+            self._values[key] = self._values.get(key, 0) + amount
+        self.registry.maybe_flush()
+
+
+class Gauge(Metric):
+    """증감 가능한 현재 값 (멀티프로세스에서는 살아있는 프로세스 합계)"""
+
+    type_name = 'gauge'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self.registry.lock:
+            self._values[key] = self._values.get(key, 0) + amount
+        self.registry.maybe_flush()
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self.registry.lock:
+            self._values[key] = value
+        self.registry.maybe_flush()
+
+
+class Histogram(Metric):
+    """버킷 기반 분포 (값: [버킷별 개수, 합계, 개수])"""
+
+    type_name = 'histogram'
+
+    def __init__(self, registry, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self.registry.lock:
+            state = self._values.get(key)
+            if state is None:
+                state = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._values[key] = state
+            state[0][self._bucket_index(value)] += 1
+            state[1] += value
+            state[2] += 1
+        self.registry.maybe_flush()
+
+    def _bucket_index(self, value):
+        for index, upper in enumerate(self.buckets):
+            if value <= upper:
+                return index
+        return len(self.buckets)  # +Inf
+
+    def snapshot(self):
+        with self.registry.lock:
+            return [
+                [list(key), [list(state[0]), state[1], state[2]]]
+                for key, state in self._values.items()
+            ]
+
+
+class MetricsRegistry:
+    """프로세스 단위 메트릭 레지스트리"""
+
+    def __init__(self, multiproc_dir=None, flush_interval=5.0):
+        self.lock = threading.RLock()
+        self._metrics = {}
+        self._multiproc_dir = multiproc_dir
+        self._flush_interval = flush_interval
+        self._last_flush = 0.0
+        self._pid = None
+        self._instance = None
+
+    # ================================
+    # 메트릭 등록 (get-or-create)
+    # ================================
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def _get_or_create(self, metric_class, name, documentation, labelnames, **kwargs):
+        with self.lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = metric_class(self, name, documentation, labelnames, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, metric_class):
+                raise ValueError(f'{name} 은 이미 {metric.type_name} 로 등록되어 있습니다.')
+            return metric
+
+    # ================================
+    # 멀티프로세스 스냅샷
+    # ================================
+
+    @property
+    def multiproc_dir(self):
+        if self._multiproc_dir is not None:
+            return self._multiproc_dir
+        return getattr(settings, 'METRICS_MULTIPROC_DIR', None)
+
+    def snapshot(self):
+        """현재 프로세스의 전체 메트릭 스냅샷"""
+        with self.lock:
+            metrics = list(self._metrics.values())
+        return {
+            metric.name: {
+                'type': metric.type_name,
+                'help': metric.documentation,
+                'labelnames': list(metric.labelnames),
+                'buckets': list(getattr(metric, 'buckets', ())),
+                'samples': metric.snapshot(),
+            }
+            for metric in metrics
+        }
+
+    def maybe_flush(self):
+        """flush_interval 이 지났으면 스냅샷 파일 갱신"""
+        if not self.multiproc_dir:
+            return
+        now = time.monotonic()
+        if now - self._last_flush < self._flush_interval:
+            return
+        self._last_flush = now
+        self.flush()
+
+    @property
+    def instance(self):
+        """프로세스 시작 ID (fork된 자식은 pid가 바뀌므로 새로 발급)"""
+        pid = os.getpid()
+        if self._pid != pid:
+            self._pid = pid
+            self._instance = uuid.uuid4().hex
+        return self._instance
+
+    def flush(self):
+        """현재 프로세스 스냅샷을 `<dir>/<pid>-<시작 ID>.json` 에 원자적으로 기록"""
+        directory = self.multiproc_dir
+        if not directory:
+            return
+        os.makedirs(directory, exist_ok=True)
+        pid = os.getpid()
+        instance = self.instance
+        path = os.path.join(directory, f'{pid}-{instance}.json')
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'pid': pid, 'instance': instance, 'metrics': self.snapshot()}, f)
+        os.replace(tmp_path, path)
+
+    def collect(self):
+        """
+        출력할 메트릭 스냅샷 (멀티프로세스 모드면 전체 프로세스 합산)
+
+        Returns:
+            dict: {name: {'type', 'help', 'labelnames', 'buckets', 'samples'}}
+        """
+        directory = self.multiproc_dir
+        if not directory:
+            return self.snapshot()
+
+        self.flush()
+        merged = {}
+        with _directory_lock(directory):
+            self._reap(directory)
+            dead_totals = _read_json(os.path.join(directory, DEAD_TOTALS_FILE)) or {}
+            for name, metric in dead_totals.get('metrics', {}).items():
+                _merge_metric(merged, name, metric)
+            for path, data in self._process_snapshots(directory):
+                for name, metric in data.get('metrics', {}).items():
+                    _merge_metric(merged, name, metric)
+
+        for metric in merged.values():
+            metric.pop('_index', None)
+        return merged
+
+    def _process_snapshots(self, directory):
+        for path in glob.glob(os.path.join(directory, '*-*.json')):
+            data = _read_json(path)
+            if data is not None:  # 기록 중이거나 손상된 파일은 건너뜀
+                yield path, data
+
+    def _reap(self, directory):
+        """
+        종료된 프로세스 스냅샷의 Counter / Histogram을 dead.json에 합치고 삭제합니다.
+        (디렉토리 잠금 안에서 호출)
+
+        같은 pid의 다른 시작 ID 파일은 pid를 재사용한 이전 프로세스이므로 함께 정리합니다.
+        """
+        dead = []
+        for path, data in self._process_snapshots(directory):
+            pid = data.get('pid')
+            if pid == os.getpid():
+                if data.get('instance') != self.instance:
+                    dead.append((path, data))
+            elif not _pid_alive(pid):
+                dead.append((path, data))
+        if not dead:
+            return
+
+        totals_path = os.path.join(directory, DEAD_TOTALS_FILE)
+        merged = {}
+        for data in [_read_json(totals_path) or {}] + [data for _, data in dead]:
+            for name, metric in data.get('metrics', {}).items():
+                if metric['type'] != 'gauge':
+                    _merge_metric(merged, name, metric)
+        for metric in merged.values():
+            metric.pop('_index', None)
+
+        tmp_path = f'{totals_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'metrics': merged}, f)
+        os.replace(tmp_path, totals_path)
+        for path, _ in dead:
+            os.remove(path)
+
+    # ================================
+    # Prometheus 텍스트 포맷
+    # ================================
+
+    def render(self):
+        """Prometheus exposition 텍스트 포맷 (text/plain; version=0.0.4)"""
+        lines = []
+        for name, metric in sorted(self.collect().items()):
+            lines.append(f'# HELP {name} {metric["help"]}')
+            lines.append(f'# TYPE {name} {metric["type"]}')
+            labelnames = metric['labelnames']
+            for label_values, value in sorted(metric['samples'], key=lambda s: s[0]):
+                labels = list(zip(labelnames, label_values))
+                if metric['type'] == 'histogram':
+                    lines.extend(_render_histogram(name, labels, metric['buckets'], value))
+                else:
+                    lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+    def clear(self):
+        """모든 값 초기화 (테스트용)"""
+        with self.lock:
+            for metric in self._metrics.values():
+                metric._values.clear()
+
+
+def _merge_metric(merged, name, metric):
+    target = merged.get(name)
+    if target is None:
+        target = dict(metric, samples=[])
+        target['_index'] = {}
+        merged[name] = target
+
+    index = target['_index']
+    for label_values, value in metric['samples']:
+        key = tuple(label_values)
+        if key not in index:
+            if metric['type'] == 'histogram':
+                value = [list(value[0]), value[1], value[2]]
+            sample = [list(label_values), value]
+            index[key] = sample
+            target['samples'].append(sample)
+            continue
+
+        sample = index[key]
+        if metric['type'] == 'histogram':
+            counts, total, count = sample[1]
+            sample[1] = [
+                [a + b for a, b in zip(counts, value[0])],
+                total + value[1],
+                count + value[2],
+            ]
+        else:
+            sample[1] += value
+
+
+def _render_histogram(name, labels, buckets, value):
+    counts, total, count = value
+    lines = []
+    cumulative = 0
+    for upper, bucket_count in zip(list(buckets) + [math.inf], counts):
+        cumulative += bucket_count
+        le = '+Inf' if upper == math.inf else _format_value(upper)
+        lines.append(f'{name}_bucket{_format_labels(labels + [("le", le)])} {cumulative}')
+    lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(total)}')
+    lines.append(f'{name}_count{_format_labels(labels)} {count}')
+    return lines
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    parts = []
+    for key, value in labels:
+        escaped = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{key}="{escaped}"')
+    return '{' + ','.join(parts) + '}'
+
+
+def _format_value(value):
+    if isinstance(value, float) and value.is_integer():
+        return f'{value:.1f}'
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _read_json(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+@contextmanager
+def _directory_lock(directory):
+    """스냅샷 정리/합산을 프로세스 간 직렬화 (같은 스냅샷을 두 번 합치지 않도록)"""
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(directory, LOCK_FILE), 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _pid_alive(pid):
+    if not pid:
+        return False
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+REGISTRY = MetricsRegistry()
+atexit.register(REGISTRY.flush)
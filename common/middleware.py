@@ -0,0 +1,251 @@
+"""
+요청 단위 성능 계측 미들웨어
+
+- DB 쿼리 수/시간 (connection.execute_wrapper)
+- 캐시 적중/미스 (common.cache 백엔드)
+- view / render 구간 시간
+을 Server-Timing 헤더와 구조화 로그로 내보내고,
+느린 요청은 상위 쿼리와 함께 별도 로거로 샘플링합니다.
+같은 값을 라우트별 Prometheus 메트릭(common.metrics)에도 기록합니다.
+
+설정 (settings):
+    PERF_INSTRUMENTATION_ENABLED: 계측 사용 여부 (기본 True)
+    PERF_SERVER_TIMING_HEADER: Server-Timing 헤더 출력 여부 (기본 True, 운영은 False)
+    PERF_SLOW_REQUEST_MS: 느린 요청 기준 (ms, 기본 500)
+    PERF_SLOW_SAMPLE_RATE: 느린 요청 샘플링 비율 (0.0~1.0, 기본 1.0)
+    PERF_TOP_QUERIES: 느린 요청 로그에 포함할 쿼리 수 (기본 5)
+
+sync/async 모두 지원하므로 ASGI에서 async view 앞에 두어도
+요청이 sync 스레드로 전환되지 않습니다.
+"""
+import logging
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from .instrumentation import (
+    install_query_recorder, start_request_metrics, finish_request_metrics,
+)
+from .metrics import REGISTRY
+
+logger = logging.getLogger('teammoa.performance')
+slow_logger = logging.getLogger('teammoa.performance.slow')
+
+http_requests_total = REGISTRY.counter(
+    'teammoa_http_requests_total',
+    'HTTP 요청 수',
+    ['method', 'route', 'status'],
+)
+http_request_duration = REGISTRY.histogram(
+    'teammoa_http_request_duration_seconds',
+    'HTTP 요청 처리 시간 (초)',
+    ['method', 'route'],
+)
+http_request_db_queries = REGISTRY.histogram(
+    'teammoa_http_request_db_queries',
+    '요청당 DB 쿼리 수',
+    ['route'],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200),
+)
+db_queries_total = REGISTRY.counter(
+    'teammoa_db_queries_total',
+    'HTTP 요청 중 실행된 DB 쿼리 수',
+    ['route'],
+)
+db_query_duration_total = REGISTRY.counter(
+    'teammoa_db_query_seconds_total',
+    'HTTP 요청 중 DB 쿼리 누적 시간 (초)',
+    ['route'],
+)
+
+
+class PerformanceInstrumentationMiddleware:
+    """요청별 DB/캐시/구간 시간을 수집하는 미들웨어"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PERF_INSTRUMENTATION_ENABLED', True):
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        self.emit_header = getattr(settings, 'PERF_SERVER_TIMING_HEADER', True)
+        self.slow_request_ms = getattr(settings, 'PERF_SLOW_REQUEST_MS', 500)
+        self.slow_sample_rate = getattr(settings, 'PERF_SLOW_SAMPLE_RATE', 1.0)
+        self.top_queries = getattr(settings, 'PERF_TOP_QUERIES', 5)
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+            # sync 훅은 Django가 sync_to_async로 감싸므로 async 버전으로 교체
+            self.process_view = self._aprocess_view
+            self.process_template_response = self._aprocess_template_response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        metrics, token = start_request_metrics(top_queries=self.top_queries)
+        request._perf_metrics = metrics
+
+        try:
+            # 이후 생성되는 연결은 connection_created 시그널로 등록됨
+            for connection in connections.all():
+                install_query_recorder(connection)
+            response = self.get_response(request)
+        finally:
+            finish_request_metrics(token)
+
+        self._close_view_span(request, metrics)
+        self._emit(request, response, metrics)
+        return response
+
+    async def __acall__(self, request):
+        metrics, token = start_request_metrics(top_queries=self.top_queries)
+        request._perf_metrics = metrics
+
+        try:
+            response = await self.get_response(request)
+        finally:
+            finish_request_metrics(token)
+
+        self._close_view_span(request, metrics)
+        self._emit(request, response, metrics)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """view 구간 시작 시점 기록"""
+        request._perf_view_started_at = time.perf_counter()
+
+    async def _aprocess_view(self, request, view_func, view_args, view_kwargs):
+        PerformanceInstrumentationMiddleware.process_view(self, request, view_func, view_args, view_kwargs)
+
+    async def _aprocess_template_response(self, request, response):
+        return PerformanceInstrumentationMiddleware.process_template_response(self, request, response)
+
+    def process_template_response(self, request, response):
+        """
+        지연 렌더링 응답(DRF Response, TemplateResponse)은 이 시점에 view가 끝나고
+        이후 render()가 실행되므로 여기서 view 구간을 닫고 render 구간을 엽니다.
+        """
+        metrics = getattr(request, '_perf_metrics', None)
+        started_at = getattr(request, '_perf_view_started_at', None)
+        if metrics is not None and started_at is not None:
+            now = time.perf_counter()
+            metrics.add_span('view', now - started_at)
+            request._perf_view_started_at = None
+            request._perf_render_started_at = now
+        return response
+
+    def _close_view_span(self, request, metrics):
+        """get_response 반환 시점에 열려 있는 view/render 구간 정리"""
+        now = time.perf_counter()
+
+        render_started_at = getattr(request, '_perf_render_started_at', None)
+        if render_started_at is not None:
+            metrics.add_span('render', now - render_started_at)
+
+        view_started_at = getattr(request, '_perf_view_started_at', None)
+        if view_started_at is not None:
+            metrics.add_span('view', now - view_started_at)
+
+    def _emit(self, request, response, metrics):
+        total_ms = metrics.total_time * 1000
+        db_ms = metrics.query_time * 1000
+
+        if self.emit_header:
+            response['Server-Timing'] = self._build_server_timing(metrics, total_ms, db_ms)
+
+        route = self._get_route(request)
+        self._observe(request, response, metrics, route)
+
+        fields = {
+            'method': request.method,
+            'path': request.path,
+            'route': route,
+            'status': response.status_code,
+            'total_ms': round(total_ms, 2),
+            'db_queries': metrics.query_count,
+            'db_ms': round(db_ms, 2),
+            'cache_hits': metrics.cache_hits,
+            'cache_misses': metrics.cache_misses,
+        }
+        for name, duration in metrics.spans.items():
+            fields[f'{name}_ms'] = round(duration * 1000, 2)
+
+        logger.info(
+            ' '.join(f'{key}={value}' for key, value in fields.items()),
+            extra={'perf': fields},
+        )
+
+        if total_ms >= self.slow_request_ms and random.random() < self.slow_sample_rate:
+            slow_fields = dict(fields, top_queries=metrics.top_queries)
+            slow_logger.warning(
+                f'slow request {request.method} {request.path} {total_ms:.1f}ms '
+                f'({metrics.query_count} queries, {db_ms:.1f}ms db) '
+                f'top_queries={slow_fields["top_queries"]}',
+                extra={'perf': slow_fields},
+            )
+
+    def _observe(self, request, response, metrics, route):
+        """라우트별 Prometheus 메트릭 기록 (라우트 미매칭은 한 그룹으로 묶음)"""
+        route = route or 'unmatched'
+        http_requests_total.inc(method=request.method, route=route, status=str(response.status_code))
+        http_request_duration.observe(metrics.total_time, method=request.method, route=route)
+        http_request_db_queries.observe(metrics.query_count, route=route)
+        db_queries_total.inc(metrics.query_count, route=route)
+        db_query_duration_total.inc(metrics.query_time, route=route)
+
+    def _build_server_timing(self, metrics, total_ms, db_ms):
+        entries = [
+            f'db;dur={db_ms:.2f};desc="{metrics.query_count} queries"',
+            f'cache;desc="hit={metrics.cache_hits} miss={metrics.cache_misses}"',
+        ]
+        for name, duration in metrics.spans.items():
+            entries.append(f'{name};dur={duration * 1000:.2f}')
+        entries.append(f'total;dur={total_ms:.2f}')
+        return ', '.join(entries)
+
+    def _get_route(self, request):
+        """URL name 기반 라우트 이름 (매칭 실패 시 빈 문자열)"""
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match is None:
+            return ''
+        return resolver_match.view_name or resolver_match.route or ''
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    sync/async 겸용 WhiteNoise 미들웨어
+
+    WhiteNoise 6.x 미들웨어는 sync 전용이라 ASGI에서 그 뒤의 async view가
+    요청마다 sync 스레드로 전환됩니다. 정적 파일만 스레드에서 서빙하고
+    나머지 요청은 async 그대로 통과시킵니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
@@ -0,0 +1,128 @@
+"""
+요청 성능 계측 테스트
+
+테스트 구성:
+- TestPerformanceInstrumentationMiddleware: Server-Timing 헤더, 쿼리/캐시 집계, 느린 요청 로그
+- TestInstrumentationHelpers: span, RequestMetrics 상위 쿼리 보관
+"""
+import logging
+
+import pytest
+from django.core.cache import cache
+
+from common.instrumentation import (
+    RequestMetrics, span, start_request_metrics, finish_request_metrics,
+)
+
+
+def parse_server_timing(header):
+    """Server-Timing 헤더를 {이름: {속성}} 형태로 변환"""
+    result = {}
+    for entry in header.split(', '):
+        name, *params = entry.split(';')
+        result[name] = dict(param.split('=', 1) for param in params)
+    return result
+
+
+@pytest.mark.integration
+class TestPerformanceInstrumentationMiddleware:
+    """PerformanceInstrumentationMiddleware 테스트"""
+
+    def test_server_timing_header_present(self, web_client):
+        """모든 응답에 Server-Timing 헤더가 붙는다"""
+        response = web_client.get('/health/')
+
+        timing = parse_server_timing(response['Server-Timing'])
+        assert 'db' in timing
+        assert 'cache' in timing
+        assert 'total' in timing
+        assert 'view' in timing
+
+    def test_db_queries_counted(self, authenticated_api_client, team):
+        """API 요청의 DB 쿼리 수가 헤더에 기록된다"""
+        response = authenticated_api_client.get('/api/v1/teams/')
+
+        assert response.status_code == 200
+        timing = parse_server_timing(response['Server-Timing'])
+        assert timing['db']['desc'] != '"0 queries"'
+        assert 'render' in timing
+
+    def test_cache_hits_and_misses_counted(self, db, settings, web_client):
+        """캐시 적중/미스가 헤더에 기록된다"""
+        from django.http import JsonResponse
+        from django.urls import path
+
+        def cached_view(request):
+            cache.get('perf-test-miss')
+            cache.set('perf-test-hit', 1)
+            cache.get('perf-test-hit')
+            return JsonResponse({})
+
+        settings.ROOT_URLCONF = type('urls', (), {
+            'urlpatterns': [path('cached/', cached_view)]
+        })
+
+        response = web_client.get('/cached/')
+
+        timing = parse_server_timing(response['Server-Timing'])
+        assert timing['cache']['desc'] == '"hit=1 miss=1"'
+
+    def test_serialize_span_recorded_for_detail_view(self, authenticated_api_client, team):
+        """상세 조회의 serializer 구간이 serialize로 기록된다"""
+        response = authenticated_api_client.get(f'/api/v1/teams/{team.id}/')
+
+        assert response.status_code == 200
+        timing = parse_server_timing(response['Server-Timing'])
+        assert 'serialize' in timing
+
+    def test_slow_request_logged_with_top_queries(self, authenticated_api_client, team, settings, caplog):
+        """기준 시간을 넘은 요청은 상위 쿼리와 함께 샘플링된다"""
+        settings.PERF_SLOW_REQUEST_MS = 0
+        settings.PERF_SLOW_SAMPLE_RATE = 1.0
+
+        with caplog.at_level(logging.WARNING, logger='teammoa.performance.slow'):
+            authenticated_api_client.get('/api/v1/teams/')
+
+        records = [r for r in caplog.records if r.name == 'teammoa.performance.slow']
+        assert len(records) == 1
+        assert records[0].perf['top_queries']
+        assert records[0].perf['route'] == 'api:team-list'
+
+    def test_server_timing_header_can_be_disabled(self, web_client, settings):
+        """PERF_SERVER_TIMING_HEADER=False면 헤더를 내보내지 않는다"""
+        settings.PERF_SERVER_TIMING_HEADER = False
+
+        response = web_client.get('/health/')
+
+        assert 'Server-Timing' not in response
+
+
+@pytest.mark.unit
+class TestInstrumentationHelpers:
+    """계측 헬퍼 테스트"""
+
+    def test_span_accumulates_only_while_instrumented(self):
+        """계측 컨텍스트 밖에서는 span이 무시된다"""
+        with span('serialize'):
+            pass
+
+        metrics, token = start_request_metrics()
+        try:
+            with span('serialize'):
+                pass
+            with span('serialize'):
+                pass
+        finally:
+            finish_request_metrics(token)
+
+        assert 'serialize' in metrics.spans
+
+    def test_top_queries_keeps_slowest(self):
+        """상위 N개 쿼리만 느린 순으로 보관한다"""
+        metrics = RequestMetrics(top_queries=2)
+        metrics.record_query('SELECT 1', 0.001)
+        metrics.record_query('SELECT 2', 0.003)
+        metrics.record_query('SELECT 3', 0.002)
+
+        assert metrics.query_count == 3
+        assert [q['sql'] for q in metrics.top_queries] == ['SELECT 2', 'SELECT 3']
@@ -0,0 +1,134 @@
+"""
+Prometheus 메트릭 테스트
+
+테스트 구성:
+- TestMetricsRegistry: Counter/Gauge/Histogram 텍스트 포맷, 멀티프로세스 합산, 종료 프로세스 정리
+- TestMetricsEndpoint: /metrics 응답, 토큰 인증, HTTP 요청 메트릭 기록
+"""
+import json
+import os
+
+import pytest
+
+from common.metrics import MetricsRegistry, REGISTRY
+
+
+@pytest.mark.unit
+class TestMetricsRegistry:
+    """MetricsRegistry 테스트"""
+
+    def test_render_counter_and_gauge(self):
+        """Counter/Gauge가 레이블과 함께 텍스트 포맷으로 출력된다"""
+        registry = MetricsRegistry()
+        counter = registry.counter('test_requests_total', '요청 수', ['status'])
+        gauge = registry.gauge('test_active', '활성 연결')
+
+        counter.inc(status='200')
+        counter.inc(2, status='200')
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        output = registry.render()
+        assert '# TYPE test_requests_total counter' in output
+        assert 'test_requests_total{status="200"} 3' in output
+        assert 'test_active 1' in output
+
+    def test_render_histogram_is_cumulative(self):
+        """Histogram 버킷은 누적 개수로 출력된다"""
+        registry = MetricsRegistry()
+        histogram = registry.histogram('test_seconds', '소요 시간', buckets=(0.1, 1.0))
+
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        output = registry.render()
+        assert 'test_seconds_bucket{le="0.1"} 1' in output
+        assert 'test_seconds_bucket{le="1.0"} 2' in output
+        assert 'test_seconds_bucket{le="+Inf"} 3' in output
+        assert 'test_seconds_count 3' in output
+
+    def test_label_mismatch_raises(self):
+        """정의되지 않은 레이블을 사용하면 ValueError"""
+        registry = MetricsRegistry()
+        counter = registry.counter('test_total', '테스트', ['route'])
+
+        with pytest.raises(ValueError):
+            counter.inc(status='200')
+
+    def test_multiprocess_snapshots_are_merged(self, tmp_path):
+        """다른 프로세스 스냅샷의 Counter는 합산되고 종료된 프로세스의 Gauge는 제외된다"""
+        registry = MetricsRegistry(multiproc_dir=str(tmp_path))
+        registry.counter('test_total', '테스트', ['route']).inc(route='a')
+        registry.gauge('test_active', '활성').set(2)
+
+        dead_pid = 2 ** 22 + 1  # pid_max를 넘는 값은 존재하지 않는 프로세스
+        other = {
+            'pid': dead_pid,
+            'metrics': {
+                'test_total': {
+                    'type': 'counter', 'help': '테스트', 'labelnames': ['route'],
+                    'buckets': [], 'samples': [[['a'], 4]],
+                },
+                'test_active': {
+                    'type': 'gauge', 'help': '활성', 'labelnames': [],
+                    'buckets': [], 'samples': [[[], 10]],
+                },
+            },
+        }
+        with open(os.path.join(tmp_path, f'{dead_pid}-old.json'), 'w') as f:
+            json.dump(other, f)
+
+        output = registry.render()
+        assert 'test_total{route="a"} 5' in output
+        assert 'test_active 2' in output
+
+    def test_dead_process_snapshots_are_folded(self, tmp_path):
+        """종료된 프로세스 스냅샷은 누적 파일로 합쳐져 삭제되고, 같은 pid로 재시작해도 Counter가 줄지 않는다"""
+        registry = MetricsRegistry(multiproc_dir=str(tmp_path))
+        registry.counter('test_total', '테스트').inc(3)
+        registry.flush()
+        first_file = f'{os.getpid()}-{registry.instance}.json'
+        assert registry.collect()['test_total']['samples'] == [[[], 3]]
+
+        # 같은 pid를 받은 새 프로세스 (시작 ID만 다름)
+        restarted = MetricsRegistry(multiproc_dir=str(tmp_path))
+        restarted.counter('test_total', '테스트').inc(1)
+
+        assert restarted.collect()['test_total']['samples'] == [[[], 4]]
+        assert first_file not in os.listdir(tmp_path)
+        assert 'dead.json' in os.listdir(tmp_path)
+        assert restarted.collect()['test_total']['samples'] == [[[], 4]]
+
+
+@pytest.mark.integration
+class TestMetricsEndpoint:
+    """/metrics 엔드포인트 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_registry(self):
+        REGISTRY.clear()
+        yield
+        REGISTRY.clear()
+
+    def test_metrics_records_http_requests(self, authenticated_api_client, team, web_client):
+        """API 요청이 라우트별 요청 수/쿼리 수 메트릭으로 기록된다"""
+        authenticated_api_client.get('/api/v1/teams/')
+
+        response = web_client.get('/metrics')
+
+        assert response.status_code == 200
+        assert response['Content-Type'].startswith('text/plain; version=0.0.4')
+        body = response.content.decode()
+        assert 'teammoa_http_requests_total{method="GET",route="api:team-list",status="200"} 1' in body
+        assert 'teammoa_http_request_db_queries_count{route="api:team-list"} 1' in body
+
+    def test_metrics_requires_token_when_configured(self, db, web_client, settings):
+        """METRICS_AUTH_TOKEN이 설정되면 Bearer 토큰이 필요하다"""
+        settings.METRICS_AUTH_TOKEN = 'scrape-secret'
+
+        assert web_client.get('/metrics').status_code == 401
+
+        response = web_client.get('/metrics', HTTP_AUTHORIZATION='Bearer scrape-secret')
+        assert response.status_code == 200
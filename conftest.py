@@ -14,6 +14,13 @@ from teams.models import Team, TeamUser
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    """업로드 파일은 테스트마다 임시 MEDIA_ROOT에 저장 (저장소의 media/에 파일이 남지 않도록)"""
+    settings.MEDIA_ROOT = str(tmp_path / 'media')
+    return settings.MEDIA_ROOT
+
+
 @pytest.fixture
 def user(db):
     """기본 테스트 사용자"""
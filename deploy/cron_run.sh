@@ -10,5 +10,10 @@ source /tmp/container_env.sh
 # cleanup
 rm -f /tmp/container_env.sh
 
+# 실행할 management command (인자가 없으면 미인증 계정 삭제)
+if [ $# -eq 0 ]; then
+    set -- delete_unverified_users --verbose
+fi
+
 cd /app
-/opt/venv/bin/python manage.py delete_unverified_users --verbose
+/opt/venv/bin/python manage.py "$@"
@@ -10,7 +10,20 @@ backlog = 2048
 
 # Worker processes
 workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
-worker_class = 'sync'  # Use 'gevent' or 'eventlet' for async
+
+# Worker mode
+# - sync (default): WSGI app, one request per worker at a time
+# - asgi: uvicorn workers running the ASGI app, so async views (api/async_views.py)
+#   don't pin a worker while waiting on the DB or cache
+worker_mode = os.getenv('GUNICORN_WORKER_MODE', 'sync')
+if worker_mode == 'asgi':
+    worker_class = 'uvicorn.workers.UvicornWorker'
+    wsgi_app = 'TeamMoa.asgi:application'
+elif worker_mode == 'sync':
+    worker_class = 'sync'
+    wsgi_app = 'TeamMoa.wsgi:application'
+else:
+    raise ValueError(f"GUNICORN_WORKER_MODE must be 'sync' or 'asgi', got {worker_mode!r}")
 worker_connections = 1000
 max_requests = 1000
 max_requests_jitter = 50
@@ -42,10 +55,18 @@ def on_starting(server):
     """Called just before the master process is initialized."""
     print("Starting Gunicorn server...")
 
+    # Reset per-worker metrics snapshots left over from the previous run
+    metrics_dir = os.getenv('METRICS_MULTIPROC_DIR')
+    if metrics_dir:
+        os.makedirs(metrics_dir, exist_ok=True)
+        for name in os.listdir(metrics_dir):
+            if name.endswith('.json') or name.endswith('.json.tmp'):
+                os.remove(os.path.join(metrics_dir, name))
+
 def when_ready(server):
     """Called just after the server is started."""
     print(f"Gunicorn server is ready. Listening on: {bind}")
-    print(f"Workers: {workers}")
+    print(f"Workers: {workers} ({worker_mode})")
 
 def on_exit(server):
     """Called just before the master process is shut down."""
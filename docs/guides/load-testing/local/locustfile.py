@@ -0,0 +1,252 @@
+"""
+TeamMoa 로컬 부하 테스트 시나리오 (REST + 마인드맵 WebSocket)
+
+`python manage.py seed_loadtest` 가 만든 manifest JSON을 읽어 동작하므로
+팀 ID/계정을 하드코딩하지 않습니다. 종료 시 엔드포인트별 응답 시간 백분위와
+처리량을 JSON 리포트로 저장합니다.
+
+사용법:
+    python manage.py seed_loadtest --reset --output loadtest_manifest.json
+    daphne -b 127.0.0.1 -p 8000 TeamMoa.asgi:application
+    locust -f docs/guides/load-testing/local/locustfile.py --host http://127.0.0.1:8000 \\
+        --headless -u 50 -r 10 -t 2m \\
+        --manifest loadtest_manifest.json --report-json results/local_report.json
+"""
+import json
+import logging
+import random
+import time
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+import gevent
+import requests
+import websocket
+from locust import HttpUser, User, between, events, task
+from locust.exception import StopUser
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (0.5, 0.75, 0.9, 0.95, 0.99)
+
+MANIFEST = {}
+
+
+@events.init_command_line_parser.add_listener
+def add_arguments(parser):
+    parser.add_argument('--manifest', default='loadtest_manifest.json', help='seed_loadtest manifest 경로')
+    parser.add_argument('--report-json', default=None, help='JSON 리포트 저장 경로')
+
+
+@events.init.add_listener
+def load_manifest(environment, **kwargs):
+    path = Path(environment.parsed_options.manifest)
+    MANIFEST.update(json.loads(path.read_text(encoding='utf-8')))
+    logger.info(f"manifest 로드: 팀 {len(MANIFEST['teams'])}개 ({path})")
+
+
+def pick_account():
+    """manifest에서 임의의 (팀 정보, username) 선택"""
+    team = random.choice(MANIFEST['teams'])
+    return team, random.choice(team['usernames'])
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# REST 시나리오
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class RestUser(HttpUser):
+    """팀 조회/TODO/스케줄/게시판/마인드맵 API 사용자"""
+
+    weight = 3
+    wait_time = between(1, 3)
+
+    def on_start(self):
+        self.team, self.username = pick_account()
+        self.team_id = self.team['team_id']
+        with self.client.post(
+            '/api/v1/users/login/',
+            data={'username': self.username, 'password': MANIFEST['password']},
+            name='login',
+            catch_response=True,
+        ) as response:
+            if response.status_code != 200:
+                response.failure(f'status {response.status_code}')
+                raise StopUser()
+
+    @task(20)
+    def team_list(self):
+        self.client.get('/api/v1/teams/', name='GET /api/v1/teams/')
+
+    @task(10)
+    def team_detail(self):
+        self.client.get(f'/api/v1/teams/{self.team_id}/', name='GET /api/v1/teams/:id/')
+
+    @task(15)
+    def todos(self):
+        self.client.get(f'/api/v1/teams/{self.team_id}/todos/', name='GET /api/v1/teams/:id/todos/')
+
+    @task(10)
+    def schedules(self):
+        self.client.get(
+            f'/api/v1/teams/{self.team_id}/schedules/team-availability/',
+            params={'start_date': self.team['week_start'], 'end_date': self.team['week_end']},
+            name='GET /api/v1/teams/:id/schedules/team-availability/',
+        )
+
+    @task(10)
+    def milestones(self):
+        self.client.get(f'/api/v1/teams/{self.team_id}/milestones/', name='GET /api/v1/teams/:id/milestones/')
+
+    @task(10)
+    def shares(self):
+        self.client.get(f'/shares/{self.team_id}/', name='GET /shares/:id/')
+
+    @task(5)
+    def mindmap_detail(self):
+        self.client.get(
+            f'/api/v1/teams/{self.team_id}/mindmaps/{self.team["mindmap_id"]}/',
+            name='GET /api/v1/teams/:id/mindmaps/:id/',
+        )
+
+    @task(2)
+    def health(self):
+        self.client.get('/health/', name='GET /health/')
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 마인드맵 WebSocket 시나리오
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class MindmapWebSocketUser(User):
+    """
+    마인드맵 룸에 접속해 node_move / cursor_move 를 보내는 사용자
+
+    기록 항목 (request_type=WS):
+    - connect: 핸드셰이크 ~ existing_users 수신까지
+    - send node_move / send cursor_move: 전송 소요 시간
+    - fanout cursor_move: 다른 사용자가 보낸 커서가 도착하기까지의 지연
+      (cursor_move의 x에 전송 시각(ms)을 실어 보냄, 같은 호스트 시계 기준)
+    """
+
+    weight = 1
+    wait_time = between(0.2, 1.0)
+
+    def on_start(self):
+        self.team, self.username = pick_account()
+        session = requests.Session()
+        response = session.post(
+            f'{self.host}/api/v1/users/login/',
+            data={'username': self.username, 'password': MANIFEST['password']},
+        )
+        if response.status_code != 200:
+            self._fire('login', 0, exception=Exception(f'status {response.status_code}'))
+            raise StopUser()
+
+        parsed = urlparse(self.host)
+        scheme = 'wss' if parsed.scheme == 'https' else 'ws'
+        url = f'{scheme}://{parsed.netloc}/ws/mindmap/{self.team["team_id"]}/{self.team["mindmap_id"]}/'
+
+        start = time.perf_counter()
+        try:
+            self.ws = websocket.create_connection(
+                url,
+                header=[f'Cookie: sessionid={session.cookies.get("sessionid")}'],
+                origin=self.host,
+            )
+            json.loads(self.ws.recv())  # existing_users
+        except Exception as e:
+            self._fire('connect', (time.perf_counter() - start) * 1000, exception=e)
+            raise StopUser()
+        self._fire('connect', (time.perf_counter() - start) * 1000)
+
+        self.receiver = gevent.spawn(self._receive_loop)
+
+    def on_stop(self):
+        if getattr(self, 'receiver', None):
+            self.receiver.kill()
+        if getattr(self, 'ws', None):
+            self.ws.close()
+
+    @task(3)
+    def node_move(self):
+        self._send('node_move', {
+            'node_id': random.choice(self.team['node_ids']),
+            'x': random.randint(0, 3000),
+            'y': random.randint(0, 3000),
+        })
+
+    @task(7)
+    def cursor_move(self):
+        self._send('cursor_move', {'x': time.time() * 1000, 'y': random.randint(0, 3000)})
+
+    def _send(self, message_type, payload):
+        start = time.perf_counter()
+        try:
+            self.ws.send(json.dumps(dict(payload, type=message_type)))
+        except Exception as e:
+            self._fire(f'send {message_type}', (time.perf_counter() - start) * 1000, exception=e)
+            raise StopUser()
+        self._fire(f'send {message_type}', (time.perf_counter() - start) * 1000)
+
+    def _receive_loop(self):
+        while True:
+            try:
+                message = json.loads(self.ws.recv())
+            except Exception:
+                return
+            if message.get('type') == 'cursor_moved':
+                sent_at = message.get('x')
+                if isinstance(sent_at, (int, float)):
+                    self._fire('fanout cursor_move', max(time.time() * 1000 - sent_at, 0))
+
+    def _fire(self, name, response_time, exception=None):
+        self.environment.events.request.fire(
+            request_type='WS',
+            name=name,
+            response_time=response_time,
+            response_length=0,
+            exception=exception,
+            context={},
+        )
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# JSON 리포트
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def summarize(entry):
+    return {
+        'requests': entry.num_requests,
+        'failures': entry.num_failures,
+        'rps': round(entry.total_rps, 2),
+        'avg_ms': round(entry.avg_response_time, 2),
+        'max_ms': round(entry.max_response_time or 0, 2),
+        'percentiles_ms': {
+            f'p{int(p * 100)}': entry.get_response_time_percentile(p) for p in PERCENTILES
+        },
+    }
+
+
+@events.test_stop.add_listener
+def write_report(environment, **kwargs):
+    path = environment.parsed_options.report_json
+    if not path:
+        return
+
+    stats = environment.stats
+    report = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'host': environment.host,
+        'users': environment.runner.user_count if environment.runner else None,
+        'total': summarize(stats.total),
+        'endpoints': {
+            f'{entry.method} {entry.name}': summarize(entry)
+            for entry in sorted(stats.entries.values(), key=lambda e: (e.method, e.name))
+        },
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+    logger.info(f'JSON 리포트 저장: {path}')
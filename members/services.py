@@ -3,7 +3,8 @@ from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.db.models import Count, Q, Prefetch, Max
 from .models import Todo
-from teams.models import Team, TeamUser, Milestone
+from teams.models import Team, TeamChange, TeamUser, Milestone
+from teams.tasks import recompute_milestone_progress
 
 
 class TodoServiceException(Exception):
@@ -50,6 +51,7 @@ class TodoService:
             team=team,
             is_completed=False
         )
+        TeamChange.record(team.id, TeamChange.ENTITY_TODO, todo.id, TeamChange.OP_CREATED)
 
         return todo
     
@@ -88,6 +90,7 @@ class TodoService:
         todo.assignee = assignee
         todo.order = max_order + 1
         todo.save()
+        TeamChange.record(team.id, TeamChange.ENTITY_TODO, todo.id, TeamChange.OP_UPDATED)
 
         return todo
 
@@ -130,6 +133,7 @@ class TodoService:
         todo.completed_at = timezone.now() if todo.is_completed else None
 
         todo.save()  # save() 훅이 자동으로 마일스톤 진행률 갱신
+        TeamChange.record(team.id, TeamChange.ENTITY_TODO, todo.id, TeamChange.OP_UPDATED)
 
         # 마일스톤 정보 수집
         milestone_updated = False
@@ -187,6 +191,7 @@ class TodoService:
         todo.completed_at = None
         todo.order = max_order + 1
         todo.save()
+        TeamChange.record(team.id, TeamChange.ENTITY_TODO, todo.id, TeamChange.OP_UPDATED)
 
         return todo
 
@@ -228,12 +233,15 @@ class TodoService:
         todo.is_completed = True
         todo.order = max_order + 1
         todo.save()
+        TeamChange.record(team.id, TeamChange.ENTITY_TODO, todo.id, TeamChange.OP_UPDATED)
 
         return todo
     
+    @transaction.atomic
     def delete_todo(self, todo_id, team):
         """
         Todo를 삭제합니다.
+        연결된 AUTO 모드 마일스톤의 진행률은 커밋 후 작업 큐에서 다시 계산합니다.
 
         Args:
             todo_id: Todo ID
@@ -242,9 +250,14 @@ class TodoService:
         Returns:
             str: 삭제된 Todo 내용
         """
-        todo = get_object_or_404(Todo, pk=todo_id, team=team)
+        todo = get_object_or_404(Todo.objects.select_related('milestone'), pk=todo_id, team=team)
         todo_content = todo.content
+        milestone = todo.milestone
         todo.delete()
+        TeamChange.record(team.id, TeamChange.ENTITY_TODO, todo_id, TeamChange.OP_DELETED)
+
+        if milestone and milestone.progress_mode == 'auto':
+            recompute_milestone_progress.delay_on_commit(milestone_id=milestone.id)
 
         return todo_content
 
@@ -301,6 +314,7 @@ class TodoService:
         # 6. 새 마일스톤 할당
         todo.milestone = milestone
         todo.save()  # save() 훅이 자동으로 이전/새 마일스톤 진행률 모두 갱신
+        TeamChange.record(team.id, TeamChange.ENTITY_TODO, todo.id, TeamChange.OP_UPDATED)
 
         # 7. 메타데이터 반환
         return todo, {
@@ -346,6 +360,7 @@ class TodoService:
 
         # 4. detach_from_milestone() 메서드 호출 (모델 메서드 활용)
         todo.detach_from_milestone()
+        TeamChange.record(team.id, TeamChange.ENTITY_TODO, todo.id, TeamChange.OP_UPDATED)
 
         return todo, {
             'detached': True,
@@ -406,6 +421,53 @@ class TodoService:
             'members_data': members_data
         }
 
+    async def aget_team_todos_with_stats(self, team_id):
+        """
+        get_team_todos_with_stats의 async 버전 (async view용)
+
+        async 컨텍스트에서는 지연 로딩이 불가능하므로 모든 QuerySet을 평가한
+        리스트로 반환합니다. 직렬화에 필요한 관계는 미리 로딩합니다.
+
+        Args:
+            team_id: 대상 팀 ID
+
+        Returns:
+            dict: members_data, todos_unassigned, todos_done
+        """
+        members_with_stats = TeamUser.objects.filter(team_id=team_id).annotate(
+            todo_count=Count('todo_set', filter=Q(todo_set__team_id=team_id)),
+            completed_count=Count('todo_set',
+                filter=Q(todo_set__team_id=team_id, todo_set__is_completed=True)),
+            in_progress_count=Count('todo_set',
+                filter=Q(todo_set__team_id=team_id, todo_set__is_completed=False))
+        ).select_related('user', 'team__host').prefetch_related(
+            Prefetch('todo_set',
+                queryset=Todo.objects.filter(team_id=team_id).select_related('milestone').order_by('order', 'created_at'))
+        ).order_by('id')
+
+        unassigned = Todo.objects.filter(
+            team_id=team_id,
+            assignee__isnull=True
+        ).select_related('milestone').order_by('order', 'created_at')
+
+        members_data = [
+            {
+                'member': member,
+                'todos': list(member.todo_set.all()),  # prefetch된 데이터 사용
+                'todo_count': member.todo_count,
+                'completed_count': member.completed_count,
+                'in_progress_count': member.in_progress_count,
+            }
+            async for member in members_with_stats
+        ]
+        todos = [todo async for todo in unassigned]
+
+        return {
+            'members_data': members_data,
+            'todos_unassigned': [todo for todo in todos if not todo.is_completed],
+            'todos_done': [todo for todo in todos if todo.is_completed],
+        }
+
     # Private 헬퍼 메서드들
     def _can_assign_todo(self, todo, assignee, requester, team):
         """Todo 할당 권한 검증"""
@@ -1,17 +1,20 @@
 """
 TodoService 서비스 레이어 테스트
-총 20개 테스트:
+총 21개 테스트:
 - create_todo: 2개
 - assign_todo: 5개
 - complete_todo: 3개
 - move_to_todo: 3개
 - move_to_done: 3개
-- delete_todo: 2개
+- delete_todo: 3개
 - get_team_todos_with_stats: 2개
 """
+from datetime import date
+
 import pytest
 from django.http import Http404
 from members.models import Todo
+from teams.models import Milestone
 
 
 pytestmark = pytest.mark.django_db
@@ -310,6 +313,23 @@ class TestTodoServiceDeleteTodo:
         assert content == 'Test Todo'
         assert not Todo.objects.filter(id=todo.id).exists()
 
+    def test_delete_todo_recomputes_milestone_after_commit(self, todo_service, team, django_capture_on_commit_callbacks):
+        """AUTO 마일스톤에 연결된 Todo 삭제 시 커밋 후 진행률 재계산"""
+        milestone = Milestone.objects.create(
+            team=team, title='마일스톤', startdate=date(2025, 1, 1), enddate=date(2025, 1, 31)
+        )
+        Todo.objects.create(team=team, content='완료', milestone=milestone, is_completed=True)
+        todo = Todo.objects.create(team=team, content='미완료', milestone=milestone)
+        milestone.refresh_from_db()
+        assert milestone.progress_percentage == 50
+
+        with django_capture_on_commit_callbacks(execute=True):
+            todo_service.delete_todo(todo_id=todo.id, team=team)
+
+        milestone.refresh_from_db()
+        assert milestone.progress_percentage == 100
+        assert milestone.is_completed is True
+
     def test_delete_todo_nonexistent(self, todo_service, team):
         """존재하지 않는 Todo 삭제 시도"""
         with pytest.raises(Http404):
@@ -12,12 +12,13 @@ from .serializers import (
     TeamMemberSerializer, TodoMilestoneAssignSerializer
 )
 from .services import TodoService
-from teams.models import Team, TeamUser, Milestone
+from teams.models import Team, TeamChange, TeamUser, Milestone
+from api.mixins import ConditionalGetMixin
 from api.permissions import IsTeamMember
 from api.utils import api_response, api_success_response, api_error_response
 
 
-class TodoViewSet(viewsets.ModelViewSet):
+class TodoViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     팀 TODO 관리 ViewSet
 
@@ -29,6 +30,7 @@ class TodoViewSet(viewsets.ModelViewSet):
     """
     serializer_class = TodoSerializer
     permission_classes = [IsAuthenticated, IsTeamMember]
+    change_entity = TeamChange.ENTITY_TODO
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -281,7 +283,7 @@ class TodoViewSet(viewsets.ModelViewSet):
             return api_error_response(request, str(e))
 
 
-class TeamMemberViewSet(viewsets.ReadOnlyModelViewSet):
+class TeamMemberViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """팀 멤버 조회 ViewSet"""
     serializer_class = TeamMemberSerializer
     permission_classes = [IsAuthenticated, IsTeamMember]
@@ -1,8 +1,10 @@
 from django.contrib import admin
-from .models import Comment, Mindmap, Node, NodeConnection
+from .models import Comment, Mindmap, MindmapOperation, MindmapSnapshot, Node, NodeConnection
 # Register your models here.
 
 admin.site.register(Mindmap)
 admin.site.register(Node)
 admin.site.register(NodeConnection)
-admin.site.register(Comment)
\ No newline at end of file
+admin.site.register(Comment)
+admin.site.register(MindmapOperation)
+admin.site.register(MindmapSnapshot)
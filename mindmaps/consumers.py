@@ -1,5 +1,8 @@
-import json
+import asyncio
 import logging
+import time
+import zlib
+from urllib.parse import parse_qs
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from django.contrib.auth.models import AnonymousUser
@@ -7,25 +10,70 @@ from django.shortcuts import get_object_or_404
 from django.conf import settings
 import redis.asyncio as redis
 
-from .models import Mindmap, Node, NodeConnection
+from .models import Mindmap
 from teams.models import TeamUser
 from .services import MindmapService
+from common import fastjson
+from common.metrics import REGISTRY
 
 logger = logging.getLogger(__name__)
 
+KNOWN_MESSAGE_TYPES = {'cursor_move', 'sync', *MindmapService.OPERATION_TYPES}
+
+ws_connections_total = REGISTRY.counter(
+    'teammoa_mindmap_ws_connections_total',
+    '마인드맵 WebSocket 연결 시도 수',
+    ['result'],
+)
+ws_active_connections = REGISTRY.gauge(
+    'teammoa_mindmap_ws_active_connections',
+    '현재 열려 있는 마인드맵 WebSocket 연결 수',
+)
+ws_messages_total = REGISTRY.counter(
+    'teammoa_mindmap_ws_messages_total',
+    '마인드맵 WebSocket 수신 메시지 수',
+    ['type'],
+)
+channel_layer_send_seconds = REGISTRY.histogram(
+    'teammoa_channel_layer_send_seconds',
+    'channel_layer.group_send 소요 시간 (초)',
+    ['type'],
+)
+ws_operation_batch_size = REGISTRY.histogram(
+    'teammoa_mindmap_ws_operation_batch_size',
+    '한 트랜잭션으로 적용한 편집 연산 수',
+    buckets=(1, 2, 5, 10, 20, 50),
+)
+
 class MindmapConsumer(AsyncWebsocketConsumer):
     """
     마인드맵 실시간 협업을 위한 WebSocket Consumer
 
     기능:
     - 마인드맵 룸 참가/퇴장
-    - 실시간 노드 위치 동기화
-    - 노드 생성/삭제 동기화
+    - 노드/연결선 편집 연산 적용 (서버가 저장 후 결과를 브로드캐스트)
     - 사용자 커서 위치 공유
+    - 노드 댓글 등록 알림 (REST/SSR에서 등록한 댓글의 노드별 댓글 수)
+
+    편집 연산(MindmapService.OPERATION_TYPES)은 BATCH_WINDOW_SECONDS 동안 모아
+    한 트랜잭션으로 저장하고, 서버 ID와 연산 로그의 순번(seq)/Lamport 시각을 붙여
+    operations_applied 메시지 하나로 룸 전체(발신자 포함)에 전달합니다.
+    실패한 연산은 발신자에게만 operation_rejected로 알립니다.
+    팀 멤버 여부는 연결 시와 연산 배치를 저장할 때마다 확인하며, 팀에서 빠진 사용자는 연결을 끊습니다.
+    재접속한 클라이언트는 접속 URL의 ?since= 또는 sync(since)로 놓친 연산만 다시 받습니다.
+    연산 로그가 압축(compact_mindmaps)되어 이어 붙일 수 없으면 캐시된 스냅샷 하나와
+    스냅샷 이후 연산을 보냅니다. since 없이 들어온 클라이언트는 입장 직후 스냅샷 + 이후 연산을 받습니다.
 
     Redis를 사용하여 ALB 다중 서버 환경에서 접속자 정보 동기화
     """
 
+    # 편집 연산 배치 설정
+    BATCH_WINDOW_SECONDS = 0.03
+    BATCH_MAX_OPERATIONS = 50
+
+    # 팀에서 빠진 사용자의 연결 종료 코드
+    CLOSE_CODE_NOT_MEMBER = 4403
+
     # Redis 클라이언트 (클래스 변수)
     _redis_client = None
 
@@ -50,9 +98,14 @@ class MindmapConsumer(AsyncWebsocketConsumer):
         self.team_id = self.scope['url_route']['kwargs']['team_id']
         self.room_group_name = f'mindmap_{self.mindmap_id}'
         self.user = self.scope.get('user', AnonymousUser())
+        self.pending_operations = []
+        self._flush_task = None
+        self._flush_lock = asyncio.Lock()
+        self._removed = False
 
         # 사용자 인증 및 권한 확인
         if not await self.check_permissions():
+            ws_connections_total.inc(result='rejected')
             await self.close()
             return
 
@@ -63,6 +116,9 @@ class MindmapConsumer(AsyncWebsocketConsumer):
         )
 
         await self.accept()
+        self._accepted = True
+        ws_connections_total.inc(result='accepted')
+        ws_active_connections.inc()
         logger.info(f"User {self.user.username} joined mindmap {self.mindmap_id}")
 
         # Redis에서 기존 접속자 목록 가져오기
@@ -81,14 +137,20 @@ class MindmapConsumer(AsyncWebsocketConsumer):
         # TTL 설정 (24시간 후 자동 삭제)
         await redis_client.expire(redis_key, 86400)
 
-        # 새 접속자에게 기존 접속자 목록 전송
-        await self.send(text_data=json.dumps({
+        # 새 접속자에게 기존 접속자 목록과 연산 로그의 현재 순번/시각 전송
+        await self.send(text_data=fastjson.dumps_str({
             'type': 'existing_users',
-            'users': existing_users
+            'users': existing_users,
+            'seq': self.mindmap.last_seq,
+            'lamport': self.mindmap.lamport_clock
         }))
 
+        # 마지막으로 반영한 순번을 알려 온 클라이언트에게는 놓친 변경을,
+        # 처음 들어온 클라이언트에게는 캐시된 스냅샷 + 이후 연산을 바로 전송
+        await self.send_catch_up(self.get_since())
+
         # 다른 사용자들에게 새 사용자 알림
-        await self.channel_layer.group_send(
+        await self._group_send(
             self.room_group_name,
             {
                 'type': 'user_joined',
@@ -99,6 +161,13 @@ class MindmapConsumer(AsyncWebsocketConsumer):
     
     async def disconnect(self, close_code):
         """WebSocket 연결 종료 시 실행"""
+        if getattr(self, '_accepted', False):
+            ws_active_connections.dec()
+
+        if getattr(self, '_accepted', False):
+            # 아직 저장하지 않은 편집 연산 반영
+            await self.flush_operations()
+
         if hasattr(self, 'room_group_name'):
             # Redis에서 접속자 제거
             redis_client = await self.get_redis_client()
@@ -106,7 +175,7 @@ class MindmapConsumer(AsyncWebsocketConsumer):
             await redis_client.hdel(redis_key, self.user.id)
 
             # 다른 사용자들에게 사용자 퇴장 알림
-            await self.channel_layer.group_send(
+            await self._group_send(
                 self.room_group_name,
                 {
                     'type': 'user_left',
@@ -126,102 +195,151 @@ class MindmapConsumer(AsyncWebsocketConsumer):
     async def receive(self, text_data):
         """클라이언트로부터 메시지 수신"""
         try:
-            data = json.loads(text_data)
+            data = fastjson.loads(text_data)
             message_type = data.get('type')
-            
+            ws_messages_total.inc(
+                type=message_type if message_type in KNOWN_MESSAGE_TYPES else 'unknown'
+            )
+
             # 메시지 타입별 처리
-            if message_type == 'node_move':
-                await self.handle_node_move(data)
-            elif message_type == 'node_create':
-                await self.handle_node_create(data)
-            elif message_type == 'node_delete':
-                await self.handle_node_delete(data)
+            if message_type in MindmapService.OPERATION_TYPES:
+                await self.enqueue_operation(data)
             elif message_type == 'cursor_move':
                 await self.handle_cursor_move(data)
-            elif message_type == 'connection_create':
-                await self.handle_connection_create(data)
-            elif message_type == 'connection_delete':
-                await self.handle_connection_delete(data)
+            elif message_type == 'sync':
+                await self.handle_sync(data)
             else:
                 logger.warning(f"Unknown message type: {message_type}")
                 
-        except json.JSONDecodeError:
+        except fastjson.JSONDecodeError:
             logger.error(f"Invalid JSON received: {text_data}")
         except Exception as e:
             logger.error(f"Error handling message: {e}")
     
-    async def handle_node_move(self, data):
-        """노드 이동 처리"""
-        node_id = data.get('node_id')
-        x = data.get('x')
-        y = data.get('y')
-        
-        if node_id is None or x is None or y is None:
-            return
-        
-        # 데이터베이스 업데이트
-        success = await self.update_node_position(node_id, x, y)
-        if success:
-            # 다른 사용자들에게 브로드캐스트 (발신자 제외)
-            await self.channel_layer.group_send(
+    async def _group_send(self, group, message):
+        """channel_layer.group_send 래퍼 (브로드캐스트 소요 시간 기록)"""
+        start = time.perf_counter()
+        try:
+            await self.channel_layer.group_send(group, message)
+        finally:
+            channel_layer_send_seconds.observe(
+                time.perf_counter() - start, type=message.get('type', '')
+            )
+
+    async def enqueue_operation(self, data):
+        """편집 연산을 배치에 추가 (가득 차면 즉시, 아니면 BATCH_WINDOW_SECONDS 후 저장)"""
+        self.pending_operations.append(data)
+
+        if len(self.pending_operations) >= self.BATCH_MAX_OPERATIONS:
+            await self.flush_operations()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.BATCH_WINDOW_SECONDS)
+        try:
+            await self.flush_operations()
+        except Exception as e:
+            logger.error(f"Error flushing operations: {e}")
+
+    async def flush_operations(self):
+        """모인 편집 연산을 한 트랜잭션으로 저장하고 결과를 브로드캐스트"""
+        async with self._flush_lock:
+            operations, self.pending_operations = self.pending_operations, []
+            if not operations:
+                return
+
+            ws_operation_batch_size.observe(len(operations))
+            results = await self.apply_operations(operations)
+            if results is None:
+                await self.close_removed_member()
+                return
+            applied = [result for result in results if result.pop('ok')]
+
+            for result in results:
+                if 'error' in result:
+                    # LWW에서 밀린 연산은 현재 노드 상태를 함께 보내 클라이언트가 되돌리게 함
+                    await self.send(text_data=fastjson.dumps_str({
+                        'type': 'operation_rejected',
+                        'operation': result['type'],
+                        'client_op_id': result['client_op_id'],
+                        'error': result['error'],
+                        'superseded': result.get('superseded', False),
+                        'node': result.get('node')
+                    }))
+
+            if not applied:
+                return
+
+            await self._group_send(
                 self.room_group_name,
                 {
-                    'type': 'node_moved',
-                    'node_id': node_id,
-                    'x': x,
-                    'y': y,
+                    'type': 'operations_applied',
+                    'operations': applied,
                     'user_id': self.user.id,
                     'username': self.user.username,
-                    'sender_channel': self.channel_name  # 발신자 구분용
+                    'sender_channel': self.channel_name
                 }
             )
-    
-    async def handle_node_create(self, data):
-        """노드 생성 처리"""
-        node_id = data.get('node_id')
-        title = data.get('title')
-        content = data.get('content')
-        posX = data.get('posX')
-        posY = data.get('posY')
-
-        if node_id is None or posX is None or posY is None:
+
+    async def close_removed_member(self):
+        """연결 후 팀에서 나가거나 추방된 사용자 → 남은 연산을 버리고 연결 종료"""
+        self.pending_operations = []
+        if self._removed:
+            return
+        self._removed = True
+        logger.info(f"User {self.user.username} is no longer a member of team {self.team_id}, closing mindmap socket")
+        await self.close(code=self.CLOSE_CODE_NOT_MEMBER)
+
+    async def handle_sync(self, data):
+        """재접속/누락 시 since 이후 변경 재전송"""
+        since = data.get('since')
+        if not isinstance(since, int) or isinstance(since, bool) or since < 0:
             return
 
-        # 다른 사용자들에게 브로드캐스트
-        await self.channel_layer.group_send(
-            self.room_group_name,
-            {
-                'type': 'node_created',
-                'node_id': node_id,
-                'title': title,
-                'content': content,
-                'posX': posX,
-                'posY': posY,
-                'user_id': self.user.id,
-                'username': self.user.username,
-                'sender_channel': self.channel_name
-            }
-        )
+        # 아직 저장 대기 중인 내 연산도 포함되도록 먼저 반영
+        await self.flush_operations()
+        if self._removed:
+            return
+        if not await self.is_member():
+            await self.close_removed_member()
+            return
+        await self.send_catch_up(since)
+
+    async def send_catch_up(self, since):
+        """
+        since 이후 연산 전송 (로그가 압축됐으면 스냅샷 + 이후 연산, 둘 다 안 되면 전체 재로딩 요청)
+        since가 None이면 스냅샷 + 이후 연산 (스냅샷이 없으면 보내지 않고 HTTP로 받은 상태를 그대로 사용)
+        """
+        catch_up = await self.get_catch_up(since)
+        if catch_up is None:
+            if since is not None:
+                await self.send(text_data=fastjson.dumps_str({'type': 'resync_required'}))
+            return
 
-    async def handle_node_delete(self, data):
-        """노드 삭제 처리"""
-        node_id = data.get('node_id')
+        snapshot = catch_up['snapshot']
+        if snapshot is not None:
+            # 압축 해제한 JSON을 다시 파싱하지 않고 그대로 메시지에 붙여 전송
+            state = zlib.decompress(snapshot['data']).decode('utf-8')
+            await self.send(text_data=(
+                f'{{"type": "snapshot", "seq": {snapshot["seq"]}, '
+                f'"lamport": {snapshot["lamport"]}, "state": {state}}}'
+            ))
+
+        await self.send(text_data=fastjson.dumps_str({
+            'type': 'operations_replay',
+            'operations': catch_up['operations']
+        }))
 
-        if node_id is None:
-            return
+    def get_since(self):
+        """접속 URL의 since 쿼리 파라미터 (없거나 잘못된 값이면 None)"""
+        query = parse_qs(self.scope.get('query_string', b'').decode())
+        try:
+            since = int(query['since'][0])
+        except (KeyError, ValueError):
+            return None
+        return since if since >= 0 else None
 
-        # 다른 사용자들에게 브로드캐스트
-        await self.channel_layer.group_send(
-            self.room_group_name,
-            {
-                'type': 'node_deleted',
-                'node_id': node_id,
-                'user_id': self.user.id,
-                'username': self.user.username,
-                'sender_channel': self.channel_name
-            }
-        )
-    
     async def handle_cursor_move(self, data):
         """커서 이동 처리"""
         x = data.get('x')
@@ -231,7 +349,7 @@ class MindmapConsumer(AsyncWebsocketConsumer):
             return
 
         # 다른 사용자들에게 커서 위치 브로드캐스트
-        await self.channel_layer.group_send(
+        await self._group_send(
             self.room_group_name,
             {
                 'type': 'cursor_moved',
@@ -243,52 +361,10 @@ class MindmapConsumer(AsyncWebsocketConsumer):
             }
         )
 
-    async def handle_connection_create(self, data):
-        """연결선 생성 처리"""
-        connection_id = data.get('connection_id')
-        from_node_id = data.get('from_node_id')
-        to_node_id = data.get('to_node_id')
-
-        if connection_id is None or from_node_id is None or to_node_id is None:
-            return
-
-        # 다른 사용자들에게 브로드캐스트
-        await self.channel_layer.group_send(
-            self.room_group_name,
-            {
-                'type': 'connection_created',
-                'connection_id': connection_id,
-                'from_node_id': from_node_id,
-                'to_node_id': to_node_id,
-                'user_id': self.user.id,
-                'username': self.user.username,
-                'sender_channel': self.channel_name
-            }
-        )
-
-    async def handle_connection_delete(self, data):
-        """연결선 삭제 처리"""
-        connection_id = data.get('connection_id')
-
-        if connection_id is None:
-            return
-
-        # 다른 사용자들에게 브로드캐스트
-        await self.channel_layer.group_send(
-            self.room_group_name,
-            {
-                'type': 'connection_deleted',
-                'connection_id': connection_id,
-                'user_id': self.user.id,
-                'username': self.user.username,
-                'sender_channel': self.channel_name
-            }
-        )
-
     # 그룹 메시지 핸들러들
     async def user_joined(self, event):
         """사용자 참가 알림"""
-        await self.send(text_data=json.dumps({
+        await self.send(text_data=fastjson.dumps_str({
             'type': 'user_joined',
             'user_id': event['user_id'],
             'username': event['username']
@@ -296,30 +372,37 @@ class MindmapConsumer(AsyncWebsocketConsumer):
     
     async def user_left(self, event):
         """사용자 퇴장 알림"""
-        await self.send(text_data=json.dumps({
+        await self.send(text_data=fastjson.dumps_str({
             'type': 'user_left',
             'user_id': event['user_id'],
             'username': event['username']
         }))
     
-    async def node_moved(self, event):
-        """노드 이동 알림"""
-        # 발신자에게는 전송하지 않음
-        if event.get('sender_channel') != self.channel_name:
-            await self.send(text_data=json.dumps({
-                'type': 'node_moved',
-                'node_id': event['node_id'],
-                'x': event['x'],
-                'y': event['y'],
-                'user_id': event['user_id'],
-                'username': event['username']
-            }))
-    
+    async def operations_applied(self, event):
+        """편집 연산 결과 알림 (발신자 포함, 발신자는 client_op_id로 자기 연산 확인)"""
+        is_sender = event.get('sender_channel') == self.channel_name
+        await self.send(text_data=fastjson.dumps_str({
+            'type': 'operations_applied',
+            'user_id': event['user_id'],
+            'username': event['username'],
+            'is_sender': is_sender,
+            'operations': event['operations']
+        }))
+
+    async def comment_created(self, event):
+        """노드 댓글 등록 알림 (REST/SSR에서 등록, 노드별 댓글 수 갱신용)"""
+        await self.send(text_data=fastjson.dumps_str({
+            'type': 'comment_created',
+            'node_id': event['node_id'],
+            'comment_count': event['comment_count'],
+            'comment': event['comment']
+        }))
+
     async def cursor_moved(self, event):
         """커서 이동 알림"""
         # 발신자에게는 전송하지 않음
         if event.get('sender_channel') != self.channel_name:
-            await self.send(text_data=json.dumps({
+            await self.send(text_data=fastjson.dumps_str({
                 'type': 'cursor_moved',
                 'x': event['x'],
                 'y': event['y'],
@@ -327,56 +410,6 @@ class MindmapConsumer(AsyncWebsocketConsumer):
                 'username': event['username']
             }))
 
-    async def connection_created(self, event):
-        """연결선 생성 알림"""
-        # 발신자에게는 전송하지 않음
-        if event.get('sender_channel') != self.channel_name:
-            await self.send(text_data=json.dumps({
-                'type': 'connection_created',
-                'connection_id': event['connection_id'],
-                'from_node_id': event['from_node_id'],
-                'to_node_id': event['to_node_id'],
-                'user_id': event['user_id'],
-                'username': event['username']
-            }))
-
-    async def connection_deleted(self, event):
-        """연결선 삭제 알림"""
-        # 발신자에게는 전송하지 않음
-        if event.get('sender_channel') != self.channel_name:
-            await self.send(text_data=json.dumps({
-                'type': 'connection_deleted',
-                'connection_id': event['connection_id'],
-                'user_id': event['user_id'],
-                'username': event['username']
-            }))
-
-    async def node_created(self, event):
-        """노드 생성 알림"""
-        # 발신자에게는 전송하지 않음
-        if event.get('sender_channel') != self.channel_name:
-            await self.send(text_data=json.dumps({
-                'type': 'node_created',
-                'node_id': event['node_id'],
-                'title': event['title'],
-                'content': event['content'],
-                'posX': event['posX'],
-                'posY': event['posY'],
-                'user_id': event['user_id'],
-                'username': event['username']
-            }))
-
-    async def node_deleted(self, event):
-        """노드 삭제 알림"""
-        # 발신자에게는 전송하지 않음
-        if event.get('sender_channel') != self.channel_name:
-            await self.send(text_data=json.dumps({
-                'type': 'node_deleted',
-                'node_id': event['node_id'],
-                'user_id': event['user_id'],
-                'username': event['username']
-            }))
-
     # 데이터베이스 작업 (동기 → 비동기 변환)
     @database_sync_to_async
     def check_permissions(self):
@@ -387,23 +420,32 @@ class MindmapConsumer(AsyncWebsocketConsumer):
         try:
             # 팀 멤버인지 확인
             TeamUser.objects.get(team_id=self.team_id, user=self.user)
-            # 마인드맵이 존재하는지 확인
-            Mindmap.objects.get(id=self.mindmap_id, team_id=self.team_id)
+            # 마인드맵이 존재하는지 확인 (연산 로그 순번/시각도 함께 조회)
+            self.mindmap = Mindmap.objects.only('id', 'last_seq', 'lamport_clock').get(
+                id=self.mindmap_id, team_id=self.team_id
+            )
             return True
         except (TeamUser.DoesNotExist, Mindmap.DoesNotExist):
             return False
     
     @database_sync_to_async
-    def update_node_position(self, node_id, x, y):
-        """노드 위치 업데이트"""
-        try:
-            node = Node.objects.get(
-                id=node_id, 
-                mindmap_id=self.mindmap_id
-            )
-            node.posX = float(x)
-            node.posY = float(y)
-            node.save()
-            return True
-        except (Node.DoesNotExist, ValueError, TypeError):
-            return False
\ No newline at end of file
+    def apply_operations(self, operations):
+        """
+        편집 연산 묶음 저장 (MindmapService.apply_operations)
+
+        배치마다 팀 멤버인지 다시 확인합니다. ((team, user) unique 인덱스 EXISTS 1회)
+        멤버가 아니면 저장하지 않고 None을 반환합니다.
+        """
+        if not TeamUser.objects.filter(team_id=self.team_id, user=self.user).exists():
+            return None
+        return MindmapService().apply_operations(self.mindmap_id, operations, user=self.user)
+
+    @database_sync_to_async
+    def get_catch_up(self, since):
+        """since 이후 연산 또는 스냅샷 + 이후 연산 조회 (MindmapService.get_catch_up)"""
+        return MindmapService().get_catch_up(self.mindmap_id, since)
+
+    @database_sync_to_async
+    def is_member(self):
+        """아직 팀 멤버인지 확인 (연결 후 추방/탈퇴 확인용)"""
+        return TeamUser.objects.filter(team_id=self.team_id, user=self.user).exists()
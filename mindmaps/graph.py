@@ -0,0 +1,189 @@
+"""
+마인드맵 연결 구조 분석용 그래프
+
+NodeConnection은 방향(from → to)을 저장하지만 마인드맵 구조 분석에서는 무방향으로 다룹니다.
+인접 정보는 CSR(Compressed Sparse Row) 배열로 보관합니다.
+
+- node_ids: 노드 ID (오름차순, 위치 i가 그래프 내부 인덱스)
+- offsets: 길이 n + 1, 노드 i의 이웃은 neighbors[offsets[i]:offsets[i + 1]]
+- neighbors: 이웃 노드 인덱스 (길이 2 × 간선 수)
+
+리스트/딕셔너리 대신 array를 사용해 노드 수천 개 규모에서도 캐시 크기와 피클 비용이 작습니다.
+"""
+from array import array
+from bisect import bisect_left
+from collections import deque
+
+
+class MindmapGraph:
+    """마인드맵 무방향 그래프 (CSR)"""
+
+    def __init__(self, node_ids, edges):
+        """
+        Args:
+            node_ids (list[int]): 마인드맵의 노드 ID 목록 (오름차순)
+            edges (iterable[tuple[int, int]]): (from_node_id, to_node_id) 목록.
+                자기 자신 연결, 모르는 노드, 양방향 중복 연결은 무시합니다.
+        """
+        self.node_ids = array('q', node_ids)
+        node_count = len(self.node_ids)
+
+        pairs = set()
+        for from_node_id, to_node_id in edges:
+            i, j = self.index_of(from_node_id), self.index_of(to_node_id)
+            if i is None or j is None or i == j:
+                continue
+            pairs.add((i, j) if i < j else (j, i))
+        self.edge_count = len(pairs)
+
+        degrees = [0] * node_count
+        for i, j in pairs:
+            degrees[i] += 1
+            degrees[j] += 1
+
+        self.offsets = array('q', [0]) * (node_count + 1)
+        for i, degree in enumerate(degrees):
+            self.offsets[i + 1] = self.offsets[i] + degree
+
+        self.neighbors = array('q', [0]) * (2 * self.edge_count)
+        cursor = list(self.offsets[:-1])
+        for i, j in sorted(pairs):
+            self.neighbors[cursor[i]] = j
+            cursor[i] += 1
+            self.neighbors[cursor[j]] = i
+            cursor[j] += 1
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def index_of(self, node_id):
+        """노드 ID → 내부 인덱스 (없으면 None)"""
+        i = bisect_left(self.node_ids, node_id)
+        if i < len(self.node_ids) and self.node_ids[i] == node_id:
+            return i
+        return None
+
+    def degree(self, i):
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def neighbors_of(self, i):
+        return self.neighbors[self.offsets[i]:self.offsets[i + 1]]
+
+    def components(self):
+        """
+        연결 요소 목록 (크기 내림차순, 같으면 가장 작은 노드 ID 순)
+
+        Returns:
+            list[list[int]]: 요소별 노드 ID 목록 (오름차순)
+        """
+        labels = array('q', [-1]) * len(self)
+        components = []
+        for start in range(len(self)):
+            if labels[start] != -1:
+                continue
+            label = len(components)
+            labels[start] = label
+            members = [start]
+            queue = deque(members)
+            while queue:
+                for j in self.neighbors_of(queue.popleft()):
+                    if labels[j] == -1:
+                        labels[j] = label
+                        members.append(j)
+                        queue.append(j)
+            components.append(sorted(self.node_ids[i] for i in members))
+
+        components.sort(key=lambda members: (-len(members), members[0]))
+        return components
+
+    def orphans(self):
+        """연결선이 하나도 없는 노드 ID 목록"""
+        return [self.node_ids[i] for i in range(len(self)) if self.degree(i) == 0]
+
+    def shortest_path(self, from_node_id, to_node_id):
+        """
+        두 노드 사이 최단 경로 (BFS, 간선 수 기준)
+
+        Returns:
+            list[int] | None: 양 끝을 포함한 노드 ID 경로. 연결되어 있지 않으면 None
+        """
+        source, target = self.index_of(from_node_id), self.index_of(to_node_id)
+        if source is None or target is None:
+            return None
+
+        parents = array('q', [-1]) * len(self)
+        parents[source] = source
+        queue = deque([source])
+        while queue and parents[target] == -1:
+            i = queue.popleft()
+            for j in self.neighbors_of(i):
+                if parents[j] == -1:
+                    parents[j] = i
+                    queue.append(j)
+
+        if parents[target] == -1:
+            return None
+
+        path = [target]
+        while path[-1] != source:
+            path.append(parents[path[-1]])
+        return [self.node_ids[i] for i in reversed(path)]
+
+    def degree_centrality(self):
+        """노드별 연결 중심성 (degree / (n - 1))"""
+        denominator = max(len(self) - 1, 1)
+        return [self.degree(i) / denominator for i in range(len(self))]
+
+    def betweenness_centrality(self, sample_size=None):
+        """
+        노드별 매개 중심성 (Brandes 알고리즘, 0~1 정규화)
+
+        O(출발 노드 수 × 간선 수)이므로 호출부에서 결과를 캐시해야 합니다.
+        sample_size가 노드 수보다 작으면 출발 노드를 그만큼만 골라(고정 간격) 근사합니다.
+        """
+        node_count = len(self)
+        offsets = self.offsets.tolist()
+        neighbors = self.neighbors.tolist()
+        betweenness = [0.0] * node_count
+
+        if sample_size is None or sample_size >= node_count:
+            sources = range(node_count)
+        else:
+            step = node_count / sample_size
+            sources = [int(k * step) for k in range(sample_size)]
+
+        for source in sources:
+            order = []
+            predecessors = {}
+            paths = [0] * node_count
+            paths[source] = 1
+            distances = [-1] * node_count
+            distances[source] = 0
+
+            queue = deque([source])
+            while queue:
+                i = queue.popleft()
+                order.append(i)
+                next_distance = distances[i] + 1
+                for j in neighbors[offsets[i]:offsets[i + 1]]:
+                    if distances[j] < 0:
+                        distances[j] = next_distance
+                        queue.append(j)
+                    if distances[j] == next_distance:
+                        paths[j] += paths[i]
+                        predecessors.setdefault(j, []).append(i)
+
+            dependency = [0.0] * node_count
+            for j in reversed(order):
+                coefficient = (1 + dependency[j]) / paths[j]
+                for i in predecessors.get(j, ()):
+                    dependency[i] += paths[i] * coefficient
+                if j != source:
+                    betweenness[j] += dependency[j]
+
+        # 무방향 그래프는 각 쌍을 양쪽에서 두 번 세므로 (n - 1)(n - 2)로 나누고,
+        # 표본으로 계산했으면 전체 출발 노드 수에 맞게 늘림
+        scale = (node_count - 1) * (node_count - 2) * len(sources) / max(node_count, 1)
+        if scale <= 0:
+            return [0.0] * node_count
+        return [value / scale for value in betweenness]
@@ -0,0 +1,360 @@
+"""
+마인드맵 자동 배치 (NumPy)
+
+MindmapGraph(CSR)의 offsets/neighbors 배열을 그대로 NumPy 배열로 보고 계산합니다.
+좌표는 노드 간 기준 간격을 1로 하는 단위로 계산하며, 픽셀 변환은 호출부(MindmapLayoutService)가 합니다.
+
+- tree_layout: 연결 요소마다 루트(지정 노드 또는 연결이 가장 많은 노드)에서 BFS 트리를 만들어
+  깊이를 세로, 잎 순서를 가로로 배치
+- radial_layout: 같은 트리를 루트 중심 동심원에 배치 (부채꼴 폭은 하위 잎 수에 비례)
+- force_layout: radial_layout에서 시작하는 Fruchterman–Reingold 배치.
+  반발력은 Barnes–Hut 근사로 계산합니다 (아래 _repulsion 참고).
+"""
+import numpy as np
+
+
+def _csr(graph):
+    offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+    neighbors = np.frombuffer(graph.neighbors, dtype=np.int64)
+    return offsets, neighbors
+
+
+def _spanning_forest(graph, root_index=None):
+    """
+    연결 요소별 BFS 트리
+
+    Returns:
+        tuple: (order, parent, depth, component)
+            order: BFS 방문 순서 (요소별로 이어짐)
+            parent: 부모 인덱스 (루트는 -1)
+            depth: 루트로부터 깊이
+            component: 요소 번호 (큰 요소부터 0, 1, ...)
+    """
+    node_count = len(graph)
+    offsets, neighbors = _csr(graph)
+    degrees = np.diff(offsets)
+    offsets, neighbors = offsets.tolist(), neighbors.tolist()
+
+    parent = [-1] * node_count
+    depth = [-1] * node_count
+    component = [-1] * node_count
+    trees = []
+
+    # 지정한 루트를 먼저, 나머지는 연결이 많은 노드부터 루트로 사용
+    candidates = np.argsort(-degrees, kind='stable').tolist()
+    if root_index is not None:
+        candidates.insert(0, root_index)
+
+    for root in candidates:
+        if depth[root] != -1:
+            continue
+        depth[root] = 0
+        tree = [root]
+        head = 0
+        while head < len(tree):
+            i = tree[head]
+            head += 1
+            for j in neighbors[offsets[i]:offsets[i + 1]]:
+                if depth[j] == -1:
+                    depth[j] = depth[i] + 1
+                    parent[j] = i
+                    tree.append(j)
+        trees.append(tree)
+
+    trees.sort(key=len, reverse=True)
+    order = []
+    for label, tree in enumerate(trees):
+        for i in tree:
+            component[i] = label
+        order.extend(tree)
+
+    return (
+        np.array(order, dtype=np.int64),
+        np.array(parent, dtype=np.int64),
+        np.array(depth, dtype=np.int64),
+        np.array(component, dtype=np.int64),
+    )
+
+
+def _leaf_spans(order, parent):
+    """
+    트리 노드별 (잎 수, 잎 순서상 시작 위치)
+
+    BFS 순서에서 형제는 연속으로 나오므로 역순으로 잎 수를 누적하고,
+    정순으로 부모의 시작 위치에 앞선 형제들의 잎 수를 더해 시작 위치를 정합니다.
+    """
+    node_count = len(parent)
+    leaves = np.zeros(node_count, dtype=np.int64)
+    parent_list = parent.tolist()
+    leaves_list = [0] * node_count
+    for i in reversed(order.tolist()):
+        if leaves_list[i] == 0:
+            leaves_list[i] = 1
+        if parent_list[i] != -1:
+            leaves_list[parent_list[i]] += leaves_list[i]
+
+    start = [0] * node_count
+    next_child_start = {}
+    component_start = 0
+    for i in order.tolist():
+        p = parent_list[i]
+        if p == -1:
+            start[i] = component_start
+            component_start += leaves_list[i]
+        else:
+            start[i] = next_child_start.get(p, start[p])
+        next_child_start[p] = start[i] + leaves_list[i]
+
+    leaves[:] = leaves_list
+    return leaves, np.array(start, dtype=np.int64)
+
+
+def _pack_components(positions, component, gap=1.0):
+    """
+    연결 요소를 큰 것부터 줄 단위로 채워 배치 (줄 폭은 전체 면적 기준 가로 1.5배 비율)
+
+    좌표를 제자리에서 옮기고 그대로 반환합니다.
+    """
+    component_count = component.max() + 1
+    low = np.full((component_count, 2), np.inf)
+    high = np.full((component_count, 2), -np.inf)
+    np.minimum.at(low, component, positions)
+    np.maximum.at(high, component, positions)
+    sizes = high - low + gap
+
+    row_width = max(np.sqrt((sizes[:, 0] * sizes[:, 1]).sum() * 1.5), sizes[:, 0].max())
+    origin = np.zeros((component_count, 2))
+    x = y = row_height = 0.0
+    for label, (width, height) in enumerate(sizes.tolist()):
+        if x > 0 and x + width > row_width:
+            x, y, row_height = 0.0, y + row_height, 0.0
+        origin[label] = (x, y)
+        x += width
+        row_height = max(row_height, height)
+
+    positions += (origin - low)[component]
+    return positions
+
+
+def tree_layout(graph, root_index=None):
+    """
+    계층형 배치: 깊이를 세로(1.5단위), 하위 잎의 가운데를 가로 좌표로 사용
+
+    Returns:
+        np.ndarray: (노드 수, 2) 좌표
+    """
+    positions = np.zeros((len(graph), 2))
+    if len(graph) == 0:
+        return positions
+
+    order, parent, depth, component = _spanning_forest(graph, root_index)
+    leaves, start = _leaf_spans(order, parent)
+    positions[:, 0] = start + (leaves - 1) / 2
+    positions[:, 1] = depth * 1.5
+    return _pack_components(positions, component)
+
+
+def radial_layout(graph, root_index=None):
+    """
+    방사형 배치: 요소별로 루트를 중심에 두고 깊이별 동심원에 배치
+
+    각 노드는 하위 잎 수에 비례하는 부채꼴의 가운데 각도에 놓입니다.
+    반지름은 깊이마다 1단위 이상 늘리되, 해당 깊이의 노드 수가 원둘레에
+    1단위 간격으로 들어가도록 필요한 만큼 더 늘립니다.
+
+    Returns:
+        np.ndarray: (노드 수, 2) 좌표
+    """
+    positions = np.zeros((len(graph), 2))
+    if len(graph) == 0:
+        return positions
+
+    order, parent, depth, component = _spanning_forest(graph, root_index)
+    leaves, start = _leaf_spans(order, parent)
+
+    component_count = component.max() + 1
+    roots = parent == -1
+    component_first_leaf = np.zeros(component_count, dtype=np.int64)
+    component_leaves = np.zeros(component_count, dtype=np.int64)
+    component_first_leaf[component[roots]] = start[roots]
+    component_leaves[component[roots]] = leaves[roots]
+
+    # 요소별 깊이별 반지름
+    max_depth = depth.max() + 1
+    ring_counts = np.zeros((component_count, max_depth))
+    np.add.at(ring_counts, (component, depth), 1)
+    radii = np.zeros((component_count, max_depth))
+    for d in range(1, max_depth):
+        radii[:, d] = np.maximum(radii[:, d - 1] + 1, ring_counts[:, d] / (2 * np.pi))
+
+    angle = 2 * np.pi * (start - component_first_leaf[component] + leaves / 2) / component_leaves[component]
+    radius = radii[component, depth]
+    positions[:, 0] = radius * np.cos(angle)
+    positions[:, 1] = radius * np.sin(angle)
+    return _pack_components(positions, component)
+
+
+def force_layout(graph, root_index=None, iterations=30, theta_levels=None, seed=0):
+    """
+    Fruchterman–Reingold 힘 기반 배치 (기준 간격 k = 1)
+
+    - 인력: 연결된 노드 사이 d² / k
+    - 반발력: 모든 노드 쌍 k² / d (Barnes–Hut 근사)
+    - 이동량은 온도(temperature)로 제한하고 반복마다 선형으로 식힘
+
+    Args:
+        graph (MindmapGraph): 배치할 그래프
+        root_index (int): 초기 배치(radial_layout)의 루트
+        iterations (int): 반복 횟수
+        theta_levels (int): 근사 격자의 최대 깊이 (기본값: 칸 수가 노드 수의 2배 이상이 되는 깊이)
+        seed (int): 겹친 노드를 벌리는 난수 시드
+
+    Returns:
+        np.ndarray: (노드 수, 2) 좌표
+    """
+    node_count = len(graph)
+    positions = radial_layout(graph, root_index)
+    if node_count < 2:
+        return positions
+
+    rng = np.random.default_rng(seed)
+    positions += rng.uniform(-0.05, 0.05, positions.shape)
+
+    offsets, neighbors = _csr(graph)
+    sources = np.repeat(np.arange(node_count), np.diff(offsets))
+    targets = neighbors
+    if theta_levels is None:
+        theta_levels = max(2, int(np.ceil(np.log(2 * node_count) / np.log(4))))
+
+    temperature = np.sqrt(node_count) / 2
+    cooling = temperature / (iterations + 1)
+    for _ in range(iterations):
+        force = _repulsion(positions, theta_levels)
+
+        # 인력 (간선은 양방향으로 두 번 들어 있으므로 source 쪽만 당김)
+        delta = positions[targets] - positions[sources]
+        distance = np.sqrt((delta ** 2).sum(axis=1))
+        pull = delta * distance[:, None]
+        force[:, 0] += np.bincount(sources, weights=pull[:, 0], minlength=node_count)
+        force[:, 1] += np.bincount(sources, weights=pull[:, 1], minlength=node_count)
+
+        magnitude = np.sqrt((force ** 2).sum(axis=1))
+        step = np.minimum(magnitude, temperature) / np.maximum(magnitude, 1e-9)
+        positions += force * step[:, None]
+        temperature -= cooling
+
+    return positions
+
+
+# 가장 깊은 격자 한 칸에서 정확히 계산할 최대 노드 수 (초과분은 서로의 근거리 반발력에서 제외)
+NEAR_FIELD_LIMIT = 32
+
+# 부모 칸의 이웃(3×3)을 자식 칸으로 나눈 6×6 블록 내 오프셋
+_BLOCK_X, _BLOCK_Y = np.divmod(np.arange(36), 6)
+
+
+def _repulsion(positions, levels):
+    """
+    Barnes–Hut 반발력
+
+    트리 대신 깊이별 균등 격자(2^L × 2^L, 현재 좌표 범위 기준)를 사용합니다.
+    깊이 L에서 노드가 있는 각 칸은 부모 칸 이웃 영역 안에서 자기와 인접하지 않은 칸(최대 27개)을
+    질량 중심 하나로 보고 반발력을 받고, 인접한 칸과의 상호작용은 다음 깊이로 넘깁니다.
+    칸이 받은 힘은 그 칸의 모든 노드에 더해지며, 가장 깊은 격자에서 같은/인접 칸의 노드끼리는
+    정확히 계산합니다. 멀리 있는 노드 묶음을 한 점으로 근사하는 기준이 칸 크기와 거리의 비로
+    고정된 Barnes–Hut이며, 깊이별로 모든 칸을 한 번에 벡터 연산합니다.
+    """
+    node_count = len(positions)
+    px, py = positions[:, 0], positions[:, 1]
+    fx, fy = np.zeros(node_count), np.zeros(node_count)
+    low_x, low_y = px.min(), py.min()
+    size = max(px.max() - low_x, py.max() - low_y, 1e-9) * (1 + 1e-9)
+    finest_side = 1 << levels
+    finest_x = np.minimum(((px - low_x) / size * finest_side).astype(np.int64), finest_side - 1)
+    finest_y = np.minimum(((py - low_y) / size * finest_side).astype(np.int64), finest_side - 1)
+
+    for level in range(2, levels + 1):
+        side = 1 << level
+        shift = levels - level
+        cell_x, cell_y = finest_x >> shift, finest_y >> shift
+        occupied, inverse = np.unique(cell_x * side + cell_y, return_inverse=True)
+        mass = np.bincount(inverse).astype(float)
+        center_x = np.bincount(inverse, weights=px) / mass
+        center_y = np.bincount(inverse, weights=py) / mass
+
+        mass_grid = np.zeros(side * side)
+        center_x_grid = np.zeros(side * side)
+        center_y_grid = np.zeros(side * side)
+        mass_grid[occupied] = mass
+        center_x_grid[occupied] = center_x
+        center_y_grid[occupied] = center_y
+
+        occupied_x, occupied_y = np.divmod(occupied, side)
+        block_x = (occupied_x // 2 * 2 - 2)[:, None] + _BLOCK_X       # (칸 수, 36)
+        block_y = (occupied_y // 2 * 2 - 2)[:, None] + _BLOCK_Y
+        valid = (block_x >= 0) & (block_x < side) & (block_y >= 0) & (block_y < side)
+        valid &= (np.abs(block_x - occupied_x[:, None]) > 1) | (np.abs(block_y - occupied_y[:, None]) > 1)
+        index = np.where(valid, block_x * side + block_y, 0)
+
+        dx = center_x[:, None] - center_x_grid[index]
+        dy = center_y[:, None] - center_y_grid[index]
+        scale = np.where(valid, mass_grid[index], 0) / np.maximum(dx * dx + dy * dy, 1e-6)
+        fx += (dx * scale).sum(axis=1)[inverse]
+        fy += (dy * scale).sum(axis=1)[inverse]
+
+    # 가장 깊은 격자: 같은/인접 칸의 노드 쌍은 정확히 계산 (쌍마다 한 번, 양쪽에 반대 방향으로)
+    first, second = _near_pairs(finest_x, finest_y, finest_side)
+    dx = px[first] - px[second]
+    dy = py[first] - py[second]
+    scale = 1 / np.maximum(dx * dx + dy * dy, 1e-6)
+    push_x, push_y = dx * scale, dy * scale
+    fx += np.bincount(first, weights=push_x, minlength=node_count) - np.bincount(second, weights=push_x, minlength=node_count)
+    fy += np.bincount(first, weights=push_y, minlength=node_count) - np.bincount(second, weights=push_y, minlength=node_count)
+
+    return np.stack([fx, fy], axis=1)
+
+
+def _near_pairs(cell_x, cell_y, side):
+    """
+    같은 칸 또는 인접한 칸에 있는 노드 쌍 (각 쌍 한 번씩)
+
+    칸마다 노드는 NEAR_FIELD_LIMIT개까지만 사용합니다.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (first, second) 노드 인덱스
+    """
+    flat = cell_x * side + cell_y
+    order = np.argsort(flat, kind='stable')
+    occupied, starts, counts = np.unique(flat[order], return_index=True, return_counts=True)
+    counts = np.minimum(counts, NEAR_FIELD_LIMIT)
+    slot = np.full(side * side, -1, dtype=np.int64)
+    slot[occupied] = np.arange(len(occupied))
+    occupied_x, occupied_y = np.divmod(occupied, side)
+
+    firsts, seconds = [], []
+    # 자기 칸 + 절반의 이웃 방향만 보면 인접한 칸 쌍을 한 번씩 모두 만남
+    for offset_x, offset_y in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+        x, y = occupied_x + offset_x, occupied_y + offset_y
+        inside = (x >= 0) & (x < side) & (y >= 0) & (y < side)
+        a = np.nonzero(inside)[0]
+        b = slot[x[inside] * side + y[inside]]
+        a, b = a[b >= 0], b[b >= 0]
+
+        pair_counts = counts[a] * counts[b]
+        total = int(pair_counts.sum())
+        if total == 0:
+            continue
+        cell_pair = np.repeat(np.arange(len(a)), pair_counts)
+        local = np.arange(total) - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+        width = counts[b][cell_pair]
+        first = order[starts[a][cell_pair] + local // width]
+        second = order[starts[b][cell_pair] + local % width]
+        if offset_x == 0 and offset_y == 0:
+            keep = first < second
+            first, second = first[keep], second[keep]
+        firsts.append(first)
+        seconds.append(second)
+
+    if not firsts:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(firsts), np.concatenate(seconds)
@@ -0,0 +1,74 @@
+"""
+마인드맵 연산 로그 압축 Management Command
+
+마지막 스냅샷 이후 연산이 일정 건수 이상 쌓인 마인드맵의 현재 상태를
+압축 스냅샷(MindmapSnapshot)으로 저장하고, delta 동기화용 최근 연산만 남긴 채
+오래된 연산 로그를 삭제합니다. 스냅샷은 캐시에도 올려 두어 룸 입장 시 바로 사용됩니다.
+
+사용법:
+    python manage.py compact_mindmaps
+    python manage.py compact_mindmaps --min-operations 500  # 500건 이상 쌓인 마인드맵만
+    python manage.py compact_mindmaps --keep 200  # 최근 200건만 남김
+    python manage.py compact_mindmaps --mindmap 12  # 특정 마인드맵만 (건수 조건 무시)
+    python manage.py compact_mindmaps --dry-run  # 대상만 확인
+"""
+from django.core.management.base import BaseCommand
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce
+
+from mindmaps.models import Mindmap
+from mindmaps.services import MindmapService
+
+
+class Command(BaseCommand):
+    help = '마인드맵 연산 로그를 압축 스냅샷으로 접고 오래된 연산을 정리합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--min-operations',
+            type=int,
+            default=100,
+            help='마지막 스냅샷 이후 이 건수 이상 연산이 쌓인 마인드맵만 압축 (기본값: 100)',
+        )
+        parser.add_argument(
+            '--keep',
+            type=int,
+            default=MindmapService.OPERATION_REPLAY_LIMIT,
+            help=f'남길 최근 연산 수 (기본값: {MindmapService.OPERATION_REPLAY_LIMIT})',
+        )
+        parser.add_argument('--mindmap', type=int, default=None, help='압축할 마인드맵 ID')
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='실제로 압축하지 않고 대상만 확인합니다.',
+        )
+
+    def handle(self, *args, **options):
+        mindmaps = Mindmap.objects.annotate(
+            pending_operations=F('last_seq') - Coalesce(F('snapshot__seq'), Value(0))
+        )
+        if options['mindmap'] is not None:
+            mindmaps = mindmaps.filter(pk=options['mindmap'])
+        else:
+            mindmaps = mindmaps.filter(pending_operations__gte=max(options['min_operations'], 1))
+        targets = list(mindmaps.order_by('id').values_list('id', 'pending_operations'))
+
+        if not targets:
+            self.stdout.write(self.style.SUCCESS('압축할 마인드맵이 없습니다.'))
+            return
+
+        if options['dry_run']:
+            for mindmap_id, pending in targets:
+                self.stdout.write(f'  - Mindmap {mindmap_id}: 스냅샷 이후 연산 {pending}건')
+            self.stdout.write(self.style.WARNING(f'\n[DRY-RUN] 압축 대상 {len(targets)}개 (실제로 압축하지 않았습니다.)'))
+            return
+
+        service = MindmapService()
+        for mindmap_id, pending in targets:
+            snapshot = service.compact_operations(mindmap_id, keep=options['keep'])
+            self.stdout.write(
+                f'  - Mindmap {mindmap_id}: seq {snapshot.seq}, 노드 {snapshot.node_count}개, '
+                f'{len(snapshot.data):,} bytes (스냅샷 이후 연산 {pending}건)'
+            )
+
+        self.stdout.write(self.style.SUCCESS(f'\n✅ 마인드맵 {len(targets)}개의 연산 로그를 압축했습니다.'))
@@ -0,0 +1,53 @@
+"""
+마인드맵 내보내기 Management Command
+
+마인드맵의 노드/연결선/댓글을 NDJSON 또는 MessagePack 레코드 스트림으로 저장합니다.
+파일 형식은 API 내보내기(GET .../mindmaps/<pk>/export/)와 같습니다.
+
+사용법:
+    python manage.py export_mindmap 12 --output workshop.ndjson
+    python manage.py export_mindmap 12 --format msgpack --output workshop.msgpack
+    python manage.py export_mindmap 12 > workshop.ndjson  # --output이 없으면 표준 출력
+"""
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from mindmaps.models import Mindmap
+from mindmaps.services import MindmapTransferService
+
+
+class Command(BaseCommand):
+    help = '마인드맵을 NDJSON/MessagePack 파일로 내보냅니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('mindmap_id', type=int, help='내보낼 마인드맵 ID')
+        parser.add_argument(
+            '--format',
+            dest='file_format',
+            choices=sorted(MindmapTransferService.CONTENT_TYPES),
+            default='ndjson',
+            help='파일 형식 (기본값: ndjson)',
+        )
+        parser.add_argument('--output', default=None, help='저장할 파일 경로 (기본값: 표준 출력)')
+
+    def handle(self, *args, **options):
+        if not Mindmap.objects.filter(pk=options['mindmap_id']).exists():
+            raise CommandError(f'마인드맵 {options["mindmap_id"]}을 찾을 수 없습니다.')
+
+        chunks = MindmapTransferService().export_mindmap(options['mindmap_id'], options['file_format'])
+        if options['output'] is None:
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+            return
+
+        size = 0
+        with open(options['output'], 'wb') as output:
+            for chunk in chunks:
+                output.write(chunk)
+                size += len(chunk)
+
+        self.stderr.write(self.style.SUCCESS(
+            f'✅ 마인드맵 {options["mindmap_id"]}을 {options["output"]}에 저장했습니다. ({size:,} bytes)'
+        ))
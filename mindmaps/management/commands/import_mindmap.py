@@ -0,0 +1,58 @@
+"""
+마인드맵 가져오기 Management Command
+
+export_mindmap(또는 API 내보내기)으로 만든 파일로 팀에 새 마인드맵을 만듭니다.
+노드는 1000개씩 bulk_create하고 연결선/댓글의 노드 ID를 새 ID로 바꿔 연결합니다.
+전체가 한 트랜잭션이라 중간에 잘못된 레코드가 있으면 아무것도 만들지 않습니다.
+
+사용법:
+    python manage.py import_mindmap workshop.ndjson --team 3
+    python manage.py import_mindmap workshop.msgpack --team 3 --title "워크숍 결과"
+    python manage.py import_mindmap workshop.data --team 3 --format msgpack  # 확장자로 판단할 수 없는 경우
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.http import Http404
+
+from mindmaps.services import DuplicateTitleError, MindmapTransferService
+
+
+class Command(BaseCommand):
+    help = 'NDJSON/MessagePack 파일로 팀에 새 마인드맵을 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='가져올 파일 경로')
+        parser.add_argument('--team', type=int, required=True, help='마인드맵을 만들 팀 ID')
+        parser.add_argument('--title', default=None, help='마인드맵 제목 (기본값: 파일의 제목)')
+        parser.add_argument(
+            '--format',
+            dest='file_format',
+            choices=sorted(MindmapTransferService.CONTENT_TYPES),
+            default=None,
+            help='파일 형식 (기본값: 확장자로 판단)',
+        )
+
+    def handle(self, *args, **options):
+        file_format = options['file_format']
+        if file_format is None:
+            file_format = 'msgpack' if options['path'].lower().endswith('.msgpack') else 'ndjson'
+
+        try:
+            with open(options['path'], 'rb') as stream:
+                result = MindmapTransferService().import_mindmap(
+                    team_id=options['team'],
+                    stream=stream,
+                    file_format=file_format,
+                    title=options['title']
+                )
+        except OSError as e:
+            raise CommandError(f'파일을 열 수 없습니다: {e}')
+        except Http404:
+            raise CommandError(f'팀 {options["team"]}을 찾을 수 없습니다.')
+        except (DuplicateTitleError, ValueError) as e:
+            raise CommandError(str(e))
+
+        mindmap = result['mindmap']
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ 마인드맵 "{mindmap.title}"(ID {mindmap.id})을 만들었습니다. '
+            f'노드 {result["node_count"]}개, 연결선 {result["connection_count"]}개, 댓글 {result["comment_count"]}개'
+        ))
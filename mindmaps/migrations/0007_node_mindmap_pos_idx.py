@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-20 00:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mindmaps', '0006_alter_comment_user'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='node',
+            index=models.Index(fields=['mindmap', 'posX', 'posY'], name='node_mindmap_pos_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.4 on 2026-10-20 00:54
+
+import datetime
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mindmaps', '0008_mindmap_operation_log'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MindmapSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('seq', models.PositiveBigIntegerField()),
+                ('lamport', models.PositiveBigIntegerField()),
+                ('data', models.BinaryField()),
+                ('node_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(default=datetime.datetime.now)),
+                ('mindmap', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='snapshot', to='mindmaps.mindmap')),
+            ],
+        ),
+    ]
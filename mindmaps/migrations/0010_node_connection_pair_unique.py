@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-20 01:27
+
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+def delete_duplicate_connections(apps, schema_editor):
+    """같은 두 노드 사이 연결선(양방향 포함)은 가장 먼저 만든 것만 남김"""
+    NodeConnection = apps.get_model('mindmaps', 'NodeConnection')
+    seen = set()
+    duplicate_ids = []
+    connections = NodeConnection.objects.order_by('id').values_list('id', 'from_node_id', 'to_node_id')
+    for connection_id, from_node_id, to_node_id in connections.iterator(chunk_size=2000):
+        pair = (min(from_node_id, to_node_id), max(from_node_id, to_node_id))
+        if pair in seen:
+            duplicate_ids.append(connection_id)
+        else:
+            seen.add(pair)
+
+    for start in range(0, len(duplicate_ids), 1000):
+        NodeConnection.objects.filter(id__in=duplicate_ids[start:start + 1000]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mindmaps', '0009_mindmap_snapshot'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_connections, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='nodeconnection',
+            constraint=models.UniqueConstraint(django.db.models.functions.comparison.Least('from_node', 'to_node'), django.db.models.functions.comparison.Greatest('from_node', 'to_node'), name='node_connection_pair_unique'),
+        ),
+    ]
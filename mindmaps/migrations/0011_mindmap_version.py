@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-20 03:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mindmaps', '0010_node_connection_pair_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mindmap',
+            name='version',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from datetime import datetime
 from django.db import models
+from django.db.models.functions import Greatest, Least
 
 # Create your models here.
 
@@ -7,12 +8,32 @@ class Mindmap(models.Model):
     title = models.CharField(max_length=64)
     team = models.ForeignKey('teams.Team',on_delete = models.CASCADE)
 
+    # 실시간 편집 연산 로그 (MindmapOperation) 순번 / Lamport 시계
+    last_seq = models.PositiveBigIntegerField(default=0)
+    lamport_clock = models.PositiveBigIntegerField(default=0)
+    # 노드/연결선/댓글/추천 변경 카운터 (마인드맵 API 조건부 GET의 ETag 기준)
+    # 편집마다 팀 데이터 버전(TeamDataVersion)을 올리면 팀의 다른 API ETag까지 무효화되므로 분리
+    version = models.PositiveBigIntegerField(default=0)
+
     class Meta:
         unique_together = [['team', 'title']]
 
     def __str__(self):
         return self.title
 
+    @classmethod
+    def bump_version(cls, mindmap_id):
+        """마인드맵 내용 버전을 1 올립니다. (행을 잠그고 있지 않은 경로용)"""
+        cls.objects.filter(pk=mindmap_id).update(version=models.F('version') + 1)
+
+    @classmethod
+    def current_version(cls, team_id, mindmap_id=None):
+        """마인드맵 내용 버전 (mindmap_id가 없으면 팀 마인드맵 전체의 합)"""
+        mindmaps = cls.objects.filter(team_id=team_id)
+        if mindmap_id is not None:
+            mindmaps = mindmaps.filter(pk=mindmap_id)
+        return mindmaps.aggregate(total=models.Sum('version'))['total'] or 0
+
 class Node(models.Model):
     posX = models.PositiveIntegerField()
     posY = models.PositiveIntegerField()
@@ -25,6 +46,16 @@ class Node(models.Model):
     recommended_users = models.JSONField(default=list, blank=True)  # [user_id1, user_id2, ...]
     recommendation_count = models.PositiveIntegerField(default=0)  # 캐시용 카운트
 
+    # 필드별 마지막 변경 시각 {'position': [lamport, user_id], 'title': [...], 'content': [...]}
+    # 동시 편집 시 (lamport, user_id)가 큰 쪽이 이기는 LWW 병합에 사용
+    field_clocks = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        indexes = [
+            # 뷰포트(bounding box) 조회용: mindmap 동등 조건 + posX 범위 스캔
+            models.Index(fields=['mindmap', 'posX', 'posY'], name='node_mindmap_pos_idx'),
+        ]
+
     def __str__(self):
         return self.content
     
@@ -48,6 +79,41 @@ class NodeConnection(models.Model):
     to_node = models.ForeignKey('Node', related_name='incoming_connections', on_delete=models.CASCADE)
     mindmap = models.ForeignKey('Mindmap', on_delete=models.CASCADE)
 
+    class Meta:
+        constraints = [
+            # 두 노드 사이 연결선은 방향과 관계없이 하나 (A→B가 있으면 B→A도 중복)
+            models.UniqueConstraint(
+                Least('from_node', 'to_node'), Greatest('from_node', 'to_node'),
+                name='node_connection_pair_unique',
+            ),
+        ]
+
+
+class MindmapOperation(models.Model):
+    """마인드맵 실시간 편집 연산 로그 (재접속 시 since 이후 연산 재전송용, append-only)"""
+    mindmap = models.ForeignKey('Mindmap', on_delete=models.CASCADE, related_name='operations')
+    seq = models.PositiveBigIntegerField()
+    lamport = models.PositiveBigIntegerField()
+    op_type = models.CharField(max_length=32)
+    payload = models.JSONField()  # operations_applied로 브로드캐스트한 이벤트 그대로
+    user = models.ForeignKey('accounts.User', on_delete=models.SET_NULL, null=True, blank=True)
+    created_at = models.DateTimeField(default=datetime.now)
 
+    class Meta:
+        unique_together = [['mindmap', 'seq']]
 
+    def __str__(self):
+        return f'{self.mindmap_id}#{self.seq} {self.op_type}'
 
+
+class MindmapSnapshot(models.Model):
+    """연산 로그를 seq 시점까지 접어 둔 마인드맵 상태 (룸 입장 시 연산 대신 전송)"""
+    mindmap = models.OneToOneField('Mindmap', on_delete=models.CASCADE, related_name='snapshot')
+    seq = models.PositiveBigIntegerField()
+    lamport = models.PositiveBigIntegerField()
+    data = models.BinaryField()  # zlib 압축 JSON {'nodes': [...], 'lines': [...]}
+    node_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(default=datetime.now)
+
+    def __str__(self):
+        return f'{self.mindmap_id}@{self.seq}'
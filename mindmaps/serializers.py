@@ -10,8 +10,8 @@ class MindmapSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Mindmap
-        fields = ['id', 'title', 'team_id', 'team_name']
-        read_only_fields = ['id', 'team_id', 'team_name']
+        fields = ['id', 'title', 'team_id', 'team_name', 'last_seq']
+        read_only_fields = ['id', 'team_id', 'team_name', 'last_seq']
 
 
 class MindmapCreateSerializer(serializers.Serializer):
@@ -30,16 +30,41 @@ class MindmapCreateSerializer(serializers.Serializer):
 
 
 class NodeSerializer(serializers.ModelSerializer):
-    """노드 직렬화"""
+    """노드 직렬화 (comment_count는 comment_count를 annotate한 쿼리셋에서만 포함)"""
     mindmap_id = serializers.IntegerField(source='mindmap.id', read_only=True)
+    comment_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Node
         fields = ['id', 'posX', 'posY', 'title', 'content', 'mindmap_id',
-                  'recommended_users', 'recommendation_count']
+                  'recommended_users', 'recommendation_count', 'comment_count']
         read_only_fields = ['id', 'mindmap_id', 'recommended_users', 'recommendation_count']
 
 
+class NodeSummarySerializer(serializers.ModelSerializer):
+    """뷰포트 조회용 노드 요약 직렬화 (content, recommended_users 제외)"""
+    comment_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Node
+        fields = ['id', 'posX', 'posY', 'title', 'recommendation_count', 'comment_count']
+        read_only_fields = fields
+
+
+class ViewportQuerySerializer(serializers.Serializer):
+    """뷰포트 조회 파라미터 검증"""
+    min_x = serializers.IntegerField(min_value=0, help_text="뷰포트 좌측 X")
+    min_y = serializers.IntegerField(min_value=0, help_text="뷰포트 상단 Y")
+    max_x = serializers.IntegerField(min_value=0, help_text="뷰포트 우측 X")
+    max_y = serializers.IntegerField(min_value=0, help_text="뷰포트 하단 Y")
+
+    def validate(self, data):
+        """경계 순서 검증"""
+        if data['min_x'] > data['max_x'] or data['min_y'] > data['max_y']:
+            raise serializers.ValidationError('뷰포트의 최솟값은 최댓값보다 클 수 없습니다.')
+        return data
+
+
 class NodeCreateSerializer(serializers.Serializer):
     """노드 생성용 직렬화"""
     posX = serializers.IntegerField(min_value=0, help_text="X 좌표")
@@ -81,6 +106,17 @@ class NodeConnectionSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'from_node_id', 'to_node_id', 'from_node_title', 'to_node_title']
 
 
+class NodeEdgeSerializer(serializers.ModelSerializer):
+    """뷰포트 조회용 연결선 직렬화 (노드 제목 제외)"""
+    from_node_id = serializers.IntegerField(read_only=True)
+    to_node_id = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = NodeConnection
+        fields = ['id', 'from_node_id', 'to_node_id']
+        read_only_fields = fields
+
+
 class NodeConnectionCreateSerializer(serializers.Serializer):
     """노드 연결 생성용 직렬화"""
     from_node_id = serializers.IntegerField(help_text="시작 노드 ID")
@@ -93,12 +129,73 @@ class NodeConnectionCreateSerializer(serializers.Serializer):
         return data
 
 
+class NodeConnectionBulkCreateSerializer(serializers.Serializer):
+    """연결선 일괄 생성용 직렬화"""
+    connections = NodeConnectionCreateSerializer(
+        many=True, allow_empty=False, max_length=1000, help_text="연결할 노드 쌍 목록 (최대 1000개)"
+    )
+
+
+class NodeRankingQuerySerializer(serializers.Serializer):
+    """중심성 순위 조회 파라미터 검증"""
+    metric = serializers.ChoiceField(
+        choices=['degree', 'betweenness'], default='degree', help_text="순위 기준 (연결 수 / 매개 중심성)"
+    )
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=10, help_text="반환할 노드 수")
+
+
+class NodeRankingSerializer(serializers.Serializer):
+    """중심성 순위 직렬화"""
+    node_id = serializers.IntegerField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    degree = serializers.IntegerField(read_only=True, help_text="연결된 노드 수")
+    score = serializers.FloatField(read_only=True, help_text="0~1 정규화 중심성")
+
+
+class ShortestPathQuerySerializer(NodeConnectionCreateSerializer):
+    """최단 경로 조회 파라미터 검증 (양 끝 노드)"""
+
+
+class MindmapLayoutSerializer(serializers.Serializer):
+    """자동 배치 요청 검증"""
+    algorithm = serializers.ChoiceField(
+        choices=['force', 'tree', 'radial'], default='force', help_text="배치 방식 (힘 기반 / 트리 / 방사형)"
+    )
+    root_node_id = serializers.IntegerField(
+        required=False, help_text="tree/radial 기준 노드 ID (기본값: 연결이 가장 많은 노드)"
+    )
+
+
+class MindmapExportQuerySerializer(serializers.Serializer):
+    """내보내기 파라미터 검증 (DRF가 format 파라미터를 사용하므로 file_format)"""
+    file_format = serializers.ChoiceField(
+        choices=['ndjson', 'msgpack'], default='ndjson', help_text="파일 형식 (NDJSON / MessagePack)"
+    )
+
+
+class MindmapImportSerializer(serializers.Serializer):
+    """가져오기 요청 검증"""
+    file = serializers.FileField(help_text="export로 받은 .ndjson / .msgpack 파일")
+    file_format = serializers.ChoiceField(
+        choices=['ndjson', 'msgpack'], required=False, help_text="파일 형식 (기본값: 확장자로 판단)"
+    )
+    title = serializers.CharField(
+        max_length=64, required=False, allow_blank=True, help_text="마인드맵 제목 (기본값: 파일의 제목)"
+    )
+
+    def validate(self, data):
+        """형식을 지정하지 않으면 확장자로 판단"""
+        if 'file_format' not in data:
+            data['file_format'] = 'msgpack' if data['file'].name.lower().endswith('.msgpack') else 'ndjson'
+        return data
+
+
 class CommentSerializer(serializers.ModelSerializer):
     """댓글 직렬화"""
     user_id = serializers.IntegerField(source='user.id', read_only=True)
     username = serializers.CharField(source='user.username', read_only=True)
     nickname = serializers.CharField(source='user.nickname', read_only=True)
-    node_id = serializers.IntegerField(source='node.id', read_only=True)
+    node_id = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Comment
@@ -1,17 +1,49 @@
-from django.db import transaction
+import logging
+import math
+import zlib
+from datetime import datetime
+
+import msgpack
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, Max, Q
 from django.shortcuts import get_object_or_404
 from django.core.exceptions import ValidationError
 
-from .models import Mindmap, Node, NodeConnection, Comment
-from teams.models import Team
+from .graph import MindmapGraph
+from .layout import force_layout, radial_layout, tree_layout
+from .models import Mindmap, MindmapOperation, MindmapSnapshot, Node, NodeConnection, Comment
+from common import fastjson
+from common.deletion import raw_delete_in_chunks
+from teams.models import Team, TeamDataVersion
 from accounts.models import User
 
+logger = logging.getLogger(__name__)
+
+
+def _broadcast_to_mindmap(mindmap_id, message):
+    """마인드맵 WebSocket 룸에 그룹 메시지 전송 (REST/관리 명령 등 동기 코드용, 실패해도 저장은 유지)"""
+    try:
+        async_to_sync(get_channel_layer().group_send)(f'mindmap_{mindmap_id}', message)
+    except Exception as e:
+        logger.error(f"Error broadcasting {message.get('type')} to mindmap {mindmap_id}: {e}")
+
 
 class DuplicateTitleError(Exception):
     """제목 중복 시 발생하는 예외"""
     pass
 
 
+class OperationSuperseded(ValueError):
+    """동시 편집에서 더 최신(Lamport 기준) 변경에 밀려 반영되지 않은 연산"""
+
+    def __init__(self, node):
+        super().__init__('더 최신 변경이 있어 반영되지 않았습니다.')
+        self.node = node
+
+
 class MindmapService:
     """
     마인드맵 관련 비즈니스 로직을 처리하는 서비스 클래스
@@ -22,6 +54,33 @@ class MindmapService:
     - JSON 기반 추천 시스템
     - 댓글 관리 시스템
     """
+
+    # 뷰포트 조회 1회당 최대 노드 수 (전체가 보이도록 축소한 경우 대비)
+    VIEWPORT_MAX_NODES = 2000
+
+    # 노드 수가 이 값을 넘으면 상세 페이지가 전체 노드를 심지 않고 뷰포트 단위로 로딩
+    LAZY_LOAD_NODE_THRESHOLD = 300
+
+    # apply_operations가 처리하는 실시간 편집 연산
+    OPERATION_TYPES = (
+        'node_create', 'node_update', 'node_move', 'node_delete',
+        'connection_create', 'connection_delete',
+    )
+
+    # 마인드맵별 연산 로그 보관 건수 / 재접속 시 한 번에 재전송할 최대 연산 수
+    OPERATION_LOG_RETENTION = 1000
+    OPERATION_REPLAY_LIMIT = 500
+
+    # 클라이언트 Lamport 시각이 서버 시각보다 앞설 수 있는 최대 폭
+    # (오프라인 편집분만큼은 앞설 수 있지만, 큰 값 하나로 시계를 필드 한계까지 밀지 못하게 함)
+    LAMPORT_MAX_DRIFT = 10000
+
+    # 연결선 일괄 생성 1회당 최대 연결 수
+    BULK_CONNECT_LIMIT = 1000
+
+    # 압축 스냅샷 캐시 키 / 유지 시간 (초)
+    SNAPSHOT_CACHE_KEY = 'mindmap_snapshot:{mindmap_id}'
+    SNAPSHOT_CACHE_TIMEOUT = 60 * 60 * 24
     
     # ================================
     # 마인드맵 관리 메서드
@@ -56,18 +115,22 @@ class MindmapService:
 
         # 팀 멤버 권한 검증은 뷰에서 Mixin으로 처리되므로 여기서는 생략
 
-        return Mindmap.objects.create(
+        mindmap = Mindmap.objects.create(
             title=title,
             team=team
         )
+        TeamDataVersion.bump(team.id)
+        return mindmap
     
-    def delete_mindmap(self, mindmap_id, user):
+    @transaction.atomic
+    def delete_mindmap(self, mindmap_id, user, progress=None):
         """
         마인드맵을 삭제합니다.
         
         Args:
             mindmap_id (int): 마인드맵 ID
             user (User): 삭제를 요청한 사용자
+            progress (callable | None): 삭제 청크마다 progress(모델 label, 누적 삭제 수) 호출
             
         Returns:
             str: 삭제된 마인드맵 제목
@@ -80,9 +143,46 @@ class MindmapService:
         # 팀장 권한 검증은 뷰에서 Mixin으로 처리되므로 여기서는 생략
         
         mindmap_title = mindmap.title
-        mindmap.delete()
+        self.purge_mindmaps([mindmap.id], progress=progress)
+        TeamDataVersion.bump(mindmap.team_id)
         
         return mindmap_title
+
+    def purge_mindmaps(self, mindmap_ids, progress=None):
+        """
+        마인드맵과 하위 데이터를 의존 순서대로 청크 단위 일괄 삭제합니다.
+
+        Collector 없이 댓글 → 연결선 → 노드 → 연산 로그 → 스냅샷 → 마인드맵 순으로
+        DELETE만 실행하므로 노드 수만 건 규모에서도 메모리에 객체를 올리지 않습니다.
+        호출부의 트랜잭션 안에서 실행해야 합니다.
+
+        Args:
+            mindmap_ids (iterable[int]): 삭제할 마인드맵 ID 목록
+            progress (callable | None): 삭제 청크마다 progress(모델 label, 누적 삭제 수) 호출
+
+        Returns:
+            dict: {모델 label: 삭제된 행 수}
+        """
+        mindmap_ids = list(mindmap_ids)
+        if not mindmap_ids:
+            return {}
+
+        querysets = (
+            Comment.objects.filter(node__mindmap_id__in=mindmap_ids),
+            NodeConnection.objects.filter(mindmap_id__in=mindmap_ids),
+            Node.objects.filter(mindmap_id__in=mindmap_ids),
+            MindmapOperation.objects.filter(mindmap_id__in=mindmap_ids),
+            MindmapSnapshot.objects.filter(mindmap_id__in=mindmap_ids),
+            Mindmap.objects.filter(id__in=mindmap_ids),
+        )
+        deleted = {
+            queryset.model._meta.label: raw_delete_in_chunks(queryset, progress=progress)
+            for queryset in querysets
+        }
+
+        snapshot_keys = [self.SNAPSHOT_CACHE_KEY.format(mindmap_id=mindmap_id) for mindmap_id in mindmap_ids]
+        transaction.on_commit(lambda: cache.delete_many(snapshot_keys))
+        return deleted
     
     def get_mindmap_with_nodes(self, mindmap_id):
         """
@@ -94,14 +194,16 @@ class MindmapService:
         Returns:
             dict: {
                 'mindmap': Mindmap 객체,
-                'nodes': Node 쿼리셋,
+                'nodes': Node 쿼리셋 (comment_count 포함),
                 'lines': NodeConnection 쿼리셋
             }
         """
         mindmap = get_object_or_404(Mindmap, pk=mindmap_id)
         
-        # 최적화된 쿼리: 관련 객체들을 한번에 조회
-        nodes = Node.objects.filter(mindmap=mindmap).select_related('mindmap').order_by('id')
+        # 최적화된 쿼리: 관련 객체들을 한번에 조회 (노드별 댓글 수는 GROUP BY 한 번으로)
+        nodes = Node.objects.filter(mindmap=mindmap).select_related('mindmap').annotate(
+            comment_count=Count('comment')
+        ).order_by('id')
         lines = NodeConnection.objects.filter(mindmap=mindmap).select_related('mindmap').order_by('id')
         
         return {
@@ -110,6 +212,91 @@ class MindmapService:
             'lines': lines
         }
     
+    async def aget_mindmap_with_nodes(self, team_id, mindmap_id):
+        """
+        get_mindmap_with_nodes의 async 버전 (async view용)
+
+        직렬화에 필요한 관계를 미리 로딩한 리스트로 반환합니다.
+
+        Raises:
+            Mindmap.DoesNotExist: 팀에 해당 마인드맵이 없는 경우
+        """
+        mindmap = await Mindmap.objects.select_related('team').aget(pk=mindmap_id, team_id=team_id)
+        nodes = [
+            node async for node in Node.objects.filter(mindmap=mindmap).select_related('mindmap')
+            .annotate(comment_count=Count('comment')).order_by('id')
+        ]
+        lines = [
+            line async for line in NodeConnection.objects.filter(mindmap=mindmap)
+            .select_related('from_node', 'to_node').order_by('id')
+        ]
+
+        return {
+            'mindmap': mindmap,
+            'nodes': nodes,
+            'lines': lines
+        }
+
+    def get_nodes_in_viewport(self, mindmap_id, min_x, min_y, max_x, max_y):
+        """
+        뷰포트(bounding box) 안의 노드와 그 노드에 닿는 연결선을 조회합니다.
+
+        (mindmap, posX, posY) 복합 인덱스로 범위 조회하며, 연결선의 반대편 노드가
+        뷰포트 밖에 있으면 선을 그릴 수 있도록 anchor_nodes로 함께 반환합니다.
+        노드 수가 VIEWPORT_MAX_NODES를 넘으면 잘라내고 truncated=True로 표시합니다.
+
+        Args:
+            mindmap_id (int): 마인드맵 ID
+            min_x, min_y, max_x, max_y (int): 뷰포트 경계 (양 끝 포함)
+
+        Returns:
+            dict: {
+                'nodes': 뷰포트 안의 Node 리스트 (comment_count 포함),
+                'anchor_nodes': 연결선 반대편의 뷰포트 밖 Node 리스트 (comment_count 포함),
+                'lines': NodeConnection 리스트,
+                'truncated': bool
+            }
+        """
+        mindmap = get_object_or_404(Mindmap, pk=mindmap_id)
+
+        nodes = list(
+            Node.objects.filter(
+                mindmap=mindmap,
+                posX__gte=min_x, posX__lte=max_x,
+                posY__gte=min_y, posY__lte=max_y,
+            ).only('id', 'posX', 'posY', 'title', 'recommendation_count')
+            .annotate(comment_count=Count('comment')).order_by('id')[:self.VIEWPORT_MAX_NODES + 1]
+        )
+        truncated = len(nodes) > self.VIEWPORT_MAX_NODES
+        nodes = nodes[:self.VIEWPORT_MAX_NODES]
+
+        node_ids = [node.id for node in nodes]
+        lines = list(
+            NodeConnection.objects.filter(mindmap=mindmap)
+            .filter(Q(from_node_id__in=node_ids) | Q(to_node_id__in=node_ids))
+            .only('id', 'from_node_id', 'to_node_id').order_by('id')
+        )
+
+        visible_ids = set(node_ids)
+        anchor_ids = {
+            node_id
+            for line in lines
+            for node_id in (line.from_node_id, line.to_node_id)
+            if node_id not in visible_ids
+        }
+        anchor_nodes = list(
+            Node.objects.filter(id__in=anchor_ids)
+            .only('id', 'posX', 'posY', 'title', 'recommendation_count')
+            .annotate(comment_count=Count('comment')).order_by('id')
+        ) if anchor_ids else []
+
+        return {
+            'nodes': nodes,
+            'anchor_nodes': anchor_nodes,
+            'lines': lines,
+            'truncated': truncated
+        }
+
     def get_team_mindmaps(self, team_id):
         """
         팀의 모든 마인드맵을 조회합니다.
@@ -165,15 +352,39 @@ class MindmapService:
         except (ValueError, TypeError):
             raise ValueError('위치 정보는 숫자여야 합니다.')
 
-        # 노드 생성
-        node = Node.objects.create(
-            posX=pos_x,
-            posY=pos_y,
-            title=node_data['title'].strip(),
-            content=node_data['content'].strip(),
-            mindmap=mindmap
-        )
+        # 노드 생성 (실시간 편집과 같은 연산 로그/LWW 시각으로 기록)
+        result = self._apply_single_operation(mindmap.id, {
+            'type': 'node_create',
+            'posX': pos_x,
+            'posY': pos_y,
+            'title': node_data['title'].strip(),
+            'content': node_data['content'].strip()
+        }, creator)
+
+        return Node.objects.get(pk=result['node_id'])
+
+    @transaction.atomic
+    def update_node(self, node_id, node_data, user):
+        """
+        노드의 위치/제목/내용을 수정합니다. (REST 부분 수정)
+
+        Args:
+            node_id (int): 노드 ID
+            node_data (dict): posX, posY, title, content 중 바꿀 필드
+            user (User): 수정한 사용자
+
+        Returns:
+            Node: 수정된 노드 객체
 
+        Raises:
+            ValueError: 값이 올바르지 않거나 더 최신 실시간 편집에 밀린 경우 (OperationSuperseded)
+            ValidationError: 노드가 존재하지 않는 경우
+        """
+        node = get_object_or_404(Node, pk=node_id)
+        if node_data:
+            operation = {'type': 'node_update', 'node_id': node.id, **node_data}
+            self._apply_single_operation(node.mindmap_id, operation, user)
+            node.refresh_from_db()
         return node
     
     def delete_node(self, node_id, user):
@@ -193,14 +404,15 @@ class MindmapService:
         node = get_object_or_404(Node, pk=node_id)
         
         node_title = node.title
-        mindmap_id = node.mindmap.id
+        mindmap_id = node.mindmap_id
         
         # 노드 삭제 시 관련 연결도 자동으로 삭제됨 (CASCADE)
-        node.delete()
+        self._apply_single_operation(mindmap_id, {'type': 'node_delete', 'node_id': node.id}, user)
         
         return node_title, mindmap_id
     
-    def create_node_connection(self, from_node_id, to_node_id, mindmap_id):
+    @transaction.atomic
+    def create_node_connection(self, from_node_id, to_node_id, mindmap_id, user=None):
         """
         두 노드 사이의 연결을 생성합니다.
 
@@ -208,12 +420,14 @@ class MindmapService:
             from_node_id (int): 시작 노드 ID
             to_node_id (int): 끝 노드 ID
             mindmap_id (int): 마인드맵 ID
+            user (User): 연결한 사용자
 
         Returns:
             NodeConnection: 생성된 연결 객체
 
         Raises:
-            ValueError: 노드가 다른 마인드맵에 속하거나 자기 자신과 연결하려는 경우
+            ValueError: 노드가 다른 마인드맵에 속하거나 자기 자신과 연결하려는 경우,
+                두 노드가 이미 (어느 방향으로든) 연결되어 있는 경우
             ValidationError: 노드가 존재하지 않는 경우
         """
         from_node = get_object_or_404(Node, pk=from_node_id)
@@ -228,19 +442,88 @@ class MindmapService:
         if from_node_id == to_node_id:
             raise ValueError('노드는 자기 자신과 연결할 수 없습니다.')
 
-        # 중복 연결 검증 (같은 방향만 체크)
-        if NodeConnection.objects.filter(
-            from_node=from_node,
-            to_node=to_node,
-            mindmap=mindmap
-        ).exists():
-            raise ValueError('이미 같은 방향으로 연결되어 있습니다.')
-
-        return NodeConnection.objects.create(
-            from_node=from_node,
-            to_node=to_node,
-            mindmap=mindmap
-        )
+        # 실시간 연산은 같은 연결을 기존 연결선으로 합치므로, 연산과 같은 마인드맵 행 잠금 아래에서
+        # 중복(양방향 포함)을 먼저 확인
+        Mindmap.objects.select_for_update().filter(pk=mindmap.id).exists()
+        if self._connections_between(mindmap.id, {from_node.id, to_node.id}):
+            raise ValueError('이미 연결되어 있는 노드입니다.')
+
+        result = self._apply_single_operation(mindmap.id, {
+            'type': 'connection_create', 'from_node_id': from_node.id, 'to_node_id': to_node.id
+        }, user)
+        return NodeConnection.objects.get(pk=result['connection_id'])
+
+    @transaction.atomic
+    def bulk_create_node_connections(self, mindmap_id, pairs, user=None):
+        """
+        여러 연결선을 한 번에 생성합니다 (이미 있는 연결은 그대로 둠).
+
+        요청 안의 중복/역방향 중복은 먼저 나온 것만 사용하고, 노드 검증 1회 +
+        기존 연결 조회 1회 + INSERT(충돌 무시) + 결과 조회 1회로 처리합니다.
+        새로 만든 연결선은 connection_created 연산으로 연산 로그에 남깁니다.
+
+        Args:
+            mindmap_id (int): 마인드맵 ID
+            pairs (list[tuple[int, int]]): (from_node_id, to_node_id) 목록 (최대 BULK_CONNECT_LIMIT개)
+            user (User): 연결한 사용자
+
+        Returns:
+            dict: {
+                'connections': 요청한 두 노드 쌍의 NodeConnection 리스트 (요청 순서, 기존 연결 포함),
+                'created_count': 새로 만든 연결선 수
+            }
+
+        Raises:
+            ValueError: 자기 자신과 연결, 마인드맵에 없는 노드, 개수 초과
+        """
+        # 연산 로그 순번을 이어 붙이므로 실시간 연산과 같은 마인드맵 행 잠금
+        mindmap = get_object_or_404(Mindmap.objects.select_for_update(), pk=mindmap_id)
+        if len(pairs) > self.BULK_CONNECT_LIMIT:
+            raise ValueError(f'연결선은 한 번에 {self.BULK_CONNECT_LIMIT}개까지 만들 수 있습니다.')
+
+        requested = {}  # (작은 ID, 큰 ID) → (from_node_id, to_node_id)
+        for from_node_id, to_node_id in pairs:
+            from_node_id = self._clean_id(from_node_id, '노드를 찾을 수 없습니다.')
+            to_node_id = self._clean_id(to_node_id, '노드를 찾을 수 없습니다.')
+            if from_node_id == to_node_id:
+                raise ValueError('노드는 자기 자신과 연결할 수 없습니다.')
+            requested.setdefault(self._pair_key(from_node_id, to_node_id), (from_node_id, to_node_id))
+
+        node_ids = {node_id for pair in requested for node_id in pair}
+        if Node.objects.filter(mindmap=mindmap, id__in=node_ids).count() != len(node_ids):
+            raise ValueError('다른 마인드맵의 노드들은 연결할 수 없습니다.')
+
+        existing = self._connections_between(mindmap.id, node_ids)
+        missing = [
+            NodeConnection(mindmap=mindmap, from_node_id=from_node_id, to_node_id=to_node_id)
+            for key, (from_node_id, to_node_id) in requested.items()
+            if key not in existing
+        ]
+        # 동시에 같은 연결이 만들어져도 unique 제약에 걸린 행만 건너뜀 (INSERT IGNORE)
+        NodeConnection.objects.bulk_create(missing, ignore_conflicts=True)
+
+        # 건너뛴 행은 PK도 개수도 돌려받지 못하므로 결과 조회로 실제 생성 수를 셈
+        # (없던 쌍이 요청한 방향 그대로 생겼으면 이번 INSERT로 생긴 것으로 봄)
+        connections = self._connections_between(mindmap.id, node_ids)
+        created = [
+            connections[key] for key, (from_node_id, to_node_id) in requested.items()
+            if key not in existing and key in connections
+            and (connections[key].from_node_id, connections[key].to_node_id) == (from_node_id, to_node_id)
+        ]
+        self._log_events(mindmap, [
+            {
+                'type': 'connection_created',
+                'connection_id': connection.id,
+                'from_node_id': connection.from_node_id,
+                'to_node_id': connection.to_node_id
+            }
+            for connection in created
+        ], user)
+
+        return {
+            'connections': [connections[key] for key in requested if key in connections],
+            'created_count': len(created)
+        }
 
     def delete_node_connection(self, connection_id, user):
         """
@@ -261,10 +544,12 @@ class MindmapService:
         from_title = connection.from_node.title
         to_title = connection.to_node.title
 
-        connection.delete()
+        self._apply_single_operation(
+            connection.mindmap_id, {'type': 'connection_delete', 'connection_id': connection.id}, user
+        )
 
         return from_title, to_title
-    
+
     def toggle_node_recommendation(self, node_id, user_id):
         """
         노드의 추천 상태를 토글합니다 (JSON 기반).
@@ -300,9 +585,478 @@ class MindmapService:
         # 데이터 일관성 보장: 실제 배열 길이와 카운트 동기화
         node.recommendation_count = len(node.recommended_users)
         node.save()
+        Mindmap.bump_version(node.mindmap_id)
         
         return action, node.recommendation_count
     
+    # ================================
+    # 실시간 편집 연산 (WebSocket)
+    # ================================
+
+    @transaction.atomic
+    def apply_operations(self, mindmap_id, operations, user=None):
+        """
+        WebSocket으로 받은 편집 연산 묶음을 한 트랜잭션에서 적용하고 연산 로그에 기록합니다.
+
+        - 연산마다 savepoint를 두어 하나가 실패해도 나머지는 반영됩니다.
+        - 같은 노드의 node_move가 여러 번 있으면 마지막 것만 저장합니다.
+        - 성공한 연산에는 마인드맵별 순번(seq)과 Lamport 시각을 붙여 MindmapOperation에 남깁니다.
+        - 노드의 위치/제목/내용은 필드별 LWW 레지스터입니다. 연산의 (lamport, user_id)가
+          마지막 변경보다 작으면 도착 순서와 관계없이 반영하지 않습니다(superseded).
+          lamport가 없는 연산은 서버 시각을 사용하므로 항상 반영됩니다.
+          서버 시각보다 LAMPORT_MAX_DRIFT 넘게 앞선 lamport는 그 한도로 잘라 사용합니다.
+        - 노드 삭제가 이동/수정보다 우선하며, 같은 방향 연결선 생성은 기존 연결선으로 합쳐집니다.
+
+        권한(팀 멤버 여부)은 호출하는 쪽(WebSocket 연산 배치마다, REST 권한 클래스)에서 확인하므로
+        여기서는 대상이 mindmap_id에 속하는지만 검증합니다.
+
+        Args:
+            mindmap_id (int): 마인드맵 ID
+            operations (list[dict]): {'type': OPERATION_TYPES 중 하나, 'lamport': int(선택), ...연산별 필드}
+            user (User): 연산을 보낸 사용자
+
+        Returns:
+            list[dict]: 적용 순서대로의 결과. 성공 시 브로드캐스트용 이벤트
+                ({'ok': True, 'type': 'node_created', 'seq': ..., 'lamport': ..., 'node_id': ..., ...}),
+                실패 시 {'ok': False, 'type': 연산 타입, 'error': 메시지}.
+                LWW에서 밀린 경우 'superseded': True와 현재 노드 상태('node')를 함께 담습니다.
+                두 경우 모두 연산의 client_op_id를 그대로 담습니다.
+        """
+        mindmap = Mindmap.objects.select_for_update().get(pk=mindmap_id)
+        user_id = user.id if user else None
+        username = user.username if user else None
+
+        last_move_index = {}
+        for index, operation in enumerate(operations):
+            if operation.get('type') == 'node_move':
+                last_move_index[str(operation.get('node_id'))] = index
+
+        results = []
+        log_entries = []
+        for index, operation in enumerate(operations):
+            op_type = operation.get('type')
+            if op_type == 'node_move' and last_move_index[str(operation.get('node_id'))] != index:
+                continue
+
+            client_clock = self._clean_clock(operation.get('lamport'), mindmap.lamport_clock + self.LAMPORT_MAX_DRIFT)
+            mindmap.lamport_clock = max(mindmap.lamport_clock, client_clock or 0) + 1
+            stamp = [client_clock if client_clock is not None else mindmap.lamport_clock, user_id or 0]
+
+            try:
+                if op_type not in self.OPERATION_TYPES:
+                    raise ValueError('지원하지 않는 연산입니다.')
+                with transaction.atomic():
+                    result = getattr(self, f'_apply_{op_type}')(mindmap_id, operation, stamp)
+            except OperationSuperseded as e:
+                result = {'ok': False, 'type': op_type, 'error': str(e), 'superseded': True, 'node': e.node}
+            except ValueError as e:
+                result = {'ok': False, 'type': op_type, 'error': str(e)}
+            else:
+                mindmap.last_seq += 1
+                result.update({
+                    'seq': mindmap.last_seq,
+                    'lamport': mindmap.lamport_clock,
+                    'user_id': user_id,
+                    'username': username,
+                    'client_op_id': operation.get('client_op_id')
+                })
+                log_entries.append(MindmapOperation(
+                    mindmap=mindmap,
+                    seq=mindmap.last_seq,
+                    lamport=mindmap.lamport_clock,
+                    op_type=result['type'],
+                    payload=result,
+                    user=user
+                ))
+                result = dict(result, ok=True)
+
+            result['client_op_id'] = operation.get('client_op_id')
+            results.append(result)
+
+        if log_entries:
+            mindmap.version += 1
+        mindmap.save(update_fields=['last_seq', 'lamport_clock', 'version'])
+        if log_entries:
+            MindmapOperation.objects.bulk_create(log_entries)
+            self._prune_operation_log(mindmap, previous_seq=log_entries[0].seq - 1)
+
+        return results
+
+    def _apply_single_operation(self, mindmap_id, operation, user):
+        """
+        REST/SSR 편집을 실시간 편집과 같은 경로(apply_operations)로 적용합니다.
+        연산 로그/순번/필드별 LWW 시각이 같이 남고, 커밋 후 룸에 operations_applied로 전달됩니다.
+
+        Returns:
+            dict: 적용된 연산 이벤트
+
+        Raises:
+            ValueError: 연산이 거부된 경우 (LWW에서 밀렸으면 OperationSuperseded)
+        """
+        result = self.apply_operations(mindmap_id, [operation], user=user)[0]
+        if not result.pop('ok'):
+            if result.get('superseded'):
+                raise OperationSuperseded(result['node'])
+            raise ValueError(result['error'])
+
+        transaction.on_commit(lambda: _broadcast_to_mindmap(mindmap_id, {
+            'type': 'operations_applied',
+            'operations': [result],
+            'user_id': result['user_id'],
+            'username': result['username']
+        }))
+        return result
+
+    def _log_events(self, mindmap, events, user):
+        """
+        apply_operations를 거치지 않고 한꺼번에 반영한 변경을 연산 로그에 이어 붙입니다.
+        (select_for_update로 잠근 mindmap으로 호출, 커밋 후 룸에 operations_applied로 전달)
+        """
+        if not events:
+            return
+
+        previous_seq = mindmap.last_seq
+        entries = []
+        for event in events:
+            mindmap.lamport_clock += 1
+            mindmap.last_seq += 1
+            event.update({
+                'seq': mindmap.last_seq,
+                'lamport': mindmap.lamport_clock,
+                'user_id': user.id if user else None,
+                'username': user.username if user else None,
+                'client_op_id': None
+            })
+            entries.append(MindmapOperation(
+                mindmap=mindmap, seq=mindmap.last_seq, lamport=mindmap.lamport_clock,
+                op_type=event['type'], payload=event, user=user
+            ))
+
+        mindmap.version += 1
+        mindmap.save(update_fields=['last_seq', 'lamport_clock', 'version'])
+        MindmapOperation.objects.bulk_create(entries)
+        self._prune_operation_log(mindmap, previous_seq=previous_seq)
+
+        transaction.on_commit(lambda: _broadcast_to_mindmap(mindmap.id, {
+            'type': 'operations_applied',
+            'operations': events,
+            'user_id': user.id if user else None,
+            'username': user.username if user else None
+        }))
+
+    def get_operations_since(self, mindmap_id, since):
+        """
+        since 이후의 편집 연산을 순서대로 조회합니다 (재접속 시 재전송용).
+
+        Args:
+            mindmap_id (int): 마인드맵 ID
+            since (int): 클라이언트가 마지막으로 반영한 seq
+
+        Returns:
+            list[dict] | None: operations_applied와 같은 형식의 연산 목록.
+                로그가 정리되어 이어 붙일 수 없거나 OPERATION_REPLAY_LIMIT를 넘으면 None
+                (클라이언트는 전체를 다시 불러와야 함)
+        """
+        last_seq = Mindmap.objects.filter(pk=mindmap_id).values_list('last_seq', flat=True).first()
+        if last_seq is None:
+            return None
+        if since >= last_seq:
+            return []
+        if last_seq - since > self.OPERATION_REPLAY_LIMIT:
+            return None
+
+        operations = list(
+            MindmapOperation.objects.filter(mindmap_id=mindmap_id, seq__gt=since)
+            .order_by('seq').values_list('payload', flat=True)
+        )
+        if not operations or operations[0]['seq'] != since + 1:
+            return None
+        return operations
+
+    def _prune_operation_log(self, mindmap, previous_seq):
+        """OPERATION_LOG_RETENTION보다 오래된 로그 정리 (100건마다 한 번)"""
+        if mindmap.last_seq // 100 == previous_seq // 100:
+            return
+        MindmapOperation.objects.filter(
+            mindmap=mindmap, seq__lte=mindmap.last_seq - self.OPERATION_LOG_RETENTION
+        ).delete()
+
+    def _apply_node_create(self, mindmap_id, operation, stamp):
+        pos_x, pos_y = self._clean_position(operation.get('posX'), operation.get('posY'))
+        title = str(operation.get('title') or '').strip()
+        content = str(operation.get('content') or '').strip()
+        if not title:
+            raise ValueError('노드 제목을 입력해주세요.')
+        if not content:
+            raise ValueError('노드 내용을 입력해주세요.')
+
+        node = Node.objects.create(
+            mindmap_id=mindmap_id, posX=pos_x, posY=pos_y,
+            title=title[:64], content=content,
+            field_clocks={'position': stamp, 'title': stamp, 'content': stamp}
+        )
+        return self._node_event('node_created', node)
+
+    def _apply_node_update(self, mindmap_id, operation, stamp):
+        node = self._get_operation_node(mindmap_id, operation.get('node_id'))
+
+        changes = {}
+        if 'posX' in operation or 'posY' in operation:
+            changes['position'] = self._clean_position(
+                operation.get('posX', node.posX), operation.get('posY', node.posY)
+            )
+        for field in ('title', 'content'):
+            if field in operation:
+                value = str(operation[field] or '').strip()
+                if not value:
+                    raise ValueError(f'{field} 필드는 필수입니다.')
+                changes[field] = value[:64] if field == 'title' else value
+
+        applied = [field for field in changes if self._wins(node, field, stamp)]
+        if not applied:
+            raise OperationSuperseded(self._node_event('node_updated', node))
+
+        for field in applied:
+            if field == 'position':
+                node.posX, node.posY = changes[field]
+            else:
+                setattr(node, field, changes[field])
+            node.field_clocks[field] = stamp
+        node.save(update_fields=['posX', 'posY', 'title', 'content', 'field_clocks'])
+
+        return self._node_event('node_updated', node)
+
+    def _apply_node_move(self, mindmap_id, operation, stamp):
+        pos_x, pos_y = self._clean_position(operation.get('x'), operation.get('y'))
+        node = self._get_operation_node(mindmap_id, operation.get('node_id'))
+        if not self._wins(node, 'position', stamp):
+            raise OperationSuperseded(self._node_event('node_updated', node))
+
+        node.posX, node.posY = pos_x, pos_y
+        node.field_clocks['position'] = stamp
+        node.save(update_fields=['posX', 'posY', 'field_clocks'])
+        return {'type': 'node_moved', 'node_id': node.id, 'x': pos_x, 'y': pos_y}
+
+    def _apply_node_delete(self, mindmap_id, operation, stamp):
+        node = self._get_operation_node(mindmap_id, operation.get('node_id'))
+        node_id = node.id
+        # 연결선은 CASCADE로 함께 삭제됨
+        node.delete()
+        return {'type': 'node_deleted', 'node_id': node_id}
+
+    def _apply_connection_create(self, mindmap_id, operation, stamp):
+        from_node_id = self._clean_id(operation.get('from_node_id'), '노드를 찾을 수 없습니다.')
+        to_node_id = self._clean_id(operation.get('to_node_id'), '노드를 찾을 수 없습니다.')
+        if from_node_id == to_node_id:
+            raise ValueError('노드는 자기 자신과 연결할 수 없습니다.')
+        if Node.objects.filter(mindmap_id=mindmap_id, id__in=[from_node_id, to_node_id]).count() != 2:
+            raise ValueError('다른 마인드맵의 노드들은 연결할 수 없습니다.')
+
+        # 동시에 같은 연결(역방향 포함)을 만들면 먼저 생성된 연결선으로 합침
+        connection, _ = self._insert_connection(mindmap_id, from_node_id, to_node_id)
+        return {
+            'type': 'connection_created',
+            'connection_id': connection.id,
+            'from_node_id': connection.from_node_id,
+            'to_node_id': connection.to_node_id
+        }
+
+    def _apply_connection_delete(self, mindmap_id, operation, stamp):
+        connection_id = self._clean_id(operation.get('connection_id'), '연결선을 찾을 수 없습니다.')
+        deleted, _ = NodeConnection.objects.filter(id=connection_id, mindmap_id=mindmap_id).delete()
+        if not deleted:
+            raise ValueError('연결선을 찾을 수 없습니다.')
+        return {'type': 'connection_deleted', 'connection_id': connection_id}
+
+    def _insert_connection(self, mindmap_id, from_node_id, to_node_id):
+        """
+        연결선 INSERT, unique 제약(node_connection_pair_unique)에 걸리면 기존 연결선 반환
+
+        Returns:
+            tuple[NodeConnection, bool]: (연결선, 새로 만들었는지)
+        """
+        try:
+            with transaction.atomic():
+                connection = NodeConnection.objects.create(
+                    mindmap_id=mindmap_id, from_node_id=from_node_id, to_node_id=to_node_id
+                )
+            return connection, True
+        except IntegrityError:
+            existing = NodeConnection.objects.filter(
+                Q(from_node_id=from_node_id, to_node_id=to_node_id) | Q(from_node_id=to_node_id, to_node_id=from_node_id)
+            ).first()
+            if existing is None:
+                raise  # 연결선 중복이 아닌 제약 위반 (노드가 그 사이 삭제된 경우 등)
+            return existing, False
+
+    def _connections_between(self, mindmap_id, node_ids):
+        """node_ids 사이의 연결선 {(작은 ID, 큰 ID): NodeConnection}"""
+        connections = NodeConnection.objects.filter(
+            mindmap_id=mindmap_id, from_node_id__in=node_ids, to_node_id__in=node_ids
+        )
+        return {self._pair_key(c.from_node_id, c.to_node_id): c for c in connections}
+
+    def _pair_key(self, from_node_id, to_node_id):
+        return (from_node_id, to_node_id) if from_node_id < to_node_id else (to_node_id, from_node_id)
+
+    def _node_event(self, event_type, node):
+        return {
+            'type': event_type,
+            'node_id': node.id,
+            'posX': node.posX,
+            'posY': node.posY,
+            'title': node.title,
+            'content': node.content
+        }
+
+    def _wins(self, node, field, stamp):
+        """LWW 비교: (lamport, user_id)가 마지막 변경보다 크면 반영"""
+        return stamp > (node.field_clocks.get(field) or [0, 0])
+
+    def _get_operation_node(self, mindmap_id, node_id):
+        node_id = self._clean_id(node_id, '노드를 찾을 수 없습니다.')
+        try:
+            return Node.objects.get(id=node_id, mindmap_id=mindmap_id)
+        except Node.DoesNotExist:
+            raise ValueError('노드를 찾을 수 없습니다.')
+
+    def _clean_id(self, value, error_message):
+        if isinstance(value, bool):
+            raise ValueError(error_message)
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            raise ValueError(error_message)
+
+    def _clean_clock(self, value, upper):
+        """클라이언트 Lamport 시각 (없거나 잘못된 값이면 None, upper를 넘으면 upper로 자름)"""
+        if isinstance(value, bool):
+            return None
+        try:
+            clock = int(value)
+        except (ValueError, TypeError, OverflowError):
+            return None
+        return min(clock, upper) if clock >= 0 else None
+
+    def _clean_position(self, x, y):
+        """좌표를 0 이상의 정수로 변환 (드래그 중 소수 좌표는 반올림)"""
+        try:
+            x, y = float(x), float(y)
+            if not (math.isfinite(x) and math.isfinite(y)):
+                raise ValueError
+            pos_x, pos_y = round(x), round(y)
+        except (ValueError, TypeError, OverflowError):
+            raise ValueError('위치 정보는 숫자여야 합니다.')
+        if pos_x < 0 or pos_y < 0:
+            raise ValueError('위치 정보는 0 이상의 숫자여야 합니다.')
+        return pos_x, pos_y
+
+    # ================================
+    # 연산 로그 압축 (스냅샷)
+    # ================================
+
+    def compact_operations(self, mindmap_id, keep=None):
+        """
+        현재 마인드맵 상태를 압축 스냅샷으로 저장하고 최근 keep건을 제외한 연산 로그를 정리합니다.
+
+        마인드맵 행을 잠근 상태에서 만들므로 스냅샷은 seq 시점의 상태와 정확히 일치합니다.
+        남긴 연산은 스냅샷보다 조금 뒤처진 클라이언트의 delta 동기화에 사용됩니다.
+
+        Args:
+            mindmap_id (int): 마인드맵 ID
+            keep (int): 남길 최근 연산 수 (기본값: OPERATION_REPLAY_LIMIT)
+
+        Returns:
+            MindmapSnapshot: 저장된 스냅샷
+        """
+        keep = self.OPERATION_REPLAY_LIMIT if keep is None else keep
+
+        with transaction.atomic():
+            mindmap = Mindmap.objects.select_for_update().get(pk=mindmap_id)
+            nodes = list(
+                Node.objects.filter(mindmap_id=mindmap_id).annotate(comment_count=Count('comment'))
+                .order_by('id').values('id', 'posX', 'posY', 'title', 'content', 'comment_count')
+            )
+            lines = list(
+                NodeConnection.objects.filter(mindmap_id=mindmap_id).order_by('id')
+                .values('id', 'from_node_id', 'to_node_id')
+            )
+            state = fastjson.dumps({'nodes': nodes, 'lines': lines})
+
+            snapshot, _ = MindmapSnapshot.objects.update_or_create(
+                mindmap=mindmap,
+                defaults={
+                    'seq': mindmap.last_seq,
+                    'lamport': mindmap.lamport_clock,
+                    'data': zlib.compress(state),
+                    'node_count': len(nodes),
+                    'created_at': datetime.now()
+                }
+            )
+            MindmapOperation.objects.filter(mindmap=mindmap, seq__lte=mindmap.last_seq - keep).delete()
+
+        self._cache_snapshot(snapshot)
+        return snapshot
+
+    def get_snapshot(self, mindmap_id):
+        """
+        마인드맵의 최신 스냅샷을 조회합니다 (캐시 우선, 없으면 DB 한 행).
+
+        Returns:
+            dict | None: {'seq': int, 'lamport': int, 'node_count': int, 'data': zlib 압축 JSON(bytes)}
+        """
+        key = self.SNAPSHOT_CACHE_KEY.format(mindmap_id=mindmap_id)
+        snapshot = cache.get(key)
+        if snapshot is not None:
+            return snapshot
+
+        snapshot = MindmapSnapshot.objects.filter(mindmap_id=mindmap_id).first()
+        if snapshot is None:
+            return None
+        return self._cache_snapshot(snapshot)
+
+    def get_catch_up(self, mindmap_id, since=None):
+        """
+        클라이언트가 현재 상태를 따라잡는 데 필요한 데이터를 조회합니다.
+
+        since가 있으면 연산 로그로 이어 붙일 수 있을 때 연산만, 로그가 압축되어 끊겼으면
+        스냅샷 + 스냅샷 이후 연산을 반환합니다. since 없이 룸에 들어온 클라이언트에게는
+        바로 스냅샷 + 이후 연산을 반환합니다. (노드 수와 관계없이 압축된 스냅샷 하나로 전송)
+
+        Args:
+            mindmap_id (int): 마인드맵 ID
+            since (int | None): 클라이언트가 마지막으로 반영한 seq (처음 입장이면 None)
+
+        Returns:
+            dict | None: {'snapshot': get_snapshot() 결과 또는 None, 'operations': list[dict]}.
+                어느 쪽으로도 이어 붙일 수 없으면 None (클라이언트는 전체를 다시 불러와야 함)
+        """
+        if since is not None:
+            operations = self.get_operations_since(mindmap_id, since)
+            if operations is not None:
+                return {'snapshot': None, 'operations': operations}
+
+        snapshot = self.get_snapshot(mindmap_id)
+        if snapshot is None:
+            return None
+
+        operations = self.get_operations_since(mindmap_id, snapshot['seq'])
+        if operations is None:
+            return None
+        return {'snapshot': snapshot, 'operations': operations}
+
+    def _cache_snapshot(self, snapshot):
+        cached = {
+            'seq': snapshot.seq,
+            'lamport': snapshot.lamport,
+            'node_count': snapshot.node_count,
+            'data': bytes(snapshot.data)
+        }
+        cache.set(
+            self.SNAPSHOT_CACHE_KEY.format(mindmap_id=snapshot.mindmap_id), cached, self.SNAPSHOT_CACHE_TIMEOUT
+        )
+        return cached
+
     # ================================
     # 댓글 관리 메서드
     # ================================
@@ -327,16 +1081,35 @@ class MindmapService:
             raise ValueError('댓글 내용을 입력해주세요.')
         
         node = get_object_or_404(Node, pk=node_id)
-        
-        return Comment.objects.create(
+
+        comment = Comment.objects.create(
             comment=comment_text.strip(),
             node=node,
             user=user
         )
+        Mindmap.bump_version(node.mindmap_id)
+
+        # 마인드맵을 열어 둔 사용자에게 댓글 수 갱신 전달 (폴링 없이)
+        event = {
+            'type': 'comment_created',
+            'node_id': node.id,
+            'comment_count': Comment.objects.filter(node=node).count(),
+            'comment': {
+                'id': comment.id,
+                'comment': comment.comment,
+                'user_id': user.id if user else None,
+                'username': user.username if user else None,
+                'commented_at': comment.commented_at.isoformat()
+            }
+        }
+        transaction.on_commit(lambda: _broadcast_to_mindmap(node.mindmap_id, event))
+        return comment
     
     def get_node_with_comments(self, node_id):
         """
-        노드와 관련된 모든 댓글을 조회합니다.
+        노드와 관련된 댓글을 조회합니다.
+
+        댓글 쿼리셋은 지연 평가되므로 API는 커서 페이지네이션으로 필요한 만큼만 읽습니다.
         
         Args:
             node_id (int): 노드 ID
@@ -344,15 +1117,559 @@ class MindmapService:
         Returns:
             dict: {
                 'node': Node 객체,
-                'comments': Comment 쿼리셋
+                'comments': Comment 쿼리셋 (최신순)
             }
         """
         node = get_object_or_404(Node, pk=node_id)
         
-        # 최적화된 쿼리: 댓글과 관련 사용자 정보 사전 로딩
-        comments = Comment.objects.filter(node=node).select_related('node', 'user').order_by('-id')
+        # 최적화된 쿼리: 작성자 정보 사전 로딩 (노드는 이미 조회했으므로 JOIN하지 않음)
+        comments = Comment.objects.filter(node=node).select_related('user').order_by('-id')
         
         return {
             'node': node,
             'comments': comments
-        }
\ No newline at end of file
+        }
+
+
+class MindmapGraphService:
+    """
+    마인드맵 연결 구조 분석 서비스 (연결 요소, 중심성 순위, 최단 경로, 고립 노드)
+
+    노드/연결선 구성이 바뀔 때마다 CSR 그래프(MindmapGraph)를 한 번 만들어 캐시하고,
+    이후 요청은 캐시된 그래프로 계산합니다. 구성 버전은 노드/연결선의 (개수, 최대 ID)로
+    판단하므로 REST/WebSocket/관리자 등 어느 경로로 바뀌어도 새 그래프를 만듭니다.
+    """
+
+    GRAPH_CACHE_KEY = 'mindmap_graph:{mindmap_id}:{version}'
+    GRAPH_CACHE_TIMEOUT = 60 * 60
+
+    # 순위 기준: 연결 수(degree) / 매개 중심성(betweenness, 아이디어 사이를 잇는 노드)
+    RANKING_METRICS = ('degree', 'betweenness')
+
+    # 매개 중심성 계산 시 출발 노드 표본 수 (노드가 더 많으면 근사, 2,000노드 기준 약 0.5초)
+    BETWEENNESS_SAMPLE_SIZE = 200
+
+    def get_graph(self, mindmap_id):
+        """
+        마인드맵의 현재 구성에 해당하는 그래프를 조회합니다 (캐시 우선).
+
+        Returns:
+            tuple[str, MindmapGraph]: (구성 버전, 그래프)
+        """
+        version = self._graph_version(mindmap_id)
+        key = self.GRAPH_CACHE_KEY.format(mindmap_id=mindmap_id, version=version)
+        graph = cache.get(key)
+        if graph is None:
+            graph = MindmapGraph(
+                Node.objects.filter(mindmap_id=mindmap_id).order_by('id').values_list('id', flat=True),
+                NodeConnection.objects.filter(mindmap_id=mindmap_id).values_list('from_node_id', 'to_node_id')
+            )
+            cache.set(key, graph, self.GRAPH_CACHE_TIMEOUT)
+        return version, graph
+
+    def get_components(self, mindmap_id):
+        """
+        연결 요소(서로 이어진 아이디어 묶음)를 큰 순서대로 조회합니다.
+
+        Returns:
+            dict: {'node_count', 'edge_count', 'components': [{'size': int, 'node_ids': [...]}, ...]}
+        """
+        _, graph = self.get_graph(mindmap_id)
+        return {
+            'node_count': len(graph),
+            'edge_count': graph.edge_count,
+            'components': [
+                {'size': len(node_ids), 'node_ids': node_ids}
+                for node_ids in graph.components()
+            ]
+        }
+
+    def get_node_ranking(self, mindmap_id, metric='degree', limit=10):
+        """
+        중심성이 높은 노드 순위를 조회합니다.
+
+        Args:
+            mindmap_id (int): 마인드맵 ID
+            metric (str): RANKING_METRICS 중 하나
+            limit (int): 반환할 노드 수
+
+        Returns:
+            list[dict]: [{'node_id', 'title', 'degree', 'score'}, ...] (score 내림차순, 같으면 노드 ID 순)
+
+        Raises:
+            ValueError: 지원하지 않는 metric
+        """
+        if metric not in self.RANKING_METRICS:
+            raise ValueError('지원하지 않는 순위 기준입니다.')
+
+        version, graph = self.get_graph(mindmap_id)
+        if metric == 'degree':
+            scores = graph.degree_centrality()
+        else:
+            # 매개 중심성은 O(노드 수 × 간선 수)라 구성 버전별로 따로 캐시
+            key = self.GRAPH_CACHE_KEY.format(mindmap_id=mindmap_id, version=version) + ':betweenness'
+            scores = cache.get(key)
+            if scores is None:
+                scores = graph.betweenness_centrality(sample_size=self.BETWEENNESS_SAMPLE_SIZE)
+                cache.set(key, scores, self.GRAPH_CACHE_TIMEOUT)
+
+        top = sorted(range(len(graph)), key=lambda i: (-scores[i], graph.node_ids[i]))[:limit]
+        titles = dict(
+            Node.objects.filter(id__in=[graph.node_ids[i] for i in top]).values_list('id', 'title')
+        )
+        return [
+            {
+                'node_id': graph.node_ids[i],
+                'title': titles.get(graph.node_ids[i], ''),
+                'degree': graph.degree(i),
+                'score': round(scores[i], 4)
+            }
+            for i in top
+        ]
+
+    def get_shortest_path(self, mindmap_id, from_node_id, to_node_id):
+        """
+        두 노드를 잇는 최단 경로를 조회합니다 (연결선 방향 무시).
+
+        Returns:
+            list[Node] | None: 양 끝을 포함한 경로의 노드 목록. 연결되어 있지 않으면 None
+
+        Raises:
+            ValueError: 노드가 마인드맵에 없는 경우
+        """
+        _, graph = self.get_graph(mindmap_id)
+        if graph.index_of(from_node_id) is None or graph.index_of(to_node_id) is None:
+            raise ValueError('노드를 찾을 수 없습니다.')
+
+        path = graph.shortest_path(from_node_id, to_node_id)
+        if path is None:
+            return None
+        nodes = Node.objects.in_bulk(path)
+        return [nodes[node_id] for node_id in path]
+
+    def get_orphan_nodes(self, mindmap_id):
+        """
+        연결선이 하나도 없는 노드를 조회합니다.
+
+        Returns:
+            QuerySet[Node]: ID 순
+        """
+        _, graph = self.get_graph(mindmap_id)
+        return Node.objects.filter(id__in=graph.orphans()).order_by('id')
+
+    def _graph_version(self, mindmap_id):
+        nodes = Node.objects.filter(mindmap_id=mindmap_id).aggregate(count=Count('id'), last=Max('id'))
+        lines = NodeConnection.objects.filter(mindmap_id=mindmap_id).aggregate(count=Count('id'), last=Max('id'))
+        return f"{nodes['count']}.{nodes['last'] or 0}.{lines['count']}.{lines['last'] or 0}"
+
+
+class MindmapLayoutService:
+    """
+    마인드맵 자동 배치 서비스
+
+    MindmapGraphService가 캐시한 CSR 그래프로 새 좌표를 계산(mindmaps.layout)해
+    배치마다 UPDATE 한 문장으로 저장하고, 연산 로그에 layout_applied 하나로 기록한 뒤
+    WebSocket 룸에 operations_applied 메시지 하나로 전달합니다.
+    """
+
+    LAYOUTS = {
+        'force': force_layout,
+        'tree': tree_layout,
+        'radial': radial_layout,
+    }
+
+    # 배치 계산 단위(노드 간 기준 간격 1)의 픽셀 크기
+    NODE_SPACING = 180
+
+    # 편집기 가상 캔버스 크기 (static/js/pages/mindmap_detail.js VIRTUAL_CANVAS)와 여백.
+    # 배치 결과가 캔버스보다 크면 비율을 유지한 채 축소합니다.
+    CANVAS_WIDTH = 5400
+    CANVAS_HEIGHT = 3600
+    CANVAS_MARGIN = 100
+
+    # UPDATE 한 문장에 담을 노드 수 (CASE WHEN 문장이 너무 길어지지 않도록)
+    UPDATE_BATCH_SIZE = 500
+
+    @transaction.atomic
+    def apply_layout(self, mindmap_id, algorithm='force', root_node_id=None, user=None):
+        """
+        마인드맵 전체 노드를 자동 배치하고 저장합니다.
+
+        배치된 위치는 연산 한 건(seq 하나)으로 기록되며, 모든 노드의 위치 LWW 시각을
+        이 연산의 Lamport 시각으로 갱신합니다. 배치 계산 중 추가된 노드는 그대로 둡니다.
+
+        Args:
+            mindmap_id (int): 마인드맵 ID
+            algorithm (str): LAYOUTS 중 하나
+            root_node_id (int): tree/radial의 루트 노드 (기본값: 연결이 가장 많은 노드)
+            user (User): 배치를 요청한 사용자
+
+        Returns:
+            dict: operations_applied와 같은 형식의 연산
+                ({'type': 'layout_applied', 'algorithm', 'positions': [[node_id, x, y], ...], 'seq', ...})
+
+        Raises:
+            ValueError: 지원하지 않는 배치 방식, 마인드맵에 없는 루트 노드
+        """
+        if algorithm not in self.LAYOUTS:
+            raise ValueError('지원하지 않는 배치 방식입니다.')
+
+        mindmap = Mindmap.objects.select_for_update().get(pk=mindmap_id)
+        _, graph = MindmapGraphService().get_graph(mindmap_id)
+        root_index = None
+        if root_node_id is not None:
+            root_index = graph.index_of(root_node_id)
+            if root_index is None:
+                raise ValueError('노드를 찾을 수 없습니다.')
+
+        positions = self._to_canvas(self.LAYOUTS[algorithm](graph, root_index))
+
+        mindmap.lamport_clock += 1
+        mindmap.last_seq += 1
+        stamp = [mindmap.lamport_clock, user.id if user else 0]
+
+        moved = []
+        for node in Node.objects.filter(mindmap_id=mindmap_id).only('id', 'posX', 'posY', 'field_clocks'):
+            i = graph.index_of(node.id)
+            if i is None:
+                continue
+            node.posX, node.posY = positions[i]
+            node.field_clocks['position'] = stamp
+            moved.append(node)
+        self._save_positions(moved)
+
+        operation = {
+            'type': 'layout_applied',
+            'algorithm': algorithm,
+            'positions': [[node.id, node.posX, node.posY] for node in moved],
+            'seq': mindmap.last_seq,
+            'lamport': mindmap.lamport_clock,
+            'user_id': user.id if user else None,
+            'username': user.username if user else None,
+            'client_op_id': None
+        }
+        mindmap.version += 1
+        mindmap.save(update_fields=['last_seq', 'lamport_clock', 'version'])
+        MindmapOperation.objects.create(
+            mindmap=mindmap,
+            seq=mindmap.last_seq,
+            lamport=mindmap.lamport_clock,
+            op_type=operation['type'],
+            payload=operation,
+            user=user
+        )
+        MindmapService()._prune_operation_log(mindmap, previous_seq=mindmap.last_seq - 1)
+
+        transaction.on_commit(lambda: _broadcast_to_mindmap(mindmap_id, {
+            'type': 'operations_applied',
+            'operations': [operation],
+            'user_id': operation['user_id'],
+            'username': operation['username'],
+            'sender_channel': None
+        }))
+        return operation
+
+    def _to_canvas(self, positions):
+        """배치 단위 좌표 → 캔버스 픽셀 좌표 (좌상단 여백 정렬, 캔버스보다 크면 축소)"""
+        if len(positions) == 0:
+            return []
+        pixels = (positions - positions.min(axis=0)) * self.NODE_SPACING
+        extent = pixels.max(axis=0)
+        available = (
+            self.CANVAS_WIDTH - 2 * self.CANVAS_MARGIN,
+            self.CANVAS_HEIGHT - 2 * self.CANVAS_MARGIN
+        )
+        scale = min(1.0, *(room / size for room, size in zip(available, extent) if size > 0))
+        pixels = (pixels * scale + self.CANVAS_MARGIN).round().astype(int)
+        return pixels.tolist()
+
+    def _save_positions(self, nodes):
+        """
+        posX/posY/field_clocks를 UPDATE_BATCH_SIZE개씩 UPDATE ... CASE 한 문장으로 저장
+
+        bulk_update와 같은 SQL이지만 노드 × 필드마다 When 표현식을 만드는 ORM 비용이
+        노드 수천 개에서 배치 계산보다 몇 배 커서 직접 만듭니다.
+        """
+        quote = connection.ops.quote_name
+        pk_column = quote(Node._meta.pk.column)
+        fields = [Node._meta.get_field(name) for name in ('posX', 'posY', 'field_clocks')]
+
+        with connection.cursor() as cursor:
+            for start in range(0, len(nodes), self.UPDATE_BATCH_SIZE):
+                batch = nodes[start:start + self.UPDATE_BATCH_SIZE]
+                cases = ' '.join(['WHEN %s THEN %s'] * len(batch))
+                assignments, params = [], []
+                for field in fields:
+                    assignments.append(f'{quote(field.column)} = CASE {pk_column} {cases} END')
+                    for node in batch:
+                        params += [node.id, field.get_db_prep_save(getattr(node, field.attname), connection)]
+                params += [node.id for node in batch]
+
+                cursor.execute(
+                    f'UPDATE {quote(Node._meta.db_table)} SET {", ".join(assignments)} '
+                    f'WHERE {pk_column} IN ({", ".join(["%s"] * len(batch))})',
+                    params
+                )
+
+
+class MindmapTransferService:
+    """
+    마인드맵 가져오기/내보내기 서비스
+
+    마인드맵 하나를 레코드 스트림(NDJSON 한 줄 또는 MessagePack 객체 하나가 레코드 하나)으로
+    주고받습니다. 레코드 순서는 mindmap 헤더 → node → edge → comment이며,
+    가져올 때 노드는 IMPORT_CHUNK_SIZE개씩 bulk_create하고 파일의 노드 ID를 새 ID로 바꿔
+    연결선/댓글을 연결합니다. 같은 두 노드 사이의 연결선이 여러 번 나오면 하나만 저장합니다.
+
+    레코드 형식 (FORMAT_VERSION 1):
+        {'type': 'mindmap', 'version': 1, 'title': str}
+        {'type': 'node', 'id': int, 'posX': int, 'posY': int, 'title': str, 'content': str}
+        {'type': 'edge', 'from_node_id': int, 'to_node_id': int}
+        {'type': 'comment', 'node_id': int, 'comment': str, 'username': str | None, 'commented_at': ISO 8601}
+    """
+
+    FORMAT_VERSION = 1
+
+    CONTENT_TYPES = {
+        'ndjson': 'application/x-ndjson',
+        'msgpack': 'application/x-msgpack',
+    }
+
+    # 내보내기: 레코드 묶음(응답 청크) 크기 / 가져오기: bulk_create 단위
+    EXPORT_CHUNK_SIZE = 1000
+    IMPORT_CHUNK_SIZE = 1000
+
+    def __init__(self):
+        self.mindmap_service = MindmapService()
+
+    def export_mindmap(self, mindmap_id, file_format='ndjson'):
+        """
+        마인드맵을 레코드 스트림으로 내보냅니다.
+
+        전체를 메모리에 올리지 않도록 노드/연결선/댓글을 iterator()로 읽으며
+        EXPORT_CHUNK_SIZE개 레코드마다 bytes 하나를 만듭니다.
+
+        Args:
+            mindmap_id (int): 마인드맵 ID
+            file_format (str): CONTENT_TYPES 중 하나
+
+        Returns:
+            Iterator[bytes]: StreamingHttpResponse나 파일에 그대로 쓸 수 있는 청크
+
+        Raises:
+            ValueError: 지원하지 않는 형식
+            Http404: 마인드맵이 존재하지 않는 경우
+        """
+        encode = self._encoder(file_format)
+        mindmap = get_object_or_404(Mindmap, pk=mindmap_id)
+
+        def chunks():
+            buffer = []
+            for record in self._export_records(mindmap):
+                buffer.append(encode(record))
+                if len(buffer) >= self.EXPORT_CHUNK_SIZE:
+                    yield b''.join(buffer)
+                    buffer = []
+            if buffer:
+                yield b''.join(buffer)
+
+        return chunks()
+
+    @transaction.atomic
+    def import_mindmap(self, team_id, stream, file_format='ndjson', title=None, creator=None):
+        """
+        레코드 스트림으로 새 마인드맵을 만듭니다 (전체가 한 트랜잭션).
+
+        Args:
+            team_id (int): 마인드맵을 만들 팀 ID
+            stream: 바이너리 파일 객체 (업로드 파일, open(path, 'rb') 등)
+            file_format (str): CONTENT_TYPES 중 하나
+            title (str): 마인드맵 제목 (기본값: 헤더의 title)
+            creator (User): 가져오기를 요청한 사용자
+
+        Returns:
+            dict: {'mindmap': Mindmap, 'node_count': int, 'connection_count': int, 'comment_count': int}
+
+        Raises:
+            ValueError: 형식이 잘못되었거나 연결선/댓글이 파일에 없는 노드를 가리키는 경우
+            DuplicateTitleError: 같은 팀에 동일한 제목이 이미 존재하는 경우
+        """
+        records = self._decoder(file_format)(stream)
+        header = next(records, None)
+        if not isinstance(header, dict) or header.get('type') != 'mindmap':
+            raise ValueError('파일 첫 레코드는 mindmap이어야 합니다.')
+        if header.get('version') != self.FORMAT_VERSION:
+            raise ValueError('지원하지 않는 파일 버전입니다.')
+        title = str(title or header.get('title') or '')
+        if len(title.strip()) > Mindmap._meta.get_field('title').max_length:
+            raise ValueError('마인드맵 제목이 너무 깁니다.')
+        mindmap = self.mindmap_service.create_mindmap(team_id, title, creator)
+
+        node_ids = {}  # 파일의 노드 ID → 새 노드 ID
+        pending = {'node': [], 'edge': [], 'comment': []}
+        counts = {'node': 0, 'edge': 0, 'comment': 0}
+        flush = {
+            'node': lambda items: self._create_nodes(mindmap, items, node_ids),
+            'edge': lambda items: NodeConnection.objects.bulk_create(items, ignore_conflicts=True),
+            'comment': lambda items: self._create_comments(mindmap, items),
+        }
+
+        for index, record in enumerate(records, start=2):
+            kind = record.get('type') if isinstance(record, dict) else None
+            if kind not in pending:
+                raise ValueError(f'{index}번째 레코드: 알 수 없는 레코드입니다.')
+            # 연결선/댓글은 앞서 나온 노드의 새 ID가 필요하므로 대기 중인 노드부터 저장
+            if kind != 'node' and pending['node']:
+                flush['node'](pending['node'])
+                pending['node'] = []
+            try:
+                pending[kind].append(getattr(self, f'_clean_{kind}')(mindmap, record, node_ids))
+            except ValueError as e:
+                raise ValueError(f'{index}번째 레코드: {e}')
+            counts[kind] += 1
+            if len(pending[kind]) >= self.IMPORT_CHUNK_SIZE:
+                flush[kind](pending[kind])
+                pending[kind] = []
+
+        for kind, items in pending.items():
+            if items:
+                flush[kind](items)
+        TeamDataVersion.bump(mindmap.team_id)
+
+        return {
+            'mindmap': mindmap,
+            'node_count': counts['node'],
+            # 중복/역방향 중복 연결선은 INSERT IGNORE로 건너뛰므로 실제로 들어간 행 수
+            'connection_count': NodeConnection.objects.filter(mindmap=mindmap).count(),
+            'comment_count': counts['comment']
+        }
+
+    def _export_records(self, mindmap):
+        yield {'type': 'mindmap', 'version': self.FORMAT_VERSION, 'title': mindmap.title}
+
+        nodes = Node.objects.filter(mindmap=mindmap).order_by('id').values_list(
+            'id', 'posX', 'posY', 'title', 'content'
+        )
+        for node_id, pos_x, pos_y, title, content in nodes.iterator(chunk_size=self.EXPORT_CHUNK_SIZE):
+            yield {'type': 'node', 'id': node_id, 'posX': pos_x, 'posY': pos_y, 'title': title, 'content': content}
+
+        edges = NodeConnection.objects.filter(mindmap=mindmap).order_by('id').values_list('from_node_id', 'to_node_id')
+        for from_node_id, to_node_id in edges.iterator(chunk_size=self.EXPORT_CHUNK_SIZE):
+            yield {'type': 'edge', 'from_node_id': from_node_id, 'to_node_id': to_node_id}
+
+        comments = Comment.objects.filter(node__mindmap=mindmap).order_by('id').values_list(
+            'node_id', 'comment', 'user__username', 'commented_at'
+        )
+        for node_id, comment, username, commented_at in comments.iterator(chunk_size=self.EXPORT_CHUNK_SIZE):
+            yield {
+                'type': 'comment',
+                'node_id': node_id,
+                'comment': comment,
+                'username': username,
+                'commented_at': commented_at.isoformat() if commented_at else None
+            }
+
+    def _encoder(self, file_format):
+        if file_format == 'ndjson':
+            return lambda record: fastjson.dumps(record) + b'\n'
+        if file_format == 'msgpack':
+            return msgpack.Packer(use_bin_type=True).pack
+        raise ValueError('지원하지 않는 파일 형식입니다.')
+
+    def _decoder(self, file_format):
+        if file_format == 'ndjson':
+            return self._read_ndjson
+        if file_format == 'msgpack':
+            return self._read_msgpack
+        raise ValueError('지원하지 않는 파일 형식입니다.')
+
+    def _read_ndjson(self, stream):
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield fastjson.loads(line)
+            except ValueError:
+                raise ValueError(f'{line_number}번째 줄을 읽을 수 없습니다.')
+
+    def _read_msgpack(self, stream):
+        try:
+            yield from msgpack.Unpacker(stream, raw=False)
+        except (msgpack.UnpackException, ValueError):
+            raise ValueError('MessagePack 데이터를 읽을 수 없습니다.')
+
+    def _clean_node(self, mindmap, record, node_ids):
+        source_id = self.mindmap_service._clean_id(record.get('id'), '노드 ID가 올바르지 않습니다.')
+        if source_id in node_ids:
+            raise ValueError('노드 ID가 중복되었습니다.')
+        node_ids[source_id] = None  # _create_nodes에서 새 ID로 채움
+
+        title = str(record.get('title') or '').strip()
+        if not title:
+            raise ValueError('노드 제목을 입력해주세요.')
+        if len(title) > Node._meta.get_field('title').max_length:
+            raise ValueError('노드 제목이 너무 깁니다.')
+        pos_x, pos_y = self.mindmap_service._clean_position(record.get('posX'), record.get('posY'))
+        return source_id, Node(
+            mindmap=mindmap,
+            posX=pos_x,
+            posY=pos_y,
+            title=title,
+            content=str(record.get('content') or '').strip()
+        )
+
+    def _clean_edge(self, mindmap, record, node_ids):
+        from_node_id = self._mapped_node_id(record.get('from_node_id'), node_ids)
+        to_node_id = self._mapped_node_id(record.get('to_node_id'), node_ids)
+        if from_node_id == to_node_id:
+            raise ValueError('노드는 자기 자신과 연결할 수 없습니다.')
+        return NodeConnection(mindmap=mindmap, from_node_id=from_node_id, to_node_id=to_node_id)
+
+    def _clean_comment(self, mindmap, record, node_ids):
+        comment = str(record.get('comment') or '').strip()
+        if not comment:
+            raise ValueError('댓글 내용을 입력해주세요.')
+        try:
+            commented_at = datetime.fromisoformat(record['commented_at']) if record.get('commented_at') else datetime.now()
+        except (TypeError, ValueError):
+            raise ValueError('댓글 작성 시각이 올바르지 않습니다.')
+        return record.get('username'), Comment(
+            node_id=self._mapped_node_id(record.get('node_id'), node_ids),
+            comment=comment,
+            commented_at=commented_at
+        )
+
+    def _mapped_node_id(self, value, node_ids):
+        node_id = node_ids.get(self.mindmap_service._clean_id(value, '노드 ID가 올바르지 않습니다.'))
+        if node_id is None:
+            raise ValueError('파일에 없는 노드를 가리킵니다.')
+        return node_id
+
+    def _create_nodes(self, mindmap, items, node_ids):
+        nodes = [node for _, node in items]
+        Node.objects.bulk_create(nodes)
+        new_ids = [node.pk for node in nodes]
+        if new_ids[0] is None:
+            # bulk_create가 PK를 돌려주지 않는 DB(MySQL): 새로 만든 마인드맵이라 가장 최근 ID들이 이번 묶음
+            new_ids = sorted(
+                Node.objects.filter(mindmap=mindmap).order_by('-id').values_list('id', flat=True)[:len(nodes)]
+            )
+        for (source_id, _), node_id in zip(items, new_ids):
+            node_ids[source_id] = node_id
+
+    def _create_comments(self, mindmap, items):
+        """
+        작성자는 가져오는 팀의 멤버 중 같은 아이디의 사용자로 연결
+        (팀 밖 사용자나 없는 아이디는 탈퇴 사용자처럼 NULL - 파일로 다른 사람 명의의 댓글을 만들 수 없음)
+        """
+        usernames = {username for username, _ in items if username}
+        users = dict(
+            User.objects.filter(username__in=usernames, teamuser__team_id=mindmap.team_id)
+            .values_list('username', 'id')
+        )
+        comments = []
+        for username, comment in items:
+            comment.user_id = users.get(username)
+            comments.append(comment)
+        Comment.objects.bulk_create(comments)
+
@@ -0,0 +1,55 @@
+"""
+compact_mindmaps Management Command 테스트
+
+테스트 구성:
+- TestCompactMindmapsCommand: 건수 기준 대상 선정, 스냅샷 저장/로그 정리, --dry-run
+"""
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from mindmaps.models import MindmapOperation, MindmapSnapshot
+from mindmaps.services import MindmapService
+from .conftest import create_mindmap
+
+
+@pytest.mark.integration
+class TestCompactMindmapsCommand:
+    """compact_mindmaps 커맨드 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+
+    def _move(self, node, count):
+        for x in range(count):
+            MindmapService().apply_operations(node.mindmap_id, [
+                {'type': 'node_move', 'node_id': node.id, 'x': x, 'y': 0},
+            ])
+
+    def test_compacts_mindmaps_over_threshold(self, sample_node, host_teamuser):
+        """연산이 min-operations 이상 쌓인 마인드맵만 압축하고 최근 keep건만 남긴다"""
+        quiet_mindmap = create_mindmap(host_teamuser.team, title='조용한 마인드맵')
+        self._move(sample_node, 5)
+
+        call_command('compact_mindmaps', min_operations=3, keep=2)
+
+        snapshot = MindmapSnapshot.objects.get(mindmap_id=sample_node.mindmap_id)
+        assert (snapshot.seq, snapshot.node_count) == (5, 1)
+        assert list(MindmapOperation.objects.values_list('seq', flat=True).order_by('seq')) == [4, 5]
+        assert not MindmapSnapshot.objects.filter(mindmap=quiet_mindmap).exists()
+        assert MindmapService().get_snapshot(sample_node.mindmap_id)['seq'] == 5
+
+        # 스냅샷 이후 새 연산이 기준에 못 미치면 다시 압축하지 않음
+        self._move(sample_node, 2)
+        call_command('compact_mindmaps', min_operations=3, keep=2)
+        assert MindmapSnapshot.objects.get(mindmap_id=sample_node.mindmap_id).seq == 5
+
+    def test_dry_run_keeps_log(self, sample_node):
+        """--dry-run은 스냅샷을 만들거나 로그를 지우지 않는다"""
+        self._move(sample_node, 3)
+
+        call_command('compact_mindmaps', min_operations=1, keep=0, dry_run=True)
+
+        assert not MindmapSnapshot.objects.exists()
+        assert MindmapOperation.objects.count() == 3
@@ -1,24 +1,33 @@
 """
 MindmapService 비즈니스 로직 테스트
-총 16개 테스트: Mindmap CRUD, Node CRUD, Connection CRUD, 댓글, 권한
+총 37개 테스트: Mindmap CRUD, Node CRUD, Connection CRUD, 실시간 편집 연산, 자동 배치, 가져오기/내보내기, 댓글, 권한
 
 개선 사항:
 - DB 상태 기반 검증 (서비스 리턴값 의존도 감소)
 - 구체적 예외 타입 검증 (Exception → ValueError/DuplicateTitleError)
 - 부정 시나리오 추가 (다른 팀 사용자, 권한 없는 접근)
 """
+import io
+import json
+import zlib
+
+import msgpack
 import pytest
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from django.contrib.auth import get_user_model
-from mindmaps.models import Mindmap, Node, NodeConnection, Comment
-from mindmaps.services import MindmapService, DuplicateTitleError
+from mindmaps.models import Mindmap, MindmapOperation, Node, NodeConnection, Comment
+from mindmaps.services import MindmapService, MindmapLayoutService, MindmapTransferService, DuplicateTitleError
 from .conftest import create_mindmap, create_node, create_connection, create_comment
 
 User = get_user_model()
 
 
 class TestMindmapCRUD:
-    """마인드맵 CRUD 테스트 (4개)"""
+    """마인드맵 CRUD 테스트 (6개)"""
 
     def test_create_mindmap_success(self, mindmap_service, host_teamuser, db):
         """마인드맵 생성 성공"""
@@ -67,13 +76,14 @@ class TestMindmapCRUD:
         assert list(result['nodes'].values_list('title', flat=True)) == ['노드1', '노드2']
 
     def test_delete_mindmap_cascade_deletes_nodes_and_connections(self, mindmap_service, sample_mindmap, host_teamuser, db):
-        """마인드맵 삭제 시 노드/연결선 cascade 삭제 (DB 상태 검증)"""
+        """마인드맵 삭제 시 노드/연결선/댓글 일괄 삭제 (DB 상태 검증)"""
         # 노드 2개 생성
         node1 = create_node(sample_mindmap, title='노드1')
         node2 = create_node(sample_mindmap, title='노드2')
 
-        # 연결선 생성
+        # 연결선, 댓글 생성
         create_connection(node1, node2)
+        create_comment(node1, host_teamuser.user)
 
         mindmap_id = sample_mindmap.id
         node1_id = node1.id
@@ -87,6 +97,35 @@ class TestMindmapCRUD:
         assert not Node.objects.filter(id=node1_id).exists()
         assert not Node.objects.filter(id=node2_id).exists()
         assert not NodeConnection.objects.filter(mindmap_id=mindmap_id).exists()
+        assert not Comment.objects.filter(node_id=node1_id).exists()
+
+    def test_get_nodes_in_viewport_returns_edges_and_anchors(self, mindmap_service, sample_mindmap, db):
+        """뷰포트 조회: 범위 안 노드 + 닿는 연결선 + 범위 밖 반대편 노드(anchor)"""
+        inside1 = create_node(sample_mindmap, title='안1', x=100, y=100)
+        inside2 = create_node(sample_mindmap, title='안2', x=500, y=400)
+        outside = create_node(sample_mindmap, title='밖', x=3000, y=3000)
+        far = create_node(sample_mindmap, title='먼곳', x=4000, y=100)
+        inner_line = create_connection(inside1, inside2)
+        cross_line = create_connection(outside, inside2)
+        create_connection(outside, far)  # 뷰포트와 무관한 연결선
+
+        result = mindmap_service.get_nodes_in_viewport(sample_mindmap.id, 0, 0, 1000, 1000)
+
+        assert [node.id for node in result['nodes']] == [inside1.id, inside2.id]
+        assert [node.id for node in result['anchor_nodes']] == [outside.id]
+        assert [line.id for line in result['lines']] == [inner_line.id, cross_line.id]
+        assert result['truncated'] is False
+
+    def test_get_nodes_in_viewport_truncates(self, mindmap_service, sample_mindmap, db, monkeypatch):
+        """최대 노드 수 초과 시 잘라내고 truncated 표시"""
+        monkeypatch.setattr(MindmapService, 'VIEWPORT_MAX_NODES', 2)
+        for i in range(3):
+            create_node(sample_mindmap, title=f'노드{i}', x=100 + i, y=100)
+
+        result = mindmap_service.get_nodes_in_viewport(sample_mindmap.id, 0, 0, 1000, 1000)
+
+        assert len(result['nodes']) == 2
+        assert result['truncated'] is True
 
 
 class TestNodeCRUD:
@@ -192,7 +231,7 @@ class TestNodeCRUD:
 
 
 class TestConnectionCRUD:
-    """연결선 CRUD 테스트 (3개)"""
+    """연결선 CRUD 테스트 (6개)"""
 
     def test_create_connection_between_nodes(self, mindmap_service, sample_mindmap, db):
         """연결선 생성"""
@@ -219,6 +258,64 @@ class TestConnectionCRUD:
                 mindmap_id=sample_node.mindmap.id
             )
 
+    def test_prevent_reverse_duplicate_connection(self, mindmap_service, sample_mindmap, db):
+        """A→B가 있으면 B→A는 중복 (서비스는 ValueError, DB는 unique 제약)"""
+        node1 = create_node(sample_mindmap, title='노드1')
+        node2 = create_node(sample_mindmap, title='노드2')
+        create_connection(node1, node2)
+
+        with pytest.raises(ValueError, match='이미 연결되어 있는 노드입니다'):
+            mindmap_service.create_node_connection(node2.id, node1.id, sample_mindmap.id)
+        with pytest.raises(IntegrityError), transaction.atomic():
+            create_connection(node2, node1)
+        assert NodeConnection.objects.filter(mindmap=sample_mindmap).count() == 1
+
+    def test_bulk_create_connections_skips_existing(self, mindmap_service, sample_mindmap, db):
+        """일괄 생성: 요청 내 중복/역방향과 기존 연결은 건너뛰고 요청 순서대로 연결선 반환"""
+        nodes = [create_node(sample_mindmap, title=f'노드{i}') for i in range(4)]
+        existing = create_connection(nodes[1], nodes[0])
+
+        result = mindmap_service.bulk_create_node_connections(sample_mindmap.id, [
+            (nodes[0].id, nodes[1].id),
+            (nodes[1].id, nodes[2].id),
+            (nodes[2].id, nodes[1].id),
+            (nodes[2].id, nodes[3].id),
+        ])
+
+        assert result['created_count'] == 2
+        assert result['connections'][0] == existing
+        assert [(c.from_node_id, c.to_node_id) for c in result['connections'][1:]] == [
+            (nodes[1].id, nodes[2].id), (nodes[2].id, nodes[3].id)
+        ]
+        assert NodeConnection.objects.filter(mindmap=sample_mindmap).count() == 3
+
+        other_node = create_node(create_mindmap(sample_mindmap.team, title='다른 마인드맵'))
+        with pytest.raises(ValueError, match='다른 마인드맵'):
+            mindmap_service.bulk_create_node_connections(sample_mindmap.id, [(nodes[0].id, other_node.id)])
+
+    def test_bulk_create_connections_counts_only_inserted(self, mindmap_service, sample_mindmap, db, monkeypatch):
+        """기존 연결 조회 뒤 다른 요청이 같은 쌍을 먼저 만들면 건너뛴 행은 생성 수에서 빠진다"""
+        nodes = [create_node(sample_mindmap, title=f'노드{i}') for i in range(3)]
+        original = mindmap_service._connections_between
+        calls = []
+
+        def racing(mindmap_id, node_ids):
+            result = original(mindmap_id, node_ids)
+            if not calls:
+                calls.append(mindmap_id)
+                create_connection(nodes[1], nodes[0])  # 다른 요청의 INSERT
+            return result
+
+        monkeypatch.setattr(mindmap_service, '_connections_between', racing)
+
+        result = mindmap_service.bulk_create_node_connections(sample_mindmap.id, [
+            (nodes[0].id, nodes[1].id),
+            (nodes[1].id, nodes[2].id),
+        ])
+
+        assert result['created_count'] == 1
+        assert NodeConnection.objects.filter(mindmap=sample_mindmap).count() == 2
+
     def test_delete_connection_success(self, mindmap_service, sample_mindmap, host_teamuser, db):
         """연결선 삭제 (DB 상태 검증)"""
         node1 = create_node(sample_mindmap, title='노드1')
@@ -236,8 +333,318 @@ class TestConnectionCRUD:
         assert Node.objects.filter(id=node2.id).exists()
 
 
+class TestRealtimeOperations:
+    """WebSocket 편집 연산 일괄 적용 / 병합 / 재전송 / 스냅샷 압축 테스트 (10개)"""
+
+    def test_apply_operations_returns_server_ids(self, mindmap_service, sample_mindmap, sample_node, db):
+        """생성/연결 연산을 한 번에 적용하고 서버 ID를 반환"""
+        results = mindmap_service.apply_operations(sample_mindmap.id, [
+            {'type': 'node_create', 'client_op_id': 'a', 'posX': 10, 'posY': 20, 'title': '새 노드', 'content': '내용'},
+            {'type': 'connection_delete', 'client_op_id': 'b', 'connection_id': 999999},
+        ])
+
+        created, rejected = results
+        assert created['ok'] is True
+        assert created['type'] == 'node_created'
+        assert created['client_op_id'] == 'a'
+        assert Node.objects.get(id=created['node_id']).title == '새 노드'
+        assert rejected == {'ok': False, 'type': 'connection_delete', 'error': '연결선을 찾을 수 없습니다.', 'client_op_id': 'b'}
+        assert created['seq'] == 1
+
+        results = mindmap_service.apply_operations(sample_mindmap.id, [
+            {'type': 'connection_create', 'from_node_id': sample_node.id, 'to_node_id': created['node_id']},
+        ])
+        assert results[0]['type'] == 'connection_created'
+        assert NodeConnection.objects.filter(id=results[0]['connection_id'], mindmap=sample_mindmap).exists()
+
+    def test_apply_operations_coalesces_moves(self, mindmap_service, sample_node, db):
+        """같은 노드의 이동은 마지막 것만 저장 (소수 좌표 반올림)"""
+        results = mindmap_service.apply_operations(sample_node.mindmap_id, [
+            {'type': 'node_move', 'node_id': sample_node.id, 'x': 300, 'y': 300},
+            {'type': 'node_move', 'node_id': sample_node.id, 'x': 310.6, 'y': 320.2},
+        ])
+
+        assert len(results) == 1
+        assert results[0]['type'] == 'node_moved'
+        assert (results[0]['x'], results[0]['y']) == (311, 320)
+        sample_node.refresh_from_db()
+        assert (sample_node.posX, sample_node.posY) == (311, 320)
+
+    def test_apply_operations_rejects_non_finite_position(self, mindmap_service, sample_mindmap, sample_node, db):
+        """inf/nan 좌표 연산만 거절하고 같은 배치의 나머지 연산은 적용"""
+        results = mindmap_service.apply_operations(sample_mindmap.id, [
+            {'type': 'node_move', 'client_op_id': 'a', 'node_id': sample_node.id, 'x': 'inf', 'y': 0},
+            {'type': 'node_create', 'client_op_id': 'b', 'posX': float('nan'), 'posY': 0, 'title': 'N', 'content': 'N'},
+            {'type': 'node_create', 'client_op_id': 'c', 'posX': 10, 'posY': 20, 'title': '새 노드', 'content': '내용'},
+        ])
+
+        by_id = {result['client_op_id']: result for result in results}
+        assert by_id['a']['ok'] is False and by_id['b']['ok'] is False
+        assert by_id['a']['error'] == '위치 정보는 숫자여야 합니다.'
+        assert by_id['c']['ok'] is True
+        assert Node.objects.filter(id=by_id['c']['node_id'], title='새 노드').exists()
+        sample_node.refresh_from_db()
+        assert (sample_node.posX, sample_node.posY) == (100, 200)
+
+    def test_apply_operations_rejects_other_mindmap_node(self, mindmap_service, sample_mindmap, sample_node, host_teamuser, db):
+        """다른 마인드맵의 노드는 수정/삭제할 수 없고 나머지 연산은 반영"""
+        other_node = create_node(create_mindmap(host_teamuser.team, title='다른 마인드맵'), title='다른 노드')
+
+        results = mindmap_service.apply_operations(sample_mindmap.id, [
+            {'type': 'node_delete', 'node_id': other_node.id},
+            {'type': 'node_update', 'node_id': sample_node.id, 'title': '수정된 제목'},
+            {'type': 'node_update', 'node_id': sample_node.id, 'content': '   '},
+        ])
+
+        assert [result['ok'] for result in results] == [False, True, False]
+        assert Node.objects.filter(id=other_node.id).exists()
+        sample_node.refresh_from_db()
+        assert sample_node.title == '수정된 제목'
+        assert sample_node.content == '샘플 내용'
+
+    def test_apply_operations_last_writer_wins_by_lamport(self, mindmap_service, sample_node, host_teamuser, member_teamuser, db):
+        """동시 이동은 도착 순서가 아니라 (lamport, user_id)가 큰 쪽이 반영"""
+        mindmap_id = sample_node.mindmap_id
+
+        mindmap_service.apply_operations(mindmap_id, [
+            {'type': 'node_move', 'node_id': sample_node.id, 'x': 500, 'y': 500, 'lamport': 5},
+        ], user=host_teamuser.user)
+        # 더 늦게 도착했지만 이전 상태를 기준으로 한 이동
+        stale = mindmap_service.apply_operations(mindmap_id, [
+            {'type': 'node_move', 'node_id': sample_node.id, 'x': 10, 'y': 10, 'lamport': 3},
+        ], user=member_teamuser.user)
+
+        assert stale[0]['ok'] is False
+        assert stale[0]['superseded'] is True
+        assert (stale[0]['node']['posX'], stale[0]['node']['posY']) == (500, 500)
+        sample_node.refresh_from_db()
+        assert (sample_node.posX, sample_node.posY) == (500, 500)
+
+        # 위치와 무관한 제목 변경은 별도 레지스터이므로 반영
+        results = mindmap_service.apply_operations(mindmap_id, [
+            {'type': 'node_update', 'node_id': sample_node.id, 'title': '새 제목', 'lamport': 3},
+        ], user=member_teamuser.user)
+        assert results[0]['ok'] is True
+        assert results[0]['title'] == '새 제목'
+
+    def test_apply_operations_clamps_client_lamport(self, mindmap_service, sample_node, host_teamuser, db):
+        """서버 시각보다 크게 앞선 lamport(64비트 초과, float 포함)는 LAMPORT_MAX_DRIFT까지만 반영"""
+        mindmap_id = sample_node.mindmap_id
+        limit = MindmapService.LAMPORT_MAX_DRIFT
+
+        results = mindmap_service.apply_operations(mindmap_id, [
+            {'type': 'node_move', 'node_id': sample_node.id, 'x': 10, 'y': 10, 'lamport': 2 ** 70},
+        ], user=host_teamuser.user)
+        assert results[0]['ok'] is True
+        assert results[0]['lamport'] == limit + 1
+
+        # orjson은 64비트를 넘는 정수를 float으로 읽음
+        results = mindmap_service.apply_operations(mindmap_id, [
+            {'type': 'node_move', 'node_id': sample_node.id, 'x': 20, 'y': 20, 'lamport': float(2 ** 64)},
+        ], user=host_teamuser.user)
+        assert results[0]['ok'] is True
+        assert Mindmap.objects.get(pk=mindmap_id).lamport_clock == 2 * limit + 2
+
+    def test_rest_writes_use_operation_log(self, mindmap_service, sample_node, host_teamuser, member_teamuser, db):
+        """REST 생성/수정/연결/삭제도 연산 로그 순번과 필드별 LWW 시각을 남긴다"""
+        mindmap_id = sample_node.mindmap_id
+        user = host_teamuser.user
+
+        node = mindmap_service.create_node(mindmap_id, {'posX': 0, 'posY': 0, 'title': '새 노드', 'content': '내용'}, user)
+        mindmap_service.update_node(node.id, {'title': '바뀐 제목'}, user)
+        connection = mindmap_service.create_node_connection(sample_node.id, node.id, mindmap_id, user=user)
+        mindmap_service.bulk_create_node_connections(mindmap_id, [(node.id, sample_node.id)], user=user)
+        mindmap_service.delete_node_connection(connection.id, user)
+        mindmap_service.delete_node(node.id, user)
+
+        operations = mindmap_service.get_operations_since(mindmap_id, 0)
+        assert [(op['seq'], op['type']) for op in operations] == [
+            (1, 'node_created'), (2, 'node_updated'), (3, 'connection_created'),
+            (4, 'connection_deleted'), (5, 'node_deleted'),
+        ]
+        assert Mindmap.objects.get(pk=mindmap_id).last_seq == 5
+
+        # REST 수정은 서버 시각으로 찍혀 앞서 반영된 실시간 편집 뒤에 오고, 이후 stale 연산은 밀어냄
+        mindmap_service.apply_operations(mindmap_id, [
+            {'type': 'node_update', 'node_id': sample_node.id, 'title': '실시간', 'lamport': 100},
+        ], user=member_teamuser.user)
+        node = mindmap_service.update_node(sample_node.id, {'title': 'REST'}, user)
+        assert node.title == 'REST'
+        assert node.field_clocks['title'] == [102, user.id]
+
+        stale = mindmap_service.apply_operations(mindmap_id, [
+            {'type': 'node_update', 'node_id': sample_node.id, 'title': '늦은 편집', 'lamport': 101},
+        ], user=member_teamuser.user)
+        assert stale[0]['superseded'] is True
+
+    def test_apply_operations_merges_duplicate_connection(self, mindmap_service, sample_mindmap, db):
+        """같은 방향 연결선 동시 생성은 하나로 합쳐짐"""
+        node1 = create_node(sample_mindmap, title='노드1')
+        node2 = create_node(sample_mindmap, title='노드2')
+        operation = {'type': 'connection_create', 'from_node_id': node1.id, 'to_node_id': node2.id}
+
+        first = mindmap_service.apply_operations(sample_mindmap.id, [operation])[0]
+        second = mindmap_service.apply_operations(sample_mindmap.id, [operation])[0]
+
+        assert second['ok'] is True
+        assert second['connection_id'] == first['connection_id']
+        assert NodeConnection.objects.filter(mindmap=sample_mindmap).count() == 1
+
+    def test_get_operations_since_replays_log(self, mindmap_service, sample_node, host_teamuser, db, monkeypatch):
+        """since 이후 연산을 순서대로 재전송, 이어 붙일 수 없으면 None"""
+        mindmap_id = sample_node.mindmap_id
+        for x in (100, 200, 300):
+            mindmap_service.apply_operations(mindmap_id, [
+                {'type': 'node_move', 'node_id': sample_node.id, 'x': x, 'y': 0},
+            ], user=host_teamuser.user)
+
+        replay = mindmap_service.get_operations_since(mindmap_id, 1)
+
+        assert [(op['seq'], op['x']) for op in replay] == [(2, 200), (3, 300)]
+        assert replay[0]['user_id'] == host_teamuser.user.id
+        assert mindmap_service.get_operations_since(mindmap_id, 3) == []
+
+        monkeypatch.setattr(MindmapService, 'OPERATION_REPLAY_LIMIT', 1)
+        assert mindmap_service.get_operations_since(mindmap_id, 1) is None
+
+    def test_compact_operations_serves_snapshot_catch_up(self, mindmap_service, sample_node, db, monkeypatch):
+        """압축 후 로그가 끊긴 클라이언트와 새로 입장한 클라이언트는 스냅샷 + 이후 연산으로 따라잡음"""
+        cache.clear()
+        mindmap_id = sample_node.mindmap_id
+        for x in (100, 200, 300):
+            mindmap_service.apply_operations(mindmap_id, [
+                {'type': 'node_move', 'node_id': sample_node.id, 'x': x, 'y': 0},
+            ])
+
+        snapshot = mindmap_service.compact_operations(mindmap_id, keep=1)
+        mindmap_service.apply_operations(mindmap_id, [
+            {'type': 'node_move', 'node_id': sample_node.id, 'x': 400, 'y': 0},
+        ])
+
+        assert snapshot.seq == 3
+        assert list(MindmapOperation.objects.filter(mindmap_id=mindmap_id).values_list('seq', flat=True)) == [3, 4]
+        state = json.loads(zlib.decompress(snapshot.data))
+        assert [(node['id'], node['posX']) for node in state['nodes']] == [(sample_node.id, 300)]
+
+        catch_up = mindmap_service.get_catch_up(mindmap_id, 2)
+        assert catch_up['operations'][0]['seq'] == 3
+        assert catch_up['snapshot'] is None
+
+        catch_up = mindmap_service.get_catch_up(mindmap_id, 0)
+        assert catch_up['snapshot']['seq'] == 3
+        assert [op['x'] for op in catch_up['operations']] == [400]
+
+        # 룸 입장(since 없음)은 노드 수와 관계없이 스냅샷 + 이후 연산
+        monkeypatch.setattr(MindmapService, 'LAZY_LOAD_NODE_THRESHOLD', 0)
+        catch_up = mindmap_service.get_catch_up(mindmap_id)
+        assert catch_up['snapshot']['seq'] == 3
+        assert [op['seq'] for op in catch_up['operations']] == [4]
+
+
+class TestMindmapLayout:
+    """자동 배치 테스트 (1개)"""
+
+    def test_force_layout_fits_canvas_and_logs_operation(self, sample_mindmap, host_teamuser, db):
+        """힘 기반 배치: 모든 노드가 캔버스 안의 서로 다른 위치, 연산 하나로 기록"""
+        cache.clear()
+        nodes = [create_node(sample_mindmap, title=f'노드{i}') for i in range(30)]
+        for i in range(1, len(nodes)):
+            create_connection(nodes[(i - 1) // 2], nodes[i])
+
+        operation = MindmapLayoutService().apply_layout(sample_mindmap.id, user=host_teamuser.user)
+
+        service = MindmapLayoutService
+        positions = list(Node.objects.filter(mindmap=sample_mindmap).values_list('posX', 'posY'))
+        assert len(set(positions)) == len(nodes)
+        assert all(
+            service.CANVAS_MARGIN <= x <= service.CANVAS_WIDTH - service.CANVAS_MARGIN
+            and service.CANVAS_MARGIN <= y <= service.CANVAS_HEIGHT - service.CANVAS_MARGIN
+            for x, y in positions
+        )
+        assert operation['seq'] == 1
+        assert MindmapService().get_operations_since(sample_mindmap.id, 0) == [operation]
+
+        with pytest.raises(ValueError):
+            MindmapLayoutService().apply_layout(sample_mindmap.id, algorithm='grid')
+
+
+class TestMindmapTransfer:
+    """가져오기/내보내기 테스트 (4개)"""
+
+    def test_export_import_round_trip(self, sample_mindmap, host_teamuser, monkeypatch, db):
+        """NDJSON/MessagePack 모두 노드/연결선/댓글을 새 ID로 옮기고 작성자는 아이디로 연결"""
+        monkeypatch.setattr(MindmapTransferService, 'IMPORT_CHUNK_SIZE', 2)
+        nodes = [create_node(sample_mindmap, title=f'노드{i}', x=i * 10, y=i) for i in range(5)]
+        for i in range(1, 5):
+            create_connection(nodes[0], nodes[i])
+        create_comment(nodes[3], host_teamuser.user, text='좋은 아이디어')
+
+        service = MindmapTransferService()
+        for file_format in ('ndjson', 'msgpack'):
+            data = b''.join(service.export_mindmap(sample_mindmap.id, file_format))
+            result = service.import_mindmap(
+                host_teamuser.team.id, io.BytesIO(data), file_format, title=f'복사본 {file_format}'
+            )
+
+            copy = result['mindmap']
+            assert (result['node_count'], result['connection_count'], result['comment_count']) == (5, 4, 1)
+            copied = {node.title: node for node in Node.objects.filter(mindmap=copy)}
+            assert (copied['노드3'].posX, copied['노드3'].posY) == (30, 3)
+            assert not set(node.id for node in copied.values()) & set(node.id for node in nodes)
+            edges = set(NodeConnection.objects.filter(mindmap=copy).values_list('from_node__title', 'to_node__title'))
+            assert edges == {('노드0', f'노드{i}') for i in range(1, 5)}
+            comment = Comment.objects.get(node__mindmap=copy)
+            assert (comment.node_id, comment.user) == (copied['노드3'].id, host_teamuser.user)
+
+    def test_import_links_only_team_members_and_counts_inserted_edges(self, host_teamuser, db):
+        """팀 밖 사용자 아이디의 댓글은 작성자 없이, 건너뛴 중복 연결선은 개수에서 제외"""
+        User.objects.create_user(username='outsider', password='test1234!', email='outsider@test.com')
+        lines = [
+            {'type': 'mindmap', 'version': 1, 'title': '가져온 파일'},
+            {'type': 'node', 'id': 1, 'posX': 0, 'posY': 0, 'title': 'A', 'content': ''},
+            {'type': 'node', 'id': 2, 'posX': 10, 'posY': 0, 'title': 'B', 'content': ''},
+            {'type': 'edge', 'from_node_id': 1, 'to_node_id': 2},
+            {'type': 'edge', 'from_node_id': 2, 'to_node_id': 1},
+            {'type': 'comment', 'node_id': 1, 'comment': '멤버', 'username': host_teamuser.user.username},
+            {'type': 'comment', 'node_id': 1, 'comment': '외부인', 'username': 'outsider'},
+        ]
+        data = '\n'.join(json.dumps(line) for line in lines).encode('utf-8')
+
+        result = MindmapTransferService().import_mindmap(host_teamuser.team.id, io.BytesIO(data))
+
+        assert (result['connection_count'], result['comment_count']) == (1, 2)
+        authors = dict(Comment.objects.filter(node__mindmap=result['mindmap']).values_list('comment', 'user'))
+        assert authors == {'멤버': host_teamuser.user.id, '외부인': None}
+
+    def test_import_invalid_record_rolls_back(self, host_teamuser, db):
+        """없는 노드를 가리키는 연결선이 있으면 마인드맵을 만들지 않음"""
+        lines = [
+            {'type': 'mindmap', 'version': 1, 'title': '깨진 파일'},
+            {'type': 'node', 'id': 1, 'posX': 0, 'posY': 0, 'title': 'A', 'content': ''},
+            {'type': 'edge', 'from_node_id': 1, 'to_node_id': 2},
+        ]
+        data = '\n'.join(json.dumps(line) for line in lines).encode('utf-8')
+
+        with pytest.raises(ValueError, match='3번째 레코드'):
+            MindmapTransferService().import_mindmap(host_teamuser.team.id, io.BytesIO(data))
+        assert not Mindmap.objects.filter(title='깨진 파일').exists()
+
+
+    def test_import_non_finite_position_raises_value_error(self, host_teamuser, db):
+        """MessagePack의 inf/nan 좌표는 ValueError (서버 오류가 아닌 400으로 응답)"""
+        for value in (float('inf'), float('nan')):
+            records = [
+                {'type': 'mindmap', 'version': 1, 'title': '무한 좌표'},
+                {'type': 'node', 'id': 1, 'posX': value, 'posY': 0, 'title': 'A', 'content': ''},
+            ]
+            data = b''.join(msgpack.packb(record) for record in records)
+
+            with pytest.raises(ValueError, match='2번째 레코드'):
+                MindmapTransferService().import_mindmap(host_teamuser.team.id, io.BytesIO(data), 'msgpack')
+        assert not Mindmap.objects.filter(title='무한 좌표').exists()
+
 class TestCommentAndPermission:
-    """댓글 및 권한 테스트 (4개)"""
+    """댓글 및 권한 테스트 (5개)"""
 
     def test_add_comment_to_node(self, mindmap_service, sample_node, host_teamuser, db):
         """노드 댓글 작성 (DB 상태 검증)"""
@@ -253,6 +660,27 @@ class TestCommentAndPermission:
         assert comment.user == host_teamuser.user
         assert Comment.objects.filter(node=sample_node, user=host_teamuser.user).exists()
 
+    def test_create_comment_broadcasts_comment_count(
+        self, mindmap_service, sample_node, host_teamuser, django_capture_on_commit_callbacks
+    ):
+        """댓글 등록 커밋 후 마인드맵 룸에 comment_created, 노드 조회에 comment_count 포함"""
+        channel_layer = get_channel_layer()
+        channel = async_to_sync(channel_layer.new_channel)()
+        async_to_sync(channel_layer.group_add)(f'mindmap_{sample_node.mindmap_id}', channel)
+        create_comment(sample_node, host_teamuser.user, '기존 댓글')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            comment = mindmap_service.create_comment(sample_node.id, '새 댓글', host_teamuser.user)
+
+        message = async_to_sync(channel_layer.receive)(channel)
+        assert message['type'] == 'comment_created'
+        assert (message['node_id'], message['comment_count']) == (sample_node.id, 2)
+        assert message['comment']['id'] == comment.id
+        assert message['comment']['username'] == host_teamuser.user.username
+
+        nodes = mindmap_service.get_mindmap_with_nodes(sample_node.mindmap_id)['nodes']
+        assert nodes.get(pk=sample_node.id).comment_count == 2
+
     def test_create_comment_empty_text_raises_error(self, mindmap_service, sample_node, host_teamuser):
         """빈 댓글 작성 시 ValueError"""
         with pytest.raises(ValueError, match='댓글 내용을 입력해주세요'):
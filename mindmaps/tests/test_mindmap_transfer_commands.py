@@ -0,0 +1,38 @@
+"""
+export_mindmap / import_mindmap Management Command 테스트
+
+테스트 구성:
+- TestMindmapTransferCommands: 파일로 내보낸 뒤 다른 팀으로 가져오기
+"""
+import pytest
+from django.core.management import call_command
+
+from mindmaps.models import Mindmap, Node, NodeConnection
+from teams.models import Team
+from .conftest import create_connection, create_node
+
+
+@pytest.mark.integration
+class TestMindmapTransferCommands:
+    """마인드맵 가져오기/내보내기 커맨드 테스트"""
+
+    def test_export_to_file_and_import_into_team(self, sample_mindmap, host_teamuser, tmp_path):
+        """export_mindmap --output 파일을 import_mindmap --team으로 가져오면 제목과 구조가 유지된다"""
+        nodes = [create_node(sample_mindmap, title=f'노드{i}') for i in range(3)]
+        create_connection(nodes[0], nodes[1])
+        create_connection(nodes[1], nodes[2])
+        other_team = Team.objects.create(
+            title='다른 팀', maxuser=5, currentuser=1, teampasswd='teampass123',
+            invitecode='OTHERCODE', introduction='가져오기 대상 팀', host=host_teamuser.user
+        )
+        path = tmp_path / 'workshop.ndjson'
+
+        call_command('export_mindmap', sample_mindmap.id, output=str(path))
+        call_command('import_mindmap', str(path), team=other_team.id)
+
+        copy = Mindmap.objects.get(team=other_team)
+        assert copy.title == sample_mindmap.title
+        assert Node.objects.filter(mindmap=copy).count() == 3
+        assert set(NodeConnection.objects.filter(mindmap=copy).values_list('from_node__title', 'to_node__title')) == {
+            ('노드0', '노드1'), ('노드1', '노드2')
+        }
@@ -1,6 +1,6 @@
 """
 Mindmap SSR Views 테스트
-총 6개 테스트: 목록, 생성, 삭제, 에디터, 노드 상세
+총 7개 테스트: 목록, 생성, 삭제, 에디터, 노드 상세
 
 개선 사항:
 - 템플릿 렌더링 검증
@@ -96,7 +96,7 @@ class TestMindmapDelete:
 
 
 class TestMindmapEditor:
-    """마인드맵 에디터 테스트 (1개)"""
+    """마인드맵 에디터 테스트 (2개)"""
 
     def test_mindmap_editor_view_renders_canvas(self, authenticated_host_client, host_teamuser):
         """GET /teams/{id}/mindmaps/{id}/ - 에디터 페이지 렌더링"""
@@ -111,6 +111,23 @@ class TestMindmapEditor:
         assert 'mindmaps/mindmap_detail_page.html' in [t.name for t in response.templates]
         assert 'nodes' in response.context
         assert response.context['nodes'].count() == 1
+        assert response.context['lazy_load'] is False
+
+    def test_mindmap_editor_large_map_uses_lazy_load(self, authenticated_host_client, host_teamuser, monkeypatch):
+        """노드 수가 임계값을 넘으면 노드를 페이지에 심지 않는다"""
+        from mindmaps.services import MindmapService
+        monkeypatch.setattr(MindmapService, 'LAZY_LOAD_NODE_THRESHOLD', 1)
+        mindmap = create_mindmap(host_teamuser.team, title='큰 마인드맵')
+        create_node(mindmap, title='노드1', x=100, y=200)
+        create_node(mindmap, title='노드2', x=300, y=400)
+
+        url = reverse('mindmaps:mindmap_detail_page', kwargs={'pk': host_teamuser.team.id, 'mindmap_id': mindmap.id})
+        response = authenticated_host_client.get(url)
+
+        assert response.status_code == 200
+        assert response.context['lazy_load'] is True
+        assert response.context['nodes'] == []
+        assert b'lazyLoad: true' in response.content
 
 
 class TestNodeDetail:
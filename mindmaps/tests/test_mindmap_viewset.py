@@ -1,6 +1,6 @@
 """
 Mindmap ViewSet 테스트 (DRF API)
-총 8개 테스트: Node ViewSet, Connection ViewSet
+총 19개 테스트: Node ViewSet, Connection ViewSet, 그래프 분석, 자동 배치, 가져오기/내보내기
 
 개선 사항:
 - HTTP 상태 코드 구체적 검증
@@ -8,9 +8,11 @@ Mindmap ViewSet 테스트 (DRF API)
 - 권한 검증 (다른 팀 사용자 차단)
 """
 import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
 from rest_framework.test import APIClient
 from rest_framework import status
-from mindmaps.models import Node, NodeConnection
+from mindmaps.models import Mindmap, MindmapOperation, Node, NodeConnection
 from .conftest import create_node, create_connection, create_mindmap
 
 
@@ -35,7 +37,7 @@ def member_client(api_client, member_teamuser):
 
 
 class TestNodeViewSet:
-    """Node ViewSet 테스트 (5개)"""
+    """Node ViewSet 테스트 (8개)"""
 
     def test_node_create_via_api(self, authenticated_client, sample_mindmap, host_teamuser):
         """POST /api/v1/teams/{team_id}/mindmaps/{mindmap_id}/nodes/ - 노드 생성"""
@@ -149,9 +151,48 @@ class TestNodeViewSet:
         # 권한 없음 (IsTeamMember 권한 체크)
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
+    def test_node_viewport_returns_compact_payload(self, authenticated_client, sample_mindmap, host_teamuser):
+        """GET .../nodes/viewport/ - 범위 안 노드 요약과 연결선만 반환"""
+        inside = create_node(sample_mindmap, title='안', x=100, y=100)
+        outside = create_node(sample_mindmap, title='밖', x=3000, y=3000)
+        create_node(sample_mindmap, title='먼곳', x=4000, y=4000)
+        line = create_connection(inside, outside)
+
+        url = f'/api/v1/teams/{host_teamuser.team.id}/mindmaps/{sample_mindmap.id}/nodes/viewport/'
+        response = authenticated_client.get(url, {'min_x': 0, 'min_y': 0, 'max_x': 1920, 'max_y': 1080})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [node['id'] for node in response.data['nodes']] == [inside.id]
+        assert set(response.data['nodes'][0]) == {'id', 'posX', 'posY', 'title', 'recommendation_count', 'comment_count'}
+        assert [node['id'] for node in response.data['anchor_nodes']] == [outside.id]
+        assert response.data['lines'] == [{'id': line.id, 'from_node_id': inside.id, 'to_node_id': outside.id}]
+
+    def test_node_comments_cursor_pagination(self, authenticated_client, sample_node, host_teamuser):
+        """GET .../comments/ - 최신순 page_size개씩, next 커서로 이어서 조회"""
+        from .conftest import create_comment
+
+        comments = [create_comment(sample_node, host_teamuser.user, f'댓글{i}') for i in range(5)]
+        url = f'/api/v1/teams/{host_teamuser.team.id}/mindmaps/{sample_node.mindmap.id}/nodes/{sample_node.id}/comments/'
+
+        response = authenticated_client.get(url, {'page_size': 3})
+        assert response.status_code == status.HTTP_200_OK
+        assert [comment['id'] for comment in response.data['data']] == [c.id for c in comments[:1:-1]]
+        assert response.data['previous'] is None
+
+        response = authenticated_client.get(response.data['next'])
+        assert [comment['comment'] for comment in response.data['data']] == ['댓글1', '댓글0']
+        assert response.data['next'] is None
+
+    def test_node_viewport_invalid_bounds_returns_400(self, authenticated_client, sample_mindmap, host_teamuser):
+        """min이 max보다 크면 400"""
+        url = f'/api/v1/teams/{host_teamuser.team.id}/mindmaps/{sample_mindmap.id}/nodes/viewport/'
+        response = authenticated_client.get(url, {'min_x': 500, 'min_y': 0, 'max_x': 100, 'max_y': 100})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
 
 class TestConnectionViewSet:
-    """Connection ViewSet 테스트 (3개)"""
+    """Connection ViewSet 테스트 (5개)"""
 
     def test_connection_create_via_api(self, authenticated_client, sample_mindmap, host_teamuser):
         """POST /api/teams/{team_id}/mindmaps/{mindmap_id}/connections/ - 연결선 생성"""
@@ -216,3 +257,200 @@ class TestConnectionViewSet:
 
         # DB 검증 (연결선 생성되지 않음)
         assert not NodeConnection.objects.filter(from_node=node, to_node=node).exists()
+
+    def test_connection_bulk_create_via_api(self, authenticated_client, sample_mindmap, host_teamuser):
+        """POST .../connections/bulk/ - 여러 연결선을 한 번에, 역방향 중복은 하나로"""
+        nodes = [create_node(sample_mindmap, title=f'노드{i}') for i in range(3)]
+        url = f'/api/v1/teams/{host_teamuser.team.id}/mindmaps/{sample_mindmap.id}/connections/bulk/'
+        data = {'connections': [
+            {'from_node_id': nodes[0].id, 'to_node_id': nodes[1].id},
+            {'from_node_id': nodes[1].id, 'to_node_id': nodes[0].id},
+            {'from_node_id': nodes[1].id, 'to_node_id': nodes[2].id},
+        ]}
+
+        response = authenticated_client.post(url, data, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['created_count'] == 2
+        assert len(response.data['connections']) == 2
+        assert NodeConnection.objects.filter(mindmap=sample_mindmap).count() == 2
+
+        data = {'connections': [{'from_node_id': nodes[0].id, 'to_node_id': nodes[0].id}]}
+        response = authenticated_client.post(url, data, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_connection_bulk_create_other_team_mindmap_returns_404(self, authenticated_client, host_teamuser):
+        """자기 팀 URL로 다른 팀 마인드맵에 bulk 연결 시도 시 404, 기록 없음"""
+        from django.contrib.auth import get_user_model
+        from teams.models import Team
+
+        other_host = get_user_model().objects.create_user(username='other', password='test1234!', email='other@test.com')
+        other_team = Team.objects.create(
+            title='다른팀', maxuser=5, currentuser=1, teampasswd='pass123',
+            invitecode='OTHER', introduction='다른 팀', host=other_host
+        )
+        other_mindmap = create_mindmap(other_team, title='다른 팀 마인드맵')
+        nodes = [create_node(other_mindmap, title=f'노드{i}') for i in range(2)]
+
+        base = f'/api/v1/teams/{host_teamuser.team.id}/mindmaps/{other_mindmap.id}'
+        data = {'connections': [{'from_node_id': nodes[0].id, 'to_node_id': nodes[1].id}]}
+        response = authenticated_client.post(f'{base}/connections/bulk/', data, format='json')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert not NodeConnection.objects.filter(mindmap=other_mindmap).exists()
+        assert not MindmapOperation.objects.filter(mindmap=other_mindmap).exists()
+
+        # 노드 목록/수정도 URL 팀 밖의 마인드맵에는 닿지 않음
+        response = authenticated_client.get(f'{base}/nodes/')
+        assert '노드0' not in str(response.data)
+        response = authenticated_client.patch(f'{base}/nodes/{nodes[0].id}/', {'title': '침범'}, format='json')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        nodes[0].refresh_from_db()
+        assert nodes[0].title == '노드0'
+
+
+class TestMindmapGraphViewSet:
+    """마인드맵 그래프 분석 API 테스트 (3개)"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+
+    @pytest.fixture
+    def star_mindmap(self, sample_mindmap):
+        """허브 1개 + 잎 3개 + 고립 노드 1개"""
+        hub = create_node(sample_mindmap, title='허브')
+        leaves = [create_node(sample_mindmap, title=f'잎{i}') for i in range(3)]
+        for leaf in leaves:
+            create_connection(leaf, hub)
+        orphan = create_node(sample_mindmap, title='고립')
+        return hub, leaves, orphan
+
+    def test_graph_ranking_components_and_orphans(self, authenticated_client, sample_mindmap, host_teamuser, star_mindmap):
+        """GET .../graph/ - 연결 많은 노드 순위, 연결 요소, 고립 노드"""
+        hub, leaves, orphan = star_mindmap
+        base_url = f'/api/v1/teams/{host_teamuser.team.id}/mindmaps/{sample_mindmap.id}/graph'
+
+        response = authenticated_client.get(f'{base_url}/ranking/', {'limit': 2})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['nodes'][0] == {'node_id': hub.id, 'title': '허브', 'degree': 3, 'score': 0.75}
+        assert len(response.data['nodes']) == 2
+
+        response = authenticated_client.get(f'{base_url}/ranking/', {'metric': 'betweenness', 'limit': 1})
+        assert response.data['nodes'][0]['node_id'] == hub.id
+        assert response.data['nodes'][0]['score'] == 0.5
+
+        response = authenticated_client.get(f'{base_url}/components/')
+        assert [component['size'] for component in response.data['components']] == [4, 1]
+        assert response.data['edge_count'] == 3
+
+        response = authenticated_client.get(f'{base_url}/orphans/')
+        assert [node['id'] for node in response.data['nodes']] == [orphan.id]
+
+        # 연결선이 추가되면 캐시된 그래프 대신 새 구성으로 계산
+        create_connection(orphan, leaves[0])
+        response = authenticated_client.get(f'{base_url}/orphans/')
+        assert response.data['nodes'] == []
+
+    def test_graph_shortest_path(self, authenticated_client, sample_mindmap, host_teamuser, star_mindmap):
+        """GET .../graph/shortest-path/ - 방향과 무관한 최단 경로, 끊겨 있으면 connected=False"""
+        hub, leaves, orphan = star_mindmap
+        url = f'/api/v1/teams/{host_teamuser.team.id}/mindmaps/{sample_mindmap.id}/graph/shortest-path/'
+
+        response = authenticated_client.get(url, {'from_node_id': leaves[0].id, 'to_node_id': leaves[2].id})
+        assert response.status_code == status.HTTP_200_OK
+        assert [node['id'] for node in response.data['nodes']] == [leaves[0].id, hub.id, leaves[2].id]
+        assert response.data['distance'] == 2
+
+        response = authenticated_client.get(url, {'from_node_id': hub.id, 'to_node_id': orphan.id})
+        assert response.data['connected'] is False
+        assert response.data['nodes'] == []
+
+        response = authenticated_client.get(url, {'from_node_id': hub.id, 'to_node_id': 999999})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_graph_invalid_metric_and_non_member(self, authenticated_client, sample_mindmap, host_teamuser):
+        """지원하지 않는 metric은 400, 팀 멤버가 아니면 403"""
+        from django.contrib.auth import get_user_model
+
+        url = f'/api/v1/teams/{host_teamuser.team.id}/mindmaps/{sample_mindmap.id}/graph/ranking/'
+        response = authenticated_client.get(url, {'metric': 'pagerank'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        outsider = get_user_model().objects.create_user(username='outsider', password='test1234!', email='outsider@test.com')
+        authenticated_client.force_authenticate(user=outsider)
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestMindmapLayoutViewSet:
+    """마인드맵 자동 배치 API 테스트 (2개)"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+
+    def test_tree_layout_persists_positions(self, authenticated_client, sample_mindmap, host_teamuser):
+        """POST .../layout/ - 루트가 자식보다 위에 오고, 위치와 연산 로그가 저장됨"""
+        root = create_node(sample_mindmap, title='루트')
+        children = [create_node(sample_mindmap, title=f'자식{i}') for i in range(3)]
+        for child in children:
+            create_connection(root, child)
+        url = f'/api/v1/teams/{host_teamuser.team.id}/mindmaps/{sample_mindmap.id}/layout/'
+
+        response = authenticated_client.post(url, {'algorithm': 'tree', 'root_node_id': root.id}, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['seq'] == 1
+        positions = {node_id: (x, y) for node_id, x, y in response.data['positions']}
+        root.refresh_from_db()
+        assert (root.posX, root.posY) == positions[root.id]
+        for child in children:
+            child.refresh_from_db()
+            assert child.posY > root.posY
+            assert child.field_clocks['position'][0] == 1
+        assert len({positions[child.id] for child in children}) == 3
+
+        operation = MindmapOperation.objects.get(mindmap=sample_mindmap)
+        assert operation.op_type == 'layout_applied'
+
+    def test_layout_invalid_algorithm_and_root(self, authenticated_client, sample_mindmap, host_teamuser):
+        """지원하지 않는 배치 방식, 다른 마인드맵의 루트 노드는 400"""
+        create_node(sample_mindmap)
+        url = f'/api/v1/teams/{host_teamuser.team.id}/mindmaps/{sample_mindmap.id}/layout/'
+
+        response = authenticated_client.post(url, {'algorithm': 'grid'}, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = authenticated_client.post(url, {'algorithm': 'radial', 'root_node_id': 999999}, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['error'] == '노드를 찾을 수 없습니다.'
+
+
+class TestMindmapTransferViewSet:
+    """마인드맵 가져오기/내보내기 API 테스트 (1개)"""
+
+    def test_export_then_import(self, authenticated_client, sample_mindmap, host_teamuser):
+        """GET .../export/ 스트리밍 응답을 POST .../import/로 올리면 같은 구조의 새 마인드맵 생성"""
+        root = create_node(sample_mindmap, title='루트')
+        create_connection(root, create_node(sample_mindmap, title='자식'))
+        base_url = f'/api/v1/teams/{host_teamuser.team.id}/mindmaps'
+
+        response = authenticated_client.get(f'{base_url}/{sample_mindmap.id}/export/', {'file_format': 'msgpack'})
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/x-msgpack'
+        data = b''.join(response.streaming_content)
+
+        upload = SimpleUploadedFile('workshop.msgpack', data)
+        response = authenticated_client.post(f'{base_url}/import/', {'file': upload, 'title': '가져온 마인드맵'})
+        assert response.status_code == status.HTTP_201_CREATED
+        assert (response.data['node_count'], response.data['connection_count']) == (2, 1)
+        copy = Mindmap.objects.get(pk=response.data['mindmap']['id'])
+        assert copy.team_id == host_teamuser.team.id
+        assert NodeConnection.objects.get(mindmap=copy).from_node.title == '루트'
+
+        # 같은 제목으로 다시 가져오면 400
+        upload = SimpleUploadedFile('workshop.msgpack', data)
+        response = authenticated_client.post(f'{base_url}/import/', {'file': upload, 'title': '가져온 마인드맵'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
@@ -51,11 +51,15 @@ class MindmapDetailPageView(TeamMemberRequiredMixin, DetailView):
         
         # 서비스 레이어를 통한 최적화된 조회
         mindmap_data = self.mindmap_service.get_mindmap_with_nodes(self.kwargs['mindmap_id'])
-        
+
+        # 노드가 많으면 페이지에 심지 않고 JS가 뷰포트 API로 필요한 영역만 로딩
+        lazy_load = mindmap_data['nodes'].count() > MindmapService.LAZY_LOAD_NODE_THRESHOLD
+
         context.update({
             'team': team,
-            'nodes': mindmap_data['nodes'],
-            'lines': mindmap_data['lines']
+            'nodes': [] if lazy_load else mindmap_data['nodes'],
+            'lines': [] if lazy_load else mindmap_data['lines'],
+            'lazy_load': lazy_load
         })
         return context
 
@@ -2,6 +2,7 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.contrib import messages
 
@@ -9,20 +10,48 @@ from .models import Mindmap, Node, NodeConnection, Comment
 from .serializers import (
     MindmapSerializer, MindmapCreateSerializer,
     NodeSerializer, NodeCreateSerializer, NodeUpdateSerializer,
-    NodeConnectionSerializer, NodeConnectionCreateSerializer,
+    NodeSummarySerializer, ViewportQuerySerializer,
+    NodeConnectionSerializer, NodeConnectionCreateSerializer, NodeConnectionBulkCreateSerializer, NodeEdgeSerializer,
+    NodeRankingQuerySerializer, NodeRankingSerializer, ShortestPathQuerySerializer,
+    MindmapLayoutSerializer, MindmapExportQuerySerializer, MindmapImportSerializer,
     CommentSerializer, CommentCreateSerializer,
     NodeRecommendSerializer
 )
-from .services import MindmapService, DuplicateTitleError
-from teams.models import Team
+from .services import (
+    MindmapService, MindmapGraphService, MindmapLayoutService, MindmapTransferService, DuplicateTitleError
+)
+from teams.models import Team, TeamDataVersion
+from api.mixins import ConditionalGetMixin
+from api.pagination import CommentCursorPagination
 from api.permissions import IsTeamMember
 from api.utils import api_response, api_success_response, api_error_response
+from common.instrumentation import span
+
+
+class MindmapContentVersionMixin:
+    """
+    마인드맵 하위 리소스(노드/연결선) ViewSet용 데이터 버전
+
+    편집은 팀 데이터 버전 대신 Mindmap.version만 올리므로, ETag는 팀 버전(멤버 닉네임 등)과
+    URL 마인드맵의 내용 버전을 함께 봅니다. 기본 쓰기(perform_*)도 마인드맵 버전만 올립니다.
+    """
 
+    def get_data_version(self):
+        team_id = self.get_version_team_id()
+        mindmap_version = Mindmap.current_version(team_id, self.kwargs.get('mindmap_pk'))
+        return f'{TeamDataVersion.current(team_id)}.{mindmap_version}'
 
-class MindmapViewSet(viewsets.ModelViewSet):
+    def record_change(self, op, entity_id):
+        Mindmap.bump_version(self.kwargs.get('mindmap_pk'))
+
+
+class MindmapViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """마인드맵 관리 ViewSet"""
     serializer_class = MindmapSerializer
     permission_classes = [IsAuthenticated, IsTeamMember]
+    conditional_actions = (
+        'list', 'retrieve', 'graph_components', 'graph_ranking', 'graph_shortest_path', 'graph_orphans'
+    )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -40,14 +69,22 @@ class MindmapViewSet(viewsets.ModelViewSet):
         team_id = self.kwargs.get('team_pk')
         return get_object_or_404(Team, pk=team_id)
 
+    def get_data_version(self):
+        """팀 버전 + 마인드맵 내용 버전 (목록은 last_seq를 담으므로 팀 마인드맵 전체)"""
+        team_id = self.get_version_team_id()
+        mindmap_id = None if self.action == 'list' else self.kwargs.get('pk')
+        return f'{TeamDataVersion.current(team_id)}.{Mindmap.current_version(team_id, mindmap_id)}'
+
     def list(self, request, *args, **kwargs):
         """마인드맵 목록 조회"""
         team = self.get_team()
         mindmaps = self.mindmap_service.get_team_mindmaps(team.id)
         serializer = self.get_serializer(mindmaps, many=True)
+        with span('serialize'):
+            data = serializer.data
         return Response({
             'success': True,
-            'data': serializer.data
+            'data': data
         })
 
     def retrieve(self, request, *args, **kwargs):
@@ -60,12 +97,14 @@ class MindmapViewSet(viewsets.ModelViewSet):
         nodes_serializer = NodeSerializer(mindmap_data['nodes'], many=True)
         lines_serializer = NodeConnectionSerializer(mindmap_data['lines'], many=True)
 
-        return Response({
-            'success': True,
-            'mindmap': mindmap_serializer.data,
-            'nodes': nodes_serializer.data,
-            'lines': lines_serializer.data
-        })
+        with span('serialize'):
+            data = {
+                'success': True,
+                'mindmap': mindmap_serializer.data,
+                'nodes': nodes_serializer.data,
+                'lines': lines_serializer.data
+            }
+        return Response(data)
 
     def create(self, request, *args, **kwargs):
         """마인드맵 생성"""
@@ -119,11 +158,162 @@ class MindmapViewSet(viewsets.ModelViewSet):
                 'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    @action(detail=True, methods=['get'], url_path='graph/components')
+    def graph_components(self, request, team_pk=None, pk=None):
+        """
+        연결 요소(서로 이어진 노드 묶음) 조회
+
+        GET /api/v1/teams/{team_pk}/mindmaps/{pk}/graph/components/
+        """
+        mindmap = self.get_object()
+        return Response({
+            'success': True,
+            **MindmapGraphService().get_components(mindmap.id)
+        })
+
+    @action(detail=True, methods=['get'], url_path='graph/ranking')
+    def graph_ranking(self, request, team_pk=None, pk=None):
+        """
+        중심성 순위 조회 (가장 많이 연결된 아이디어)
+
+        GET /api/v1/teams/{team_pk}/mindmaps/{pk}/graph/ranking/?metric=degree&limit=10
+        """
+        mindmap = self.get_object()
+        query_serializer = NodeRankingQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        ranking = MindmapGraphService().get_node_ranking(mindmap.id, **query_serializer.validated_data)
+        return Response({
+            'success': True,
+            'metric': query_serializer.validated_data['metric'],
+            'nodes': NodeRankingSerializer(ranking, many=True).data
+        })
+
+    @action(detail=True, methods=['get'], url_path='graph/shortest-path')
+    def graph_shortest_path(self, request, team_pk=None, pk=None):
+        """
+        두 노드 사이 최단 경로 조회 (연결선 방향 무시)
+
+        GET /api/v1/teams/{team_pk}/mindmaps/{pk}/graph/shortest-path/?from_node_id=1&to_node_id=2
+        """
+        mindmap = self.get_object()
+        query_serializer = ShortestPathQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        try:
+            path = MindmapGraphService().get_shortest_path(mindmap.id, **query_serializer.validated_data)
+        except ValueError as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        return Response({
+            'success': True,
+            'connected': path is not None,
+            'distance': len(path) - 1 if path is not None else None,
+            'nodes': NodeSummarySerializer(path or [], many=True).data
+        })
+
+    @action(detail=True, methods=['get'], url_path='graph/orphans')
+    def graph_orphans(self, request, team_pk=None, pk=None):
+        """
+        연결선이 없는 고립 노드 조회
+
+        GET /api/v1/teams/{team_pk}/mindmaps/{pk}/graph/orphans/
+        """
+        mindmap = self.get_object()
+        return Response({
+            'success': True,
+            'nodes': NodeSummarySerializer(MindmapGraphService().get_orphan_nodes(mindmap.id), many=True).data
+        })
+
+    @action(detail=True, methods=['post'], url_path='layout')
+    def layout(self, request, team_pk=None, pk=None):
+        """
+        노드 자동 배치 (서버에서 계산해 저장하고 접속자에게 layout_applied로 전달)
+
+        POST /api/v1/teams/{team_pk}/mindmaps/{pk}/layout/
+        """
+        mindmap = self.get_object()
+        serializer = MindmapLayoutSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            operation = MindmapLayoutService().apply_layout(
+                mindmap.id, user=request.user, **serializer.validated_data
+            )
+        except ValueError as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            'success': True,
+            'algorithm': operation['algorithm'],
+            'seq': operation['seq'],
+            'positions': operation['positions']
+        })
+
+    @action(detail=True, methods=['get'], url_path='export')
+    def export_mindmap(self, request, team_pk=None, pk=None):
+        """
+        마인드맵 내보내기 (노드/연결선/댓글 스트리밍)
+
+        GET /api/v1/teams/{team_pk}/mindmaps/{pk}/export/?file_format=ndjson|msgpack
+        """
+        mindmap = self.get_object()
+        query_serializer = MindmapExportQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        file_format = query_serializer.validated_data['file_format']
+
+        response = StreamingHttpResponse(
+            MindmapTransferService().export_mindmap(mindmap.id, file_format),
+            content_type=MindmapTransferService.CONTENT_TYPES[file_format]
+        )
+        response['Content-Disposition'] = f'attachment; filename="mindmap-{mindmap.id}.{file_format}"'
+        return response
+
+    @action(detail=False, methods=['post'], url_path='import')
+    def import_mindmap(self, request, team_pk=None):
+        """
+        내보낸 파일로 새 마인드맵 만들기 (multipart/form-data)
+
+        POST /api/v1/teams/{team_pk}/mindmaps/import/
+        """
+        team = self.get_team()
+        serializer = MindmapImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            result = MindmapTransferService().import_mindmap(
+                team_id=team.id,
+                stream=serializer.validated_data['file'],
+                file_format=serializer.validated_data['file_format'],
+                title=serializer.validated_data.get('title'),
+                creator=request.user
+            )
+        except (DuplicateTitleError, ValueError) as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_400_BAD_REQUEST)
 
-class NodeViewSet(viewsets.ModelViewSet):
+        mindmap = result.pop('mindmap')
+        return Response({
+            'success': True,
+            'message': f'마인드맵 "{mindmap.title}"을 가져왔습니다.',
+            'mindmap': MindmapSerializer(mindmap).data,
+            **result
+        }, status=status.HTTP_201_CREATED)
+
+
+class NodeViewSet(MindmapContentVersionMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """노드 관리 ViewSet"""
     serializer_class = NodeSerializer
     permission_classes = [IsAuthenticated, IsTeamMember]
+    conditional_actions = ('list', 'retrieve', 'viewport', 'comments')
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -133,13 +323,14 @@ class NodeViewSet(viewsets.ModelViewSet):
         """마인드맵별 노드 목록 반환"""
         mindmap_id = self.kwargs.get('mindmap_pk')
         if mindmap_id:
-            return Node.objects.filter(mindmap_id=mindmap_id).select_related('mindmap')
+            return Node.objects.filter(
+                mindmap_id=mindmap_id, mindmap__team_id=self.kwargs.get('team_pk')
+            ).select_related('mindmap')
         return Node.objects.none()
 
     def get_mindmap(self):
-        """현재 마인드맵 객체 반환"""
-        mindmap_id = self.kwargs.get('mindmap_pk')
-        return get_object_or_404(Mindmap, pk=mindmap_id)
+        """현재 마인드맵 객체 반환 (URL의 팀에 속한 마인드맵만)"""
+        return get_object_or_404(Mindmap, pk=self.kwargs.get('mindmap_pk'), team_id=self.kwargs.get('team_pk'))
 
     def create(self, request, *args, **kwargs):
         """노드 생성"""
@@ -173,10 +364,17 @@ class NodeViewSet(viewsets.ModelViewSet):
         serializer = NodeUpdateSerializer(data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
 
-        # 직접 업데이트 (간단한 필드만)
-        for field, value in serializer.validated_data.items():
-            setattr(node, field, value)
-        node.save()
+        try:
+            node = self.mindmap_service.update_node(
+                node_id=node.id,
+                node_data=serializer.validated_data,
+                user=request.user
+            )
+        except ValueError as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_400_BAD_REQUEST)
 
         response_serializer = NodeSerializer(node)
         return Response({
@@ -206,6 +404,30 @@ class NodeViewSet(viewsets.ModelViewSet):
                 'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    @action(detail=False, methods=['get'], url_path='viewport')
+    def viewport(self, request, team_pk=None, mindmap_pk=None):
+        """
+        뷰포트 안의 노드 요약 + 연결선 조회
+
+        GET /api/v1/teams/{team_pk}/mindmaps/{mindmap_pk}/nodes/viewport/?min_x=0&min_y=0&max_x=1920&max_y=1080
+        """
+        mindmap = get_object_or_404(Mindmap, pk=mindmap_pk, team_id=team_pk)
+        query_serializer = ViewportQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        viewport_data = self.mindmap_service.get_nodes_in_viewport(mindmap.id, **query_serializer.validated_data)
+
+        with span('serialize'):
+            data = {
+                'success': True,
+                'nodes': NodeSummarySerializer(viewport_data['nodes'], many=True).data,
+                'anchor_nodes': NodeSummarySerializer(viewport_data['anchor_nodes'], many=True).data,
+                'lines': NodeEdgeSerializer(viewport_data['lines'], many=True).data,
+                'truncated': viewport_data['truncated'],
+                'seq': mindmap.last_seq
+            }
+        return Response(data)
+
     @action(detail=True, methods=['post'], url_path='recommend')
     def recommend(self, request, team_pk=None, mindmap_pk=None, pk=None):
         """노드 추천 토글"""
@@ -233,17 +455,28 @@ class NodeViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['get', 'post'], url_path='comments')
     def comments(self, request, team_pk=None, mindmap_pk=None, pk=None):
-        """노드 댓글 조회 및 생성"""
+        """
+        노드 댓글 조회 및 생성
+
+        GET: 최신순 커서 페이지네이션 (?cursor=&page_size=, 다음 페이지는 next URL)
+        POST: 등록 후 마인드맵 WebSocket 룸에 comment_created 전달
+        """
         node = self.get_object()
 
         if request.method == 'GET':
             # 댓글 목록 조회
             node_data = self.mindmap_service.get_node_with_comments(node.id)
-            comments_serializer = CommentSerializer(node_data['comments'], many=True)
+            paginator = CommentCursorPagination()
+            page = paginator.paginate_queryset(node_data['comments'], request, view=self)
+            comments_serializer = CommentSerializer(page, many=True)
+            with span('serialize'):
+                data = comments_serializer.data
 
             return Response({
                 'success': True,
-                'data': comments_serializer.data
+                'data': data,
+                'next': paginator.get_next_link(),
+                'previous': paginator.get_previous_link()
             })
 
         else:  # POST
@@ -272,7 +505,7 @@ class NodeViewSet(viewsets.ModelViewSet):
                 }, status=status.HTTP_400_BAD_REQUEST)
 
 
-class NodeConnectionViewSet(viewsets.ModelViewSet):
+class NodeConnectionViewSet(MindmapContentVersionMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """노드 연결선 관리 ViewSet"""
     serializer_class = NodeConnectionSerializer
     permission_classes = [IsAuthenticated, IsTeamMember]
@@ -286,14 +519,13 @@ class NodeConnectionViewSet(viewsets.ModelViewSet):
         mindmap_id = self.kwargs.get('mindmap_pk')
         if mindmap_id:
             return NodeConnection.objects.filter(
-                mindmap_id=mindmap_id
+                mindmap_id=mindmap_id, mindmap__team_id=self.kwargs.get('team_pk')
             ).select_related('from_node', 'to_node', 'mindmap')
         return NodeConnection.objects.none()
 
     def get_mindmap(self):
-        """현재 마인드맵 객체 반환"""
-        mindmap_id = self.kwargs.get('mindmap_pk')
-        return get_object_or_404(Mindmap, pk=mindmap_id)
+        """현재 마인드맵 객체 반환 (URL의 팀에 속한 마인드맵만)"""
+        return get_object_or_404(Mindmap, pk=self.kwargs.get('mindmap_pk'), team_id=self.kwargs.get('team_pk'))
 
     def create(self, request, *args, **kwargs):
         """노드 연결 생성"""
@@ -305,7 +537,8 @@ class NodeConnectionViewSet(viewsets.ModelViewSet):
             connection = self.mindmap_service.create_node_connection(
                 from_node_id=serializer.validated_data['from_node_id'],
                 to_node_id=serializer.validated_data['to_node_id'],
-                mindmap_id=mindmap.id
+                mindmap_id=mindmap.id,
+                user=request.user
             )
 
             response_serializer = NodeConnectionSerializer(connection)
@@ -321,6 +554,39 @@ class NodeConnectionViewSet(viewsets.ModelViewSet):
                 'error': str(e)
             }, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk_connect(self, request, team_pk=None, mindmap_pk=None):
+        """
+        연결선 일괄 생성 (이미 연결된 쌍은 기존 연결선을 그대로 반환)
+
+        POST /api/v1/teams/{team_pk}/mindmaps/{mindmap_pk}/connections/bulk/
+        """
+        mindmap = self.get_mindmap()
+        serializer = NodeConnectionBulkCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            result = self.mindmap_service.bulk_create_node_connections(
+                mindmap_id=mindmap.id,
+                pairs=[
+                    (connection['from_node_id'], connection['to_node_id'])
+                    for connection in serializer.validated_data['connections']
+                ],
+                user=request.user
+            )
+        except ValueError as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            'success': True,
+            'message': f'연결선 {result["created_count"]}개가 생성되었습니다.',
+            'created_count': result['created_count'],
+            'connections': NodeEdgeSerializer(result['connections'], many=True).data
+        }, status=status.HTTP_201_CREATED)
+
     def destroy(self, request, *args, **kwargs):
         """노드 연결 삭제"""
         connection = self.get_object()
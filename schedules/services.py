@@ -1,7 +1,7 @@
 from django.shortcuts import get_object_or_404
 from django.db import transaction
 from datetime import datetime, date, timedelta
-from teams.models import Team, TeamUser
+from teams.models import Team, TeamChange, TeamUser
 from .models import PersonalDaySchedule
 
 
@@ -30,6 +30,20 @@ class ScheduleService:
             date__range=[start_date, end_date]
         ).select_related('owner')
 
+        return self._aggregate_availability(schedules, start_date, end_date)
+
+    async def aget_team_availability(self, team_id, start_date, end_date):
+        """get_team_availability의 async 버전 (async view용)"""
+        schedules = [
+            schedule async for schedule in PersonalDaySchedule.objects.filter(
+                owner__team_id=team_id,
+                date__range=[start_date, end_date]
+            ).only('date', 'available_hours')
+        ]
+        return self._aggregate_availability(schedules, start_date, end_date)
+
+    def _aggregate_availability(self, schedules, start_date, end_date):
+        """스케줄 목록을 날짜별/시간대별 가능 인원 수로 집계합니다."""
         # 날짜별로 그룹화
         schedules_by_date = {}
         for schedule in schedules:
@@ -89,5 +103,6 @@ class ScheduleService:
                     available_hours=available_hours
                 )
                 updated_days += 1
+        TeamChange.record(team_user.team_id, TeamChange.ENTITY_SCHEDULE, team_user.id, TeamChange.OP_UPDATED)
         
         return updated_days
\ No newline at end of file
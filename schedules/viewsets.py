@@ -14,15 +14,18 @@ from .serializers import (
     TeamScheduleQuerySerializer
 )
 from .services import ScheduleService
-from teams.models import Team, TeamUser
+from teams.models import Team, TeamChange, TeamUser
+from api.mixins import ConditionalGetMixin
 from api.permissions import IsTeamMember
 from api.utils import api_response, api_success_response, api_error_response
 
 
-class ScheduleViewSet(viewsets.ModelViewSet):
+class ScheduleViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """팀 스케줄 관리 ViewSet"""
     serializer_class = PersonalDayScheduleSerializer
     permission_classes = [IsAuthenticated, IsTeamMember]
+    conditional_actions = ('list', 'retrieve', 'get_team_availability', 'get_my_schedule')
+    change_entity = TeamChange.ENTITY_SCHEDULE
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -37,6 +40,10 @@ class ScheduleViewSet(viewsets.ModelViewSet):
             ).select_related('owner__user', 'owner__team')
         return PersonalDaySchedule.objects.none()
 
+    def get_change_entity_id(self, instance):
+        """스케줄 변경은 스케줄 주인(TeamUser) 단위로 기록"""
+        return instance.owner_id
+
     def get_team(self):
         """현재 팀 객체 반환"""
         team_id = self.kwargs.get('team_pk')
@@ -1,8 +1,6 @@
 from django.db import models
 from datetime import datetime
 from uuid import uuid4
-import os
-from django.conf import settings
 
 
 import teams.models
@@ -42,9 +40,11 @@ class Post(models.Model):
         return self.title
 
     def delete(self, *args, **kargs):
-        if self.upload_files:
-            os.remove(os.path.join(settings.MEDIA_ROOT, self.upload_files.path))
-        super(Post, self).delete(*args,**kargs)
+        from .tasks import remove_attachment_files_on_commit
+
+        # 첨부파일은 커밋 후 작업 큐에서 삭제 (롤백되면 파일 유지)
+        remove_attachment_files_on_commit([self.upload_files.name])
+        return super(Post, self).delete(*args,**kargs)
     class Meta:
         db_table = '게시물'
         verbose_name = '게시물'
@@ -10,7 +10,7 @@ from django.http import HttpResponse
 from django.conf import settings
 
 from .models import Post
-from teams.models import Team, TeamUser
+from teams.models import Team, TeamChange, TeamUser
 from accounts.models import User
 
 
@@ -71,6 +71,7 @@ class ShareService:
             post.upload_files = upload_file
             post.filename = upload_file.name
             post.save()
+        TeamChange.record(team_id, TeamChange.ENTITY_POST, post.id, TeamChange.OP_CREATED)
 
         return post
     
@@ -107,6 +108,7 @@ class ShareService:
         post.title = post_data['title'].strip()
         post.article = post_data['article'].strip()
         post.save()
+        TeamChange.record(post.team_id, TeamChange.ENTITY_POST, post.id, TeamChange.OP_UPDATED)
         
         return post
     
@@ -131,9 +133,11 @@ class ShareService:
             raise PermissionDenied('본인 게시글이 아닙니다.')
         
         post_title = post.title
+        team_id = post.team_id
         
         # 파일 정리 후 게시글 삭제 (모델의 delete 메서드가 파일 정리 처리)
         post.delete()
+        TeamChange.record(team_id, TeamChange.ENTITY_POST, post_id, TeamChange.OP_DELETED)
         
         return post_title
     
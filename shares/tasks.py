@@ -0,0 +1,28 @@
+"""
+Shares 백그라운드 작업
+"""
+import logging
+
+from django.core.files.storage import default_storage
+
+from taskqueue.queue import task
+
+logger = logging.getLogger(__name__)
+
+# 작업 하나에 담을 최대 파일 수 (팀 해체처럼 첨부파일이 많을 때 나눠서 큐에 넣음)
+REMOVE_FILES_CHUNK_SIZE = 500
+
+
+@task(max_attempts=5)
+def remove_attachment_files(names):
+    """게시물 첨부파일 삭제 (이미 없는 파일은 무시)"""
+    for name in names:
+        default_storage.delete(name)
+    logger.info('첨부파일 %d개 삭제', len(names))
+
+
+def remove_attachment_files_on_commit(names):
+    """현재 트랜잭션이 커밋되면 첨부파일 삭제를 REMOVE_FILES_CHUNK_SIZE개씩 큐에 넣습니다."""
+    names = [name for name in names if name]
+    for start in range(0, len(names), REMOVE_FILES_CHUNK_SIZE):
+        remove_attachment_files.delay_on_commit(names=names[start:start + REMOVE_FILES_CHUNK_SIZE])
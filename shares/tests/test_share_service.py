@@ -10,6 +10,8 @@ Shares 서비스 레이어 테스트 (16개)
 사용 위치:
 - SSR 뷰: post_list, post_detail, post_write, post_edit 등
 """
+import os
+
 import pytest
 from django.core.exceptions import PermissionDenied
 from shares.models import Post
@@ -90,15 +92,18 @@ class TestPostCRUD:
         with pytest.raises(PermissionDenied, match='본인 게시글이 아닙니다'):
             share_service.update_post(sample_post.id, updated_data, another_user)
 
-    def test_delete_post_with_file_cleanup(self, share_service, post_with_file):
-        """게시물 삭제 (파일 함께 삭제 확인)"""
+    def test_delete_post_with_file_cleanup(self, share_service, post_with_file, django_capture_on_commit_callbacks):
+        """게시물 삭제 (커밋 후 작업 큐에서 파일 함께 삭제 확인)"""
         post_id = post_with_file.id
         post_title = post_with_file.title
+        file_path = post_with_file.upload_files.path
 
-        deleted_title = share_service.delete_post(post_id, post_with_file.teamuser.user)
+        with django_capture_on_commit_callbacks(execute=True):
+            deleted_title = share_service.delete_post(post_id, post_with_file.teamuser.user)
 
         assert deleted_title == post_title
         assert not Post.objects.filter(id=post_id).exists()
+        assert not os.path.exists(file_path)
 
 
 class TestSearchFunctionality:
@@ -26,6 +26,16 @@ class MindmapEditor {
     this.connections = [];
     this.activeUsers = new Map();
     this.isDragging = false;
+
+    // 편집 연산 동기화
+    // lastSeq: 순서대로 반영한 마지막 연산 순번, lamport: 동시 편집 병합용 Lamport 시계
+    this.lastSeq = null;
+    this.lamport = 0;
+    this.pendingOperations = new Map();
+    this.operationCounter = 0;
+    this.remoteBuffer = [];
+    this.isSyncing = false;
+    this.isResyncing = false;
     this.dragNode = null;
     this.dragOffset = { x: 0, y: 0 };
 
@@ -81,7 +91,13 @@ class MindmapEditor {
 
   initWebSocket() {
     const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-    const wsUrl = `${protocol}//${window.location.host}/ws/mindmap/${this.teamId}/${this.mindmapId}/`;
+    let wsUrl = `${protocol}//${window.location.host}/ws/mindmap/${this.teamId}/${this.mindmapId}/`;
+
+    // 재연결 시 마지막으로 반영한 순번을 보내면 서버가 접속 직후 놓친 변경을 보내 줌
+    this.isSyncing = this.lastSeq !== null;
+    if (this.isSyncing) {
+      wsUrl += `?since=${this.lastSeq}`;
+    }
 
     this.socket = new WebSocket(wsUrl);
 
@@ -156,13 +172,97 @@ class MindmapEditor {
       this.connections = window.mindmapData.connections;
     }
 
+    // 대형 마인드맵은 노드가 페이지에 심어지지 않으므로 뷰포트 단위로 로딩
+    this.lazyLoad = Boolean(window.mindmapData && window.mindmapData.lazyLoad);
+
+    // 페이지 렌더링 시점의 연산 순번 (이후 연산은 WebSocket 접속 시 sync로 받음)
+    if (window.mindmapData && typeof window.mindmapData.seq === 'number') {
+      this.lastSeq = window.mindmapData.seq;
+    }
+
     this.render();
   }
 
+  scheduleViewportLoad() {
+    if (!this.lazyLoad) {
+      return;
+    }
+    // 팬/줌이 멈춘 뒤 한 번만 요청
+    clearTimeout(this.viewportLoadTimer);
+    this.viewportLoadTimer = setTimeout(() => this.loadViewport(), 200);
+  }
+
+  async loadViewport() {
+    // 현재 화면 영역 + 사방 반 화면 여백 (가상 캔버스 좌표)
+    const width = this.canvas.width / this.scale;
+    const height = this.canvas.height / this.scale;
+    const left = -this.translateX / this.scale;
+    const top = -this.translateY / this.scale;
+    const params = new URLSearchParams({
+      min_x: Math.max(0, Math.floor(left - width / 2)),
+      min_y: Math.max(0, Math.floor(top - height / 2)),
+      max_x: Math.max(0, Math.ceil(left + width * 1.5)),
+      max_y: Math.max(0, Math.ceil(top + height * 1.5))
+    });
+
+    try {
+      const url = `/api/v1/teams/${this.teamId}/mindmaps/${this.mindmapId}/nodes/viewport/?${params}`;
+      const response = await fetch(url);
+      const data = await response.json();
+      if (!data.success) {
+        return;
+      }
+      if (this.lastSeq === null) {
+        this.lastSeq = data.seq;
+      }
+
+      // 이미 가진 노드는 WebSocket으로 갱신된 위치를 유지하고 새 노드만 추가
+      const knownNodeIds = new Set(this.nodes.map(n => n.id));
+      [...data.nodes, ...data.anchor_nodes].forEach(node => {
+        if (!knownNodeIds.has(node.id)) {
+          knownNodeIds.add(node.id);
+          this.nodes.push({
+            id: node.id,
+            x: node.posX,
+            y: node.posY,
+            title: node.title,
+            commentCount: node.comment_count,
+            width: 120,
+            height: 60
+          });
+        }
+      });
+
+      const knownConnectionIds = new Set(this.connections.map(c => c.id));
+      data.lines.forEach(line => {
+        if (!knownConnectionIds.has(line.id)) {
+          knownConnectionIds.add(line.id);
+          this.connections.push({
+            id: line.id,
+            fromNodeId: line.from_node_id,
+            toNodeId: line.to_node_id
+          });
+        }
+      });
+
+      this.render();
+    } catch (error) {
+      console.error('뷰포트 노드 로딩 오류:', error);
+    }
+  }
+
   // WebSocket 메시지 처리
   handleWebSocketMessage(data) {
     switch (data.type) {
       case 'existing_users':
+        // 페이지 로딩/재연결 사이에 놓친 편집은 연산 로그에서 이어 받음
+        this.lamport = Math.max(this.lamport, data.lamport || 0);
+        if (this.lastSeq === null) {
+          this.lastSeq = data.seq;
+        } else if (data.seq > this.lastSeq) {
+          this.requestSync();
+        }
+
         // 기존 접속자 목록을 받아서 추가
         console.log(`기존 접속자 ${data.users.length}명 수신`);
         data.users.forEach(user => {
@@ -207,8 +307,52 @@ class MindmapEditor {
       case 'connection_deleted':
         this.removeConnection(data.connection_id);
         break;
+      case 'operations_applied':
+        this.applyOperations(data);
+        break;
+      case 'operations_replay':
+        this.isSyncing = false;
+        data.operations.forEach(operation => this.receiveOperation(operation, false));
+        this.drainRemoteBuffer();
+        break;
+      case 'snapshot':
+        // 연산 로그가 압축된 구간 → 스냅샷으로 교체 (이후 연산은 뒤따르는 operations_replay로 반영)
+        this.lamport = Math.max(this.lamport, data.lamport);
+        this.applyMindmapState(data.state.nodes, data.state.lines);
+        this.lastSeq = data.seq;
+        this.remoteBuffer = this.remoteBuffer.filter(({ operation }) => operation.seq > data.seq);
+        this.render();
+        break;
+      case 'resync_required':
+        this.isSyncing = false;
+        this.remoteBuffer = [];
+        this.resync();
+        break;
+      case 'operation_rejected':
+        this.pendingOperations.delete(data.client_op_id);
+        if (data.superseded && data.node) {
+          // 다른 사용자의 더 최신 변경에 밀림 → 서버 상태로 되돌림
+          this.handleWebSocketMessage(data.node);
+        } else {
+          showDjangoToast(data.error, 'error');
+        }
+        break;
+      case 'node_updated': {
+        const node = this.nodes.find(n => n.id === data.node_id);
+        if (node) {
+          node.x = data.posX;
+          node.y = data.posY;
+          node.title = data.title;
+          node.content = data.content;
+          this.render();
+        }
+        break;
+      }
       case 'node_created':
-        // 다른 사용자가 생성한 노드 추가
+        // 서버에서 생성된 노드 추가 (뷰포트 로딩 등으로 이미 있으면 무시)
+        if (this.nodes.some(n => n.id === data.node_id)) {
+          break;
+        }
         console.log(`노드 생성됨: ${data.title} by ${data.username}`);
         this.nodes.push({
           id: data.node_id,
@@ -221,6 +365,29 @@ class MindmapEditor {
         });
         this.render();
         break;
+      case 'comment_created': {
+        // REST/노드 상세 페이지에서 등록된 댓글 → 노드의 댓글 수만 갱신
+        const node = this.nodes.find(n => n.id === data.node_id);
+        if (node) {
+          node.commentCount = data.comment_count;
+          this.render();
+        }
+        break;
+      }
+      case 'layout_applied': {
+        // 서버 자동 배치 결과 (positions: [[node_id, x, y], ...])
+        const positions = new Map(data.positions.map(([id, x, y]) => [id, { x, y }]));
+        this.nodes.forEach(node => {
+          const position = positions.get(node.id);
+          if (position) {
+            node.x = position.x;
+            node.y = position.y;
+          }
+        });
+        this.render();
+        this.scheduleViewportLoad();
+        break;
+      }
       case 'node_deleted':
         // 다른 사용자가 삭제한 노드 제거
         console.log(`노드 삭제됨: ${data.node_id} by ${data.username}`);
@@ -230,6 +397,117 @@ class MindmapEditor {
     }
   }
 
+  // 서버가 저장한 편집 연산 결과 반영
+  applyOperations(data) {
+    data.operations.forEach(operation => this.receiveOperation(operation, data.is_sender));
+  }
+
+  // 연산을 순번(seq) 순서대로 한 번씩만 반영
+  receiveOperation(operation, isSender) {
+    this.lamport = Math.max(this.lamport, operation.lamport || 0);
+
+    if (this.lastSeq !== null && operation.seq <= this.lastSeq) {
+      return; // 재전송 등으로 이미 반영한 연산
+    }
+    if (this.lastSeq !== null && operation.seq > this.lastSeq + 1) {
+      // 중간 연산을 놓쳤으면 보관해 두고 놓친 구간을 요청
+      this.remoteBuffer.push({ operation, isSender });
+      this.requestSync();
+      return;
+    }
+    this.lastSeq = operation.seq;
+
+    if (isSender && this.pendingOperations.has(operation.client_op_id)) {
+      const message = this.pendingOperations.get(operation.client_op_id);
+      this.pendingOperations.delete(operation.client_op_id);
+      if (message) {
+        showDjangoToast(message, 'success');
+      }
+    }
+
+    // 내가 드래그한 위치는 이미 화면에 반영됨
+    if (isSender && operation.type === 'node_moved') {
+      return;
+    }
+
+    this.handleWebSocketMessage(operation);
+  }
+
+  drainRemoteBuffer() {
+    const buffered = this.remoteBuffer.sort((a, b) => a.operation.seq - b.operation.seq);
+    this.remoteBuffer = [];
+    buffered.forEach(({ operation, isSender }) => this.receiveOperation(operation, isSender));
+  }
+
+  requestSync() {
+    if (this.isSyncing || !this.socket || this.socket.readyState !== WebSocket.OPEN) {
+      return;
+    }
+    this.isSyncing = true;
+    this.socket.send(JSON.stringify({ type: 'sync', since: this.lastSeq }));
+  }
+
+  // 편집 연산을 WebSocket으로 전송 (연결이 없으면 false → 호출부에서 REST로 처리)
+  sendOperation(operation, successMessage = null) {
+    if (!this.socket || this.socket.readyState !== WebSocket.OPEN) {
+      return false;
+    }
+
+    const clientOpId = `${this.currentUser.userId}-${Date.now()}-${++this.operationCounter}`;
+    this.pendingOperations.set(clientOpId, successMessage);
+    this.socket.send(JSON.stringify({ ...operation, client_op_id: clientOpId, lamport: ++this.lamport }));
+    return true;
+  }
+
+  async resync() {
+    if (this.isResyncing) {
+      return;
+    }
+    this.isResyncing = true;
+
+    try {
+      if (this.lazyLoad) {
+        this.nodes = [];
+        this.connections = [];
+        this.lastSeq = null;
+        await this.loadViewport();
+        return;
+      }
+
+      const response = await fetch(`/api/v1/teams/${this.teamId}/mindmaps/${this.mindmapId}/`);
+      const data = await response.json();
+      if (data.success) {
+        this.applyMindmapState(data.nodes, data.lines);
+        this.lastSeq = data.mindmap.last_seq;
+        this.drainRemoteBuffer();
+        this.render();
+      }
+    } catch (error) {
+      console.error('마인드맵 재동기화 오류:', error);
+    } finally {
+      this.isResyncing = false;
+    }
+  }
+
+  // 서버 형식(posX/posY, from_node_id/to_node_id)의 전체 상태로 교체
+  applyMindmapState(nodes, lines) {
+    this.nodes = nodes.map(node => ({
+      id: node.id,
+      x: node.posX,
+      y: node.posY,
+      title: node.title,
+      content: node.content,
+      commentCount: node.comment_count || 0,
+      width: 120,
+      height: 60
+    }));
+    this.connections = lines.map(line => ({
+      id: line.id,
+      fromNodeId: line.from_node_id,
+      toNodeId: line.to_node_id
+    }));
+  }
+
   addConnection(connectionId, fromNodeId, toNodeId) {
     // 중복 체크
     if (this.connections.some(c => c.id === connectionId)) {
@@ -429,6 +707,10 @@ class MindmapEditor {
       this.tempConnectionEnd = null;
     }
 
+    if (this.isPanning) {
+      this.scheduleViewportLoad();
+    }
+
     this.isDragging = false;
     this.dragNode = null;
     this.isPanning = false;
@@ -470,6 +752,7 @@ class MindmapEditor {
     this.translateY = constrained.y;
 
     this.render();
+    this.scheduleViewportLoad();
   }
 
   onClick(e) {
@@ -593,6 +876,11 @@ class MindmapEditor {
 
   deleteConnection(connectionId) {
     showConfirmModal('연결선을 삭제하시겠습니까?', async () => {
+      if (this.sendOperation({ type: 'connection_delete', connection_id: connectionId }, '연결선이 삭제되었습니다.')) {
+        this.selectedConnection = null;
+        return;
+      }
+
       try {
         const url = `/api/v1/teams/${this.teamId}/mindmaps/${this.mindmapId}/connections/${connectionId}/`;
         const response = await fetch(url, {
@@ -608,14 +896,6 @@ class MindmapEditor {
           this.connections = this.connections.filter(c => c.id !== connectionId);
           this.selectedConnection = null;
 
-          // WebSocket으로 브로드캐스트
-          if (this.socket && this.socket.readyState === WebSocket.OPEN) {
-            this.socket.send(JSON.stringify({
-              type: 'connection_delete',
-              connection_id: connectionId
-            }));
-          }
-
           showDjangoToast(data.message, 'success');
           this.render();
         } else {
@@ -705,6 +985,7 @@ class MindmapEditor {
     this.translateY = constrained.y;
 
     this.render();
+    this.scheduleViewportLoad();
   }
 
   setInitialView() {
@@ -721,6 +1002,7 @@ class MindmapEditor {
     this.translateY = this.canvas.height / 2 - centerY * this.scale;
 
     this.render();
+    this.scheduleViewportLoad();
   }
 
   resetView() {
@@ -737,6 +1019,7 @@ class MindmapEditor {
     this.translateY = this.canvas.height / 2 - centerY * this.scale;
 
     this.render();
+    this.scheduleViewportLoad();
   }
 
   updateConnectionStatus(connected) {
@@ -1119,6 +1402,11 @@ class MindmapEditor {
   }
 
   async createConnection(fromNodeId, toNodeId) {
+    const operation = { type: 'connection_create', from_node_id: fromNodeId, to_node_id: toNodeId };
+    if (this.sendOperation(operation, '연결선이 생성되었습니다.')) {
+      return;
+    }
+
     try {
       const response = await fetch(`/api/v1/teams/${this.teamId}/mindmaps/${this.mindmapId}/connections/`, {
         method: 'POST',
@@ -1142,16 +1430,6 @@ class MindmapEditor {
           toNodeId: data.connection.to_node_id
         });
 
-        // WebSocket으로 브로드캐스트
-        if (this.socket && this.socket.readyState === WebSocket.OPEN) {
-          this.socket.send(JSON.stringify({
-            type: 'connection_create',
-            connection_id: data.connection.id,
-            from_node_id: fromNodeId,
-            to_node_id: toNodeId
-          }));
-        }
-
         showDjangoToast(data.message, 'success');
         this.render();
       } else {
@@ -1241,6 +1519,15 @@ class MindmapEditor {
       lines.forEach((line, index) => {
         this.ctx.fillText(line, node.x, startY + index * lineHeight);
       });
+
+      // 댓글 수 배지 (우측 하단)
+      if (node.commentCount) {
+        this.ctx.fillStyle = '#667eea';
+        this.ctx.font = '11px GmarketSansMedium, sans-serif';
+        this.ctx.textAlign = 'right';
+        this.ctx.textBaseline = 'bottom';
+        this.ctx.fillText(`💬 ${node.commentCount}`, x + node.width - 8, y + node.height - 4);
+      }
     });
   }
 
@@ -1374,6 +1661,12 @@ function initModalEvents() {
         return;
       }
 
+      // 실시간 연결이 있으면 WebSocket으로 생성 (서버가 저장 후 모든 사용자에게 반영)
+      if (editor.sendOperation({ type: 'node_create', ...data }, '노드가 생성되었습니다.')) {
+        closeModal();
+        return;
+      }
+
       const url = `/api/v1/teams/${editor.teamId}/mindmaps/${editor.mindmapId}/nodes/`;
       const response = await fetch(url, {
         method: 'POST',
@@ -1402,18 +1695,6 @@ function initModalEvents() {
 
         editor.render();
         closeModal();
-
-        // WebSocket으로 다른 사용자들에게 알림
-        if (editor.socket && editor.socket.readyState === WebSocket.OPEN) {
-          editor.socket.send(JSON.stringify({
-            type: 'node_create',
-            node_id: result.node.id,
-            posX: result.node.posX,
-            posY: result.node.posY,
-            title: result.node.title,
-            content: result.node.content
-          }));
-        }
       } else {
         showDjangoToast(result.error || '노드 생성에 실패했습니다.', 'error');
       }
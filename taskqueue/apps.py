@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class TaskqueueConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'taskqueue'
+
+    def ready(self):
+        """각 앱의 tasks.py를 불러와 작업 등록 (워커가 이름으로 찾을 수 있도록)"""
+        autodiscover_modules('tasks')
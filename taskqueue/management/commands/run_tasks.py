@@ -0,0 +1,51 @@
+"""
+백그라운드 작업 워커 Management Command
+
+Task 큐를 주기적으로 확인해 작업을 실행합니다. 웹 서버와 별도 프로세스(컨테이너)로 띄우며,
+여러 개를 띄워도 같은 작업을 중복 실행하지 않습니다.
+
+사용법:
+    python manage.py run_tasks
+    python manage.py run_tasks --once          # 지금 쌓인 작업만 처리하고 종료
+    python manage.py run_tasks --interval 5    # 큐가 비었을 때 5초마다 확인
+"""
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from taskqueue.worker import BATCH_SIZE, run_pending
+
+
+class Command(BaseCommand):
+    help = '백그라운드 작업 큐를 처리합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='대기 작업을 모두 처리한 뒤 종료합니다.')
+        parser.add_argument('--interval', type=float, default=1.0, help='큐가 비었을 때 확인 간격 (초, 기본값: 1)')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help=f'한 번에 가져올 작업 수 (기본값: {BATCH_SIZE})')
+
+    def handle(self, *args, **options):
+        self._stopping = False
+        if not options['once']:
+            signal.signal(signal.SIGTERM, self._stop)
+            signal.signal(signal.SIGINT, self._stop)
+            self.stdout.write('작업 워커 시작')
+
+        processed = 0
+        while not self._stopping:
+            close_old_connections()
+            claimed = run_pending(options['batch_size'])
+            processed += claimed
+            if claimed:
+                continue
+            if options['once']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'✅ 작업 {processed}건 처리'))
+
+    def _stop(self, signum, frame):
+        """진행 중인 묶음을 마친 뒤 종료"""
+        self._stopping = True
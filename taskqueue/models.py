@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from django.db import models
+
+
+class Task(models.Model):
+    """
+    백그라운드 작업 큐 항목
+
+    성공한 작업은 워커가 바로 삭제하므로 테이블에는 대기/실행 중/최종 실패 작업만 남습니다.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_FAILED = 'failed'
+
+    name = models.CharField(max_length=128)  # @task로 등록된 작업 이름
+    kwargs = models.JSONField(default=dict)
+    status = models.CharField(
+        max_length=16,
+        choices=[
+            (STATUS_PENDING, '대기'),
+            (STATUS_RUNNING, '실행 중'),
+            (STATUS_FAILED, '실패'),
+        ],
+        default=STATUS_PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    run_after = models.DateTimeField(default=datetime.now)  # 재시도 대기 시각
+    locked_at = models.DateTimeField(null=True, blank=True)  # 워커가 가져간 시각
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(default=datetime.now)
+
+    class Meta:
+        indexes = [
+            # 워커 조회용: 실행할 차례가 된 대기 작업
+            models.Index(fields=['status', 'run_after'], name='task_status_run_after_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.name} ({self.status})'
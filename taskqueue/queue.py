@@ -0,0 +1,81 @@
+"""
+DB 기반 백그라운드 작업 큐
+
+요청 처리 중에 하기엔 느리거나 외부 서비스에 의존하는 일(SMTP 메일 발송, 첨부파일 삭제,
+집계 재계산)을 Task 행으로 넣어 두고 `run_tasks` 워커가 꺼내 실행합니다.
+별도 브로커 없이 기존 MySQL만 사용하며, 워커 여러 개가 SELECT ... FOR UPDATE SKIP LOCKED로
+작업을 나눠 가집니다.
+
+작업 정의 (각 앱의 tasks.py, 앱 로딩 시 자동 등록):
+    from taskqueue.queue import task
+
+    @task(max_attempts=5)
+    def send_activation_email(user_id, domain):
+        ...
+
+작업 넣기:
+    send_activation_email.delay_on_commit(user_id=user.pk, domain=site.domain)  # 커밋 후 (권장)
+    send_activation_email.delay(user_id=user.pk, domain=site.domain)            # 즉시
+
+인자는 JSON으로 저장되므로 모델 인스턴스 대신 ID를 넘겨야 합니다.
+settings.TASKS_EAGER가 True이면 큐에 넣지 않고 그 자리에서 실행합니다 (개발/테스트용).
+"""
+import json
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import Task
+
+_REGISTRY = {}
+
+
+class TaskDefinition:
+    """@task로 등록된 작업 (직접 호출하면 동기 실행)"""
+
+    def __init__(self, func, name, max_attempts):
+        self.func = func
+        self.name = name
+        self.max_attempts = max_attempts
+        self.__doc__ = func.__doc__
+
+    def __call__(self, **kwargs):
+        return self.func(**kwargs)
+
+    def delay(self, **kwargs):
+        """
+        작업을 큐에 넣습니다.
+
+        Returns:
+            Task | None: 저장된 큐 항목 (TASKS_EAGER면 바로 실행하고 None)
+        """
+        # 큐를 거칠 때와 같은 인자(JSON 왕복)로 실행해 eager 모드에서도 직렬화 오류를 드러냄
+        kwargs = json.loads(json.dumps(kwargs))
+        if getattr(settings, 'TASKS_EAGER', False):
+            self(**kwargs)
+            return None
+        return Task.objects.create(name=self.name, kwargs=kwargs, max_attempts=self.max_attempts)
+
+    def delay_on_commit(self, **kwargs):
+        """현재 트랜잭션이 커밋되면 작업을 큐에 넣습니다. (롤백되면 버림)"""
+        transaction.on_commit(lambda: self.delay(**kwargs))
+
+
+def task(name=None, max_attempts=3):
+    """
+    함수를 백그라운드 작업으로 등록하는 데코레이터
+
+    Args:
+        name (str | None): 작업 이름 (기본값: '<모듈>.<함수>')
+        max_attempts (int): 실패 시 재시도를 포함한 최대 실행 횟수
+    """
+    def decorator(func):
+        definition = TaskDefinition(func, name or f'{func.__module__}.{func.__name__}', max_attempts)
+        _REGISTRY[definition.name] = definition
+        return definition
+    return decorator
+
+
+def get_task(name):
+    """이름으로 등록된 작업 조회 (없으면 None)"""
+    return _REGISTRY.get(name)
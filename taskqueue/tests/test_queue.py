@@ -0,0 +1,131 @@
+"""
+작업 큐 테스트
+
+테스트 구성:
+- TestTaskQueue: 큐 저장/eager 실행, 워커 실행·재시도·최종 실패, 멈춘 작업 회수
+- TestRunTasksCommand: run_tasks --once
+"""
+from datetime import datetime, timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from taskqueue.models import Task
+from taskqueue.queue import task
+from taskqueue.worker import LOCK_TIMEOUT, run_pending
+
+CALLS = []
+
+
+@task(name='tests.record')
+def record(value):
+    CALLS.append(value)
+
+
+@task(name='tests.explode', max_attempts=2)
+def explode():
+    raise RuntimeError('boom')
+
+
+@pytest.fixture(autouse=True)
+def queue_mode(settings):
+    """기본은 큐 모드 (eager 테스트만 따로 켬)"""
+    settings.TASKS_EAGER = False
+    CALLS.clear()
+
+
+@pytest.mark.unit
+class TestTaskQueue:
+    """Task 큐 / 워커 테스트"""
+
+    def test_delay_enqueues_and_worker_runs(self, db):
+        """delay는 행만 저장하고, 워커가 실행한 뒤 삭제한다"""
+        queued = record.delay(value=1)
+
+        assert queued.name == 'tests.record'
+        assert queued.kwargs == {'value': 1}
+        assert CALLS == []
+
+        assert run_pending() == 1
+        assert CALLS == [1]
+        assert not Task.objects.exists()
+
+    def test_eager_mode_runs_inline(self, db, settings):
+        """TASKS_EAGER면 큐를 거치지 않고 JSON 왕복한 인자로 바로 실행한다"""
+        settings.TASKS_EAGER = True
+
+        assert record.delay(value=(1, 2)) is None
+        assert CALLS == [[1, 2]]
+        assert not Task.objects.exists()
+        with pytest.raises(TypeError):
+            record.delay(value=object())
+
+    def test_delay_on_commit_waits_for_commit(self, db, django_capture_on_commit_callbacks):
+        """delay_on_commit은 커밋될 때 큐에 넣는다"""
+        with django_capture_on_commit_callbacks(execute=True):
+            record.delay_on_commit(value=2)
+            assert not Task.objects.exists()
+
+        assert Task.objects.filter(name='tests.record').count() == 1
+
+    def test_failed_task_retries_then_fails(self, db):
+        """실패하면 백오프 후 재시도하고, max_attempts를 넘기면 failed로 남는다"""
+        queued = explode.delay()
+
+        run_pending()
+        queued.refresh_from_db()
+        assert queued.status == Task.STATUS_PENDING
+        assert queued.attempts == 1
+        assert queued.run_after > datetime.now()
+        assert 'boom' in queued.last_error
+
+        # 백오프 시간이 지나기 전에는 가져가지 않음
+        assert run_pending() == 0
+
+        Task.objects.filter(pk=queued.pk).update(run_after=datetime.now())
+        run_pending()
+        queued.refresh_from_db()
+        assert queued.status == Task.STATUS_FAILED
+        assert queued.attempts == 2
+
+    def test_unknown_task_fails_without_retry(self, db):
+        """등록되지 않은 작업은 바로 failed"""
+        queued = Task.objects.create(name='tests.missing', kwargs={})
+
+        run_pending()
+
+        queued.refresh_from_db()
+        assert queued.status == Task.STATUS_FAILED
+        assert '등록되지 않은 작업' in queued.last_error
+
+    def test_stale_running_task_is_reclaimed(self, db):
+        """워커가 죽어 실행 중으로 남은 작업은 LOCK_TIMEOUT 뒤 다시 실행한다"""
+        Task.objects.create(
+            name='tests.record', kwargs={'value': 3}, status=Task.STATUS_RUNNING,
+            attempts=1, locked_at=datetime.now() - LOCK_TIMEOUT - timedelta(seconds=1)
+        )
+        Task.objects.create(
+            name='tests.record', kwargs={'value': 4}, status=Task.STATUS_RUNNING,
+            attempts=1, locked_at=datetime.now()
+        )
+
+        assert run_pending() == 1
+        assert CALLS == [3]
+
+
+@pytest.mark.integration
+class TestRunTasksCommand:
+    """run_tasks 커맨드 테스트"""
+
+    def test_once_processes_queue_and_exits(self, db):
+        """--once는 쌓인 작업을 모두 처리하고 종료한다"""
+        for value in range(3):
+            record.delay(value=value)
+        stdout = StringIO()
+
+        call_command('run_tasks', once=True, batch_size=2, stdout=stdout)
+
+        assert CALLS == [0, 1, 2]
+        assert '작업 3건 처리' in stdout.getvalue()
+        assert not Task.objects.exists()
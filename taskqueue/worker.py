@@ -0,0 +1,98 @@
+"""
+작업 큐 워커 로직 (run_tasks 커맨드가 반복 호출)
+
+- 실행할 차례가 된 대기 작업과, 워커가 죽어 LOCK_TIMEOUT 넘게 실행 중으로 남은 작업을 가져옵니다.
+- 성공한 작업은 삭제하고, 실패하면 RETRY_BACKOFF_SECONDS × 2^(시도 횟수 - 1) 뒤에 다시 실행합니다.
+- max_attempts를 다 쓰면 failed 상태로 남겨 관리자 화면에서 확인할 수 있게 합니다.
+"""
+import logging
+import traceback
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.db.models import F, Q
+
+from common.metrics import REGISTRY
+
+from .models import Task
+from .queue import get_task
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 20
+RETRY_BACKOFF_SECONDS = 30
+LOCK_TIMEOUT = timedelta(minutes=10)
+
+tasks_total = REGISTRY.counter(
+    'teammoa_tasks_total',
+    '백그라운드 작업 실행 수',
+    ['name', 'result'],
+)
+
+
+def claim_tasks(limit=BATCH_SIZE):
+    """
+    실행할 작업을 최대 limit개 가져와 실행 중으로 표시합니다.
+
+    다른 워커가 잠근 행은 건너뛰므로(SKIP LOCKED) 워커를 여러 개 띄워도 같은 작업을 두 번 가져가지 않습니다.
+    """
+    now = datetime.now()
+    with transaction.atomic():
+        tasks = list(
+            Task.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=Task.STATUS_PENDING, run_after__lte=now)
+                | Q(status=Task.STATUS_RUNNING, locked_at__lt=now - LOCK_TIMEOUT)
+            )
+            .order_by('run_after', 'id')[:limit]
+        )
+        Task.objects.filter(pk__in=[task.pk for task in tasks]).update(
+            status=Task.STATUS_RUNNING, locked_at=now, attempts=F('attempts') + 1
+        )
+    for task in tasks:
+        task.status = Task.STATUS_RUNNING
+        task.locked_at = now
+        task.attempts += 1
+    return tasks
+
+
+def execute(task):
+    """
+    가져온 작업 하나를 실행하고 결과를 기록합니다.
+
+    Returns:
+        bool: 성공 여부
+    """
+    definition = get_task(task.name)
+    try:
+        if definition is None:
+            raise LookupError(f'등록되지 않은 작업입니다: {task.name}')
+        definition(**task.kwargs)
+    except Exception:
+        logger.exception('작업 실패: %s (id=%s, %s회차)', task.name, task.pk, task.attempts)
+        retry = definition is not None and task.attempts < task.max_attempts
+        Task.objects.filter(pk=task.pk).update(
+            status=Task.STATUS_PENDING if retry else Task.STATUS_FAILED,
+            run_after=datetime.now() + timedelta(seconds=RETRY_BACKOFF_SECONDS * 2 ** (task.attempts - 1)),
+            locked_at=None,
+            last_error=traceback.format_exc()[-4000:]
+        )
+        tasks_total.inc(name=task.name, result='retry' if retry else 'failed')
+        return False
+
+    Task.objects.filter(pk=task.pk).delete()
+    tasks_total.inc(name=task.name, result='success')
+    return True
+
+
+def run_pending(limit=BATCH_SIZE):
+    """
+    대기 작업을 한 묶음 실행합니다.
+
+    Returns:
+        int: 가져온 작업 수 (0이면 큐가 비어 있음)
+    """
+    tasks = claim_tasks(limit)
+    for task in tasks:
+        execute(task)
+    return len(tasks)
@@ -0,0 +1,37 @@
+"""
+팀 변경 피드 정리 Management Command
+
+보관 기간이 지난 TeamChange를 청크 단위로 삭제합니다. (cron으로 하루 1회 실행)
+삭제된 구간부터 이어 읽으려는 클라이언트는 reset 응답을 받고 목록을 다시 조회합니다.
+
+사용법:
+    python manage.py prune_team_changes
+    python manage.py prune_team_changes --days 3  # 3일 기준
+"""
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand
+
+from teams.services import TeamChangeService
+
+
+class Command(BaseCommand):
+    help = '보관 기간이 지난 팀 변경 피드를 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=TeamChangeService.RETENTION_DAYS,
+            help=f'보관 일수 (기본값: {TeamChangeService.RETENTION_DAYS}일)',
+        )
+
+    def handle(self, *args, **options):
+        before = datetime.now() - timedelta(days=options['days'])
+
+        deleted = TeamChangeService().prune_changes(before, progress=self._report)
+
+        self.stdout.write(self.style.SUCCESS(f'✅ 팀 변경 피드 {deleted}건 삭제 (기준: {options["days"]}일)'))
+
+    def _report(self, label, deleted):
+        self.stdout.write(f'  삭제 진행: {deleted}건')
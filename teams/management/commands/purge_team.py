@@ -0,0 +1,42 @@
+"""
+대규모 팀 일괄 삭제 Management Command
+
+데이터가 많이 쌓인 팀을 웹 요청 대신 서버에서 삭제하고 진행 상황을 출력합니다.
+삭제 순서와 방식은 TeamService.purge_team과 같습니다. 첨부파일은 run_tasks 워커가 삭제합니다.
+
+사용법:
+    python manage.py purge_team 42
+    python manage.py purge_team 42 --yes  # 확인 프롬프트 생략
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from teams.models import Team
+from teams.services import TeamService
+
+
+class Command(BaseCommand):
+    help = '팀과 팀에 속한 모든 데이터를 일괄 삭제하고 진행 상황을 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('team_id', type=int, help='삭제할 팀 ID')
+        parser.add_argument('--yes', action='store_true', help='확인 프롬프트 없이 삭제합니다.')
+
+    def handle(self, *args, **options):
+        team = Team.objects.filter(pk=options['team_id']).first()
+        if team is None:
+            raise CommandError(f'팀 {options["team_id"]}이(가) 존재하지 않습니다.')
+
+        if not options['yes']:
+            answer = input(f'"{team.title}" 팀을 삭제합니다. 계속하려면 yes를 입력하세요: ')
+            if answer.strip() != 'yes':
+                raise CommandError('취소했습니다.')
+
+        deleted = TeamService().purge_team(team.id, progress=self._report)
+
+        total = sum(deleted.values())
+        self.stdout.write(self.style.SUCCESS(f'✅ "{team.title}" 팀 삭제 완료 (총 {total}건)'))
+        for label, count in deleted.items():
+            self.stdout.write(f'  {label}: {count}')
+
+    def _report(self, label, deleted):
+        self.stdout.write(f'  {label}: {deleted}건 삭제')
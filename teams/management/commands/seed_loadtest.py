@@ -0,0 +1,215 @@
+"""
+부하 테스트용 데이터 생성 Management Command
+
+로컬 부하 테스트(docs/guides/load-testing/local)에 필요한 사용자/팀/TODO/스케줄/
+게시물/마인드맵을 생성하고, locust가 읽을 manifest JSON을 출력합니다.
+같은 옵션이면 항상 같은 데이터가 생성되어 릴리스 간 수치를 비교할 수 있습니다.
+
+사용법:
+    python manage.py seed_loadtest
+    python manage.py seed_loadtest --teams 5 --members 20 --output loadtest_manifest.json
+    python manage.py seed_loadtest --reset  # 기존 부하 테스트 데이터 삭제 후 재생성
+    python manage.py seed_loadtest --reset --teams 0  # 삭제만
+"""
+import json
+import random
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from accounts.models import User
+from members.models import Todo
+from mindmaps.models import Mindmap, Node, NodeConnection
+from schedules.models import PersonalDaySchedule
+from shares.models import Post
+from teams.models import Milestone, Team, TeamUser
+from teams.services import TeamService
+
+USERNAME_PREFIX = 'loaduser'
+INVITE_CODE_PREFIX = 'LOAD'
+DEFAULT_PASSWORD = 'LoadTest2024!'
+
+
+class Command(BaseCommand):
+    help = '로컬 부하 테스트용 데이터를 생성하고 manifest JSON을 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--teams', type=int, default=3, help='생성할 팀 수 (기본값: 3)')
+        parser.add_argument('--members', type=int, default=20, help='팀당 멤버 수 (기본값: 20)')
+        parser.add_argument('--todos', type=int, default=200, help='팀당 TODO 수 (기본값: 200)')
+        parser.add_argument('--posts', type=int, default=100, help='팀당 게시물 수 (기본값: 100)')
+        parser.add_argument('--nodes', type=int, default=100, help='마인드맵당 노드 수 (기본값: 100)')
+        parser.add_argument('--password', default=DEFAULT_PASSWORD, help='생성 계정 비밀번호')
+        parser.add_argument(
+            '--output',
+            default='loadtest_manifest.json',
+            help='manifest JSON 경로 (기본값: loadtest_manifest.json)',
+        )
+        parser.add_argument('--seed', type=int, default=42, help='난수 시드 (기본값: 42)')
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='기존 부하 테스트 데이터(loaduser*, LOAD* 팀)를 삭제한 후 생성합니다.',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='DEBUG=False 환경에서도 실행합니다.',
+        )
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options['force']:
+            raise CommandError('DEBUG=False 환경입니다. 운영 DB가 아닌지 확인 후 --force 옵션으로 실행하세요.')
+
+        if options['reset']:
+            self._reset()
+
+        if options['teams'] <= 0:
+            return
+
+        if User.objects.filter(username__startswith=USERNAME_PREFIX).exists():
+            raise CommandError('기존 부하 테스트 데이터가 있습니다. --reset 옵션으로 다시 생성하세요.')
+
+        rng = random.Random(options['seed'])
+        with transaction.atomic():
+            manifest = self._seed(rng, options)
+
+        with open(options['output'], 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+        user_count = options['teams'] * options['members']
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ 팀 {options["teams"]}개, 사용자 {user_count}명 생성 완료 → {options["output"]}'
+        ))
+
+    def _reset(self):
+        team_ids = list(Team.objects.filter(invitecode__startswith=INVITE_CODE_PREFIX).values_list('id', flat=True))
+        team_service = TeamService()
+        for team_id in team_ids:
+            team_service.purge_team(team_id)
+        team_count = len(team_ids)
+        deleted_count, _ = User.objects.filter(username__startswith=USERNAME_PREFIX).delete()
+        self.stdout.write(f'기존 부하 테스트 데이터 삭제: 팀 {team_count}개, 사용자 및 연관 객체 {deleted_count}건')
+
+    def _seed(self, rng, options):
+        password = make_password(options['password'])
+        today = date.today()
+        week_start = today - timedelta(days=today.weekday())
+
+        manifest = {
+            'password': options['password'],
+            'teams': [],
+        }
+
+        for team_index in range(options['teams']):
+            usernames = [
+                f'{USERNAME_PREFIX}{team_index * options["members"] + i + 1}'
+                for i in range(options['members'])
+            ]
+            User.objects.bulk_create([
+                User(
+                    username=username,
+                    email=f'{username}@loadtest.teammoa.com',
+                    nickname=username,
+                    password=password,
+                    is_active=True,
+                )
+                for username in usernames
+            ])
+            users = list(User.objects.filter(username__in=usernames).order_by('id'))
+
+            team = Team.objects.create(
+                title=f'LoadTest Team {team_index + 1}',
+                maxuser=len(users),
+                currentuser=len(users),
+                host=users[0],
+                invitecode=f'{INVITE_CODE_PREFIX}{team_index + 1:04d}',
+                teampasswd='1234',
+                introduction='부하 테스트용 팀',
+            )
+            TeamUser.objects.bulk_create([TeamUser(team=team, user=user) for user in users])
+            team_users = list(TeamUser.objects.filter(team=team).order_by('id'))
+
+            milestones = self._seed_team_content(rng, team, team_users, week_start, options)
+            mindmap, node_ids = self._seed_mindmap(rng, team, options['nodes'])
+
+            manifest['teams'].append({
+                'team_id': team.id,
+                'usernames': usernames,
+                'milestone_ids': [m.id for m in milestones],
+                'mindmap_id': mindmap.id,
+                'node_ids': node_ids,
+                'week_start': week_start.isoformat(),
+                'week_end': (week_start + timedelta(days=6)).isoformat(),
+            })
+
+        return manifest
+
+    def _seed_team_content(self, rng, team, team_users, week_start, options):
+        Milestone.objects.bulk_create([
+            Milestone(
+                team=team,
+                title=f'마일스톤 {i + 1}',
+                startdate=week_start,
+                enddate=week_start + timedelta(days=14 * (i + 1)),
+            )
+            for i in range(5)
+        ])
+        milestones = list(Milestone.objects.filter(team=team).order_by('id'))
+
+        Todo.objects.bulk_create([
+            Todo(
+                team=team,
+                content=f'부하 테스트 할일 {i + 1}',
+                assignee=None if rng.random() < 0.2 else rng.choice(team_users),
+                milestone=rng.choice(milestones) if rng.random() < 0.5 else None,
+                is_completed=rng.random() < 0.4,
+                order=i,
+            )
+            for i in range(options['todos'])
+        ], batch_size=1000)
+
+        PersonalDaySchedule.objects.bulk_create([
+            PersonalDaySchedule(
+                owner=team_user,
+                date=week_start + timedelta(days=offset),
+                available_hours=sorted(rng.sample(range(24), rng.randint(0, 12))),
+            )
+            for team_user in team_users
+            for offset in range(14)
+        ], batch_size=1000)
+
+        Post.objects.bulk_create([
+            Post(
+                team=team,
+                teamuser=rng.choice(team_users),
+                title=f'부하 테스트 게시물 {i + 1}',
+                article='부하 테스트용 게시물 본문입니다. ' * 10,
+            )
+            for i in range(options['posts'])
+        ], batch_size=1000)
+
+        return milestones
+
+    def _seed_mindmap(self, rng, team, node_count):
+        mindmap = Mindmap.objects.create(team=team, title='LoadTest Mindmap')
+        Node.objects.bulk_create([
+            Node(
+                mindmap=mindmap,
+                posX=rng.randint(0, 3000),
+                posY=rng.randint(0, 3000),
+                title=f'노드 {i + 1}',
+                content='부하 테스트 노드',
+            )
+            for i in range(node_count)
+        ], batch_size=1000)
+        node_ids = list(Node.objects.filter(mindmap=mindmap).order_by('id').values_list('id', flat=True))
+
+        NodeConnection.objects.bulk_create([
+            NodeConnection(mindmap=mindmap, from_node_id=node_ids[rng.randrange(i)], to_node_id=node_ids[i])
+            for i in range(1, len(node_ids))
+        ], batch_size=1000)
+        return mindmap, node_ids
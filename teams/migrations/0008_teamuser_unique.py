@@ -0,0 +1,37 @@
+# Generated by Django 5.2.4 on 2026-10-19 10:12
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def delete_duplicate_memberships(apps, schema_editor):
+    """같은 팀·사용자 멤버십은 가장 먼저 가입한 것만 남기고 팀 인원수를 다시 맞춤"""
+    TeamUser = apps.get_model('teams', 'TeamUser')
+    Team = apps.get_model('teams', 'Team')
+    duplicates = (
+        TeamUser.objects.values('team_id', 'user_id')
+        .annotate(first_id=Min('id'), rows=Count('id'))
+        .filter(rows__gt=1)
+    )
+    team_ids = set()
+    for row in duplicates.iterator(chunk_size=1000):
+        TeamUser.objects.filter(team_id=row['team_id'], user_id=row['user_id']).exclude(id=row['first_id']).delete()
+        team_ids.add(row['team_id'])
+
+    for team_id in team_ids:
+        Team.objects.filter(pk=team_id).update(currentuser=TeamUser.objects.filter(team_id=team_id).count())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0007_add_progress_mode_to_milestone'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_memberships, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='teamuser',
+            constraint=models.UniqueConstraint(fields=('team', 'user'), name='team_user_unique'),
+        ),
+    ]
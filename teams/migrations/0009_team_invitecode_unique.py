@@ -0,0 +1,45 @@
+# Generated by Django 5.2.4 on 2026-10-20 02:03
+
+import base64
+import codecs
+import uuid
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def regenerate_duplicate_invite_codes(apps, schema_editor):
+    """초대 코드가 겹치는 팀은 가장 먼저 만든 팀만 코드를 유지하고 나머지는 새로 발급"""
+    Team = apps.get_model('teams', 'Team')
+    duplicate_codes = (
+        Team.objects.values('invitecode')
+        .annotate(teams=Count('id'))
+        .filter(teams__gt=1)
+        .values_list('invitecode', flat=True)
+    )
+    used_codes = set(Team.objects.values_list('invitecode', flat=True))
+    for code in list(duplicate_codes):
+        for team in Team.objects.filter(invitecode=code).order_by('id')[1:]:
+            new_code = code
+            while new_code in used_codes:
+                new_code = base64.urlsafe_b64encode(
+                    codecs.encode(uuid.uuid4().bytes, 'base64').rstrip()
+                ).decode()[:16]
+            used_codes.add(new_code)
+            Team.objects.filter(pk=team.pk).update(invitecode=new_code)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0008_teamuser_unique'),
+    ]
+
+    operations = [
+        migrations.RunPython(regenerate_duplicate_invite_codes, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='team',
+            name='invitecode',
+            field=models.CharField(max_length=16, unique=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-20 03:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def create_versions(apps, schema_editor):
+    """기존 팀마다 버전 행 생성"""
+    Team = apps.get_model('teams', 'Team')
+    TeamDataVersion = apps.get_model('teams', 'TeamDataVersion')
+    team_ids = Team.objects.values_list('id', flat=True).order_by('id')
+    batch = []
+    for team_id in team_ids.iterator(chunk_size=1000):
+        batch.append(TeamDataVersion(team_id=team_id))
+        if len(batch) >= 1000:
+            TeamDataVersion.objects.bulk_create(batch)
+            batch = []
+    TeamDataVersion.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0009_team_invitecode_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TeamDataVersion',
+            fields=[
+                ('team', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='data_version', serialize=False, to='teams.team')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(create_versions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.4 on 2026-10-20 05:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0010_teamdataversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='teamdataversion',
+            name='pruned_seq',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='TeamChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('seq', models.PositiveBigIntegerField()),
+                ('entity', models.CharField(choices=[('team', '팀'), ('member', '멤버'), ('milestone', '마일스톤'), ('todo', 'TODO'), ('post', '게시글'), ('schedule', '스케줄')], max_length=16)),
+                ('entity_id', models.PositiveBigIntegerField()),
+                ('op', models.CharField(choices=[('created', '생성'), ('updated', '수정'), ('deleted', '삭제')], max_length=8)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='teams.team')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('team', 'seq'), name='team_change_seq_unique')],
+            },
+        ),
+    ]
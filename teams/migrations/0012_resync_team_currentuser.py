@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-20 07:26
+
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def resync_currentuser(apps, schema_editor):
+    """모든 팀의 인원수를 실제 멤버십 수로 다시 맞춤 (탈퇴 시 줄지 않고 남은 값 정리)"""
+    TeamUser = apps.get_model('teams', 'TeamUser')
+    Team = apps.get_model('teams', 'Team')
+    member_count = (
+        TeamUser.objects.filter(team_id=OuterRef('pk'))
+        .values('team_id')
+        .annotate(rows=Count('id'))
+        .values('rows')
+    )
+    Team.objects.update(currentuser=Coalesce(Subquery(member_count), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0011_teamchange'),
+    ]
+
+    operations = [
+        migrations.RunPython(resync_currentuser, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,8 @@
-from django.db import models
+from django.db import models, transaction
 from django.core.exceptions import ValidationError
 
+from .signals import team_changed
+
 # Create your models here.
 
 
@@ -22,7 +24,7 @@ class Team(models.Model):
     
     # milestone은 별도 Milestone 모델로 관리됨
 
-    invitecode = models.CharField(max_length=16)
+    invitecode = models.CharField(max_length=16, unique=True)
     teampasswd = models.TextField()
     introduction = models.TextField()
     #스케줄 - TeamSchedule 모델 쪽에서 Foreignkey
@@ -57,10 +59,145 @@ class Team(models.Model):
     def __str__(self):
         return self.title
 
+class TeamDataVersion(models.Model):
+    """
+    팀 데이터 변경 카운터 (API 조건부 GET의 ETag 기준)
+
+    팀에 속한 데이터(멤버/마일스톤/TODO/스케줄/마인드맵 목록)를 바꾸는 서비스 메서드가
+    같은 트랜잭션 안에서 bump()로 올립니다. Team 행과 분리해 Team.save()가 값을 덮어쓰지 않게 합니다.
+    마인드맵 내용 편집(노드/연결선/댓글)은 Mindmap.version만 올려 팀의 다른 API ETag를 유지합니다.
+    """
+    team = models.OneToOneField('Team', on_delete=models.CASCADE, primary_key=True, related_name='data_version')
+    version = models.PositiveBigIntegerField(default=0)
+    # 보관 기간이 지나 삭제한 TeamChange의 마지막 seq (이보다 앞에서 이어 읽으려면 전체를 다시 받아야 함)
+    pruned_seq = models.PositiveBigIntegerField(default=0)
+
+    @classmethod
+    def bump(cls, team_id):
+        """팀 데이터 버전을 1 올립니다. (행이 없던 팀은 만들고 올림)"""
+        if cls.objects.filter(team_id=team_id).update(version=models.F('version') + 1):
+            return
+        cls.objects.get_or_create(team_id=team_id)
+        cls.objects.filter(team_id=team_id).update(version=models.F('version') + 1)
+
+    @classmethod
+    def bump_many(cls, team_ids):
+        """여러 팀의 데이터 버전을 한 번에 1씩 올립니다."""
+        team_ids = list(team_ids)
+        if not team_ids:
+            return
+        cls.objects.bulk_create([cls(team_id=team_id) for team_id in team_ids], ignore_conflicts=True)
+        cls.objects.filter(team_id__in=team_ids).update(version=models.F('version') + 1)
+
+    @classmethod
+    def current(cls, team_id):
+        """팀 데이터 버전 (한 번도 바뀌지 않았으면 0)"""
+        return cls.objects.filter(team_id=team_id).values_list('version', flat=True).first() or 0
+
+
+class TeamChange(models.Model):
+    """
+    팀 변경 피드 (클라이언트 폴링 / 서버 캐시 무효화용)
+
+    팀 데이터를 바꾸는 서비스 메서드가 record()로 남깁니다. seq는 TeamDataVersion 카운터 값이라
+    팀 안에서 단조 증가하고, 버전 행 잠금 순서대로 커밋되므로 seq > since 조회로 빠짐없이 이어 읽을 수 있습니다.
+    마인드맵 편집처럼 버전만 올리는 쓰기가 있어 seq가 연속이 아닐 수 있습니다.
+    커밋 후 teams.signals.team_changed를 보냅니다.
+    """
+    ENTITY_TEAM = 'team'
+    ENTITY_MEMBER = 'member'  # entity_id: TeamUser ID
+    ENTITY_MILESTONE = 'milestone'
+    ENTITY_TODO = 'todo'
+    ENTITY_POST = 'post'
+    ENTITY_SCHEDULE = 'schedule'  # entity_id: 스케줄 주인의 TeamUser ID
+    ENTITY_CHOICES = [
+        (ENTITY_TEAM, '팀'),
+        (ENTITY_MEMBER, '멤버'),
+        (ENTITY_MILESTONE, '마일스톤'),
+        (ENTITY_TODO, 'TODO'),
+        (ENTITY_POST, '게시글'),
+        (ENTITY_SCHEDULE, '스케줄'),
+    ]
+
+    OP_CREATED = 'created'
+    OP_UPDATED = 'updated'
+    OP_DELETED = 'deleted'
+    OP_CHOICES = [
+        (OP_CREATED, '생성'),
+        (OP_UPDATED, '수정'),
+        (OP_DELETED, '삭제'),
+    ]
+
+    team = models.ForeignKey('Team', on_delete=models.CASCADE, related_name='changes')
+    seq = models.PositiveBigIntegerField()
+    entity = models.CharField(max_length=16, choices=ENTITY_CHOICES)
+    entity_id = models.PositiveBigIntegerField()
+    op = models.CharField(max_length=8, choices=OP_CHOICES)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        constraints = [
+            # seq > since 범위 조회 인덱스 겸용
+            models.UniqueConstraint(fields=['team', 'seq'], name='team_change_seq_unique'),
+        ]
+
+    @classmethod
+    def record(cls, team_id, entity, entity_id, op):
+        """팀 데이터 버전을 올리고 그 값을 seq로 변경을 기록합니다."""
+        with transaction.atomic():
+            TeamDataVersion.bump(team_id)
+            # 버전 행은 이 트랜잭션이 잠그고 있으므로 방금 올린 값을 읽음
+            change = cls.objects.create(
+                team_id=team_id, seq=TeamDataVersion.current(team_id),
+                entity=entity, entity_id=entity_id, op=op
+            )
+        cls._send_on_commit([change])
+        return change
+
+    @classmethod
+    def record_team_updates(cls, team_ids):
+        """여러 팀의 팀 정보 변경(op=updated)을 한 번에 기록합니다."""
+        team_ids = list(team_ids)
+        if not team_ids:
+            return []
+        with transaction.atomic():
+            TeamDataVersion.bump_many(team_ids)
+            versions = TeamDataVersion.objects.filter(team_id__in=team_ids).values_list('team_id', 'version')
+            changes = cls.objects.bulk_create([
+                cls(team_id=team_id, seq=version, entity=cls.ENTITY_TEAM, entity_id=team_id, op=cls.OP_UPDATED)
+                for team_id, version in versions
+            ])
+        cls._send_on_commit(changes)
+        return changes
+
+    @classmethod
+    def _send_on_commit(cls, changes):
+        def send():
+            for change in changes:
+                team_changed.send(sender=cls, change=change)
+        transaction.on_commit(send)
+
+    def as_dict(self):
+        """피드 응답 형식"""
+        return {
+            'seq': self.seq,
+            'entity': self.entity,
+            'id': self.entity_id,
+            'op': self.op,
+            'created_at': self.created_at,
+        }
+
+
 class TeamUser(models.Model):
     team = models.ForeignKey('Team', on_delete=models.CASCADE)
     user = models.ForeignKey('accounts.User', on_delete=models.CASCADE)
 
+    class Meta:
+        constraints = [
+            # 동시 가입 요청이 같은 멤버십을 두 번 만들지 않도록 DB에서 보장
+            models.UniqueConstraint(fields=['team', 'user'], name='team_user_unique'),
+        ]
+
     def __str__(self):  # admin에서 표시될 user 필드 정보 설정
         return self.user.nickname
 
@@ -90,6 +227,14 @@ class Milestone(models.Model):
         ('minimal', '미미')
     ], default='medium')
 
+    # 상태 표시명 (status_display / 목록 API 공용)
+    STATUS_DISPLAY = {
+        'not_started': '시작 전',
+        'in_progress': '진행 중',
+        'completed': '완료됨',
+        'overdue': '지연됨'
+    }
+
     class Meta:
         ordering = ['-priority', 'enddate']
 
@@ -101,17 +246,21 @@ class Milestone(models.Model):
         if today_date is None:
             from datetime import date
             today_date = date.today()
-        
+        return self.compute_status(self.startdate, self.enddate, self.progress_percentage, today_date)
+
+    @staticmethod
+    def compute_status(startdate, enddate, progress_percentage, today_date):
+        """필드 값만으로 상태 계산 (values() 조회 결과에도 사용)"""
         # 100% 완료된 경우
-        if self.progress_percentage >= 100:
+        if progress_percentage >= 100:
             return 'completed'
         
         # 아직 시작 전
-        if today_date < self.startdate:
+        if today_date < startdate:
             return 'not_started'
         
         # 종료일이 지났지만 100% 미완료
-        if today_date > self.enddate:
+        if today_date > enddate:
             return 'overdue'
         
         # 진행 기간 내에 있고 진행 중
@@ -120,14 +269,7 @@ class Milestone(models.Model):
     @property
     def status_display(self):
         """상태를 한국어로 표시"""
-        status = self.get_status()
-        status_map = {
-            'not_started': '시작 전',
-            'in_progress': '진행 중',
-            'completed': '완료됨',
-            'overdue': '지연됨'
-        }
-        return status_map.get(status, '알 수 없음')
+        return self.STATUS_DISPLAY.get(self.get_status(), '알 수 없음')
 
     def calculate_progress_from_todos(self):
         """연결된 TODO들의 완료율을 계산하여 진행률 반환 (0-100)"""
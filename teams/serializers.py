@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from .models import Team, TeamUser, Milestone
+from .services import TeamChangeService
 from datetime import date
 
 User = get_user_model()
@@ -229,4 +230,11 @@ class TeamMemberSerializer(serializers.ModelSerializer):
 
     def get_is_host(self, obj):
         """팀장 여부 반환"""
-        return obj.team.host == obj.user
\ No newline at end of file
+        return obj.team.host == obj.user
+
+
+class TeamChangeQuerySerializer(serializers.Serializer):
+    """팀 변경 피드 조회 파라미터 직렬화"""
+    since = serializers.IntegerField(min_value=0, required=False)
+    timeout = serializers.IntegerField(min_value=0, max_value=TeamChangeService.MAX_WAIT,
+                                       default=TeamChangeService.MAX_WAIT)
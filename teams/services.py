@@ -1,11 +1,23 @@
 import uuid
+import time
+import asyncio
 import base64
 import codecs
 from datetime import datetime, date
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db.models import Count, Exists, F, OuterRef, Subquery, Window
+from django.db.models.functions import RowNumber
 from django.shortcuts import get_object_or_404
-from .models import Team, TeamUser, Milestone
+from common.deletion import raw_delete_in_chunks
+from members.models import Todo
+from mindmaps.models import Mindmap
+from mindmaps.services import MindmapService
+from schedules.models import PersonalDaySchedule
+from shares.models import Post
+from shares.tasks import remove_attachment_files_on_commit
+from .models import Team, TeamChange, TeamDataVersion, TeamUser, Milestone
 
 
 class TeamServiceException(Exception):
@@ -23,6 +35,12 @@ class TeamService:
         'TEAM_NOT_FOUND': '존재하지 않는 팀입니다.',
         'INVALID_CODE': '유효하지 않은 팀 코드입니다.'
     }
+
+    # 초대 코드 → 팀 ID 캐시 (없는 코드는 INVALID_INVITE_CODE로 더 짧게 캐시)
+    INVITE_CODE_CACHE_KEY = 'team_invite_code:{code}'
+    INVITE_CODE_CACHE_TIMEOUT = 60 * 5
+    INVALID_INVITE_CODE = 0
+    INVALID_INVITE_CODE_CACHE_TIMEOUT = 60
     
     @transaction.atomic
     def create_team(self, host_user, title, maxuser, teampasswd, introduction):
@@ -61,12 +79,21 @@ class TeamService:
         
         # 호스트를 멤버로 추가
         TeamUser.objects.create(team=team, user=host_user)
+        TeamDataVersion.objects.create(team=team)
+
+        # 없는 코드로 캐시돼 있었다면 비움
+        cache_key = self.INVITE_CODE_CACHE_KEY.format(code=invite_code)
+        transaction.on_commit(lambda: cache.delete(cache_key))
         
         return team
     
     def verify_team_code(self, invite_code, user):
         """
         팀 코드를 검증하고 팀 정보를 반환합니다.
+
+        팀/호스트/현재 인원/가입 여부를 쿼리 한 번으로 조회합니다.
+        코드 → 팀 ID 매핑은 짧게 캐시하고, 존재하지 않는 코드도 잠시 캐시해
+        무작위 코드 대입 요청이 매번 DB까지 내려오지 않게 합니다.
         
         Args:
             invite_code: 팀 초대 코드
@@ -81,27 +108,42 @@ class TeamService:
         if not invite_code:
             raise ValueError('팀 코드를 입력해주세요.')
         
-        # 팀 조회
-        try:
-            team = Team.objects.get(invitecode=invite_code.strip())
-        except Team.DoesNotExist:
+        # 팀 조회 (캐시된 ID가 있으면 PK 조회, 코드가 바뀌었거나 팀이 삭제됐으면 코드로 재조회)
+        invite_code = invite_code.strip()
+        cache_key = self.INVITE_CODE_CACHE_KEY.format(code=invite_code)
+        cached_team_id = cache.get(cache_key)
+        if cached_team_id == self.INVALID_INVITE_CODE:
             raise ValueError(self.ERROR_MESSAGES['INVALID_CODE'])
+
+        teams = Team.objects.select_related('host').annotate(
+            member_count=Count('teamuser'),
+            is_member=Exists(TeamUser.objects.filter(team=OuterRef('pk'), user=user)),
+        )
+        team = None
+        if cached_team_id is not None:
+            team = teams.filter(pk=cached_team_id, invitecode=invite_code).first()
+        if team is None:
+            team = teams.filter(invitecode=invite_code).first()
+            if team is None:
+                cache.set(cache_key, self.INVALID_INVITE_CODE, self.INVALID_INVITE_CODE_CACHE_TIMEOUT)
+                raise ValueError(self.ERROR_MESSAGES['INVALID_CODE'])
+            cache.set(cache_key, team.id, self.INVITE_CODE_CACHE_TIMEOUT)
         
         # 중복 가입 체크
-        if TeamUser.objects.filter(team=team, user=user).exists():
+        if team.is_member:
             raise ValueError(self.ERROR_MESSAGES['ALREADY_MEMBER'])
         
         # 인원 초과 체크
-        current_member_count = team.get_current_member_count()
-        if current_member_count >= team.maxuser:
+        if team.member_count >= team.maxuser:
             raise ValueError(self.ERROR_MESSAGES['TEAM_FULL'])
         
+        host = team.host
         return {
             'id': team.id,
             'title': team.title,
-            'current_members': current_member_count,
+            'current_members': team.member_count,
             'maxuser': team.maxuser,
-            'host_name': team.host.nickname if team.host.nickname else team.host.username,
+            'host_name': (host.nickname or host.username) if host else None,
             'introduction': team.introduction if team.introduction else None
         }
     
@@ -109,6 +151,10 @@ class TeamService:
     def join_team(self, user, team_id, password):
         """
         팀에 가입 처리를 수행합니다.
+
+        동시 가입에도 안전하도록 인원수는 조건부 UPDATE로 먼저 확보하고(팀 행 잠금),
+        멤버십 중복은 TeamUser (team, user) 유니크 제약으로 막습니다.
+        실패하면 트랜잭션이 롤백되어 확보한 자리도 되돌아갑니다.
         
         Args:
             user: 가입하려는 사용자
@@ -134,27 +180,41 @@ class TeamService:
         if team.teampasswd != password.strip():
             raise ValueError(self.ERROR_MESSAGES['INVALID_PASSWORD'])
         
-        # 중복 가입 재확인
-        if TeamUser.objects.filter(team=team, user=user).exists():
-            raise ValueError(self.ERROR_MESSAGES['ALREADY_MEMBER'])
-        
-        # 인원 초과 재확인
-        current_member_count = team.get_current_member_count()
-        if current_member_count >= team.maxuser:
+        # 인원 확보 (조건부 UPDATE 한 번, 커밋까지 팀 행 잠금)
+        if not self._reserve_member_slot(team.id):
+            if TeamUser.objects.filter(team=team, user=user).exists():
+                raise ValueError(self.ERROR_MESSAGES['ALREADY_MEMBER'])
             raise ValueError(self.ERROR_MESSAGES['TEAM_FULL'])
+        team.currentuser += 1
         
-        # 팀 가입 처리
-        TeamUser.objects.create(team=team, user=user)
-        
-        # 현재 인원수 업데이트
-        team.currentuser = team.get_current_member_count()
-        team.save()
+        # 팀 가입 처리 (중복 가입은 유니크 제약 위반 → 확보한 자리와 함께 롤백)
+        try:
+            with transaction.atomic():
+                team_user = TeamUser.objects.create(team=team, user=user)
+        except IntegrityError:
+            raise ValueError(self.ERROR_MESSAGES['ALREADY_MEMBER'])
+        TeamChange.record(team.id, TeamChange.ENTITY_MEMBER, team_user.id, TeamChange.OP_CREATED)
         
         return team
     
     def get_user_teams(self, user):
         """사용자가 가입한 모든 팀을 반환합니다."""
         return Team.objects.filter(members=user).order_by('id')
+
+    def get_user_team_rows(self, user):
+        """목록 API용 팀 목록을 TeamListSerializer와 같은 형태의 dict로 반환합니다."""
+        return list(
+            Team.objects.filter(members=user).order_by('id').values(
+                'id', 'title', 'introduction', 'maxuser', 'currentuser',
+                host_username=F('host__username'), host_nickname=F('host__nickname')
+            )
+        )
+
+    async def aget_user_teams(self, user):
+        """get_user_teams의 async 버전 (async view용, 호스트 정보 포함 리스트 반환)"""
+        return [
+            team async for team in Team.objects.filter(members=user).select_related('host').order_by('id')
+        ]
     
     def get_team_statistics(self, team, milestones=None):
         """
@@ -226,10 +286,52 @@ class TeamService:
             raise ValueError('팀을 해체할 권한이 없습니다.')
 
         team_title = team.title
-        team.delete()
+        self.purge_team(team.id)
 
         return team_title
 
+    @transaction.atomic
+    def purge_team(self, team_id, progress=None):
+        """
+        팀과 팀에 속한 모든 데이터를 의존 순서대로 청크 단위 일괄 삭제합니다. (권한 검증 없음)
+
+        team.delete()는 Collector가 노드/TODO/게시물/스케줄을 전부 메모리에 올려
+        대규모 팀에서 워커 타임아웃을 넘기므로, 참조하는 쪽부터 DELETE만 실행합니다.
+        마인드맵 → TODO → 게시물 → 개인 스케줄 → 마일스톤 → 팀 멤버 → 변경 피드 → 데이터 버전 → 팀
+        게시물 첨부파일은 커밋 후 작업 큐에서 삭제됩니다.
+
+        Args:
+            team_id: 삭제할 팀 ID
+            progress (callable | None): 삭제 청크마다 progress(모델 label, 누적 삭제 수) 호출
+
+        Returns:
+            dict: {모델 label: 삭제된 행 수}
+        """
+        team = Team.objects.select_for_update().filter(pk=team_id).first()
+        if team is None:
+            raise ValueError(self.ERROR_MESSAGES['TEAM_NOT_FOUND'])
+
+        mindmap_ids = Mindmap.objects.filter(team_id=team_id).values_list('id', flat=True)
+        deleted = MindmapService().purge_mindmaps(mindmap_ids, progress=progress)
+
+        posts = Post.objects.filter(team_id=team_id)
+        remove_attachment_files_on_commit(posts.exclude(upload_files='').values_list('upload_files', flat=True))
+
+        querysets = (
+            Todo.objects.filter(team_id=team_id),
+            posts,
+            PersonalDaySchedule.objects.filter(owner__team_id=team_id),
+            Milestone.objects.filter(team_id=team_id),
+            TeamUser.objects.filter(team_id=team_id),
+            TeamChange.objects.filter(team_id=team_id),
+            TeamDataVersion.objects.filter(team_id=team_id),
+            Team.objects.filter(pk=team_id),
+        )
+        for queryset in querysets:
+            deleted[queryset.model._meta.label] = raw_delete_in_chunks(queryset, progress=progress)
+
+        return deleted
+
     @transaction.atomic
     def remove_member(self, team_id, target_user_id, requesting_user):
         """
@@ -271,11 +373,13 @@ class TeamService:
 
         # 멤버 제거
         username = target_user.nickname if target_user.nickname else target_user.username
+        team_user_id = team_user.id
         team_user.delete()
 
         # currentuser 업데이트
-        team.currentuser = team.get_current_member_count()
-        team.save()
+        self._release_member_slot(team.id)
+        team.currentuser = max(team.currentuser - 1, 0)
+        TeamChange.record(team.id, TeamChange.ENTITY_MEMBER, team_user_id, TeamChange.OP_DELETED)
 
         action_type = 'leave' if is_self else 'remove'
 
@@ -296,6 +400,25 @@ class TeamService:
         if not teampasswd or not teampasswd.strip():
             raise ValueError('팀 비밀번호를 입력해주세요.')
     
+    def _reserve_member_slot(self, team_id):
+        """
+        자리가 남아 있으면 currentuser를 1 늘립니다.
+
+        UPDATE ... SET currentuser = currentuser + 1 WHERE currentuser < maxuser
+        한 번으로 검사와 증가를 함께 처리하므로, 동시에 가입해도 maxuser를 넘지 않습니다.
+        Team.save()의 full_clean(전 필드 검증 + 팀원 COUNT)을 거치지 않습니다.
+
+        Returns:
+            bool: 자리를 확보했으면 True, 가득 찼으면 False
+        """
+        return Team.objects.filter(
+            pk=team_id, currentuser__lt=F('maxuser')
+        ).update(currentuser=F('currentuser') + 1) == 1
+
+    def _release_member_slot(self, team_id):
+        """currentuser를 1 줄입니다. (0 미만으로 내려가지 않음)"""
+        Team.objects.filter(pk=team_id, currentuser__gt=0).update(currentuser=F('currentuser') - 1)
+
     def _generate_invite_code(self):
         """고유한 초대 코드를 생성합니다."""
         return base64.urlsafe_b64encode(
@@ -306,6 +429,7 @@ class TeamService:
     def transfer_ownership_on_user_deactivation(self, user):
         """
         사용자 탈퇴 시 소유 팀의 호스트 권한을 자동 이전합니다.
+        소유 팀 수와 관계없이 후보 조회 1회 + 일괄 갱신으로 처리합니다.
 
         전략:
         1. 가장 오래된 멤버에게 자동 승계 (TeamUser.id 오름차순)
@@ -317,32 +441,70 @@ class TeamService:
         Returns:
             dict: 처리 결과 (이전된 팀 수, 삭제된 팀 수)
         """
-        owned_teams = Team.objects.filter(host=user)
-        transferred_count = 0
-        deleted_count = 0
-
-        for team in owned_teams:
-            # 다음 호스트 후보 찾기 (자신 제외, 가입일 순)
-            next_host_membership = TeamUser.objects.filter(team=team)\
-                                                   .exclude(user=user)\
-                                                   .order_by('id')\
-                                                   .first()
-
-            if next_host_membership:
-                # 호스트 자동 승계
-                team.host = next_host_membership.user
-                team.save()
-                transferred_count += 1
-            else:
-                # 혼자인 팀은 삭제
-                team.delete()
-                deleted_count += 1
+        owned_team_ids = list(Team.objects.filter(host=user).values_list('id', flat=True))
+        if not owned_team_ids:
+            return {'transferred': 0, 'deleted': 0}
+
+        # 팀별 다음 호스트 후보를 한 번에 조회 (자신 제외, 팀 안에서 가입 순 첫 번째)
+        successors = dict(
+            TeamUser.objects.filter(team_id__in=owned_team_ids)
+            .exclude(user=user)
+            .annotate(rank=Window(RowNumber(), partition_by=[F('team_id')], order_by=F('id').asc()))
+            .filter(rank=1)
+            .values_list('team_id', 'user_id')
+        )
+
+        # 호스트 자동 승계 (host만 바뀌므로 full_clean 없이 일괄 갱신)
+        Team.objects.bulk_update(
+            [Team(id=team_id, host_id=user_id) for team_id, user_id in successors.items()],
+            ['host'],
+            batch_size=500
+        )
+        TeamChange.record_team_updates(successors)
+
+        # 혼자인 팀은 삭제
+        orphan_team_ids = [team_id for team_id in owned_team_ids if team_id not in successors]
+        for team_id in orphan_team_ids:
+            self.purge_team(team_id)
 
         return {
-            'transferred': transferred_count,
-            'deleted': deleted_count
+            'transferred': len(successors),
+            'deleted': len(orphan_team_ids)
         }
 
+    @transaction.atomic
+    def record_member_profile_update(self, user):
+        """
+        사용자 프로필(닉네임 등) 변경을 소속 팀마다 멤버 수정으로 기록합니다.
+        팀 응답에 작성자/담당자 닉네임이 들어가므로 팀 데이터 버전(ETag)도 함께 오릅니다.
+
+        Args:
+            user: 프로필을 바꾼 사용자
+        """
+        for team_user_id, team_id in TeamUser.objects.filter(user=user).values_list('id', 'team_id'):
+            TeamChange.record(team_id, TeamChange.ENTITY_MEMBER, team_user_id, TeamChange.OP_UPDATED)
+
+    @transaction.atomic
+    def leave_all_teams_on_user_deactivation(self, user):
+        """
+        사용자 탈퇴 시 남은 멤버십을 모두 해제합니다.
+        remove_member와 같이 팀마다 멤버십을 지우고 currentuser를 줄인 뒤 변경 피드에 남깁니다.
+        (소유 팀은 transfer_ownership_on_user_deactivation으로 먼저 정리)
+
+        Args:
+            user: 탈퇴하는 사용자
+
+        Returns:
+            int: 해제된 멤버십 수
+        """
+        memberships = list(TeamUser.objects.filter(user=user).values_list('id', 'team_id'))
+        for team_user_id, team_id in memberships:
+            TeamUser.objects.filter(pk=team_user_id).delete()
+            self._release_member_slot(team_id)
+            TeamChange.record(team_id, TeamChange.ENTITY_MEMBER, team_user_id, TeamChange.OP_DELETED)
+
+        return len(memberships)
+
     @transaction.atomic
     def transfer_host(self, team_id, current_host, new_host_user_id):
         """
@@ -380,9 +542,10 @@ class TeamService:
         if not TeamUser.objects.filter(team=team, user=new_host).exists():
             raise ValueError('팀 멤버에게만 권한을 양도할 수 있습니다.')
 
-        # 호스트 변경
+        # 호스트 변경 (host만 바뀌므로 full_clean 없이 갱신)
+        Team.objects.filter(pk=team.pk).update(host=new_host)
         team.host = new_host
-        team.save()
+        TeamChange.record(team.id, TeamChange.ENTITY_TEAM, team.id, TeamChange.OP_UPDATED)
 
         return team
 
@@ -432,6 +595,7 @@ class MilestoneService:
             priority=priority,
             progress_mode=progress_mode
         )
+        TeamChange.record(team.id, TeamChange.ENTITY_MILESTONE, milestone.id, TeamChange.OP_CREATED)
 
         return milestone
     
@@ -525,6 +689,7 @@ class MilestoneService:
                 updated_fields.append('완료 상태')
         
         milestone.save()
+        TeamChange.record(milestone.team_id, TeamChange.ENTITY_MILESTONE, milestone.id, TeamChange.OP_UPDATED)
         return milestone, updated_fields
     
     def delete_milestone(self, milestone_id, team):
@@ -541,6 +706,7 @@ class MilestoneService:
         milestone = get_object_or_404(Milestone, pk=milestone_id, team=team)
         milestone_title = milestone.title
         milestone.delete()
+        TeamChange.record(milestone.team_id, TeamChange.ENTITY_MILESTONE, milestone_id, TeamChange.OP_DELETED)
         return milestone_title
     
     def get_team_milestones(self, team, order_by=None):
@@ -576,6 +742,46 @@ class MilestoneService:
 
         return queryset
     
+    def get_team_milestone_rows(self, team, order_by=None):
+        """
+        목록 API용 마일스톤 목록을 MilestoneSerializer와 같은 형태의 dict로 반환합니다.
+
+        모델 인스턴스와 serializer 필드를 거치지 않도록 values()로 읽고,
+        상태/표시명은 오늘 날짜 기준으로 행마다 한 번만 계산합니다.
+        """
+        today_date = date.today()
+        priority_display = dict(Milestone._meta.get_field('priority').choices)
+        progress_mode_display = dict(Milestone._meta.get_field('progress_mode').choices)
+
+        rows = []
+        milestones = self.get_team_milestones(team, order_by=order_by).values(
+            'id', 'team_id', 'title', 'description', 'startdate', 'enddate', 'is_completed',
+            'completed_date', 'progress_percentage', 'priority', 'progress_mode'
+        )
+        for milestone in milestones:
+            status = Milestone.compute_status(
+                milestone['startdate'], milestone['enddate'], milestone['progress_percentage'], today_date
+            )
+            completed_date = milestone['completed_date']
+            rows.append({
+                'id': milestone['id'],
+                'team': milestone['team_id'],
+                'title': milestone['title'],
+                'description': milestone['description'],
+                'startdate': milestone['startdate'].isoformat(),
+                'enddate': milestone['enddate'].isoformat(),
+                'is_completed': milestone['is_completed'],
+                'completed_date': completed_date.isoformat() if completed_date else None,
+                'progress_percentage': milestone['progress_percentage'],
+                'priority': milestone['priority'],
+                'priority_display': priority_display[milestone['priority']],
+                'status': status,
+                'status_display': Milestone.STATUS_DISPLAY[status],
+                'progress_mode': milestone['progress_mode'],
+                'progress_mode_display': progress_mode_display[milestone['progress_mode']],
+            })
+        return rows
+
     def _validate_milestone_dates(self, startdate, enddate):
         """마일스톤 날짜 검증"""
         if startdate and enddate:
@@ -644,6 +850,7 @@ class MilestoneService:
 
         # 6. auto → manual: 기존 진행률 유지
         milestone.save()
+        TeamChange.record(milestone.team_id, TeamChange.ENTITY_MILESTONE, milestone.id, TeamChange.OP_UPDATED)
 
         return milestone, {
             'old_mode': old_mode,
@@ -681,4 +888,117 @@ class MilestoneService:
         return {
             'milestone': milestone,
             'todo_stats': stats
-        }
\ No newline at end of file
+        }
+
+class TeamChangeService:
+    """
+    팀 변경 피드(TeamChange) 조회 서비스
+
+    클라이언트는 목록을 한 번 받은 뒤 seq만 들고 변경을 이어 읽고, 바뀐 entity만 다시 가져옵니다.
+    응답의 reset이 True면 보관 기간이 지나 삭제된 구간을 요청한 것이므로 전체를 다시 받아야 합니다.
+    """
+
+    PAGE_SIZE = 200
+    POLL_INTERVAL = 1  # long-poll 중 버전 확인 간격 (초)
+    MAX_WAIT = 25  # long-poll 최대 대기 (초, gunicorn timeout 30초 이내)
+    RETENTION_DAYS = 7
+
+    def get_changes(self, team_id, since=None, limit=PAGE_SIZE):
+        """
+        since 이후의 팀 변경을 seq 순으로 조회합니다.
+
+        버전 행(PK 조회)으로 먼저 확인하고, 버전이 since보다 클 때만 피드를 읽습니다.
+
+        Args:
+            team_id: 팀 ID
+            since (int | None): 마지막으로 받은 seq (None이면 현재 seq만 반환)
+            limit (int): 한 번에 반환할 최대 변경 수
+
+        Returns:
+            dict: {
+                'seq': 다음 요청의 since,
+                'changes': [{'seq', 'entity', 'id', 'op', 'created_at'}, ...],
+                'has_more': limit을 넘어 남은 변경이 있는지,
+                'reset': 전체를 다시 받아야 하는지
+            }
+        """
+        state = TeamDataVersion.objects.filter(team_id=team_id).values_list('version', 'pruned_seq').first()
+        changes = None
+        if self._has_new_changes(state, since):
+            changes = list(TeamChange.objects.filter(team_id=team_id, seq__gt=since).order_by('seq')[:limit + 1])
+        return self._build_result(state, since, changes, limit)
+
+    async def aget_changes(self, team_id, since=None, limit=PAGE_SIZE):
+        """get_changes의 async 버전 (async view용)"""
+        state = await TeamDataVersion.objects.filter(team_id=team_id).values_list('version', 'pruned_seq').afirst()
+        changes = None
+        if self._has_new_changes(state, since):
+            changes = [
+                change async for change in
+                TeamChange.objects.filter(team_id=team_id, seq__gt=since).order_by('seq')[:limit + 1]
+            ]
+        return self._build_result(state, since, changes, limit)
+
+    async def wait_for_changes(self, team_id, since, timeout=MAX_WAIT):
+        """
+        since 이후 변경이 생길 때까지 최대 timeout초 기다립니다. (long-poll)
+
+        POLL_INTERVAL마다 버전 행만 확인하므로 대기 중인 요청당 DB 부하는 PK 조회 1회/초입니다.
+        변경이 없으면 빈 changes와 현재 seq를 반환합니다.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            result = await self.aget_changes(team_id, since)
+            remaining = deadline - time.monotonic()
+            if result['changes'] or result['reset'] or remaining <= 0:
+                return result
+            # 피드에 남지 않는 쓰기(마인드맵 편집)로 버전만 오른 구간은 건너뜀
+            since = result['seq']
+            await asyncio.sleep(min(self.POLL_INTERVAL, remaining))
+
+    def prune_changes(self, before, progress=None):
+        """
+        before 이전에 기록된 변경을 삭제합니다.
+
+        삭제 전에 팀별로 지울 마지막 seq를 pruned_seq에 남겨, 그 구간부터 이어 읽으려는
+        클라이언트가 reset을 받도록 합니다. 삭제는 청크마다 커밋됩니다.
+
+        Args:
+            before (datetime): 이 시각 이전에 기록된 변경 삭제
+            progress (callable | None): 삭제 청크마다 progress(모델 label, 누적 삭제 수) 호출
+
+        Returns:
+            int: 삭제된 변경 수
+        """
+        expired = TeamChange.objects.filter(created_at__lt=before)
+        last_expired_seq = expired.filter(team_id=OuterRef('team_id')).order_by('-seq').values('seq')[:1]
+        TeamDataVersion.objects.filter(team_id__in=expired.values('team_id')).update(
+            pruned_seq=Subquery(last_expired_seq)
+        )
+        return raw_delete_in_chunks(expired, progress=progress)
+
+    def _has_new_changes(self, state, since):
+        return since is not None and state is not None and state[1] <= since < state[0]
+
+    def _build_result(self, state, since, changes, limit):
+        version, pruned_seq = state or (0, 0)
+        if since is None:
+            return {'seq': version, 'changes': [], 'has_more': False, 'reset': False}
+        if since < pruned_seq or since > version:
+            # 삭제된 구간이거나 이 팀에서 발급한 적 없는 seq
+            return {'seq': version, 'changes': [], 'has_more': False, 'reset': True}
+
+        changes = changes or []
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        if has_more:
+            seq = changes[-1].seq
+        else:
+            # 남은 변경이 없으면 버전까지 건너뜀 (버전 이하의 변경은 모두 커밋되어 조회됨)
+            seq = max(version, changes[-1].seq) if changes else version
+        return {
+            'seq': seq,
+            'changes': [change.as_dict() for change in changes],
+            'has_more': has_more,
+            'reset': False
+        }
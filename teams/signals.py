@@ -0,0 +1,10 @@
+"""
+teams 앱 시그널
+
+team_changed: TeamChange가 기록된 트랜잭션이 커밋된 뒤 변경 1건마다 전송됩니다.
+    receiver(sender, change, **kwargs) - change는 TeamChange (team_id, seq, entity, entity_id, op)
+    팀 단위 서버 캐시를 무효화할 때 사용합니다.
+"""
+from django.dispatch import Signal
+
+team_changed = Signal()
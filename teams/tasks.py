@@ -0,0 +1,15 @@
+"""
+Teams 백그라운드 작업
+"""
+from taskqueue.queue import task
+
+from .models import Milestone, TeamChange
+
+
+@task()
+def recompute_milestone_progress(milestone_id):
+    """AUTO 모드 마일스톤 진행률을 TODO 기준으로 다시 계산 (삭제된 마일스톤은 건너뜀)"""
+    milestone = Milestone.objects.filter(pk=milestone_id).first()
+    if milestone is not None:
+        milestone.update_progress_from_todos()
+        TeamChange.record(milestone.team_id, TeamChange.ENTITY_MILESTONE, milestone.id, TeamChange.OP_UPDATED)
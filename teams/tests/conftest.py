@@ -3,9 +3,18 @@ Teams 앱 전용 pytest fixtures
 """
 import pytest
 from datetime import date, timedelta
+from django.core.cache import cache
 from teams.models import Milestone, TeamUser
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """초대 코드 캐시가 테스트 간에 남지 않도록 비움"""
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def milestone(db, team):
     """기본 마일스톤 (진행 중, 수동 모드)"""
@@ -1,18 +1,19 @@
 """
-Teams 마일스톤 서비스 레이어 테스트 (14개)
+Teams 마일스톤 서비스 레이어 테스트 (15개)
 
 테스트 구성:
 - TestMilestoneServiceCreateMilestone: 3개 - 마일스톤 생성, 날짜 유효성 검증
 - TestMilestoneServiceUpdateMilestone: 7개 - 날짜/진행률 수정, 완료 처리
 - TestMilestoneServiceDeleteMilestone: 1개 - 마일스톤 삭제
-- TestMilestoneServiceGetTeamMilestones: 3개 - 목록 조회, 정렬
+- TestMilestoneServiceGetTeamMilestones: 4개 - 목록 조회, 정렬, 목록 API용 dict
 
 사용 위치:
 - API: MilestoneViewSet (create, partial_update, destroy, list)
 - SSR: team_milestone_timeline 뷰
 """
 import pytest
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from teams.serializers import MilestoneSerializer
 from teams.services import MilestoneService
 from teams.models import Milestone
 
@@ -243,6 +244,21 @@ class TestMilestoneServiceGetTeamMilestones:
 
         assert list(milestones) == [m1, m2]
 
+    def test_get_team_milestone_rows_matches_serializer(self, team, milestone, completed_milestone):
+        """목록 API용 dict는 MilestoneSerializer 출력과 같다"""
+        Milestone.objects.filter(pk=completed_milestone.pk).update(completed_date=datetime(2025, 3, 1, 9, 30, 15, 123456))
+        Milestone.objects.create(
+            team=team, title='예정', startdate=date.today() + timedelta(days=3),
+            enddate=date.today() + timedelta(days=9), priority='critical'
+        )
+        order_by = ['startdate', 'enddate', 'priority']
+
+        rows = self.service.get_team_milestone_rows(team, order_by=order_by)
+
+        expected = MilestoneSerializer(self.service.get_team_milestones(team, order_by=order_by), many=True).data
+        assert rows == [dict(item) for item in expected]
+        assert [row['status'] for row in rows] == ['completed', 'in_progress', 'not_started']
+
 
 @pytest.mark.unit
 class TestMilestoneServiceProgressMode:
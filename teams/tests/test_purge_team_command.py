@@ -0,0 +1,37 @@
+"""
+purge_team Management Command 테스트
+
+테스트 구성:
+- TestPurgeTeamCommand: 진행 상황 출력과 삭제, 없는 팀
+"""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from members.models import Todo
+from teams.models import Team, TeamUser
+
+
+@pytest.mark.integration
+class TestPurgeTeamCommand:
+    """purge_team 커맨드 테스트"""
+
+    def test_purges_team_and_reports_progress(self, team):
+        """팀 데이터를 삭제하며 모델별 진행 상황을 출력한다"""
+        Todo.objects.bulk_create(Todo(team=team, content=f'할 일 {i}') for i in range(3))
+        stdout = StringIO()
+
+        call_command('purge_team', team.id, yes=True, stdout=stdout)
+
+        output = stdout.getvalue()
+        assert 'members.Todo: 3건 삭제' in output
+        assert 'teams.TeamUser: 1건 삭제' in output
+        assert not Team.objects.filter(pk=team.id).exists()
+        assert not TeamUser.objects.filter(team_id=team.id).exists()
+
+    def test_missing_team(self, db):
+        """없는 팀 ID는 CommandError"""
+        with pytest.raises(CommandError, match='존재하지 않습니다'):
+            call_command('purge_team', 999999, yes=True)
@@ -0,0 +1,61 @@
+"""
+seed_loadtest Management Command 테스트
+
+테스트 구성:
+- TestSeedLoadtestCommand: 데이터/manifest 생성, 재실행 방지, --reset, DEBUG 가드
+"""
+import json
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from accounts.models import User
+from members.models import Todo
+from mindmaps.models import Node
+from teams.models import Team, TeamUser
+
+
+SMALL_OPTIONS = {'teams': 2, 'members': 3, 'todos': 5, 'posts': 2, 'nodes': 4}
+
+
+@pytest.mark.integration
+class TestSeedLoadtestCommand:
+    """seed_loadtest 커맨드 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def debug_mode(self, settings):
+        settings.DEBUG = True
+
+    def test_creates_data_and_manifest(self, db, tmp_path):
+        """팀/멤버/콘텐츠를 만들고 manifest에 ID를 기록한다"""
+        output = tmp_path / 'manifest.json'
+
+        call_command('seed_loadtest', output=str(output), **SMALL_OPTIONS)
+
+        manifest = json.loads(output.read_text(encoding='utf-8'))
+        assert len(manifest['teams']) == 2
+        team_data = manifest['teams'][0]
+        team = Team.objects.get(pk=team_data['team_id'])
+        assert TeamUser.objects.filter(team=team).count() == 3
+        assert Todo.objects.filter(team=team).count() == 5
+        assert Node.objects.filter(mindmap_id=team_data['mindmap_id']).count() == 4
+        assert User.objects.get(username=team_data['usernames'][0]).check_password(manifest['password'])
+
+    def test_rerun_requires_reset(self, db, tmp_path):
+        """기존 데이터가 있으면 --reset 없이 다시 생성하지 않는다"""
+        output = tmp_path / 'manifest.json'
+        call_command('seed_loadtest', output=str(output), **SMALL_OPTIONS)
+
+        with pytest.raises(CommandError):
+            call_command('seed_loadtest', output=str(output), **SMALL_OPTIONS)
+
+        call_command('seed_loadtest', output=str(output), reset=True, **SMALL_OPTIONS)
+        assert Team.objects.filter(invitecode__startswith='LOAD').count() == 2
+
+    def test_refuses_without_debug(self, db, settings, tmp_path):
+        """DEBUG=False 환경에서는 --force 없이 실행되지 않는다"""
+        settings.DEBUG = False
+
+        with pytest.raises(CommandError):
+            call_command('seed_loadtest', output=str(tmp_path / 'manifest.json'), **SMALL_OPTIONS)
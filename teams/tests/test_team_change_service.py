@@ -0,0 +1,152 @@
+"""
+Teams 변경 피드 서비스 테스트 (8개)
+
+테스트 구성:
+- TestTeamChangeRecording: 4개 - 서비스 쓰기의 피드 기록, 회원 탈퇴, 커밋 후 team_changed 시그널
+- TestTeamChangeServiceGetChanges: 3개 - seq 이어 읽기, 페이지, 피드 없는 버전 증가 건너뛰기
+- TestTeamChangeServicePrune: 1개 - 보관 기간 삭제와 reset
+
+사용 위치:
+- API: async_views.team_changes (long-poll)
+- 커맨드: prune_team_changes
+"""
+from datetime import date, datetime, timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from accounts.services import AuthService
+from members.services import TodoService
+from mindmaps.services import MindmapService
+from schedules.services import ScheduleService
+from shares.services import ShareService
+from teams.models import TeamChange, TeamDataVersion, TeamUser
+from teams.services import MilestoneService, TeamChangeService, TeamService
+from teams.signals import team_changed
+
+
+def feed(team, since=0, **kwargs):
+    return TeamChangeService().get_changes(team.id, since, **kwargs)
+
+
+@pytest.mark.unit
+class TestTeamChangeRecording:
+    """서비스 쓰기의 피드 기록 테스트"""
+
+    def test_service_writes_are_recorded_in_order(self, team, user, another_user):
+        """멤버/마일스톤/TODO/게시글 쓰기가 팀 안에서 증가하는 seq로 기록된다"""
+        TeamService().join_team(another_user, team.id, 'teampass123')
+        milestone = MilestoneService().create_milestone(
+            team, '기획', '', date(2025, 1, 6), date(2025, 1, 31), 'high'
+        )
+        todo = TodoService().create_todo(team, '자료 조사', user)
+        TodoService().delete_todo(todo.id, team)
+        post = ShareService().create_post(team.id, {'title': '공지', 'article': '내용'}, None, user)
+
+        result = feed(team)
+
+        assert [(c['entity'], c['id'], c['op']) for c in result['changes']] == [
+            ('member', TeamUser.objects.get(team=team, user=another_user).id, 'created'),
+            ('milestone', milestone.id, 'created'),
+            ('todo', todo.id, 'created'),
+            ('todo', todo.id, 'deleted'),
+            ('post', post.id, 'created'),
+        ]
+        assert [c['seq'] for c in result['changes']] == [1, 2, 3, 4, 5]
+        assert result['seq'] == 5
+
+    def test_schedule_change_uses_member_id(self, team, user):
+        """스케줄 변경은 스케줄 주인의 TeamUser ID로 기록된다"""
+        team_user = TeamUser.objects.get(team=team, user=user)
+
+        ScheduleService().save_personal_schedule(team_user, date(2025, 10, 6), {'time_9-1': 'on'})
+
+        assert [(c['entity'], c['id']) for c in feed(team)['changes']] == [('schedule', team_user.id)]
+
+    def test_user_deactivation_records_member_deleted(self, team, another_user):
+        """회원 탈퇴로 빠진 멤버십도 멤버 삭제로 기록된다"""
+        TeamService().join_team(another_user, team.id, 'teampass123')
+        team_user_id = TeamUser.objects.get(team=team, user=another_user).id
+
+        AuthService().deactivate_user(another_user, 'testpass123!')
+
+        assert [(c['entity'], c['id'], c['op']) for c in feed(team, since=1)['changes']] == [
+            ('member', team_user_id, 'deleted'),
+        ]
+
+    def test_signal_sent_after_commit(self, team, django_capture_on_commit_callbacks):
+        """team_changed는 커밋된 뒤에 변경마다 전송된다"""
+        received = []
+
+        def receiver(sender, change, **kwargs):
+            received.append((change.team_id, change.entity, change.seq))
+
+        team_changed.connect(receiver)
+        try:
+            with django_capture_on_commit_callbacks(execute=True):
+                TeamChange.record(team.id, TeamChange.ENTITY_TEAM, team.id, TeamChange.OP_UPDATED)
+                assert received == []
+        finally:
+            team_changed.disconnect(receiver)
+
+        assert received == [(team.id, 'team', 1)]
+
+
+@pytest.mark.unit
+class TestTeamChangeServiceGetChanges:
+    """get_changes 테스트"""
+
+    def test_since_none_returns_current_seq(self, team):
+        """since 없이 조회하면 변경 없이 현재 seq만"""
+        for _ in range(3):
+            TeamChange.record(team.id, TeamChange.ENTITY_TEAM, team.id, TeamChange.OP_UPDATED)
+
+        assert TeamChangeService().get_changes(team.id) == {
+            'seq': 3, 'changes': [], 'has_more': False, 'reset': False
+        }
+        assert feed(team, since=3)['changes'] == []
+
+    def test_pages_with_limit(self, team):
+        """limit을 넘으면 has_more와 마지막으로 받은 seq를 돌려준다"""
+        for _ in range(5):
+            TeamChange.record(team.id, TeamChange.ENTITY_TEAM, team.id, TeamChange.OP_UPDATED)
+
+        first = feed(team, since=0, limit=3)
+        second = feed(team, since=first['seq'], limit=3)
+
+        assert [c['seq'] for c in first['changes']] == [1, 2, 3]
+        assert first['has_more'] is True
+        assert [c['seq'] for c in second['changes']] == [4, 5]
+        assert second['has_more'] is False
+
+    def test_skips_version_bumps_without_feed_rows(self, team, user, django_assert_num_queries):
+        """마인드맵 생성처럼 버전만 오른 구간은 변경 없이 seq만 앞으로 간다"""
+        MindmapService().create_mindmap(team.id, '아이디어', user)
+        TeamChange.record(team.id, TeamChange.ENTITY_TEAM, team.id, TeamChange.OP_UPDATED)
+
+        result = feed(team, since=0)
+        assert [c['seq'] for c in result['changes']] == [2]
+
+        # 버전이 그대로면 버전 행 조회 1회로 끝남
+        with django_assert_num_queries(1):
+            assert feed(team, since=result['seq'])['changes'] == []
+
+
+@pytest.mark.integration
+class TestTeamChangeServicePrune:
+    """prune_changes / prune_team_changes 커맨드 테스트"""
+
+    def test_prune_marks_reset_for_deleted_range(self, team):
+        """지운 구간부터 이어 읽으면 reset, 남은 구간은 그대로 이어 읽는다"""
+        for _ in range(3):
+            TeamChange.record(team.id, TeamChange.ENTITY_TEAM, team.id, TeamChange.OP_UPDATED)
+        TeamChange.objects.filter(team=team, seq__lte=2).update(created_at=datetime.now() - timedelta(days=8))
+        stdout = StringIO()
+
+        call_command('prune_team_changes', stdout=stdout)
+
+        assert '2건 삭제' in stdout.getvalue()
+        assert TeamDataVersion.objects.get(team=team).pruned_seq == 2
+        assert feed(team, since=1)['reset'] is True
+        assert [c['seq'] for c in feed(team, since=2)['changes']] == [3]
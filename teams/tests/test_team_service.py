@@ -1,22 +1,38 @@
 """
-Teams 서비스 레이어 테스트 (25개)
+Teams 서비스 레이어 테스트 (34개)
 
 테스트 구성:
 - TestTeamServiceCreateTeam: 5개 - 팀 생성, 유효성 검증
-- TestTeamServiceVerifyTeamCode: 5개 - 초대 코드 검증, 정원 초과
-- TestTeamServiceJoinTeam: 5개 - 팀 가입, 비밀번호 체크
-- TestTeamServiceGetUserTeams: 2개 - 사용자 팀 목록
+- TestTeamServiceVerifyTeamCode: 7개 - 초대 코드 검증, 정원 초과, 단일 쿼리/코드 캐시
+- TestTeamServiceJoinTeam: 7개 - 팀 가입, 비밀번호 체크, 인원수 조건부 갱신
+- TestTeamServiceJoinTeamConcurrency: 2개 - 동시 가입 시 정원/중복 가입 보장
+- TestTeamServiceGetUserTeams: 3개 - 사용자 팀 목록, 목록 API용 dict
 - TestTeamServiceGetTeamStatistics: 2개 - 팀 통계 계산
-- TestTeamServiceDisbandTeam: 2개 - 팀 해체, 권한 확인
+- TestTeamServiceDisbandTeam: 4개 - 팀 해체, 권한 확인, 연관 데이터 일괄 삭제
 - TestTeamServiceRemoveMember: 4개 - 멤버 제거/탈퇴
 
 사용 위치:
 - SSR 뷰: team_create, team_verify_code, team_join_process, main_page 등
 - API: TeamViewSet.remove_member
 """
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import close_old_connections, connection
+from django.db.models import CASCADE
+from django.test.utils import CaptureQueriesContext
+
+from members.models import Todo
+from mindmaps.models import Comment, Mindmap, MindmapOperation, Node, NodeConnection
+from schedules.models import PersonalDaySchedule
+from shares.models import Post
+from teams.serializers import TeamListSerializer
 from teams.services import TeamService
-from teams.models import Team, TeamUser
+from teams.models import Milestone, Team, TeamUser
 
 
 @pytest.mark.unit
@@ -129,6 +145,24 @@ class TestTeamServiceVerifyTeamCode:
         with pytest.raises(ValueError, match='팀 최대인원을 초과했습니다'):
             self.service.verify_team_code(full_team.invitecode, another_user)
 
+    def test_verify_team_code_uses_single_query(self, team, another_user, django_assert_num_queries):
+        """팀/호스트/인원/가입 여부를 쿼리 한 번으로 조회하고, 캐시 후에도 한 번"""
+        with django_assert_num_queries(1):
+            result = self.service.verify_team_code(team.invitecode, another_user)
+        with django_assert_num_queries(1):
+            self.service.verify_team_code(team.invitecode, another_user)
+
+        assert result['host_name'] == team.host.nickname
+
+    def test_verify_team_code_caches_invalid_code(self, user, django_assert_num_queries):
+        """없는 코드는 잠시 캐시해 다시 조회하지 않는다"""
+        with pytest.raises(ValueError, match='유효하지 않은 팀 코드입니다'):
+            self.service.verify_team_code('PROBE1234', user)
+
+        with django_assert_num_queries(0):
+            with pytest.raises(ValueError, match='유효하지 않은 팀 코드입니다'):
+                self.service.verify_team_code('PROBE1234', user)
+
 
 @pytest.mark.unit
 class TestTeamServiceJoinTeam:
@@ -170,6 +204,82 @@ class TestTeamServiceJoinTeam:
         with pytest.raises(ValueError, match='존재하지 않는 팀입니다'):
             self.service.join_team(another_user, 99999, 'password')
 
+    def test_join_team_updates_count_with_single_conditional_update(self, team, another_user):
+        """인원수 갱신은 조건부 UPDATE 한 번 (COUNT 조회, full_clean 없음)"""
+        with CaptureQueriesContext(connection) as captured:
+            self.service.join_team(another_user, team.id, 'teampass123')
+
+        statements = [query['sql'].upper() for query in captured.captured_queries]
+        assert not any('COUNT(' in sql for sql in statements)
+        # 팀 데이터 버전(TeamDataVersion) 갱신을 뺀 Team 행 UPDATE
+        team_updates = [sql for sql in statements if sql.startswith('UPDATE') and 'TEAMDATAVERSION' not in sql]
+        assert len(team_updates) == 1
+        assert Team.objects.get(pk=team.id).currentuser == 2
+
+    def test_join_team_does_not_overbook_last_slot(self, team, another_user, third_user):
+        """남은 자리가 하나면 먼저 가입한 사용자만 성공하고 currentuser는 maxuser를 넘지 않는다"""
+        Team.objects.filter(pk=team.id).update(maxuser=2)
+
+        self.service.join_team(another_user, team.id, 'teampass123')
+        with pytest.raises(ValueError, match='팀 최대인원을 초과했습니다'):
+            self.service.join_team(third_user, team.id, 'teampass123')
+
+        assert Team.objects.get(pk=team.id).currentuser == 2
+        assert not TeamUser.objects.filter(team=team, user=third_user).exists()
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+@pytest.mark.django_db(transaction=True)
+class TestTeamServiceJoinTeamConcurrency:
+    """동시 가입 테스트 (스레드마다 별도 DB 연결)"""
+
+    WORKERS = 16
+
+    def setup_method(self):
+        self.service = TeamService()
+
+    @pytest.fixture(autouse=True)
+    def _require_shared_test_db(self):
+        if not connection.features.test_db_allows_multiple_connections:
+            pytest.skip('인메모리 SQLite 테스트 DB는 스레드 간 동시 쓰기를 검증할 수 없습니다.')
+
+    def _join_all(self, users, team_id):
+        def join(user):
+            try:
+                self.service.join_team(user, team_id, 'teampass123')
+                return 'joined'
+            except ValueError as e:
+                return str(e)
+            finally:
+                close_old_connections()
+
+        with ThreadPoolExecutor(max_workers=self.WORKERS) as executor:
+            return Counter(executor.map(join, users))
+
+    def test_parallel_joins_never_exceed_maxuser(self, team, django_user_model):
+        """200명이 동시에 가입해도 정원(50명)까지만 가입된다"""
+        Team.objects.filter(pk=team.id).update(maxuser=50)
+        django_user_model.objects.bulk_create([
+            django_user_model(username=f'joiner{i}', email=f'joiner{i}@example.com', is_active=True)
+            for i in range(200)
+        ])
+        users = list(django_user_model.objects.filter(username__startswith='joiner'))
+
+        results = self._join_all(users, team.id)
+
+        assert results == {'joined': 49, TeamService.ERROR_MESSAGES['TEAM_FULL']: 151}
+        assert TeamUser.objects.filter(team=team).count() == 50
+        assert Team.objects.get(pk=team.id).currentuser == 50
+
+    def test_parallel_duplicate_joins_create_one_membership(self, team, another_user):
+        """같은 사용자의 동시 가입 요청은 한 번만 성공하고 인원수도 한 번만 늘어난다"""
+        results = self._join_all([another_user] * 50, team.id)
+
+        assert results == {'joined': 1, TeamService.ERROR_MESSAGES['ALREADY_MEMBER']: 49}
+        assert TeamUser.objects.filter(team=team, user=another_user).count() == 1
+        assert Team.objects.get(pk=team.id).currentuser == 2
+
 
 @pytest.mark.unit
 class TestTeamServiceGetUserTeams:
@@ -196,6 +306,18 @@ class TestTeamServiceGetUserTeams:
         teams = self.service.get_user_teams(another_user)
         assert teams.count() == 0
 
+    def test_get_user_team_rows_matches_serializer(self, user, team, another_user):
+        """목록 API용 dict는 TeamListSerializer 출력과 같다 (호스트가 없으면 키를 빼는 대신 null)"""
+        orphan = self.service.create_team(another_user, '팀2', 5, 'pass2', '소개2')
+        TeamUser.objects.create(team=orphan, user=user)
+        Team.objects.filter(pk=orphan.pk).update(host=None)
+
+        rows = self.service.get_user_team_rows(user)
+
+        expected = [dict(item) for item in TeamListSerializer(self.service.get_user_teams(user), many=True).data]
+        expected[1].update(host_username=None, host_nickname=None)
+        assert rows == expected
+
 
 @pytest.mark.unit
 class TestTeamServiceGetTeamStatistics:
@@ -246,6 +368,65 @@ class TestTeamServiceDisbandTeam:
         with pytest.raises(ValueError, match='팀을 해체할 권한이 없습니다'):
             self.service.disband_team(team_with_members.id, another_user)
 
+    def test_disband_team_deletes_related_data(
+        self, team, full_team, user, settings, tmp_path, django_capture_on_commit_callbacks
+    ):
+        """팀 해체 시 연관 데이터가 모두 삭제되고 첨부파일은 커밋 후 삭제된다 (다른 팀은 유지)"""
+        settings.MEDIA_ROOT = str(tmp_path)
+        teamuser = TeamUser.objects.get(team=team, user=user)
+        milestone = Milestone.objects.create(
+            team=team, title='마일스톤', startdate=date(2025, 1, 1), enddate=date(2025, 1, 31)
+        )
+        Todo.objects.create(team=team, content='할 일', assignee=teamuser, milestone=milestone)
+        PersonalDaySchedule.objects.create(owner=teamuser, date=date(2025, 1, 1), available_hours=[9])
+        post = Post.objects.create(
+            team=team, teamuser=teamuser, title='첨부', article='내용',
+            upload_files=SimpleUploadedFile('a.txt', b'hello'), filename='a.txt'
+        )
+        file_path = post.upload_files.path
+        mindmap = Mindmap.objects.create(team=team, title='마인드맵')
+        node1 = Node.objects.create(mindmap=mindmap, posX=0, posY=0, title='1', content='')
+        node2 = Node.objects.create(mindmap=mindmap, posX=1, posY=1, title='2', content='')
+        NodeConnection.objects.create(mindmap=mindmap, from_node=node1, to_node=node2)
+        Comment.objects.create(node=node1, comment='댓글', user=user)
+        MindmapOperation.objects.create(mindmap=mindmap, seq=1, lamport=1, op_type='node_create', payload={})
+        other_todo = Todo.objects.create(team=full_team, content='다른 팀')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self.service.disband_team(team.id, user)
+
+        assert not Team.objects.filter(pk=team.id).exists()
+        for model in (TeamUser, Milestone, Todo, Post, Mindmap):
+            assert not model.objects.filter(team_id=team.id).exists()
+        assert not PersonalDaySchedule.objects.exists()
+        assert not Node.objects.exists()
+        assert not NodeConnection.objects.exists()
+        assert not Comment.objects.exists()
+        assert not MindmapOperation.objects.exists()
+        assert Todo.objects.filter(pk=other_todo.pk).exists()
+        assert TeamUser.objects.filter(team=full_team).exists()
+        assert not os.path.exists(file_path)
+
+    def test_purge_team_covers_all_cascading_models(self):
+        """Team을 CASCADE로 참조하는 모델이 추가되면 purge_team 삭제 순서에도 넣어야 한다"""
+        covered = {
+            'teams.Team', 'teams.TeamUser', 'teams.TeamDataVersion', 'teams.TeamChange', 'teams.Milestone',
+            'members.Todo', 'shares.Post', 'schedules.PersonalDaySchedule', 'mindmaps.Mindmap', 'mindmaps.Node',
+            'mindmaps.Comment', 'mindmaps.NodeConnection', 'mindmaps.MindmapOperation', 'mindmaps.MindmapSnapshot',
+        }
+        pending = [Team]
+        seen = set()
+        while pending:
+            model = pending.pop()
+            if model._meta.label in seen:
+                continue
+            seen.add(model._meta.label)
+            for relation in model._meta.related_objects:
+                if relation.on_delete is CASCADE:
+                    pending.append(relation.related_model)
+
+        assert seen <= covered
+
 
 @pytest.mark.unit
 class TestTeamServiceRemoveMember:
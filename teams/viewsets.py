@@ -6,7 +6,7 @@ from django.shortcuts import get_object_or_404
 from django.contrib import messages
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
-from .models import Team, Milestone
+from .models import Team, TeamChange, TeamUser, Milestone
 from .serializers import (
     TeamListSerializer, TeamDetailSerializer, TeamCreateSerializer,
     TeamUpdateSerializer,
@@ -14,13 +14,17 @@ from .serializers import (
     MilestoneProgressModeSerializer
 )
 from .services import TeamService, MilestoneService
+from api.mixins import ConditionalGetMixin
 from api.permissions import IsTeamMember
 from api.utils import api_response, api_success_response, api_error_response
+from common.instrumentation import span
 
 
-class TeamViewSet(viewsets.ModelViewSet):
+class TeamViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """팀 관리 ViewSet"""
     permission_classes = [IsAuthenticated]
+    conditional_actions = ('list', 'retrieve', 'statistics')
+    change_entity = TeamChange.ENTITY_TEAM
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -44,22 +48,37 @@ class TeamViewSet(viewsets.ModelViewSet):
             return TeamUpdateSerializer
         return TeamDetailSerializer
 
+    def get_version_team_id(self):
+        return self.kwargs.get('pk')
+
+    def get_data_version(self):
+        """목록은 소속 팀 전체의 버전, 상세는 소속 팀일 때만 버전 (아니면 조건부 처리 안 함)"""
+        memberships = TeamUser.objects.filter(user=self.request.user).order_by('team_id')
+        if self.action == 'list':
+            rows = memberships.values_list('team_id', 'team__data_version__version')
+            return ','.join(f'{team_id}:{version or 0}' for team_id, version in rows)
+
+        versions = list(memberships.filter(team_id=self.get_version_team_id())
+                        .values_list('team__data_version__version', flat=True))
+        return str(versions[0] or 0) if versions else None
+
     def list(self, request, *args, **kwargs):
         """사용자가 속한 팀 목록 조회"""
-        teams = self.team_service.get_user_teams(request.user)
-        serializer = TeamListSerializer(teams, many=True)
+        # TeamListSerializer와 같은 형태를 values()로 바로 만듦 (serializer 필드 순회 생략)
         return Response({
             'success': True,
-            'data': serializer.data
+            'data': self.team_service.get_user_team_rows(request.user)
         })
 
     def retrieve(self, request, *args, **kwargs):
         """팀 상세 조회"""
         team = self.get_object()
         serializer = TeamDetailSerializer(team)
+        with span('serialize'):
+            data = serializer.data
         return Response({
             'success': True,
-            'data': serializer.data
+            'data': data
         })
 
     def create(self, request, *args, **kwargs):
@@ -106,6 +125,7 @@ class TeamViewSet(viewsets.ModelViewSet):
         for field, value in serializer.validated_data.items():
             setattr(team, field, value)
         team.save()
+        self.record_change(TeamChange.OP_UPDATED, team.id)
 
         response_serializer = TeamDetailSerializer(team)
         return api_success_response(
@@ -174,10 +194,11 @@ class TeamViewSet(viewsets.ModelViewSet):
             return api_error_response(request, str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class MilestoneViewSet(viewsets.ModelViewSet):
+class MilestoneViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """팀 마일스톤 관리 ViewSet"""
     serializer_class = MilestoneSerializer
     permission_classes = [IsAuthenticated, IsTeamMember]
+    change_entity = TeamChange.ENTITY_MILESTONE
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -209,12 +230,11 @@ class MilestoneViewSet(viewsets.ModelViewSet):
 
         # 서비스 레이어를 통한 조회 (정렬 포함)
         # 같은 시작일/종료일이면 우선순위 높은 순
-        milestones = self.milestone_service.get_team_milestones(
+        # MilestoneSerializer와 같은 형태를 values()로 바로 만듦 (행마다 상태 계산 1회)
+        milestones = self.milestone_service.get_team_milestone_rows(
             team, order_by=['startdate', 'enddate', 'priority']
         )
-
-        serializer = self.get_serializer(milestones, many=True)
-        return Response(serializer.data)
+        return Response(milestones)
 
     def retrieve(self, request, *args, **kwargs):
         """마일스톤 단일 조회 (수정 모달용)"""